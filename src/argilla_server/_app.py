@@ -12,6 +12,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import asyncio
 import contextlib
 import glob
 import inspect
@@ -23,15 +24,16 @@ from pathlib import Path
 
 import backoff
 from brotli_asgi import BrotliMiddleware
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, status
+from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import RedirectResponse
+from starlette.responses import PlainTextResponse, RedirectResponse
 
-from argilla_server import helpers
+from argilla_server import helpers, instrumentation
 from argilla_server._version import __version__ as argilla_version
 from argilla_server.apis.routes import api_v0, api_v1
 from argilla_server.constants import DEFAULT_API_KEY, DEFAULT_PASSWORD, DEFAULT_USERNAME
-from argilla_server.contexts import accounts
+from argilla_server.contexts import accounts, outbox
 from argilla_server.daos.backend import GenericElasticEngineBackend
 from argilla_server.daos.backend.base import GenericSearchError
 from argilla_server.daos.datasets import DatasetsDAO
@@ -40,9 +42,11 @@ from argilla_server.database import get_async_db
 from argilla_server.logging import configure_logging
 from argilla_server.models import User
 from argilla_server.pydantic_v1.errors import ConfigError
+from argilla_server.search_engine import close_search_engine, get_search_engine, open_search_engine
 from argilla_server.security import auth
 from argilla_server.settings import settings
 from argilla_server.static_rewrite import RewriteStaticFiles
+from argilla_server.utils.concurrency import shutdown_process_pool
 
 _LOGGER = logging.getLogger("argilla")
 
@@ -70,8 +74,11 @@ def create_server_app() -> FastAPI:
         configure_app_logging,
         configure_database,
         configure_storage,
+        configure_search_engine,
+        configure_search_engine_outbox,
         configure_telemetry,
         configure_middleware,
+        configure_instrumentation,
         configure_app_security,
         configure_api_router,
         configure_app_statics,
@@ -101,6 +108,25 @@ def configure_middleware(app: FastAPI):
 
     app.add_middleware(BrotliMiddleware, minimum_size=512, quality=7)
 
+    # Added last so it's the outermost middleware, timing the whole request
+    app.add_middleware(instrumentation.InstrumentationMiddleware)
+
+
+def configure_instrumentation(app: FastAPI):
+    """Configures the metrics endpoint and the timing of the api endpoints"""
+
+    for api in [api_v0, api_v1]:
+        for route in api.routes:
+            if isinstance(route, APIRoute):
+                route.dependant.call = instrumentation.instrument_endpoint(route.dependant.call)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def get_metrics():
+        if not settings.enable_metrics:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Metrics are not enabled")
+
+        return PlainTextResponse(instrumentation.registry.render(), media_type=instrumentation.PROMETHEUS_CONTENT_TYPE)
+
 
 def configure_api_router(app: FastAPI):
     """Configures and set the api router to app"""
@@ -186,8 +212,70 @@ def configure_storage(app: FastAPI):
 
     @app.on_event("startup")
     async def setup_elasticsearch():
+        if settings.search_engine == "sql":
+            _LOGGER.warning("Storage for v0 datasets won't be configured since the sql search engine is used")
+            return
+
         _setup_elasticsearch()
 
+    @app.on_event("shutdown")
+    async def teardown_metrics_processes():
+        shutdown_process_pool()
+
+
+def configure_search_engine(app: FastAPI):
+    """Shares a single search engine instance (and its connection pool) across all requests"""
+
+    @app.on_event("startup")
+    async def setup_search_engine():
+        await open_search_engine()
+
+    @app.on_event("shutdown")
+    async def teardown_search_engine():
+        await close_search_engine()
+
+
+def configure_search_engine_outbox(app: FastAPI):
+    """Runs the background indexer draining the records outbox when the outbox mode is enabled"""
+
+    if not settings.search_engine_outbox_enabled:
+        return
+
+    async def index_pending_records() -> int:
+        async with _get_db_wrapper() as db:
+            async for search_engine in get_search_engine():
+                indexed = await outbox.index_pending_records(
+                    db,
+                    search_engine,
+                    batch_size=settings.search_engine_outbox_batch_size,
+                    max_attempts=settings.search_engine_outbox_max_attempts,
+                )
+
+        return indexed
+
+    async def run_outbox_indexer():
+        while True:
+            try:
+                indexed = await index_pending_records()
+            except Exception as ex:
+                _LOGGER.error(f"Error indexing records from the outbox: {ex}")
+                indexed = 0
+
+            if indexed < settings.search_engine_outbox_batch_size:
+                await asyncio.sleep(settings.search_engine_outbox_poll_interval)
+
+    outbox_indexer_task = None
+
+    @app.on_event("startup")
+    async def start_outbox_indexer():
+        nonlocal outbox_indexer_task
+        outbox_indexer_task = asyncio.create_task(run_outbox_indexer())
+
+    @app.on_event("shutdown")
+    async def stop_outbox_indexer():
+        if outbox_indexer_task is not None:
+            outbox_indexer_task.cancel()
+
 
 def configure_app_security(app: FastAPI):
     auth.configure_app(app)
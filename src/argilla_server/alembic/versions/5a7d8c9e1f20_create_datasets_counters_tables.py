@@ -0,0 +1,75 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""create datasets counters tables
+
+Revision ID: 5a7d8c9e1f20
+Revises: ca7293c38970
+Create Date: 2024-04-22 10:31:12.583214
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5a7d8c9e1f20"
+down_revision = "ca7293c38970"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Counters are not backfilled here. They are lazily computed the first time they are requested for a dataset.
+    op.create_table(
+        "datasets_counters",
+        sa.Column("records", sa.Integer(), nullable=False),
+        sa.Column("submitted", sa.Integer(), nullable=False),
+        sa.Column("discarded", sa.Integer(), nullable=False),
+        sa.Column("conflicting", sa.Integer(), nullable=False),
+        sa.Column("dataset_id", sa.Uuid(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("inserted_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_datasets_counters_dataset_id"), "datasets_counters", ["dataset_id"], unique=True)
+
+    op.create_table(
+        "datasets_users_counters",
+        sa.Column("submitted", sa.Integer(), nullable=False),
+        sa.Column("discarded", sa.Integer(), nullable=False),
+        sa.Column("draft", sa.Integer(), nullable=False),
+        sa.Column("dataset_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("inserted_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("dataset_id", "user_id", name="dataset_user_counters_dataset_id_user_id_uq"),
+    )
+    op.create_index(
+        op.f("ix_datasets_users_counters_dataset_id"), "datasets_users_counters", ["dataset_id"], unique=False
+    )
+    op.create_index(op.f("ix_datasets_users_counters_user_id"), "datasets_users_counters", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_datasets_users_counters_user_id"), table_name="datasets_users_counters")
+    op.drop_index(op.f("ix_datasets_users_counters_dataset_id"), table_name="datasets_users_counters")
+    op.drop_table("datasets_users_counters")
+    op.drop_index(op.f("ix_datasets_counters_dataset_id"), table_name="datasets_counters")
+    op.drop_table("datasets_counters")
@@ -0,0 +1,51 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""create records outbox table
+
+Revision ID: 7b1e4f3a9c52
+Revises: 5a7d8c9e1f20
+Create Date: 2024-04-24 16:12:45.180914
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7b1e4f3a9c52"
+down_revision = "5a7d8c9e1f20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "records_outbox",
+        sa.Column("record_id", sa.Uuid(), nullable=False),
+        sa.Column("dataset_id", sa.Uuid(), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("inserted_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["record_id"], ["records.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_records_outbox_record_id"), "records_outbox", ["record_id"], unique=True)
+    op.create_index(op.f("ix_records_outbox_dataset_id"), "records_outbox", ["dataset_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_records_outbox_dataset_id"), table_name="records_outbox")
+    op.drop_index(op.f("ix_records_outbox_record_id"), table_name="records_outbox")
+    op.drop_table("records_outbox")
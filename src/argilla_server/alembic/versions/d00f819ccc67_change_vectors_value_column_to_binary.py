@@ -0,0 +1,107 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""change vectors value column to binary
+
+Revision ID: d00f819ccc67
+Revises: 7b1e4f3a9c52
+Create Date: 2024-04-29 10:21:37.502931
+
+"""
+import json
+from typing import Any, Callable
+
+import numpy as np
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d00f819ccc67"
+down_revision = "7b1e4f3a9c52"
+branch_labels = None
+depends_on = None
+
+# Float32 vectors header, as defined by `argilla_server.models.vectors`. It's copied here so the migration doesn't
+# depend on the current models code.
+FLOAT32_HEADER = bytes([1, 0, 0, 0])
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column("vectors", sa.Column("value_binary", sa.LargeBinary(), nullable=True))
+
+    _migrate_values(
+        source=sa.column("value", sa.JSON()),
+        target=sa.column("value_binary", sa.LargeBinary()),
+        convert=lambda value: FLOAT32_HEADER + np.asarray(_load_json(value), dtype="<f4").tobytes(),
+    )
+
+    with op.batch_alter_table("vectors") as batch_op:
+        batch_op.drop_column("value")
+        batch_op.alter_column("value_binary", new_column_name="value", nullable=False)
+
+
+def downgrade() -> None:
+    op.add_column("vectors", sa.Column("value_json", sa.JSON(), nullable=True))
+
+    _migrate_values(
+        source=sa.column("value", sa.LargeBinary()),
+        target=sa.column("value_json", sa.JSON()),
+        # Float32 values are converted using their shortest representation (e.g. `0.1` instead of `0.10000000149`)
+        convert=lambda value: _decode_vector(value).astype(str).astype(np.float64).tolist(),
+    )
+
+    with op.batch_alter_table("vectors") as batch_op:
+        batch_op.drop_column("value")
+        batch_op.alter_column("value_json", new_column_name="value", nullable=False)
+
+
+def _migrate_values(source: sa.ColumnClause, target: sa.ColumnClause, convert: Callable[[Any], Any]) -> None:
+    vectors_table = sa.table("vectors", sa.column("id", sa.Uuid()), source, target)
+    connection = op.get_bind()
+
+    last_id = None
+    while True:
+        query = sa.select(vectors_table.c.id, source).order_by(vectors_table.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(vectors_table.c.id > last_id)
+
+        rows = connection.execute(query).all()
+        if not rows:
+            break
+
+        connection.execute(
+            vectors_table.update().where(vectors_table.c.id == sa.bindparam("_id")),
+            [{"_id": id, target.name: convert(value)} for id, value in rows],
+        )
+
+        last_id = rows[-1][0]
+
+
+def _load_json(value: Any) -> Any:
+    # Depending on the database and driver JSON values can be returned as strings
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _decode_vector(data: bytes) -> np.ndarray:
+    code = data[0]
+    if code == 1:
+        return np.frombuffer(data, dtype="<f4", offset=4)
+    elif code == 2:
+        return np.frombuffer(data, dtype="<f2", offset=4).astype(np.float32)
+    elif code == 3:
+        scale = np.frombuffer(data, dtype="<f4", count=1, offset=4)[0]
+        return np.frombuffer(data, dtype=np.int8, offset=8) * scale
+
+    raise ValueError("Stored vector has an unknown format")
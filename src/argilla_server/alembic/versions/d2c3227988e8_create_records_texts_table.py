@@ -0,0 +1,124 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""create records texts table
+
+Revision ID: d2c3227988e8
+Revises: 3e9a1c7d5b24
+Create Date: 2024-05-06 10:12:41.308274
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d2c3227988e8"
+down_revision = "3e9a1c7d5b24"
+branch_labels = None
+depends_on = None
+
+# Text search configuration used by the SQL search engine. It's copied here so the migration doesn't depend on the
+# current search engine code.
+POSTGRESQL_TEXT_SEARCH_CONFIG = "simple"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "records_texts",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("record_id", sa.Uuid, sa.ForeignKey("records.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("field_name", sa.String, nullable=False),
+        sa.Column("text", sa.Text, nullable=False),
+        sa.UniqueConstraint("record_id", "field_name", name="record_id_field_name_uq"),
+    )
+
+    dialect_name = op.get_context().dialect.name
+    if dialect_name == "sqlite":
+        _create_sqlite_full_text_index()
+    elif dialect_name == "postgresql":
+        _create_postgresql_full_text_index()
+    else:
+        raise NotImplementedError(f"Unsupported database: {dialect_name}")
+
+    op.execute(_records_texts_insert_statement(dialect_name))
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "sqlite":
+        op.execute("DROP TRIGGER records_texts_after_update")
+        op.execute("DROP TRIGGER records_texts_after_delete")
+        op.execute("DROP TRIGGER records_texts_after_insert")
+        op.execute("DROP TABLE records_texts_fts")
+    else:
+        op.drop_index("ix_records_texts_document", table_name="records_texts")
+
+    op.drop_table("records_texts")
+
+
+def _create_sqlite_full_text_index() -> None:
+    # See https://www.sqlite.org/fts5.html#external_content_tables
+    op.execute("CREATE VIRTUAL TABLE records_texts_fts USING fts5(text, content='records_texts', content_rowid='id')")
+    op.execute(
+        """
+        CREATE TRIGGER records_texts_after_insert AFTER INSERT ON records_texts BEGIN
+            INSERT INTO records_texts_fts(rowid, text) VALUES (new.id, new.text);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER records_texts_after_delete AFTER DELETE ON records_texts BEGIN
+            INSERT INTO records_texts_fts(records_texts_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER records_texts_after_update AFTER UPDATE ON records_texts BEGIN
+            INSERT INTO records_texts_fts(records_texts_fts, rowid, text) VALUES ('delete', old.id, old.text);
+            INSERT INTO records_texts_fts(rowid, text) VALUES (new.id, new.text);
+        END
+        """
+    )
+
+
+def _create_postgresql_full_text_index() -> None:
+    # See https://www.postgresql.org/docs/current/textsearch-tables.html#TEXTSEARCH-TABLES-INDEX
+    op.create_index(
+        "ix_records_texts_document",
+        "records_texts",
+        [sa.text(f"to_tsvector('{POSTGRESQL_TEXT_SEARCH_CONFIG}'::regconfig, text)")],
+        postgresql_using="gin",
+    )
+
+
+def _records_texts_insert_statement(dialect_name: str) -> str:
+    """Returns the statement filling the table with the text fields values of the existing records"""
+    if dialect_name == "sqlite":
+        field_path = "'$.\"' || fields.name || '\"'"
+        return f"""
+            INSERT INTO records_texts (record_id, field_name, text)
+            SELECT records.id, fields.name, json_extract(records.fields, {field_path})
+            FROM records JOIN fields ON fields.dataset_id = records.dataset_id
+            WHERE json_extract(fields.settings, '$.type') = 'text'
+            AND json_type(records.fields, {field_path}) = 'text'
+        """
+
+    return """
+        INSERT INTO records_texts (record_id, field_name, text)
+        SELECT records.id, fields.name, records.fields ->> fields.name
+        FROM records JOIN fields ON fields.dataset_id = records.dataset_id
+        WHERE fields.settings ->> 'type' = 'text'
+        AND json_typeof(records.fields -> fields.name) = 'string'
+    """
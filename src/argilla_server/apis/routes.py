@@ -49,6 +49,9 @@ from argilla_server.apis.v1.handlers import (
 from argilla_server.apis.v1.handlers import (
     oauth2 as oauth2_v1,
 )
+from argilla_server.apis.v1.handlers import (
+    profiler as profiler_v1,
+)
 from argilla_server.apis.v1.handlers import (
     questions as questions_v1,
 )
@@ -129,6 +132,7 @@ def create_api_v1():
         workspaces_v1.router,
         oauth2_v1.router,
         settings_v1.router,
+        profiler_v1.router,
     ]:
         api_v1.include_router(router)
 
@@ -131,6 +131,18 @@ async def open_dataset(
     await service.open(user=current_user, dataset=found_ds)
 
 
+@router.put("/{name}:refresh", operation_id="refresh_dataset")
+async def refresh_dataset(
+    name: str,
+    ds_params: CommonTaskHandlerDependencies = Depends(),
+    service: DatasetsService = Depends(DatasetsService.get_instance),
+    current_user: User = Security(auth.get_current_user),
+):
+    """Makes the records written to the dataset visible to searches, for bulk writes done without refresh"""
+    found_ds = await service.find_by_name(user=current_user, name=name, workspace=ds_params.workspace)
+    await service.refresh(user=current_user, dataset=found_ds)
+
+
 @router.put("/{name}:copy", operation_id="copy_dataset", response_model=Dataset, response_model_exclude_none=True)
 async def copy_dataset(
     name: str,
@@ -26,6 +26,7 @@ from argilla_server.pydantic_v1 import BaseModel, Field
 from argilla_server.security import auth
 from argilla_server.services.datasets import DatasetsService
 from argilla_server.services.metrics import MetricsService
+from argilla_server.utils.concurrency import run_blocking
 
 
 class MetricInfo(BaseModel):
@@ -115,7 +116,8 @@ def configure_router(router: APIRouter, cfg: TaskConfig):
         metric_ = TasksFactory.find_task_metric(task=cfg.task, metric_id=metric)
         record_class = TasksFactory.get_task_record(cfg.task)
 
-        return metrics.summarize_metric(
+        return await run_blocking(
+            metrics.summarize_metric,
             dataset=dataset,
             metric=metric_,
             record_class=record_class,
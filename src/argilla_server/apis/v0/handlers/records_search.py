@@ -27,6 +27,7 @@ from argilla_server.models import User
 from argilla_server.pydantic_v1 import BaseModel, Field
 from argilla_server.security import auth
 from argilla_server.services.datasets import DatasetsService
+from argilla_server.utils.concurrency import run_blocking
 
 # TODO(@frascuchon): This will be merged with `records.py`
 #  once the similarity search feature is merged into develop
@@ -87,11 +88,14 @@ def configure_router(router: APIRouter):
         elif request.next_idx and not request.sort_by:
             paginated_sort.next_search_params = [request.next_idx]
 
-        docs = engine.scan_records(
-            id=found.id, query=request.query, sort=paginated_sort, include_fields=request.fields, limit=limit
-        )
+        def _scan_records() -> List[dict]:
+            return list(
+                engine.scan_records(
+                    id=found.id, query=request.query, sort=paginated_sort, include_fields=request.fields, limit=limit
+                )
+            )
 
-        docs = list(docs)
+        docs = await run_blocking(_scan_records)
         for doc in docs:
             # Removing sort config for each document and keep the last one, used for next page configuration
             paginated_sort.next_search_params = doc.pop("sort", None)
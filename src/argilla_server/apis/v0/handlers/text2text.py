@@ -17,7 +17,11 @@ from fastapi import APIRouter, Depends, Query, Security
 
 from argilla_server.apis.v0.handlers import metrics
 from argilla_server.apis.v0.models.commons.model import BulkResponse
-from argilla_server.apis.v0.models.commons.params import CommonTaskHandlerDependencies, RequestPagination
+from argilla_server.apis.v0.models.commons.params import (
+    BulkRequestParams,
+    CommonTaskHandlerDependencies,
+    RequestPagination,
+)
 from argilla_server.apis.v0.models.text2text import (
     Text2TextBulkRequest,
     Text2TextMetrics,
@@ -34,6 +38,7 @@ from argilla_server.security import auth
 from argilla_server.services.datasets import DatasetsService
 from argilla_server.services.tasks.text2text import Text2TextService
 from argilla_server.services.tasks.text2text.models import ServiceText2TextQuery, ServiceText2TextRecord
+from argilla_server.utils.concurrency import run_blocking
 
 
 def configure_router():
@@ -59,6 +64,7 @@ def configure_router():
         name: str,
         bulk: Text2TextBulkRequest,
         common_params: CommonTaskHandlerDependencies = Depends(),
+        bulk_params: BulkRequestParams = Depends(),
         service: Text2TextService = Depends(Text2TextService.get_instance),
         datasets: DatasetsService = Depends(DatasetsService.get_instance),
         current_user: User = Security(auth.get_current_user),
@@ -73,6 +79,7 @@ def configure_router():
         result = await service.add_records(
             dataset=dataset,
             records=[ServiceText2TextRecord.parse_obj(r) for r in bulk.records],
+            refresh=bulk_params.refresh,
         )
 
         return BulkResponse(dataset=name, processed=result.processed, failed=result.failed)
@@ -101,7 +108,8 @@ def configure_router():
             task=task_type,
             workspace=common_params.workspace,
         )
-        result = service.search(
+        result = await run_blocking(
+            service.search,
             dataset=dataset,
             query=ServiceText2TextQuery.parse_obj(query),
             sort_by=search.sort,
@@ -20,7 +20,11 @@ from fastapi import APIRouter, Depends, Query, Security
 from argilla_server.apis.v0.handlers import metrics, text_classification_dataset_settings
 from argilla_server.apis.v0.helpers import deprecate_endpoint
 from argilla_server.apis.v0.models.commons.model import BulkResponse
-from argilla_server.apis.v0.models.commons.params import CommonTaskHandlerDependencies, RequestPagination
+from argilla_server.apis.v0.models.commons.params import (
+    BulkRequestParams,
+    CommonTaskHandlerDependencies,
+    RequestPagination,
+)
 from argilla_server.apis.v0.models.text_classification import (
     CreateLabelingRule,
     DatasetLabelingRulesMetricsSummary,
@@ -47,6 +51,7 @@ from argilla_server.services.tasks.text_classification.model import (
     ServiceTextClassificationQuery,
     ServiceTextClassificationRecord,
 )
+from argilla_server.utils.concurrency import run_blocking
 
 
 def configure_router():
@@ -74,6 +79,7 @@ def configure_router():
         name: str,
         bulk: TextClassificationBulkRequest,
         common_params: CommonTaskHandlerDependencies = Depends(),
+        bulk_params: BulkRequestParams = Depends(),
         service: TextClassificationService = Depends(TextClassificationService.get_instance),
         datasets: DatasetsService = Depends(DatasetsService.get_instance),
         validator: DatasetValidator = Depends(DatasetValidator.get_instance),
@@ -90,7 +96,7 @@ def configure_router():
         records = [ServiceTextClassificationRecord.parse_obj(r) for r in bulk.records]
         await validator.validate_dataset_records(user=current_user, dataset=dataset, records=records)
 
-        result = await service.add_records(dataset=dataset, records=records)
+        result = await service.add_records(dataset=dataset, records=records, refresh=bulk_params.refresh)
         return BulkResponse(dataset=name, processed=result.processed, failed=result.failed)
 
     @router.post(
@@ -146,7 +152,8 @@ def configure_router():
             task=task_type,
             workspace=common_params.workspace,
         )
-        result = service.search(
+        result = await run_blocking(
+            service.search,
             dataset=dataset,
             query=ServiceTextClassificationQuery.parse_obj(query),
             sort_by=search.sort,
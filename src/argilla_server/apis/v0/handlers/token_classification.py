@@ -17,7 +17,11 @@ from fastapi import APIRouter, Depends, Query, Security
 
 from argilla_server.apis.v0.handlers import metrics, token_classification_dataset_settings
 from argilla_server.apis.v0.models.commons.model import BulkResponse
-from argilla_server.apis.v0.models.commons.params import CommonTaskHandlerDependencies, RequestPagination
+from argilla_server.apis.v0.models.commons.params import (
+    BulkRequestParams,
+    CommonTaskHandlerDependencies,
+    RequestPagination,
+)
 from argilla_server.apis.v0.models.token_classification import (
     TokenClassificationAggregations,
     TokenClassificationBulkRequest,
@@ -38,6 +42,7 @@ from argilla_server.services.tasks.token_classification.model import (
     ServiceTokenClassificationQuery,
     ServiceTokenClassificationRecord,
 )
+from argilla_server.utils.concurrency import run_blocking
 
 
 def configure_router():
@@ -63,6 +68,7 @@ def configure_router():
         name: str,
         bulk: TokenClassificationBulkRequest,
         common_params: CommonTaskHandlerDependencies = Depends(),
+        bulk_params: BulkRequestParams = Depends(),
         service: TokenClassificationService = Depends(TokenClassificationService.get_instance),
         datasets: DatasetsService = Depends(DatasetsService.get_instance),
         validator: DatasetValidator = Depends(DatasetValidator.get_instance),
@@ -79,7 +85,7 @@ def configure_router():
         # TODO(@frascuchon): validator can be applied in service layer
         await validator.validate_dataset_records(user=current_user, dataset=dataset, records=records)
 
-        result = await service.add_records(dataset=dataset, records=records)
+        result = await service.add_records(dataset=dataset, records=records, refresh=bulk_params.refresh)
         return BulkResponse(dataset=name, processed=result.processed, failed=result.failed)
 
     @router.post(
@@ -110,7 +116,8 @@ def configure_router():
             task=task_type,
             workspace=common_params.workspace,
         )
-        results = service.search(
+        results = await run_blocking(
+            service.search,
             dataset=dataset,
             query=ServiceTokenClassificationQuery.parse_obj(query),
             sort_by=search.sort,
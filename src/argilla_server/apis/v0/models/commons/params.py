@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 from dataclasses import dataclass
+from typing import Optional
 
 from fastapi import Header, Path, Query
 
@@ -30,6 +31,17 @@ class RequestPagination:
     from_: int = Query(0, ge=0, le=10000, alias="from", description="Record sequence from")
 
 
+@dataclass
+class BulkRequestParams:
+    """Bulk write query params"""
+
+    refresh: Optional[bool] = Query(
+        None,
+        description="If true, wait until the written records are visible to searches before returning. If false, return"
+        " right after writing them (the dataset can be refreshed later). If not provided, the server setting is used",
+    )
+
+
 @dataclass
 class OptionalWorkspaceRequestDependency:
     """Common task query dependencies"""
@@ -18,15 +18,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from argilla_server.contexts import accounts, datasets
+from argilla_server.contexts import accounts, datasets, outbox
 from argilla_server.database import get_async_db
-from argilla_server.enums import ResponseStatus
 from argilla_server.models import Dataset as DatasetModel
 from argilla_server.models import User
 from argilla_server.policies import DatasetPolicyV1, MetadataPropertyPolicyV1, authorize, is_authorized
 from argilla_server.schemas.v1.datasets import (
     Dataset,
     DatasetCreate,
+    DatasetIndexingStatus,
     DatasetMetrics,
     DatasetProgress,
     Datasets,
@@ -143,23 +143,7 @@ async def get_current_user_dataset_metrics(
 
     await authorize(current_user, DatasetPolicyV1.get(dataset))
 
-    return {
-        "records": {
-            "count": await datasets.count_records_by_dataset_id(db, dataset_id),
-        },
-        "responses": {
-            "count": await datasets.count_responses_by_dataset_id_and_user_id(db, dataset_id, current_user.id),
-            "submitted": await datasets.count_responses_by_dataset_id_and_user_id(
-                db, dataset_id, current_user.id, ResponseStatus.submitted
-            ),
-            "discarded": await datasets.count_responses_by_dataset_id_and_user_id(
-                db, dataset_id, current_user.id, ResponseStatus.discarded
-            ),
-            "draft": await datasets.count_responses_by_dataset_id_and_user_id(
-                db, dataset_id, current_user.id, ResponseStatus.draft
-            ),
-        },
-    }
+    return await datasets.get_user_dataset_metrics(db, dataset_id, current_user.id)
 
 
 @router.get("/datasets/{dataset_id}/progress", response_model=DatasetProgress)
@@ -176,6 +160,20 @@ async def get_dataset_progress(
     return await datasets.get_dataset_progress(db, dataset_id)
 
 
+@router.get("/datasets/{dataset_id}/indexing-status", response_model=DatasetIndexingStatus)
+async def get_dataset_indexing_status(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    dataset_id: UUID,
+    current_user: User = Security(auth.get_current_user),
+):
+    dataset = await _get_dataset_or_raise(db, dataset_id)
+
+    await authorize(current_user, DatasetPolicyV1.get(dataset))
+
+    return await outbox.get_dataset_indexing_status(db, dataset_id)
+
+
 @router.post("/datasets", status_code=status.HTTP_201_CREATED, response_model=Dataset)
 async def create_dataset(
     *,
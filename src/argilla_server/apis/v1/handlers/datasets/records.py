@@ -13,7 +13,8 @@
 #  limitations under the License.
 
 import re
-from typing import Dict, List, Optional, Tuple, Union
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
@@ -42,10 +43,13 @@ from argilla_server.schemas.v1.records import (
     RecordIncludeParam,
     Records,
     RecordsCreate,
+    RecordsSimilarityQuery,
     RecordsUpdate,
     SearchRecord,
     SearchRecordsQuery,
     SearchRecordsResult,
+    SearchRecordsSimilarityQuery,
+    SearchRecordsSimilarityResult,
     TermsFilter,
 )
 from argilla_server.schemas.v1.records import Record as RecordSchema
@@ -64,16 +68,22 @@ from argilla_server.search_engine import (
     MetadataFilter,
     SearchEngine,
     SearchResponses,
+    SimilarityQuery,
     SortBy,
     TermsMetadataFilter,
     UserResponseStatusFilter,
     get_search_engine,
 )
 from argilla_server.security import auth
+from argilla_server.settings import settings
 from argilla_server.telemetry import TelemetryClient, get_telemetry_client
 from argilla_server.utils import parse_query_param, parse_uuids
 
 LIST_DATASET_RECORDS_LIMIT_DEFAULT = 50
+LIST_DATASET_RECORDS_CURSOR_DESCRIPTION = (
+    f"Cursor used to paginate the records instead of using `offset`. Use `{search_engine.SEARCH_CURSOR_START}` to get "
+    "the first page and the returned `next_cursor` to get the following ones"
+)
 LIST_DATASET_RECORDS_LIMIT_LE = 1000
 LIST_DATASET_RECORDS_DEFAULT_SORT_BY = {RecordSortField.inserted_at.value: "asc"}
 DELETE_DATASET_RECORDS_LIMIT = 100
@@ -116,29 +126,95 @@ async def _filter_records_using_search_engine(
     response_statuses: Optional[List[ResponseStatusFilter]] = None,
     include: Optional[RecordIncludeParam] = None,
     sort_by_query_param: Optional[Dict[str, str]] = None,
-) -> Tuple[List["Record"], int]:
+    cursor: Optional[str] = None,
+) -> Tuple[List[Union["Record", Dict[str, Any]]], int, Optional[str]]:
+    # Stored records don't include vectors, so they are read from the database when requested
+    with_records = settings.search_engine_hydrate_records and not (
+        include and (include.with_all_vectors or include.with_some_vector)
+    )
+
     search_responses = await _get_search_responses(
         db=db,
         search_engine=search_engine,
         dataset=dataset,
         limit=limit,
         offset=offset,
+        cursor=cursor,
         user=user,
         parsed_metadata=parsed_metadata,
         response_statuses=response_statuses,
         sort_by_query_param=sort_by_query_param,
+        with_records=with_records,
     )
 
-    record_ids = [response.record_id for response in search_responses.items]
     user_id = user.id if user else None
 
     return (
-        await datasets.get_records_by_ids(
-            db=db, dataset_id=dataset.id, user_id=user_id, records_ids=record_ids, include=include
-        ),
+        await _get_search_responses_records(db, dataset, search_responses, user_id=user_id, include=include),
         search_responses.total,
+        search_responses.next_cursor,
+    )
+
+
+async def _get_search_responses_records(
+    db: "AsyncSession",
+    dataset: DatasetModel,
+    search_responses: "SearchResponses",
+    user_id: Optional[UUID] = None,
+    include: Optional[RecordIncludeParam] = None,
+) -> List[Union["Record", Dict[str, Any]]]:
+    """Returns the records of the search responses, taking them from the search hits when the search engine returned
+    them and reading the rest (if any) from the database with a single query.
+
+    Records returned by the search engine are only used if they have the same `updated_at` as in the database, so
+    records changed by writes not synced with the search engine are read from the database too."""
+    hit_items = [item for item in search_responses.items if item.record is not None]
+    records_updated_at = (
+        await datasets.get_records_updated_at(db, dataset.id, [item.record_id for item in hit_items])
+        if hit_items
+        else {}
     )
 
+    records = {
+        item.record_id: _build_record_from_search_hit(item.record, user_id=user_id, include=include)
+        for item in hit_items
+        if _is_search_hit_record_up_to_date(item.record, records_updated_at.get(item.record_id))
+    }
+
+    missing_record_ids = [item.record_id for item in search_responses.items if item.record_id not in records]
+    if missing_record_ids:
+        missing_records = await datasets.get_records_by_ids(
+            db=db, dataset_id=dataset.id, user_id=user_id, records_ids=missing_record_ids, include=include
+        )
+        records.update(zip(missing_record_ids, missing_records))
+
+    return [records[item.record_id] for item in search_responses.items]
+
+
+def _is_search_hit_record_up_to_date(hit_record: Dict[str, Any], updated_at: Optional[datetime]) -> bool:
+    if updated_at is None or not hit_record.get("updated_at"):
+        return False
+
+    return datetime.fromisoformat(hit_record["updated_at"]) == updated_at
+
+
+def _build_record_from_search_hit(
+    hit_record: Dict[str, Any], user_id: Optional[UUID] = None, include: Optional[RecordIncludeParam] = None
+) -> Dict[str, Any]:
+    # Relationships are only returned when included, as when reading the records from the database
+    record = {key: value for key, value in hit_record.items() if key not in ("responses", "suggestions")}
+
+    if include and include.with_responses:
+        responses = list((hit_record.get("responses") or {}).values())
+        if user_id:
+            responses = [response for response in responses if response["user_id"] == str(user_id)]
+        record["responses"] = responses
+
+    if include and include.with_suggestions:
+        record["suggestions"] = list((hit_record.get("suggestions") or {}).values())
+
+    return record
+
 
 def _to_search_engine_filter_scope(scope: FilterScope, user: Optional[User]) -> search_engine.FilterScope:
     if isinstance(scope, RecordFilterScope):
@@ -188,10 +264,12 @@ async def _get_search_responses(
     parsed_metadata: List[MetadataParsedQueryParam],
     limit: int,
     offset: int,
+    cursor: Optional[str] = None,
     search_records_query: Optional[SearchRecordsQuery] = None,
     user: Optional[User] = None,
     response_statuses: Optional[List[ResponseStatusFilter]] = None,
     sort_by_query_param: Optional[Dict[str, str]] = None,
+    with_records: bool = False,
 ) -> "SearchResponses":
     search_records_query = search_records_query or SearchRecordsQuery()
 
@@ -204,6 +282,17 @@ async def _get_search_responses(
     filters = search_records_query.filters
     sort = search_records_query.sort
 
+    if cursor is not None and offset:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="`offset` cannot be used when paginating with `cursor`",
+        )
+    if cursor is not None and vector_query:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="`cursor` cannot be used with vector queries",
+        )
+
     vector_settings = None
     record = None
 
@@ -213,7 +302,7 @@ async def _get_search_responses(
             record = await _get_dataset_record_by_id_or_raise(db, dataset, vector_query.record_id)
             await record.awaitable_attrs.vectors
 
-            if not record.vector_value_by_vector_settings(vector_settings):
+            if record.vector_value_by_vector_settings(vector_settings) is None:
                 raise HTTPException(
                     status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                     detail=f"Record `{record.id}` does not have a vector for vector settings `{vector_settings.name}`",
@@ -268,8 +357,25 @@ async def _get_search_responses(
             search_params["filter"] = _to_search_engine_filter(filters, user=user)
         if sort:
             search_params["sort"] = _to_search_engine_sort(sort, user=user)
+        if cursor is not None:
+            search_params["cursor"] = cursor
+        if with_records:
+            search_params["with_records"] = True
+
+        try:
+            return await search_engine.search(**search_params)
+        except ValueError as err:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(err))
+
 
-        return await search_engine.search(**search_params)
+def _build_records_result(
+    result: Union[Records, SearchRecordsResult], cursor: Optional[str], next_cursor: Optional[str]
+) -> Union[Records, SearchRecordsResult]:
+    # `next_cursor` is only included in the response when paginating with cursors
+    if cursor is not None:
+        result.next_cursor = next_cursor
+
+    return result
 
 
 async def _build_metadata_filters(
@@ -379,6 +485,46 @@ async def _get_dataset_record_by_id_or_raise(db: "AsyncSession", dataset: Datase
     return record
 
 
+async def _get_similarity_queries(
+    db: "AsyncSession", dataset: Dataset, vector_settings: VectorSettings, queries: List[RecordsSimilarityQuery]
+) -> List[SimilarityQuery]:
+    records_ids = [query.record_id for query in queries if query.record_id is not None]
+
+    records_by_id = {}
+    if records_ids:
+        # All the records are fetched at once, including only the vector used for the similarity search
+        records = await datasets.get_records_by_ids(
+            db,
+            records_ids=records_ids,
+            dataset_id=dataset.id,
+            include=RecordIncludeParam(vectors=[vector_settings.name]),
+        )
+        records_by_id = {record.id: record for record in records if record is not None}
+
+    similarity_queries = []
+    for query in queries:
+        if query.record_id is None:
+            similarity_queries.append(SimilarityQuery(value=query.value))
+            continue
+
+        record = records_by_id.get(query.record_id)
+        if record is None or record.dataset_id != dataset.id:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Record with id `{query.record_id}` not found in dataset `{dataset.id}`.",
+            )
+
+        if record.vector_value_by_vector_settings(vector_settings) is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Record `{record.id}` does not have a vector for vector settings `{vector_settings.name}`",
+            )
+
+        similarity_queries.append(SimilarityQuery(record=record))
+
+    return similarity_queries
+
+
 async def _get_vector_settings_by_name_or_raise(
     db: "AsyncSession", dataset: Dataset, vector_name: str
 ) -> VectorSettings:
@@ -407,26 +553,28 @@ async def list_current_user_dataset_records(
     response_statuses: List[ResponseStatusFilter] = Query([], alias="response_status"),
     offset: int = 0,
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    cursor: Optional[str] = Query(None, description=LIST_DATASET_RECORDS_CURSOR_DESCRIPTION),
     current_user: User = Security(auth.get_current_user),
 ):
     dataset = await _get_dataset_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicyV1.get(dataset))
 
-    records, total = await _filter_records_using_search_engine(
+    records, total, next_cursor = await _filter_records_using_search_engine(
         db,
         search_engine,
         dataset=dataset,
         parsed_metadata=metadata.metadata_parsed,
         limit=limit,
         offset=offset,
+        cursor=cursor,
         user=current_user,
         response_statuses=response_statuses,
         include=include,
         sort_by_query_param=sort_by_query_param,
     )
 
-    return Records(items=records, total=total)
+    return _build_records_result(Records(items=records, total=total), cursor, next_cursor)
 
 
 @router.get("/datasets/{dataset_id}/records", response_model=Records, response_model_exclude_unset=True)
@@ -441,25 +589,27 @@ async def list_dataset_records(
     response_statuses: List[ResponseStatusFilter] = Query([], alias="response_status"),
     offset: int = 0,
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    cursor: Optional[str] = Query(None, description=LIST_DATASET_RECORDS_CURSOR_DESCRIPTION),
     current_user: User = Security(auth.get_current_user),
 ):
     dataset = await _get_dataset_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicyV1.list_records_with_all_responses(dataset))
 
-    records, total = await _filter_records_using_search_engine(
+    records, total, next_cursor = await _filter_records_using_search_engine(
         db,
         search_engine,
         dataset=dataset,
         parsed_metadata=metadata.metadata_parsed,
         limit=limit,
         offset=offset,
+        cursor=cursor,
         response_statuses=response_statuses,
         include=include,
         sort_by_query_param=sort_by_query_param or LIST_DATASET_RECORDS_DEFAULT_SORT_BY,
     )
 
-    return Records(items=records, total=total)
+    return _build_records_result(Records(items=records, total=total), cursor, next_cursor)
 
 
 @router.post(
@@ -567,6 +717,7 @@ async def search_current_user_dataset_records(
     response_statuses: List[ResponseStatusFilter] = Query([], alias="response_status"),
     offset: int = Query(0, ge=0),
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    cursor: Optional[str] = Query(None, description=LIST_DATASET_RECORDS_CURSOR_DESCRIPTION),
     current_user: User = Security(auth.get_current_user),
 ):
     dataset = await _get_dataset_or_raise(db, dataset_id, with_fields=True)
@@ -583,6 +734,7 @@ async def search_current_user_dataset_records(
         parsed_metadata=metadata.metadata_parsed,
         limit=limit,
         offset=offset,
+        cursor=cursor,
         user=current_user,
         response_statuses=response_statuses,
         sort_by_query_param=sort_by_query_param,
@@ -606,8 +758,86 @@ async def search_current_user_dataset_records(
             record=RecordSchema.from_orm(record), query_score=record_id_score_map[record.id]["query_score"]
         )
 
-    return SearchRecordsResult(
-        items=[record["search_record"] for record in record_id_score_map.values()], total=search_responses.total
+    return _build_records_result(
+        SearchRecordsResult(
+            items=[record["search_record"] for record in record_id_score_map.values()], total=search_responses.total
+        ),
+        cursor,
+        search_responses.next_cursor,
+    )
+
+
+@router.post(
+    "/me/datasets/{dataset_id}/records/search/similarity",
+    status_code=status.HTTP_200_OK,
+    response_model=SearchRecordsSimilarityResult,
+    response_model_exclude_unset=True,
+)
+async def search_current_user_dataset_records_by_similarity(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    search_engine: SearchEngine = Depends(get_search_engine),
+    dataset_id: UUID,
+    body: SearchRecordsSimilarityQuery,
+    include: Optional[RecordIncludeParam] = Depends(parse_record_include_param),
+    limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    current_user: User = Security(auth.get_current_user),
+):
+    dataset = await _get_dataset_or_raise(db, dataset_id, with_fields=True)
+
+    await authorize(current_user, DatasetPolicyV1.search_records(dataset))
+
+    await _validate_search_records_query(db, SearchRecordsQuery(filters=body.filters), dataset_id)
+
+    if (
+        body.text
+        and body.text.field
+        and not await datasets.get_field_by_name_and_dataset_id(db, body.text.field, dataset.id)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Field `{body.text.field}` not found in dataset `{dataset.id}`.",
+        )
+
+    vector_settings = await _get_vector_settings_by_name_or_raise(db, dataset, body.name)
+    similarity_queries = await _get_similarity_queries(db, dataset, vector_settings, body.queries)
+
+    try:
+        search_responses = await search_engine.similarity_search_many(
+            dataset=dataset,
+            vector_settings=vector_settings,
+            queries=similarity_queries,
+            query=body.text,
+            filter=_to_search_engine_filter(body.filters, user=current_user) if body.filters else None,
+            max_results=limit,
+            order=body.order,
+        )
+    except ValueError as err:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(err))
+
+    # Records found by several queries are fetched only once
+    records_ids = list({item.record_id: None for responses in search_responses for item in responses.items})
+    records = await datasets.get_records_by_ids(
+        db=db,
+        dataset_id=dataset_id,
+        records_ids=records_ids,
+        include=include,
+        user_id=current_user.id,
+    )
+    records_by_id = {record.id: RecordSchema.from_orm(record) for record in records if record is not None}
+
+    return SearchRecordsSimilarityResult(
+        items=[
+            SearchRecordsResult(
+                items=[
+                    SearchRecord(record=records_by_id[item.record_id], query_score=item.score)
+                    for item in responses.items
+                    if item.record_id in records_by_id
+                ],
+                total=responses.total,
+            )
+            for responses in search_responses
+        ]
     )
 
 
@@ -629,6 +859,7 @@ async def search_dataset_records(
     response_statuses: List[ResponseStatusFilter] = Query([], alias="response_status"),
     offset: int = Query(0, ge=0),
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    cursor: Optional[str] = Query(None, description=LIST_DATASET_RECORDS_CURSOR_DESCRIPTION),
     current_user: User = Security(auth.get_current_user),
 ):
     dataset = await _get_dataset_or_raise(db, dataset_id, with_fields=True)
@@ -644,6 +875,7 @@ async def search_dataset_records(
         search_records_query=body,
         limit=limit,
         offset=offset,
+        cursor=cursor,
         parsed_metadata=metadata.metadata_parsed,
         response_statuses=response_statuses,
         sort_by_query_param=sort_by_query_param,
@@ -666,8 +898,12 @@ async def search_dataset_records(
             record=RecordSchema.from_orm(record), query_score=record_id_score_map[record.id]["query_score"]
         )
 
-    return SearchRecordsResult(
-        items=[record["search_record"] for record in record_id_score_map.values()], total=search_responses.total
+    return _build_records_result(
+        SearchRecordsResult(
+            items=[record["search_record"] for record in record_id_score_map.values()], total=search_responses.total
+        ),
+        cursor,
+        search_responses.next_cursor,
     )
 
 
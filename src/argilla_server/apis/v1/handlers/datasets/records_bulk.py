@@ -12,18 +12,31 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import AsyncGenerator, List, Type, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Security
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Security
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
 
 from argilla_server.apis.v1.handlers.datasets.datasets import _get_dataset_or_raise
 from argilla_server.bulk.records_bulk import CreateRecordsBulk, UpsertRecordsBulk
-from argilla_server.database import get_async_db
+from argilla_server.database import AsyncSessionLocal, get_async_db
+from argilla_server.models import Dataset as DatasetModel
 from argilla_server.models import User
 from argilla_server.policies import DatasetPolicyV1, authorize
-from argilla_server.schemas.v1.records_bulk import RecordsBulk, RecordsBulkCreate, RecordsBulkUpsert
+from argilla_server.pydantic_v1 import ValidationError
+from argilla_server.schemas.v1.records import RecordCreate, RecordUpsert
+from argilla_server.schemas.v1.records_bulk import (
+    RECORDS_BULK_STREAM_DEFAULT_CHUNK_SIZE,
+    RECORDS_BULK_UPSERT_MAX_ITEMS,
+    RecordsBulk,
+    RecordsBulkChunkResult,
+    RecordsBulkCreate,
+    RecordsBulkUpsert,
+)
 from argilla_server.search_engine import SearchEngine, get_search_engine
 from argilla_server.security import auth
 from argilla_server.telemetry import TelemetryClient, get_telemetry_client
@@ -98,3 +111,175 @@ async def upsert_dataset_records_bulk(
         return records_bulk
     except ValueError as err:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(err))
+
+
+@router.post("/datasets/{dataset_id}/records/bulk/stream", response_class=StreamingResponse)
+async def create_dataset_records_bulk_stream(
+    *,
+    request: Request,
+    dataset_id: UUID,
+    chunk_size: int = Query(RECORDS_BULK_STREAM_DEFAULT_CHUNK_SIZE, ge=1, le=RECORDS_BULK_UPSERT_MAX_ITEMS),
+    db: AsyncSession = Depends(get_async_db),
+    search_engine: SearchEngine = Depends(get_search_engine),
+    current_user: User = Security(auth.get_current_user),
+    telemetry_client: TelemetryClient = Depends(get_telemetry_client),
+):
+    """Create records from a newline-delimited JSON body, committing them in chunks of `chunk_size` records.
+
+    One JSON line with the result of every chunk is streamed back. Processing stops on the first invalid chunk, but
+    previous chunks remain committed.
+    """
+    dataset = await _get_dataset_or_raise(db, dataset_id)
+
+    await authorize(current_user, DatasetPolicyV1.create_records(dataset))
+
+    return _RequestBodyStreamingResponse(
+        _stream_records_bulk_chunks(request, search_engine, telemetry_client, dataset_id, chunk_size, upsert=False),
+        media_type=_NDJSON_MEDIA_TYPE,
+    )
+
+
+@router.put("/datasets/{dataset_id}/records/bulk/stream", response_class=StreamingResponse)
+async def upsert_dataset_records_bulk_stream(
+    *,
+    request: Request,
+    dataset_id: UUID,
+    chunk_size: int = Query(RECORDS_BULK_STREAM_DEFAULT_CHUNK_SIZE, ge=1, le=RECORDS_BULK_UPSERT_MAX_ITEMS),
+    db: AsyncSession = Depends(get_async_db),
+    search_engine: SearchEngine = Depends(get_search_engine),
+    current_user: User = Security(auth.get_current_user),
+    telemetry_client: TelemetryClient = Depends(get_telemetry_client),
+):
+    """Upsert records from a newline-delimited JSON body, committing them in chunks of `chunk_size` records.
+
+    One JSON line with the result of every chunk is streamed back. Processing stops on the first invalid chunk, but
+    previous chunks remain committed.
+    """
+    dataset = await _get_dataset_or_raise(db, dataset_id)
+
+    await authorize(current_user, DatasetPolicyV1.upsert_records(dataset))
+
+    return _RequestBodyStreamingResponse(
+        _stream_records_bulk_chunks(request, search_engine, telemetry_client, dataset_id, chunk_size, upsert=True),
+        media_type=_NDJSON_MEDIA_TYPE,
+    )
+
+
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class _RequestBodyStreamingResponse(StreamingResponse):
+    """Streaming response sent while the request body is still being consumed.
+
+    The default `StreamingResponse` listens for client disconnections reading from `receive`, which would steal the
+    request body messages read by the response content generator.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+
+        if self.background is not None:
+            await self.background()
+
+
+async def _stream_records_bulk_chunks(
+    request: Request,
+    search_engine: SearchEngine,
+    telemetry_client: TelemetryClient,
+    dataset_id: UUID,
+    chunk_size: int,
+    upsert: bool,
+) -> AsyncGenerator[str, None]:
+    # The request session could be closed before the response content is streamed (dependencies with yield are
+    # exited before sending the response since FastAPI 0.106), so chunks are processed in their own session.
+    async with AsyncSessionLocal() as db:
+        dataset = await _get_dataset_or_raise(
+            db,
+            dataset_id,
+            with_fields=True,
+            with_questions=True,
+            with_metadata_properties=True,
+            with_vectors_settings=True,
+        )
+
+        chunk_i = 0
+        try:
+            async for items in _read_ndjson_chunks(request, RecordUpsert if upsert else RecordCreate, chunk_size):
+                result = await _process_records_bulk_chunk(db, search_engine, dataset, chunk_i, items, upsert)
+                yield result.json(exclude_none=True) + "\n"
+
+                if result.error:
+                    return
+
+                telemetry_client.track_data(action="DatasetRecordsCreated", data={"records": result.created})
+                if upsert:
+                    telemetry_client.track_data(action="DatasetRecordsUpdated", data={"records": result.updated})
+
+                chunk_i += 1
+        except ValueError as err:
+            yield RecordsBulkChunkResult(chunk=chunk_i, items=0, error=str(err)).json(exclude_none=True) + "\n"
+
+
+async def _process_records_bulk_chunk(
+    db: AsyncSession,
+    search_engine: SearchEngine,
+    dataset: DatasetModel,
+    chunk_i: int,
+    items: List[Union[RecordCreate, RecordUpsert]],
+    upsert: bool,
+) -> RecordsBulkChunkResult:
+    result = RecordsBulkChunkResult(chunk=chunk_i, items=len(items))
+
+    try:
+        if upsert:
+            records_bulk = await UpsertRecordsBulk(db, search_engine).upsert_records_bulk(
+                dataset, RecordsBulkUpsert(items=items)
+            )
+            result.updated = len(records_bulk.updated_item_ids)
+            result.created = len(records_bulk.items) - result.updated
+        else:
+            records_bulk = await CreateRecordsBulk(db, search_engine).create_records_bulk(
+                dataset, RecordsBulkCreate(items=items)
+            )
+            result.created = len(records_bulk.items)
+    except (ValueError, ValidationError) as err:
+        await db.rollback()
+        result.error = str(err)
+
+    return result
+
+
+async def _read_ndjson_chunks(
+    request: Request, schema: Type[Union[RecordCreate, RecordUpsert]], chunk_size: int
+) -> AsyncGenerator[List[Union[RecordCreate, RecordUpsert]], None]:
+    """Parse the request body lines into chunks of `chunk_size` items, keeping at most one chunk in memory."""
+    items = []
+    buffer = b""
+    line_i = 0
+
+    def parse(line: bytes) -> Union[RecordCreate, RecordUpsert]:
+        try:
+            return schema.parse_raw(line)
+        except ValidationError as err:
+            raise ValueError(f"Line {line_i} is not valid: {err}") from err
+
+    async for body_chunk in request.stream():
+        buffer += body_chunk
+        *lines, buffer = buffer.split(b"\n")
+
+        for line in lines:
+            line_i += 1
+            if not line.strip():
+                continue
+
+            items.append(parse(line))
+            if len(items) == chunk_size:
+                yield items
+                items = []
+
+    if buffer.strip():
+        line_i += 1
+        items.append(parse(buffer))
+
+    if items:
+        yield items
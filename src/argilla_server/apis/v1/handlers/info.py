@@ -17,6 +17,7 @@ from fastapi import APIRouter, Depends
 from argilla_server.contexts import info
 from argilla_server.schemas.v1.info import Status, Version
 from argilla_server.search_engine import SearchEngine, get_search_engine
+from argilla_server.security.authentication.users_cache import users_cache
 
 router = APIRouter(tags=["info"])
 
@@ -32,4 +33,5 @@ async def get_status(search_engine: SearchEngine = Depends(get_search_engine)):
         version=info.argilla_version(),
         search_engine=await search_engine.info(),
         memory=info.memory_status(),
+        users_cache=users_cache.stats(),
     )
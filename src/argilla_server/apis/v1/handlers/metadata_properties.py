@@ -12,16 +12,23 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Security, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.models import MetadataProperty, User
 from argilla_server.policies import MetadataPropertyPolicyV1, authorize
-from argilla_server.schemas.v1.metadata_properties import MetadataMetrics, MetadataProperty, MetadataPropertyUpdate
+from argilla_server.schemas.v1.metadata_properties import (
+    TERMS_METADATA_METRICS_SIZE_GE,
+    TERMS_METADATA_METRICS_SIZE_LE,
+    MetadataMetrics,
+    MetadataProperty,
+    MetadataPropertyUpdate,
+)
 from argilla_server.search_engine import SearchEngine, get_search_engine
 from argilla_server.security import auth
 
@@ -44,6 +51,17 @@ async def get_metadata_property_metrics(
     *,
     db: AsyncSession = Depends(get_async_db),
     metadata_property_id: UUID,
+    size: Optional[int] = Query(
+        None,
+        ge=TERMS_METADATA_METRICS_SIZE_GE,
+        le=TERMS_METADATA_METRICS_SIZE_LE,
+        description="Max number of most frequent terms returned for terms metadata properties (all by default)",
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="The `next_cursor` returned by a previous request to get the following most frequent terms. "
+        "Only the 16384 most frequent terms can be paginated",
+    ),
     search_engine: SearchEngine = Depends(get_search_engine),
     current_user: User = Security(auth.get_current_user),
 ):
@@ -51,7 +69,10 @@ async def get_metadata_property_metrics(
 
     await authorize(current_user, MetadataPropertyPolicyV1.get(metadata_property))
 
-    return await search_engine.compute_metrics_for(metadata_property)
+    try:
+        return await search_engine.compute_metrics_for(metadata_property, size=size, cursor=cursor)
+    except ValueError as err:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(err))
 
 
 @router.patch("/metadata-properties/{metadata_property_id}", response_model=MetadataProperty)
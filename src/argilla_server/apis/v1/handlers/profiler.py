@@ -0,0 +1,53 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from fastapi import APIRouter, HTTPException, Query, Security, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+
+from argilla_server.instrumentation.profiler import (
+    PROFILER_DEFAULT_DURATION,
+    PROFILER_DEFAULT_INTERVAL,
+    PROFILER_MAX_DURATION,
+    ProfilerBusyError,
+    format_collapsed_stacks,
+    profiler,
+)
+from argilla_server.models import User
+from argilla_server.policies import ProfilerPolicyV1, authorize
+from argilla_server.security import auth
+from argilla_server.settings import settings
+
+router = APIRouter(tags=["profiler"])
+
+
+@router.get("/profiler", response_class=PlainTextResponse)
+async def get_profile(
+    *,
+    duration: float = Query(PROFILER_DEFAULT_DURATION, gt=0, le=PROFILER_MAX_DURATION),
+    interval: float = Query(PROFILER_DEFAULT_INTERVAL, ge=0.001, le=1),
+    current_user: User = Security(auth.get_current_user),
+):
+    await authorize(current_user, ProfilerPolicyV1.profile)
+
+    if not settings.enable_profiler:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiler is not enabled")
+
+    try:
+        # The profile is taken from a worker thread so the requests being profiled keep being served meanwhile
+        stacks = await run_in_threadpool(profiler.profile, duration, interval)
+    except ProfilerBusyError as err:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(err))
+
+    return PlainTextResponse(format_collapsed_stacks(stacks))
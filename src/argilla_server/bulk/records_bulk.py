@@ -16,10 +16,13 @@ from datetime import datetime
 from typing import Dict, List, Sequence, Tuple, Union
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from argilla_server import instrumentation
+from argilla_server.contexts import counters, outbox
 from argilla_server.contexts.accounts import fetch_users_by_ids_as_dict
 from argilla_server.contexts.records import (
     fetch_records_by_external_ids_as_dict,
@@ -36,6 +39,7 @@ from argilla_server.schemas.v1.records_bulk import (
 from argilla_server.schemas.v1.responses import UserResponseCreate
 from argilla_server.schemas.v1.suggestions import SuggestionCreate
 from argilla_server.search_engine import SearchEngine
+from argilla_server.settings import settings
 from argilla_server.validators.records import RecordsBulkCreateValidator, RecordsBulkUpsertValidator
 from argilla_server.validators.responses import ResponseCreateValidator
 from argilla_server.validators.suggestions import SuggestionCreateValidator
@@ -49,7 +53,8 @@ class CreateRecordsBulk:
         self._search_engine = search_engine
 
     async def create_records_bulk(self, dataset: Dataset, bulk_create: RecordsBulkCreate) -> RecordsBulk:
-        await RecordsBulkCreateValidator(bulk_create, db=self._db).validate_for(dataset)
+        with instrumentation.span("validation"):
+            await RecordsBulkCreateValidator(bulk_create, db=self._db).validate_for(dataset)
 
         async with self._db.begin_nested():
             records = [
@@ -66,12 +71,25 @@ class CreateRecordsBulk:
             await self._db.flush(records)
 
             await self._upsert_records_relationships(records, bulk_create.items)
-            await _preload_records_relationships_before_index(self._db, records)
-            await self._search_engine.index_records(dataset, records)
+            await counters.update_dataset_counters(
+                self._db,
+                dataset.id,
+                after=await counters.fetch_records_responses_statuses(self._db, dataset.id, [r.id for r in records]),
+                records_delta=len(records),
+            )
+            await self._index_records(dataset, records)
 
         await self._db.commit()
         return RecordsBulk(items=records)
 
+    async def _index_records(self, dataset: Dataset, records: List[Record]) -> None:
+        if settings.search_engine_outbox_enabled:
+            # Records are indexed by the background outbox indexer once the transaction is committed
+            await outbox.enqueue_records(self._db, records)
+        else:
+            await _preload_records_relationships_before_index(self._db, records)
+            await self._search_engine.index_records(dataset, records)
+
     async def _upsert_records_relationships(self, records: List[Record], records_create: List[RecordCreate]) -> None:
 
         records_and_suggestions = list(zip(records, [r.suggestions for r in records_create]))
@@ -145,7 +163,7 @@ class CreateRecordsBulk:
         )
 
     async def _upsert_records_vectors(
-        self, records_and_vectors: List[Tuple[Record, Dict[str, List[float]]]]
+        self, records_and_vectors: List[Tuple[Record, Dict[str, np.ndarray]]]
     ) -> List[Vector]:
 
         upsert_many_vectors = []
@@ -182,10 +200,15 @@ class UpsertRecordsBulk(CreateRecordsBulk):
         found_records = await self._fetch_existing_dataset_records(dataset, bulk_upsert.items)
         # found_records is passed to the validator to avoid querying the database again, but ideally, it should be
         # computed inside the validator
-        RecordsBulkUpsertValidator(bulk_upsert, self._db, found_records).validate_for(dataset)
+        with instrumentation.span("validation"):
+            RecordsBulkUpsertValidator(bulk_upsert, self._db, found_records).validate_for(dataset)
 
         records = []
         async with self._db.begin_nested():
+            before = await counters.fetch_records_responses_statuses(
+                self._db, dataset.id, [record.id for record in found_records.values()]
+            )
+
             for record_upsert in bulk_upsert.items:
                 record = found_records.get(record_upsert.external_id or record_upsert.id)
                 if not record:
@@ -205,8 +228,14 @@ class UpsertRecordsBulk(CreateRecordsBulk):
             await self._db.flush(records)
 
             await self._upsert_records_relationships(records, bulk_upsert.items)
-            await _preload_records_relationships_before_index(self._db, records)
-            await self._search_engine.index_records(dataset, records)
+            await counters.update_dataset_counters(
+                self._db,
+                dataset.id,
+                before=before,
+                after=await counters.fetch_records_responses_statuses(self._db, dataset.id, [r.id for r in records]),
+                records_delta=len({record.id for record in records}) - len(before),
+            )
+            await self._index_records(dataset, records)
 
         await self._db.commit()
 
@@ -231,6 +260,7 @@ class UpsertRecordsBulk(CreateRecordsBulk):
         return {**records_by_external_id, **records_by_id}
 
 
+@instrumentation.instrumented("db.preload_relationships")
 async def _preload_records_relationships_before_index(db: "AsyncSession", records: Sequence[Record]) -> None:
     await db.execute(
         select(Record)
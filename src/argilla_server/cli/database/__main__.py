@@ -14,6 +14,7 @@
 
 import typer
 
+from .counters import rebuild_counters
 from .migrate import migrate_db
 from .revisions import revisions
 from .users import app as users_app
@@ -23,6 +24,7 @@ app = typer.Typer(help="Commands for Argilla server database management", no_arg
 app.add_typer(users_app, name="users")
 app.command(name="migrate", help="Run database migrations.")(migrate_db)
 app.command(name="revisions", help="Show available revisions.")(revisions)
+app.command(name="rebuild-counters", help="Rebuild datasets progress and metrics counters.")(rebuild_counters)
 
 if __name__ == "__main__":
     app()
@@ -0,0 +1,69 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+from typing import List, Optional
+from uuid import UUID
+
+import typer
+from rich.progress import Progress
+from sqlalchemy import select
+
+from argilla_server.cli.rich import echo_in_panel
+from argilla_server.contexts import counters
+from argilla_server.database import AsyncSessionLocal
+from argilla_server.models import Dataset
+
+
+async def _list_datasets_ids(feedback_dataset_id: Optional[UUID] = None) -> List[UUID]:
+    async with AsyncSessionLocal() as db:
+        query = select(Dataset.id).order_by(Dataset.inserted_at.asc())
+        if feedback_dataset_id is not None:
+            query = query.filter_by(id=feedback_dataset_id)
+
+        return (await db.execute(query)).scalars().all()
+
+
+async def _rebuild_counters(feedback_dataset_id: Optional[UUID] = None) -> None:
+    datasets_ids = await _list_datasets_ids(feedback_dataset_id)
+
+    if feedback_dataset_id is not None and not datasets_ids:
+        echo_in_panel(
+            f"Feedback dataset with id={feedback_dataset_id} not found.",
+            title="Feedback dataset not found",
+            title_align="left",
+            success=False,
+        )
+
+        raise typer.Exit(code=1)
+
+    with Progress() as progress:
+        task = progress.add_task("rebuilding feedback datasets counters...", total=len(datasets_ids))
+
+        for dataset_id in datasets_ids:
+            async with AsyncSessionLocal() as db:
+                await counters.refresh_dataset_counters(db, dataset_id)
+
+            progress.advance(task)
+
+
+def rebuild_counters(
+    feedback_dataset_id: Optional[UUID] = typer.Option(
+        None, help="The id of a feedback dataset to rebuild counters for"
+    )
+) -> None:
+    asyncio.run(_rebuild_counters(feedback_dataset_id))
+
+
+if __name__ == "__main__":
+    typer.run(rebuild_counters)
@@ -12,28 +12,309 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import asyncio
-from typing import AsyncGenerator, Optional
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 import typer
-from rich.progress import Progress
-from sqlalchemy import func, select
-from sqlalchemy.exc import NoResultFound
+from rich.progress import Progress, TaskID
+from sqlalchemy import ColumnElement, exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from argilla_server.cli.rich import echo_in_panel
 from argilla_server.database import AsyncSessionLocal
-from argilla_server.models import Dataset, Record, Response, Suggestion
+from argilla_server.models import Dataset, Record, Response, Suggestion, Vector
 from argilla_server.search_engine import SearchEngine, get_search_engine
 
+# Records changed up to this time before the reindex started are indexed again when it's completed, covering writes
+# that were in progress when the reindex started and the clock skew between the servers writing them
+CATCH_UP_MARGIN = timedelta(minutes=1)
+
+
+class ReindexCheckpoint:
+    """Keeps track of the reindexed datasets and records partitions in a file, so an interrupted reindex can be resumed
+    without reindexing again what was already indexed.
+
+    Every change is appended to the file as a JSON line, so saving the progress doesn't get slower as more partitions
+    are indexed. Partitions are identified by their last record id, so an unfinished dataset reindex can only be
+    resumed using the same batch size.
+    """
+
+    def __init__(self, path: Optional[str] = None, batch_size: int = 100):
+        self.path = path
+        self.batch_size = batch_size
+        self._datasets: Dict[str, dict] = {}
+
+        if path and os.path.exists(path):
+            with open(path) as file:
+                for line in file:
+                    if line.strip():
+                        self._apply(json.loads(line))
+
+        for dataset_id, dataset in self._datasets.items():
+            if not dataset["done"] and dataset["batch_size"] != batch_size:
+                raise ValueError(
+                    f"Reindex of dataset with id={dataset_id} was started with batch size {dataset['batch_size']} "
+                    f"and it can't be resumed using batch size {batch_size}."
+                )
+
+    def is_dataset_started(self, dataset_id: UUID) -> bool:
+        return str(dataset_id) in self._datasets
+
+    def is_dataset_done(self, dataset_id: UUID) -> bool:
+        return self._datasets.get(str(dataset_id), {}).get("done", False)
+
+    def is_partition_done(self, dataset_id: UUID, partition_end: UUID) -> bool:
+        return str(partition_end) in self._datasets.get(str(dataset_id), {}).get("partitions", set())
+
+    def get_dataset_index_name(self, dataset_id: UUID) -> str:
+        return self._datasets[str(dataset_id)]["index_name"]
+
+    def get_dataset_started_at(self, dataset_id: UUID) -> datetime:
+        return datetime.fromisoformat(self._datasets[str(dataset_id)]["started_at"])
+
+    def mark_dataset_started(self, dataset_id: UUID, index_name: str, started_at: datetime) -> None:
+        self._save(
+            {
+                "event": "dataset_started",
+                "dataset_id": str(dataset_id),
+                "index_name": index_name,
+                "started_at": started_at.isoformat(),
+                "batch_size": self.batch_size,
+            }
+        )
+
+    def mark_partition_done(self, dataset_id: UUID, partition_end: UUID) -> None:
+        self._save({"event": "partition_done", "dataset_id": str(dataset_id), "partition_end": str(partition_end)})
+
+    def mark_dataset_done(self, dataset_id: UUID) -> None:
+        self._save({"event": "dataset_done", "dataset_id": str(dataset_id)})
+
+    def _apply(self, event: dict) -> None:
+        dataset_id = event["dataset_id"]
+
+        if event["event"] == "dataset_started":
+            self._datasets[dataset_id] = {
+                "done": False,
+                "index_name": event["index_name"],
+                "started_at": event["started_at"],
+                "batch_size": event["batch_size"],
+                "partitions": set(),
+            }
+        elif event["event"] == "partition_done":
+            self._datasets[dataset_id]["partitions"].add(event["partition_end"])
+        elif event["event"] == "dataset_done":
+            self._datasets[dataset_id] = {"done": True}
+
+    def _save(self, event: dict) -> None:
+        self._apply(event)
+
+        if not self.path:
+            return
+
+        with open(self.path, "a") as file:
+            file.write(f"{json.dumps(event)}\n")
+
+
+@dataclass
+class _DatasetReindex:
+    dataset: Dataset
+    index_name: str
+    started_at: datetime
+    task: TaskID
+    pending_partitions: int = 0
+    all_partitions_queued: bool = False
+
+
+@dataclass
+class ReindexSummary:
+    datasets: int = 0
+    records: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
 
 class Reindexer:
-    YIELD_PER = 100
+    """Reindexes datasets records using `concurrency` workers, each one indexing a partition of `batch_size` records
+    (a keyset range over `Record.id`) at a time. Partitions of different datasets can be indexed concurrently.
+
+    Records are indexed into a new index while the current one keeps serving searches, and the search engine applies
+    the records writes done meanwhile to both indices. Once all partitions are indexed, records changed since the
+    reindex started (which could be indexed with outdated data by their partitions) are indexed again in a single pass,
+    records deleted meanwhile are removed, and the new index atomically replaces the current one.
+    """
+
+    def __init__(
+        self,
+        search_engine: SearchEngine,
+        progress: Progress,
+        checkpoint: ReindexCheckpoint,
+        concurrency: int = 4,
+        batch_size: int = 100,
+    ):
+        self._search_engine = search_engine
+        self._progress = progress
+        self._checkpoint = checkpoint
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+
+    async def reindex(self, datasets_ids: List[UUID]) -> ReindexSummary:
+        summary = ReindexSummary()
+        queue: "asyncio.Queue[Optional[Tuple[_DatasetReindex, UUID, UUID]]]" = asyncio.Queue(self._concurrency * 2)
+
+        # Partitions are queued while workers index them. If any of them fails the others are cancelled, so the
+        # producer is never blocked forever on a full queue (nor workers waiting on an empty one).
+        tasks = [asyncio.create_task(self._queue_datasets_partitions(queue, datasets_ids, summary))]
+        tasks += [asyncio.create_task(self._index_partitions(queue, summary)) for _ in range(self._concurrency)]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return summary
+
+    async def _queue_datasets_partitions(
+        self, queue: asyncio.Queue, datasets_ids: List[UUID], summary: ReindexSummary
+    ) -> None:
+        task = self._progress.add_task("reindexing feedback datasets...", total=len(datasets_ids))
+
+        for dataset_id in datasets_ids:
+            if not self._checkpoint.is_dataset_done(dataset_id):
+                await self._queue_dataset_partitions(queue, dataset_id)
+
+            summary.datasets += 1
+            self._progress.advance(task)
+
+        for _ in range(self._concurrency):
+            await queue.put(None)
+
+    async def _queue_dataset_partitions(self, queue: asyncio.Queue, dataset_id: UUID) -> None:
+        async with AsyncSessionLocal() as db:
+            dataset = await self.get_dataset(db, dataset_id)
+
+            if not self._checkpoint.is_dataset_started(dataset.id):
+                # The start time is taken from the database records, not from this host clock
+                last_updated_at = await self.get_dataset_last_updated_at(db, dataset)
+                started_at = last_updated_at - CATCH_UP_MARGIN if last_updated_at else datetime.min
+                index_name = await self._search_engine.create_reindex_index(dataset)
+                self._checkpoint.mark_dataset_started(dataset.id, index_name, started_at)
+
+            dataset_reindex = _DatasetReindex(
+                dataset=dataset,
+                index_name=self._checkpoint.get_dataset_index_name(dataset.id),
+                started_at=self._checkpoint.get_dataset_started_at(dataset.id),
+                task=self._progress.add_task(
+                    f"reindexing feedback dataset `{dataset.name}` records...",
+                    total=await self.count_dataset_records(db, dataset),
+                ),
+            )
+
+            async for partition_start, partition_end, partition_size in self._list_dataset_partitions(db, dataset):
+                if self._checkpoint.is_partition_done(dataset.id, partition_end):
+                    self._progress.advance(dataset_reindex.task, advance=partition_size)
+                    continue
+
+                dataset_reindex.pending_partitions += 1
+                await queue.put((dataset_reindex, partition_start, partition_end))
+
+            dataset_reindex.all_partitions_queued = True
+            await self._complete_dataset_reindex_if_done(dataset_reindex)
+
+    async def _list_dataset_partitions(
+        self, db: AsyncSession, dataset: Dataset, updated_since: Optional[datetime] = None
+    ):
+        partition_start = None
+        while True:
+            query = select(Record.id).filter_by(dataset_id=dataset.id).order_by(Record.id.asc()).limit(self._batch_size)
+            if updated_since is not None:
+                query = query.filter(_record_updated_since(updated_since))
+            if partition_start is not None:
+                query = query.filter(Record.id > partition_start)
+
+            records_ids = (await db.execute(query)).scalars().all()
+            if not records_ids:
+                return
+
+            yield records_ids[0], records_ids[-1], len(records_ids)
+            partition_start = records_ids[-1]
+
+    async def _index_partitions(self, queue: asyncio.Queue, summary: ReindexSummary) -> None:
+        while (item := await queue.get()) is not None:
+            dataset_reindex, partition_start, partition_end = item
+
+            async with AsyncSessionLocal() as db:
+                records = await self.get_dataset_records_partition(
+                    db, dataset_reindex.dataset, partition_start, partition_end
+                )
+                await self._search_engine.reindex_records(dataset_reindex.dataset, records, dataset_reindex.index_name)
+
+            self._checkpoint.mark_partition_done(dataset_reindex.dataset.id, partition_end)
+            summary.records += len(records)
+            self._progress.advance(dataset_reindex.task, advance=len(records))
+
+            dataset_reindex.pending_partitions -= 1
+            await self._complete_dataset_reindex_if_done(dataset_reindex)
+
+    async def _complete_dataset_reindex_if_done(self, dataset_reindex: _DatasetReindex) -> None:
+        if not dataset_reindex.all_partitions_queued or dataset_reindex.pending_partitions > 0:
+            return
+
+        index_name = dataset_reindex.index_name
+        async with AsyncSessionLocal() as db:
+            # The dataset is loaded again, so metadata properties or vectors settings added meanwhile are indexed
+            dataset = await self.get_dataset(db, dataset_reindex.dataset.id)
+
+        await self._reindex_records_updated_since(dataset, index_name, dataset_reindex.started_at)
+        await self._delete_reindexed_records_not_found(dataset, index_name)
+
+        await self._search_engine.swap_reindex_index(dataset, index_name)
+        self._checkpoint.mark_dataset_done(dataset.id)
+
+    async def _reindex_records_updated_since(self, dataset: Dataset, index_name: str, updated_since: datetime) -> None:
+        async with AsyncSessionLocal() as db:
+            async for partition_start, partition_end, _ in self._list_dataset_partitions(
+                db, dataset, updated_since=updated_since
+            ):
+                records = await self.get_dataset_records_partition(
+                    db, dataset, partition_start, partition_end, updated_since=updated_since
+                )
+                await self._search_engine.reindex_records(dataset, records, index_name)
+
+    async def _delete_reindexed_records_not_found(self, dataset: Dataset, index_name: str) -> None:
+        # Records deleted while their partition was being indexed are deleted from the new index
+        async with AsyncSessionLocal() as db:
+            after = None
+            while records_ids := await self._search_engine.list_reindex_records_ids(
+                dataset, index_name, after=after, limit=self._batch_size
+            ):
+                found_records_ids = set(
+                    (await db.execute(select(Record.id).filter(Record.id.in_(records_ids)))).scalars().all()
+                )
+                not_found_records_ids = [record_id for record_id in records_ids if record_id not in found_records_ids]
+                if not_found_records_ids:
+                    await self._search_engine.delete_reindex_records(dataset, not_found_records_ids, index_name)
+
+                after = records_ids[-1]
 
     @classmethod
-    async def reindex_dataset(cls, db: AsyncSession, search_engine: SearchEngine, dataset_id: UUID) -> Dataset:
-        dataset = (
+    async def get_dataset(cls, db: AsyncSession, dataset_id: UUID) -> Dataset:
+        return (
             await db.execute(
                 select(Dataset)
                 .filter_by(id=dataset_id)
@@ -46,118 +327,119 @@ class Reindexer:
             )
         ).scalar_one()
 
-        await search_engine.delete_index(dataset)
-        await search_engine.create_index(dataset)
-
-        return dataset
-
     @classmethod
-    async def reindex_datasets(cls, db: AsyncSession, search_engine: SearchEngine) -> AsyncGenerator[Dataset, None]:
-        stream = await db.stream(
-            select(Dataset)
-            .order_by(Dataset.inserted_at.asc())
-            .options(
-                selectinload(Dataset.fields),
-                selectinload(Dataset.questions),
-                selectinload(Dataset.metadata_properties),
-                selectinload(Dataset.vectors_settings),
-            )
-            .execution_options(yield_per=cls.YIELD_PER)
-        )
-
-        async for dataset in stream.scalars():
-            await search_engine.delete_index(dataset)
-            await search_engine.create_index(dataset)
-
-            yield dataset
-
-    @classmethod
-    async def reindex_dataset_records(
-        cls, db: AsyncSession, search_engine: SearchEngine, dataset: Dataset
-    ) -> AsyncGenerator[list[Record], None]:
-        stream = await db.stream(
+    async def get_dataset_records_partition(
+        cls,
+        db: AsyncSession,
+        dataset: Dataset,
+        partition_start: UUID,
+        partition_end: UUID,
+        updated_since: Optional[datetime] = None,
+    ) -> List[Record]:
+        query = (
             select(Record)
-            .filter_by(dataset_id=dataset.id)
-            .order_by(Record.inserted_at.asc())
+            .filter(Record.dataset_id == dataset.id, Record.id >= partition_start, Record.id <= partition_end)
+            .order_by(Record.id.asc())
             .options(
                 selectinload(Record.responses).selectinload(Response.user),
                 selectinload(Record.suggestions).selectinload(Suggestion.question),
                 selectinload(Record.vectors),
             )
-            .execution_options(yield_per=cls.YIELD_PER)
         )
+        if updated_since is not None:
+            query = query.filter(_record_updated_since(updated_since))
 
-        async for records_partition in stream.partitions():
-            records = [record for (record,) in records_partition]
+        return (await db.execute(query)).scalars().all()
 
-            await search_engine.index_records(dataset, records)
+    @classmethod
+    async def list_datasets_ids(cls, db: AsyncSession, dataset_id: Optional[UUID] = None) -> List[UUID]:
+        query = select(Dataset.id).order_by(Dataset.inserted_at.asc())
+        if dataset_id is not None:
+            query = query.filter_by(id=dataset_id)
 
-            yield records
+        return (await db.execute(query)).scalars().all()
 
     @classmethod
-    async def count_datasets(cls, db: AsyncSession) -> int:
-        return (await db.execute(select(func.count(Dataset.id)))).scalar_one()
+    async def get_dataset_last_updated_at(cls, db: AsyncSession, dataset: Dataset) -> Optional[datetime]:
+        last_updated_at = [
+            (await db.execute(select(func.max(Record.updated_at)).filter_by(dataset_id=dataset.id))).scalar_one()
+        ]
+        for model in (Response, Suggestion, Vector):
+            last_updated_at.append(
+                (
+                    await db.execute(
+                        select(func.max(model.updated_at))
+                        .join(Record, Record.id == model.record_id)
+                        .filter(Record.dataset_id == dataset.id)
+                    )
+                ).scalar_one()
+            )
+
+        return max((updated_at for updated_at in last_updated_at if updated_at is not None), default=None)
 
     @classmethod
     async def count_dataset_records(cls, db: AsyncSession, dataset: Dataset) -> int:
         return (await db.execute(select(func.count(Record.id)).filter_by(dataset_id=dataset.id))).scalar_one()
 
 
-async def _reindex_dataset(db: AsyncSession, search_engine: SearchEngine, progress: Progress, dataset_id: UUID) -> None:
-    try:
-        dataset = await Reindexer.reindex_dataset(db, search_engine, dataset_id)
-    except NoResultFound as e:
+def _record_updated_since(updated_since: datetime) -> ColumnElement[bool]:
+    return or_(
+        Record.updated_at >= updated_since,
+        *(
+            exists().where(model.record_id == Record.id, model.updated_at >= updated_since)
+            for model in (Response, Suggestion, Vector)
+        ),
+    )
+
+
+async def _reindex(
+    feedback_dataset_id: Optional[UUID] = None,
+    concurrency: int = 4,
+    batch_size: int = 100,
+    checkpoint_file: Optional[str] = None,
+) -> None:
+    async with AsyncSessionLocal() as db:
+        datasets_ids = await Reindexer.list_datasets_ids(db, feedback_dataset_id)
+
+    if feedback_dataset_id is not None and not datasets_ids:
         echo_in_panel(
-            f"Feedback dataset with id={dataset_id} not found.",
+            f"Feedback dataset with id={feedback_dataset_id} not found.",
             title="Feedback dataset not found",
             title_align="left",
             success=False,
         )
 
-        raise typer.Exit(code=1) from e
-
-    task = progress.add_task(f"reindexing feedback dataset `{dataset.name}`...", total=1)
-
-    await _reindex_dataset_records(db, search_engine, progress, dataset)
-
-    progress.advance(task)
-
-
-async def _reindex_datasets(db: AsyncSession, search_engine: SearchEngine, progress: Progress) -> None:
-    task = progress.add_task(f"reindexing feedback datasets...", total=await Reindexer.count_datasets(db))
+        raise typer.Exit(code=1)
 
-    async for dataset in Reindexer.reindex_datasets(db, search_engine):
-        await _reindex_dataset_records(db, search_engine, progress, dataset)
-
-        progress.advance(task)
-
-
-async def _reindex_dataset_records(
-    db: AsyncSession, search_engine: SearchEngine, progress: Progress, dataset: Dataset
-) -> None:
-    task = progress.add_task(
-        f"reindexing feedback dataset `{dataset.name}` records...",
-        total=await Reindexer.count_dataset_records(db, dataset),
+    try:
+        checkpoint = ReindexCheckpoint(checkpoint_file, batch_size)
+    except ValueError as e:
+        echo_in_panel(str(e), title="Invalid checkpoint file", title_align="left", success=False)
+
+        raise typer.Exit(code=1)
+
+    async for search_engine in get_search_engine():
+        with Progress() as progress:
+            reindexer = Reindexer(search_engine, progress, checkpoint, concurrency=concurrency, batch_size=batch_size)
+            summary = await reindexer.reindex(datasets_ids)
+
+    echo_in_panel(
+        f"Reindexed {summary.records} records from {summary.datasets} feedback datasets in {summary.elapsed:.2f}s "
+        f"({summary.throughput:.2f} records/s).",
+        title="Reindex completed",
+        title_align="left",
     )
 
-    async for records in Reindexer.reindex_dataset_records(db, search_engine, dataset):
-        progress.advance(task, advance=len(records))
-
-
-async def _reindex(feedback_dataset_id: Optional[UUID] = None) -> None:
-    async with AsyncSessionLocal() as db:
-        async for search_engine in get_search_engine():
-            with Progress() as progress:
-                if feedback_dataset_id is not None:
-                    await _reindex_dataset(db, search_engine, progress, feedback_dataset_id)
-                else:
-                    await _reindex_datasets(db, search_engine, progress)
-
 
 def reindex(
-    feedback_dataset_id: Optional[UUID] = typer.Option(None, help="The id of a feedback dataset to be reindexed")
+    feedback_dataset_id: Optional[UUID] = typer.Option(None, help="The id of a feedback dataset to be reindexed"),
+    concurrency: int = typer.Option(4, min=1, help="Number of records partitions indexed concurrently"),
+    batch_size: int = typer.Option(100, min=1, help="Number of records indexed at once by every partition"),
+    checkpoint_file: Optional[str] = typer.Option(
+        None, help="File where the reindex progress is stored, so an interrupted reindex can be resumed"
+    ),
 ) -> None:
-    asyncio.run(_reindex(feedback_dataset_id))
+    asyncio.run(_reindex(feedback_dataset_id, concurrency, batch_size, checkpoint_file))
 
 
 if __name__ == "__main__":
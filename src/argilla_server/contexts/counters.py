@@ -0,0 +1,267 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy import and_, case, func, select, sql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.models import DatasetCounters, DatasetUserCounters, Record, Response, ResponseStatus
+
+RecordsResponsesStatuses = Dict[UUID, List[Tuple[Optional[UUID], ResponseStatus]]]
+
+_RECORD_STATUSES = ("submitted", "discarded", "conflicting")
+_USER_STATUSES = (ResponseStatus.submitted, ResponseStatus.discarded, ResponseStatus.draft)
+
+
+async def _get_dataset_counters_by_dataset_id(db: AsyncSession, dataset_id: UUID) -> Union[DatasetCounters, None]:
+    result = await db.execute(
+        select(DatasetCounters).filter_by(dataset_id=dataset_id).execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_dataset_counters(db: AsyncSession, dataset_id: UUID) -> DatasetCounters:
+    dataset_counters = await _get_dataset_counters_by_dataset_id(db, dataset_id)
+    if dataset_counters is None:
+        dataset_counters = await refresh_dataset_counters(db, dataset_id)
+
+    return dataset_counters
+
+
+async def get_dataset_user_counters(db: AsyncSession, dataset_id: UUID, user_id: UUID) -> DatasetUserCounters:
+    if await _get_dataset_counters_by_dataset_id(db, dataset_id) is None:
+        await refresh_dataset_counters(db, dataset_id)
+
+    result = await db.execute(
+        select(DatasetUserCounters)
+        .filter_by(dataset_id=dataset_id, user_id=user_id)
+        .execution_options(populate_existing=True)
+    )
+
+    return result.scalar_one_or_none() or DatasetUserCounters(
+        dataset_id=dataset_id, user_id=user_id, submitted=0, discarded=0, draft=0
+    )
+
+
+async def refresh_dataset_counters(db: AsyncSession, dataset_id: UUID) -> DatasetCounters:
+    submitted_sum = func.sum(case((Response.status == ResponseStatus.submitted, 1), else_=0))
+    discarded_sum = func.sum(case((Response.status == ResponseStatus.discarded, 1), else_=0))
+
+    records_statuses = (
+        select(submitted_sum.label("submitted"), discarded_sum.label("discarded"))
+        .select_from(Record)
+        .outerjoin(Response)
+        .filter(Record.dataset_id == dataset_id)
+        .group_by(Record.id)
+        .subquery()
+    )
+
+    submitted_clause = and_(records_statuses.c.submitted > 0, records_statuses.c.discarded == 0)
+    discarded_clause = and_(records_statuses.c.discarded > 0, records_statuses.c.submitted == 0)
+    conflicting_clause = and_(records_statuses.c.submitted > 0, records_statuses.c.discarded > 0)
+
+    records, submitted, discarded, conflicting = (
+        await db.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(case((submitted_clause, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((discarded_clause, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((conflicting_clause, 1), else_=0)), 0),
+            ).select_from(records_statuses)
+        )
+    ).one()
+
+    users_statuses = await db.execute(
+        select(Response.user_id, Response.status, func.count(Response.id))
+        .join(Record, and_(Record.id == Response.record_id, Record.dataset_id == dataset_id))
+        .filter(Response.user_id.isnot(None))
+        .group_by(Response.user_id, Response.status)
+    )
+
+    users_counters: Dict[UUID, Dict[str, int]] = {}
+    for user_id, status, count in users_statuses.all():
+        user_counters = users_counters.setdefault(user_id, {status.value: 0 for status in _USER_STATUSES})
+        user_counters[ResponseStatus(status).value] = count
+
+    async with db.begin_nested():
+        [dataset_counters] = await DatasetCounters.upsert_many(
+            db,
+            objects=[
+                {
+                    "dataset_id": dataset_id,
+                    "records": records,
+                    "submitted": submitted,
+                    "discarded": discarded,
+                    "conflicting": conflicting,
+                }
+            ],
+            constraints=[DatasetCounters.dataset_id],
+            autocommit=False,
+        )
+
+        await db.execute(
+            sql.delete(DatasetUserCounters).filter(
+                DatasetUserCounters.dataset_id == dataset_id,
+                DatasetUserCounters.user_id.notin_(list(users_counters.keys())),
+            )
+        )
+
+        if users_counters:
+            await DatasetUserCounters.upsert_many(
+                db,
+                objects=[
+                    {"dataset_id": dataset_id, "user_id": user_id, **counters}
+                    for user_id, counters in users_counters.items()
+                ],
+                constraints=[DatasetUserCounters.dataset_id, DatasetUserCounters.user_id],
+                autocommit=False,
+            )
+
+    await db.commit()
+
+    return dataset_counters
+
+
+async def fetch_records_responses_statuses(
+    db: AsyncSession, dataset_id: UUID, records_ids: Iterable[UUID]
+) -> RecordsResponsesStatuses:
+    """Locks the given dataset records and returns the `(user_id, status)` pairs of their responses.
+
+    Locking the records serializes concurrent writes over the same records, so the statuses read before a write are
+    still valid when the counters are updated with the statuses read after it.
+    """
+    records_ids = list(records_ids)
+    if not records_ids:
+        return {}
+
+    locked_records_ids = (
+        (
+            await db.execute(
+                select(Record.id)
+                .filter(Record.id.in_(records_ids), Record.dataset_id == dataset_id)
+                .order_by(Record.id)
+                .with_for_update()
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    records_responses_statuses = {record_id: [] for record_id in locked_records_ids}
+    if not records_responses_statuses:
+        return records_responses_statuses
+
+    result = await db.execute(
+        select(Response.record_id, Response.user_id, Response.status).filter(Response.record_id.in_(locked_records_ids))
+    )
+    for record_id, user_id, status in result.all():
+        records_responses_statuses[record_id].append((user_id, ResponseStatus(status)))
+
+    return records_responses_statuses
+
+
+async def update_dataset_counters(
+    db: AsyncSession,
+    dataset_id: UUID,
+    before: Optional[RecordsResponsesStatuses] = None,
+    after: Optional[RecordsResponsesStatuses] = None,
+    records_delta: int = 0,
+) -> None:
+    """Applies to the dataset counters the difference between the records responses statuses before and after a write.
+
+    Counters not initialized yet for the dataset are left untouched, they will be computed the first time they are
+    requested.
+    """
+    before, after = before or {}, after or {}
+
+    records_delta_by_status = _count_records_statuses(after.values())
+    records_delta_by_status.subtract(_count_records_statuses(before.values()))
+
+    users_delta_by_status = _count_users_statuses(after.values())
+    users_delta_by_status.subtract(_count_users_statuses(before.values()))
+
+    if records_delta == 0 and not any(records_delta_by_status.values()) and not any(users_delta_by_status.values()):
+        return
+
+    result = await db.execute(
+        sql.update(DatasetCounters)
+        .filter(DatasetCounters.dataset_id == dataset_id)
+        .values(
+            records=DatasetCounters.records + records_delta,
+            **{
+                status: getattr(DatasetCounters, status) + records_delta_by_status[status]
+                for status in _RECORD_STATUSES
+            },
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        return
+
+    users_ids = {user_id for user_id, _ in users_delta_by_status.keys()}
+    users_objects = [
+        {
+            "dataset_id": dataset_id,
+            "user_id": user_id,
+            **{status.value: users_delta_by_status[(user_id, status)] for status in _USER_STATUSES},
+        }
+        for user_id in users_ids
+        if any(users_delta_by_status[(user_id, status)] for status in _USER_STATUSES)
+    ]
+    if users_objects:
+        await DatasetUserCounters.increment_many(
+            db,
+            objects=users_objects,
+            constraints=[DatasetUserCounters.dataset_id, DatasetUserCounters.user_id],
+            autocommit=False,
+        )
+
+
+def _count_records_statuses(
+    records_responses_statuses: Iterable[Sequence[Tuple[Optional[UUID], ResponseStatus]]]
+) -> Counter:
+    counter = Counter()
+    for responses_statuses in records_responses_statuses:
+        record_status = _record_status({status for _, status in responses_statuses})
+        if record_status is not None:
+            counter[record_status] += 1
+
+    return counter
+
+
+def _count_users_statuses(
+    records_responses_statuses: Iterable[Sequence[Tuple[Optional[UUID], ResponseStatus]]]
+) -> Counter:
+    return Counter(
+        (user_id, status)
+        for responses_statuses in records_responses_statuses
+        for user_id, status in responses_statuses
+        if user_id is not None
+    )
+
+
+def _record_status(statuses: Union[set, frozenset]) -> Optional[str]:
+    submitted = ResponseStatus.submitted in statuses
+    discarded = ResponseStatus.discarded in statuses
+
+    if submitted and discarded:
+        return "conflicting"
+    if submitted:
+        return "submitted"
+    if discarded:
+        return "discarded"
+
+    return None
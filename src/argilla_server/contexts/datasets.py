@@ -11,8 +11,8 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import asyncio
 import copy
+from collections import defaultdict
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
@@ -31,15 +31,18 @@ from typing import (
 )
 from uuid import UUID
 
+import numpy as np
 import sqlalchemy
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import Select, and_, case, func, select
+from sqlalchemy import Select, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import contains_eager, joinedload, selectinload
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 import argilla_server.errors.future as errors
-from argilla_server.contexts import accounts, questions
-from argilla_server.enums import DatasetStatus, RecordInclude, UserRole
+from argilla_server import instrumentation
+from argilla_server.contexts import accounts, counters, outbox, questions
+from argilla_server.enums import DatasetStatus, RecordIndexProperty, UserRole
 from argilla_server.models import (
     Dataset,
     Field,
@@ -56,7 +59,10 @@ from argilla_server.models.suggestions import SuggestionCreateWithRecordId
 from argilla_server.schemas.v0.users import User
 from argilla_server.schemas.v1.datasets import (
     DatasetCreate,
+    DatasetMetrics,
     DatasetProgress,
+    RecordMetrics,
+    ResponseMetrics,
 )
 from argilla_server.schemas.v1.fields import FieldCreate
 from argilla_server.schemas.v1.metadata_properties import MetadataPropertyCreate, MetadataPropertyUpdate
@@ -390,52 +396,62 @@ async def get_records_by_ids(
     include: Optional["RecordIncludeParam"] = None,
     user_id: Optional[UUID] = None,
 ) -> List[Union[Record, None]]:
-    query = select(Record)
+    records_ids = list(records_ids)
 
-    if dataset_id:
-        query.filter(Record.dataset_id == dataset_id)
-
-    query = query.filter(Record.id.in_(records_ids))
+    query = select(Record).filter(Record.id.in_(records_ids))
 
-    if include and include.with_responses:
-        if not user_id:
-            query = query.options(joinedload(Record.responses))
-        else:
-            query = query.outerjoin(
-                Response, and_(Response.record_id == Record.id, Response.user_id == user_id)
-            ).options(contains_eager(Record.responses))
+    if dataset_id:
+        query = query.filter(Record.dataset_id == dataset_id)
 
-    query = await _configure_query_relationships(query=query, dataset_id=dataset_id, include_params=include)
+    query = _configure_query_relationships(query=query, dataset_id=dataset_id, include_params=include, user_id=user_id)
 
     result = await db.execute(query)
-    records = result.unique().scalars().all()
+    records_by_id = {record.id: record for record in result.scalars()}
 
     # Preserve the order of the `record_ids` list
-    record_order_map = {record.id: record for record in records}
-    ordered_records = [record_order_map.get(record_id, None) for record_id in records_ids]
+    return [records_by_id.get(record_id) for record_id in records_ids]
 
-    return ordered_records
 
+async def get_records_updated_at(
+    db: AsyncSession, dataset_id: UUID, records_ids: Iterable[UUID]
+) -> Dict[UUID, datetime]:
+    result = await db.execute(
+        select(Record.id, Record.updated_at).filter(Record.dataset_id == dataset_id, Record.id.in_(list(records_ids)))
+    )
 
-async def _configure_query_relationships(
-    query: "Select", dataset_id: UUID, include_params: Optional["RecordIncludeParam"] = None
+    return dict(result.all())
+
+
+def _configure_query_relationships(
+    query: "Select",
+    dataset_id: Optional[UUID],
+    include_params: Optional["RecordIncludeParam"] = None,
+    user_id: Optional[UUID] = None,
 ) -> "Select":
+    # Relationships are loaded with one additional query each (batched by records ids) instead of joining them to the
+    # records query, that would return the cartesian product of all the relationships rows for every record
     if not include_params:
         return query
 
+    if include_params.with_responses:
+        responses = Record.responses.and_(Response.user_id == user_id) if user_id else Record.responses
+        query = query.options(selectinload(responses))
+
     if include_params.with_suggestions:
-        query = query.options(joinedload(Record.suggestions))
+        query = query.options(selectinload(Record.suggestions))
 
     if include_params.with_all_vectors:
-        query = query.options(joinedload(Record.vectors).joinedload(Vector.vector_settings))
+        query = query.options(selectinload(Record.vectors).joinedload(Vector.vector_settings))
 
     elif include_params.with_some_vector:
         vector_settings_ids_subquery = select(VectorSettings.id).filter(
-            and_(VectorSettings.dataset_id == dataset_id, VectorSettings.name.in_(include_params.vectors))
+            VectorSettings.name.in_(include_params.vectors), VectorSettings.dataset_id == dataset_id
+        )
+        query = query.options(
+            selectinload(Record.vectors.and_(Vector.vector_settings_id.in_(vector_settings_ids_subquery))).joinedload(
+                Vector.vector_settings
+            )
         )
-        query = query.outerjoin(
-            Vector, and_(Vector.record_id == Record.id, Vector.vector_settings_id.in_(vector_settings_ids_subquery))
-        ).options(contains_eager(Record.vectors).joinedload(Vector.vector_settings))
 
     return query
 
@@ -445,33 +461,29 @@ async def count_records_by_dataset_id(db: AsyncSession, dataset_id: UUID) -> int
 
 
 async def get_dataset_progress(db: AsyncSession, dataset_id: UUID) -> DatasetProgress:
-    submitted_case = case((Response.status == ResponseStatus.submitted, 1), else_=0)
-    discarded_case = case((Response.status == ResponseStatus.discarded, 1), else_=0)
+    dataset_counters = await counters.get_dataset_counters(db, dataset_id)
 
-    submitted_clause = func.sum(submitted_case) > 0, func.sum(discarded_case) == 0
-    discarded_clause = func.sum(discarded_case) > 0, func.sum(submitted_case) == 0
-    conflicting_clause = func.sum(submitted_case) > 0, func.sum(discarded_case) > 0
-
-    query = select(Record.id).join(Response).filter(Record.dataset_id == dataset_id).group_by(Record.id)
-
-    total, submitted, discarded, conflicting = await asyncio.gather(
-        count_records_by_dataset_id(db, dataset_id),
-        db.execute(select(func.count("*")).select_from(query.having(*submitted_clause))),
-        db.execute(select(func.count("*")).select_from(query.having(*discarded_clause))),
-        db.execute(select(func.count("*")).select_from(query.having(*conflicting_clause))),
+    return DatasetProgress(
+        total=dataset_counters.records,
+        submitted=dataset_counters.submitted,
+        discarded=dataset_counters.discarded,
+        conflicting=dataset_counters.conflicting,
+        pending=dataset_counters.pending,
     )
 
-    submitted = submitted.scalar_one()
-    discarded = discarded.scalar_one()
-    conflicting = conflicting.scalar_one()
-    pending = total - submitted - discarded - conflicting
 
-    return DatasetProgress(
-        total=total,
-        submitted=submitted,
-        discarded=discarded,
-        conflicting=conflicting,
-        pending=pending,
+async def get_user_dataset_metrics(db: AsyncSession, dataset_id: UUID, user_id: UUID) -> DatasetMetrics:
+    dataset_counters = await counters.get_dataset_counters(db, dataset_id)
+    user_counters = await counters.get_dataset_user_counters(db, dataset_id, user_id)
+
+    return DatasetMetrics(
+        records=RecordMetrics(count=dataset_counters.records),
+        responses=ResponseMetrics(
+            count=user_counters.responses,
+            submitted=user_counters.submitted,
+            discarded=user_counters.discarded,
+            draft=user_counters.draft,
+        ),
     )
 
 
@@ -535,7 +547,7 @@ async def _validate_vector(
     db: AsyncSession,
     dataset_id: UUID,
     vector_name: str,
-    vector_value: List[float],
+    vector_value: np.ndarray,
     vectors_settings: Optional[Dict[str, VectorSettingsSchema]] = None,
 ) -> Dict[str, VectorSettingsSchema]:
     if vectors_settings is None:
@@ -613,6 +625,12 @@ async def create_records(
     async with db.begin_nested():
         db.add_all(records)
         await db.flush(records)
+        await counters.update_dataset_counters(
+            db,
+            dataset.id,
+            after=await counters.fetch_records_responses_statuses(db, dataset.id, [record.id for record in records]),
+            records_delta=len(records),
+        )
         await _preload_records_relationships_before_index(db, records)
         await search_engine.index_records(dataset, records)
 
@@ -731,8 +749,8 @@ VectorClass = TypeVar("VectorClass")
 async def _build_record_vectors(
     db: AsyncSession,
     dataset: Dataset,
-    vectors_dict: Dict[str, List[float]],
-    build_vector_func: Callable[[List[float], UUID], VectorClass],
+    vectors_dict: Dict[str, np.ndarray],
+    build_vector_func: Callable[[np.ndarray, UUID], VectorClass],
     cache: Optional[Dict[str, VectorSettingsSchema]] = None,
 ) -> List[VectorClass]:
     """Create vectors for a record."""
@@ -757,7 +775,7 @@ async def _exists_records_with_ids(db: AsyncSession, dataset_id: UUID, records_i
 
 async def _build_record_update(
     db: AsyncSession, record: Record, record_update: "RecordUpdateWithId", caches: Optional[Dict[str, Any]] = None
-) -> Tuple[Dict[str, Any], Union[List[Suggestion], None], List[VectorSchema], bool, Dict[str, Any]]:
+) -> Tuple[Dict[str, Any], Union[List[Suggestion], None], List[VectorSchema], Set[RecordIndexProperty], Dict[str, Any]]:
     if caches is None:
         caches = {
             "metadata_properties": {},
@@ -766,13 +784,13 @@ async def _build_record_update(
         }
 
     params = record_update.dict(exclude_unset=True)
-    needs_search_engine_update = False
+    search_engine_properties = set()
     suggestions = None
     vectors = []
 
     if "metadata_" in params:
         metadata = params["metadata_"]
-        needs_search_engine_update = True
+        search_engine_properties.add(RecordIndexProperty.metadata)
         if metadata is not None:
             caches["metadata_properties"] = await _validate_record_metadata(
                 db, record.dataset, metadata, caches["metadata_properties"]
@@ -784,6 +802,7 @@ async def _build_record_update(
         if len(questions_ids) != len(set(questions_ids)):
             raise ValueError("found duplicate suggestions question IDs")
         suggestions = await _build_record_suggestions(db, record, record_update.suggestions, caches["questions"])
+        search_engine_properties.add(RecordIndexProperty.suggestions)
 
     if record_update.vectors is not None:
         params.pop("vectors")
@@ -796,11 +815,12 @@ async def _build_record_update(
             ),
             cache=caches["vector_settings"],
         )
-        needs_search_engine_update = True
+        search_engine_properties.add(RecordIndexProperty.vectors)
 
-    return params, suggestions, vectors, needs_search_engine_update, caches
+    return params, suggestions, vectors, search_engine_properties, caches
 
 
+@instrumentation.instrumented("db.preload_relationships")
 async def _preload_records_relationships_before_index(db: AsyncSession, records: List[Record]) -> None:
     for record in records:
         await _preload_record_relationships_before_index(db, record)
@@ -818,6 +838,28 @@ async def _preload_record_relationships_before_index(db: AsyncSession, record: R
     )
 
 
+async def _preload_records_relationships_before_partial_update(
+    db: AsyncSession, records: List[Record], properties: Set[RecordIndexProperty]
+) -> None:
+    options = {}
+    if RecordIndexProperty.responses in properties:
+        options["responses"] = selectinload(Record.responses).selectinload(Response.user)
+    if RecordIndexProperty.suggestions in properties:
+        options["suggestions"] = selectinload(Record.suggestions).selectinload(Suggestion.question)
+    if RecordIndexProperty.vectors in properties:
+        options["vectors"] = selectinload(Record.vectors).selectinload(Vector.vector_settings)
+
+    if options:
+        # Relationships could have been changed using bulk statements, so they are reloaded
+        for record in records:
+            db.expire(record, attribute_names=list(options))
+
+        await db.execute(
+            select(Record).filter(Record.id.in_([record.id for record in records])).options(*options.values())
+        )
+
+
+@instrumentation.instrumented("db.preload_relationships")
 async def preload_records_relationships_before_validate(db: AsyncSession, records: List[Record]) -> None:
     await db.execute(
         select(Record)
@@ -847,6 +889,7 @@ async def update_records(
     # Lists to store the records that will be updated in the database or in the search engine
     records_update_objects: List[Dict[str, Any]] = []
     records_search_engine_update: List[UUID] = []
+    search_engine_properties: Set[RecordIndexProperty] = set()
     records_delete_suggestions: List[UUID] = []
 
     # Cache dictionaries to avoid querying the database multiple times
@@ -862,7 +905,7 @@ async def update_records(
     upsert_vectors = []
     for record_i, (record_update, record) in enumerate(zip(records_update.items, existing_records)):
         try:
-            params, record_suggestions, record_vectors, needs_search_engine_update, caches = await _build_record_update(
+            params, record_suggestions, record_vectors, record_properties, caches = await _build_record_update(
                 db, record, record_update, caches
             )
 
@@ -872,8 +915,9 @@ async def update_records(
 
             upsert_vectors.extend(record_vectors)
 
-            if needs_search_engine_update:
+            if record_properties:
                 records_search_engine_update.append(record_update.id)
+                search_engine_properties.update(record_properties)
 
             # Only update the record if there are params to update
             if len(params) > 1:
@@ -901,15 +945,12 @@ async def update_records(
             await Record.update_many(db, records_update_objects, autocommit=False)
 
         if records_search_engine_update:
-            records = await get_records_by_ids(
-                db,
-                dataset_id=dataset.id,
-                records_ids=records_search_engine_update,
-                include=RecordIncludeParam(keys=[RecordInclude.vectors], vectors=None),
-            )
-            await dataset.awaitable_attrs.vectors_settings
-            await _preload_records_relationships_before_index(db, records)
-            await search_engine.index_records(dataset, records)
+            records = await get_records_by_ids(db, dataset_id=dataset.id, records_ids=records_search_engine_update)
+            await dataset.awaitable_attrs.metadata_properties
+            await _preload_records_relationships_before_partial_update(db, records, search_engine_properties)
+            records = await outbox.requeue_pending_records(db, records)
+            if records:
+                await search_engine.partial_update_records(dataset, records, search_engine_properties)
 
     await db.commit()
 
@@ -918,8 +959,13 @@ async def delete_records(
     db: AsyncSession, search_engine: "SearchEngine", dataset: Dataset, records_ids: List[UUID]
 ) -> None:
     async with db.begin_nested():
+        before = await counters.fetch_records_responses_statuses(db, dataset.id, records_ids)
         params = [Record.id.in_(records_ids), Record.dataset_id == dataset.id]
         records = await Record.delete_many(db=db, params=params, autocommit=False)
+        await counters.update_dataset_counters(db, dataset.id, before=before, records_delta=-len(records))
+        # Records pending in the outbox are deleted from the search engine too, given that they could be indexed
+        # already with previous changes
+        await outbox.dequeue_records(db, [record.id for record in records])
         await search_engine.delete_records(dataset=dataset, records=records)
 
     await db.commit()
@@ -928,7 +974,7 @@ async def delete_records(
 async def update_record(
     db: AsyncSession, search_engine: "SearchEngine", record: Record, record_update: "RecordUpdate"
 ) -> Record:
-    params, suggestions, vectors, needs_search_engine_update, _ = await _build_record_update(
+    params, suggestions, vectors, search_engine_properties, _ = await _build_record_update(
         db, record, RecordUpdateWithId(id=record.id, **record_update.dict(by_alias=True, exclude_unset=True))
     )
 
@@ -946,10 +992,16 @@ async def update_record(
             )
             await db.refresh(record, attribute_names=["vectors"])
 
-        if needs_search_engine_update:
-            await record.dataset.awaitable_attrs.vectors_settings
-            await _preload_record_relationships_before_index(db, record)
-            await search_engine.index_records(record.dataset, [record])
+        if search_engine_properties:
+            await record.dataset.awaitable_attrs.metadata_properties
+            preload_properties = set(search_engine_properties)
+            if search_engine_properties & {RecordIndexProperty.metadata, RecordIndexProperty.vectors}:
+                # Responses are loaded too (but not indexed) so the returned record keeps including them as before
+                preload_properties.add(RecordIndexProperty.responses)
+
+            await _preload_records_relationships_before_partial_update(db, [record], preload_properties)
+            if not await _requeue_if_pending_index(db, record):
+                await search_engine.partial_update_records(record.dataset, [record], search_engine_properties)
 
     await db.commit()
     return record
@@ -957,7 +1009,11 @@ async def update_record(
 
 async def delete_record(db: AsyncSession, search_engine: "SearchEngine", record: Record) -> Record:
     async with db.begin_nested():
+        before = await counters.fetch_records_responses_statuses(db, record.dataset_id, [record.id])
         record = await record.delete(db=db, autocommit=False)
+        await db.flush()
+        await counters.update_dataset_counters(db, record.dataset_id, before=before, records_delta=-1)
+        await outbox.dequeue_records(db, [record.id])
         await search_engine.delete_records(dataset=record.dataset, records=[record])
 
     await db.commit()
@@ -997,12 +1053,26 @@ async def count_responses_by_dataset_id_and_user_id(
     ).scalar_one()
 
 
+async def _requeue_if_pending_index(db: AsyncSession, record: Record) -> bool:
+    """Returns True if the record is still waiting in the outbox to be indexed. It's enqueued again so the outbox
+    indexer indexes its latest changes, given that it can't be updated in the search engine yet."""
+    return not await outbox.requeue_pending_records(db, [record])
+
+
+async def _update_record_dataset_counters(
+    db: AsyncSession, record: Record, before: counters.RecordsResponsesStatuses
+) -> None:
+    after = await counters.fetch_records_responses_statuses(db, record.dataset_id, [record.id])
+    await counters.update_dataset_counters(db, record.dataset_id, before=before, after=after)
+
+
 async def create_response(
     db: AsyncSession, search_engine: SearchEngine, record: Record, user: User, response_create: ResponseCreate
 ) -> Response:
     ResponseCreateValidator(response_create).validate_for(record)
 
     async with db.begin_nested():
+        before = await counters.fetch_records_responses_statuses(db, record.dataset_id, [record.id])
         response = await Response.create(
             db,
             values=jsonable_encoder(response_create.values),
@@ -1013,8 +1083,10 @@ async def create_response(
         )
 
         await db.flush([response])
+        await _update_record_dataset_counters(db, record, before)
         await _touch_dataset_last_activity_at(db, record.dataset)
-        await search_engine.update_record_response(response)
+        if not await _requeue_if_pending_index(db, response.record):
+            await search_engine.update_record_response(response)
 
     await db.commit()
 
@@ -1027,6 +1099,7 @@ async def update_response(
     ResponseUpdateValidator(response_update).validate_for(response.record)
 
     async with db.begin_nested():
+        before = await counters.fetch_records_responses_statuses(db, response.record.dataset_id, [response.record_id])
         response = await response.update(
             db,
             values=jsonable_encoder(response_update.values),
@@ -1035,9 +1108,13 @@ async def update_response(
             autocommit=False,
         )
 
+        await db.flush([response])
+        await _update_record_dataset_counters(db, response.record, before)
+
         await _load_users_from_responses(response)
         await _touch_dataset_last_activity_at(db, response.record.dataset)
-        await search_engine.update_record_response(response)
+        if not await _requeue_if_pending_index(db, response.record):
+            await search_engine.update_record_response(response)
 
     await db.commit()
 
@@ -1057,6 +1134,7 @@ async def upsert_response(
     }
 
     async with db.begin_nested():
+        before = await counters.fetch_records_responses_statuses(db, record.dataset_id, [record.id])
         response = await Response.upsert(
             db,
             schema=schema,
@@ -1064,21 +1142,88 @@ async def upsert_response(
             autocommit=False,
         )
 
+        await _update_record_dataset_counters(db, record, before)
+
         await _load_users_from_responses(response)
         await _touch_dataset_last_activity_at(db, response.record.dataset)
-        await search_engine.update_record_response(response)
+        if not await _requeue_if_pending_index(db, response.record):
+            await search_engine.update_record_response(response)
 
     await db.commit()
 
     return response
 
 
+async def upsert_responses(
+    db: AsyncSession,
+    search_engine: SearchEngine,
+    user: User,
+    records_responses_upserts: List[Tuple[Record, ResponseUpsert]],
+) -> List[Response]:
+    """Upserts the (already validated) responses of the user using a single statement, database commit and search
+    engine bulk request. Responses are returned in the same order, and several upserts for the same record are
+    resolved keeping the last one (as if they were upserted one after another)."""
+    records_by_id = {record.id: record for record, _ in records_responses_upserts}
+    schemas_by_record_id = {
+        record.id: {
+            "values": jsonable_encoder(response_upsert.values),
+            "status": response_upsert.status,
+            "record_id": record.id,
+            "user_id": user.id,
+        }
+        for record, response_upsert in records_responses_upserts
+    }
+
+    records_ids_by_dataset_id = defaultdict(list)
+    for record in records_by_id.values():
+        records_ids_by_dataset_id[record.dataset_id].append(record.id)
+
+    async with db.begin_nested():
+        before = {
+            dataset_id: await counters.fetch_records_responses_statuses(db, dataset_id, records_ids)
+            for dataset_id, records_ids in records_ids_by_dataset_id.items()
+        }
+
+        responses = await Response.upsert_many(
+            db,
+            objects=list(schemas_by_record_id.values()),
+            constraints=[Response.record_id, Response.user_id],
+            autocommit=False,
+        )
+
+        for dataset_id, records_ids in records_ids_by_dataset_id.items():
+            after = await counters.fetch_records_responses_statuses(db, dataset_id, records_ids)
+            await counters.update_dataset_counters(db, dataset_id, before=before[dataset_id], after=after)
+            await _touch_dataset_last_activity_at(db, records_by_id[records_ids[0]].dataset)
+
+        for response in responses:
+            set_committed_value(response, "record", records_by_id[response.record_id])
+            set_committed_value(response, "user", user)
+
+        not_pending_records_ids = {
+            record.id for record in await outbox.requeue_pending_records(db, records_by_id.values())
+        }
+        not_pending_responses = [response for response in responses if response.record_id in not_pending_records_ids]
+        if not_pending_responses:
+            await search_engine.update_records_responses(not_pending_responses)
+
+    await db.commit()
+
+    responses_by_record_id = {response.record_id: response for response in responses}
+
+    return [responses_by_record_id[record.id] for record, _ in records_responses_upserts]
+
+
 async def delete_response(db: AsyncSession, search_engine: SearchEngine, response: Response) -> Response:
     async with db.begin_nested():
+        before = await counters.fetch_records_responses_statuses(db, response.record.dataset_id, [response.record_id])
         response = await response.delete(db, autocommit=False)
+        await db.flush()
+        await _update_record_dataset_counters(db, response.record, before)
         await _load_users_from_responses(response)
         await _touch_dataset_last_activity_at(db, response.record.dataset)
-        await search_engine.delete_record_response(response)
+        if not await _requeue_if_pending_index(db, response.record):
+            await search_engine.delete_record_response(response)
 
     await db.commit()
 
@@ -1136,7 +1281,8 @@ async def upsert_suggestion(
             autocommit=False,
         )
         await _preload_suggestion_relationships_before_index(db, suggestion)
-        await search_engine.update_record_suggestion(suggestion)
+        if not await _requeue_if_pending_index(db, record):
+            await search_engine.update_record_suggestion(suggestion)
 
     await db.commit()
 
@@ -1151,8 +1297,9 @@ async def delete_suggestions(
 
     async with db.begin_nested():
         await Suggestion.delete_many(db=db, params=params, autocommit=False)
-        for suggestion in suggestions:
-            await search_engine.delete_record_suggestion(suggestion)
+        if not await _requeue_if_pending_index(db, record):
+            for suggestion in suggestions:
+                await search_engine.delete_record_suggestion(suggestion)
 
     await db.commit()
 
@@ -1188,7 +1335,8 @@ async def list_suggestions_by_id_and_record_id(
 async def delete_suggestion(db: AsyncSession, search_engine: SearchEngine, suggestion: Suggestion) -> Suggestion:
     async with db.begin_nested():
         suggestion = await suggestion.delete(db, autocommit=False)
-        await search_engine.delete_record_suggestion(suggestion)
+        if not await _requeue_if_pending_index(db, suggestion.record):
+            await search_engine.delete_record_suggestion(suggestion)
 
     await db.commit()
 
@@ -0,0 +1,189 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select, sql, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from argilla_server.models import Dataset, Record, RecordOutbox, Response, Suggestion
+from argilla_server.schemas.v1.datasets import DatasetIndexingStatus
+from argilla_server.search_engine import SearchEngine
+from argilla_server.settings import settings
+
+_LOGGER = logging.getLogger("argilla")
+
+
+async def enqueue_records(db: AsyncSession, records: Sequence[Record]) -> None:
+    if not records:
+        return
+
+    await RecordOutbox.upsert_many(
+        db,
+        objects=[{"record_id": record.id, "dataset_id": record.dataset_id, "attempts": 0} for record in records],
+        constraints=[RecordOutbox.record_id],
+        autocommit=False,
+    )
+
+
+async def dequeue_records(db: AsyncSession, records_ids: Sequence[UUID]) -> None:
+    """Removes deleted records from the outbox, so they are not indexed anymore"""
+    if not records_ids:
+        return
+
+    await db.execute(sql.delete(RecordOutbox).filter(RecordOutbox.record_id.in_(records_ids)))
+
+
+async def requeue_pending_records(db: AsyncSession, records: Iterable[Record]) -> List[Record]:
+    """Enqueues again the records still waiting in the outbox to be indexed, so they are indexed with their latest
+    changes instead of being updated in the search engine, where they could be missing yet.
+
+    Returns the records that are not pending to be indexed, which must be updated in the search engine as usual.
+    """
+    records = list(records)
+    if not settings.search_engine_outbox_enabled or not records:
+        return records
+
+    pending_records_ids = set(
+        (
+            await db.execute(
+                select(RecordOutbox.record_id).filter(RecordOutbox.record_id.in_([record.id for record in records]))
+            )
+        ).scalars()
+    )
+    await enqueue_records(db, [record for record in records if record.id in pending_records_ids])
+
+    return [record for record in records if record.id not in pending_records_ids]
+
+
+async def index_pending_records(
+    db: AsyncSession, search_engine: SearchEngine, batch_size: int, max_attempts: int
+) -> int:
+    """Indexes up to `batch_size` outbox records and removes them from the outbox. Returns the number of indexed
+    records.
+
+    Outbox rows are claimed with `FOR UPDATE SKIP LOCKED`, so the indexers of several server workers never index the
+    same records. Records enqueued again while they were being indexed are kept in the outbox, so they are indexed
+    once more with their latest changes.
+
+    Records deleted while they are being indexed are deleted from the search engine once indexed.
+
+    If the records of a dataset cannot be indexed, their number of attempts is increased and they are queued behind
+    the other pending records. Records failing `max_attempts` times are not indexed again (they're reported as failed
+    by the dataset indexing status) until they are enqueued again.
+    """
+    pending = (
+        await db.execute(
+            select(RecordOutbox.record_id, RecordOutbox.dataset_id, RecordOutbox.updated_at)
+            .filter(RecordOutbox.attempts < max_attempts)
+            .order_by(RecordOutbox.attempts.asc(), RecordOutbox.inserted_at.asc())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+    ).all()
+    if not pending:
+        await db.commit()
+        return 0
+
+    records_ids_by_dataset_id: Dict[UUID, List[UUID]] = {}
+    for record_id, dataset_id, _ in pending:
+        records_ids_by_dataset_id.setdefault(dataset_id, []).append(record_id)
+
+    datasets = await db.execute(
+        select(Dataset)
+        .filter(Dataset.id.in_(records_ids_by_dataset_id.keys()))
+        .options(
+            selectinload(Dataset.fields),
+            selectinload(Dataset.questions),
+            selectinload(Dataset.metadata_properties),
+            selectinload(Dataset.vectors_settings),
+        )
+    )
+
+    failed_records_ids = set()
+    for dataset in datasets.scalars():
+        records = await db.execute(
+            select(Record)
+            .filter(Record.id.in_(records_ids_by_dataset_id[dataset.id]))
+            .options(
+                selectinload(Record.responses).selectinload(Response.user),
+                selectinload(Record.suggestions).selectinload(Suggestion.question),
+                selectinload(Record.vectors),
+            )
+        )
+        records = records.scalars().all()
+        try:
+            await search_engine.index_records(dataset, records)
+            # Records deleted while they were being indexed are removed again, so they don't come back to searches
+            deleted_records = await _filter_deleted_records(db, records)
+            if deleted_records:
+                await search_engine.delete_records(dataset, deleted_records)
+        except Exception as ex:
+            _LOGGER.error(f"Error indexing outbox records of dataset {dataset.id}: {ex}")
+            failed_records_ids.update(records_ids_by_dataset_id[dataset.id])
+
+    indexed = [(record_id, updated_at) for record_id, _, updated_at in pending if record_id not in failed_records_ids]
+    if indexed:
+        await db.execute(
+            sql.delete(RecordOutbox).filter(tuple_(RecordOutbox.record_id, RecordOutbox.updated_at).in_(indexed))
+        )
+    if failed_records_ids:
+        await db.execute(
+            sql.update(RecordOutbox)
+            .filter(RecordOutbox.record_id.in_(failed_records_ids))
+            .values(attempts=RecordOutbox.attempts + 1)
+        )
+    await db.commit()
+
+    return len(indexed)
+
+
+async def _filter_deleted_records(db: AsyncSession, records: Sequence[Record]) -> List[Record]:
+    if not records:
+        return []
+
+    existing_records_ids = set(
+        (await db.execute(select(Record.id).filter(Record.id.in_([record.id for record in records])))).scalars()
+    )
+
+    return [record for record in records if record.id not in existing_records_ids]
+
+
+async def get_dataset_indexing_status(db: AsyncSession, dataset_id: UUID) -> DatasetIndexingStatus:
+    max_attempts = settings.search_engine_outbox_max_attempts
+
+    pending, oldest_pending_at = (
+        await db.execute(
+            select(func.count(RecordOutbox.id), func.min(RecordOutbox.inserted_at)).filter(
+                RecordOutbox.dataset_id == dataset_id, RecordOutbox.attempts < max_attempts
+            )
+        )
+    ).one()
+    failed = (
+        await db.execute(
+            select(func.count(RecordOutbox.id)).filter(
+                RecordOutbox.dataset_id == dataset_id, RecordOutbox.attempts >= max_attempts
+            )
+        )
+    ).scalar_one()
+
+    return DatasetIndexingStatus(
+        pending=pending,
+        failed=failed,
+        oldest_pending_at=oldest_pending_at,
+        lag=(datetime.utcnow() - oldest_pending_at).total_seconds() if oldest_pending_at else 0.0,
+    )
@@ -177,7 +177,7 @@ class IClientAdapter(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def index_documents(self, index: str, docs: List[Dict[str, Any]]) -> int:
+    def index_documents(self, index: str, docs: List[Dict[str, Any]], refresh: bool = True) -> int:
         pass
 
     @abstractmethod
@@ -199,6 +199,10 @@ class IClientAdapter(metaclass=ABCMeta):
     def close_index(self, index: str):
         pass
 
+    @abstractmethod
+    def refresh_index(self, index: str):
+        pass
+
     @abstractmethod
     def clone_index(
         self,
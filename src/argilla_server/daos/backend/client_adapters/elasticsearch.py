@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 import dataclasses
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Optional
 
 import elasticsearch8
 
@@ -31,6 +31,7 @@ from elasticsearch8.helpers import BulkIndexError
 class ElasticsearchClient(OpenSearchClient):
     ES_CLIENT_VERSION = ES_CLIENT_VERSION
     query_builder = EsQueryBuilder()
+    bulk_helpers = helpers
 
     def __post_init__(self):
         self.__client__ = Elasticsearch(**self.config_backend)
@@ -80,21 +81,6 @@ class ElasticsearchClient(OpenSearchClient):
                 target_index=target_index,
             )
 
-    def bulk(
-        self,
-        *,
-        index: str,
-        actions: Iterable[dict],
-    ) -> Tuple:
-        with self.error_handling(index=index):
-            return helpers.bulk(
-                client=self.__client__,
-                index=index,
-                actions=actions,
-                raise_on_error=True,
-                refresh="wait_for",
-            )
-
     def _es_search(
         self,
         index: str,
@@ -34,6 +34,8 @@ class ClientAdapterFactory:
         ca_path: str,
         retry_on_timeout: bool = True,
         max_retries: int = 5,
+        bulk_chunk_size: int = 500,
+        bulk_thread_count: int = 1,
     ) -> IClientAdapter:
         client_config = dict(
             hosts=hosts,
@@ -63,7 +65,12 @@ class ClientAdapterFactory:
                 "Please, upgrade the backend to a supported version."
             )
 
-        return client_class(index_shards=index_shards, config_backend=client_config)
+        return client_class(
+            index_shards=index_shards,
+            config_backend=client_config,
+            bulk_chunk_size=bulk_chunk_size,
+            bulk_thread_count=bulk_thread_count,
+        )
 
     @classmethod
     def _fetch_cluster_version_info(cls, client_config: dict) -> Tuple[str, str]:
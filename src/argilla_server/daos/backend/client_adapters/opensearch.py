@@ -32,9 +32,14 @@ class OpenSearchClient(IClientAdapter):
     index_shards: int
 
     config_backend: Dict[str, Any]
+
+    bulk_chunk_size: int = 500
+    bulk_thread_count: int = 1
+
     highlight = HighlightParser()
 
     query_builder = OpenSearchQueryBuilder()
+    bulk_helpers = helpers
 
     def __post_init__(self):
         self.__client__ = OpenSearch(**self.config_backend)
@@ -115,15 +120,31 @@ class OpenSearchClient(IClientAdapter):
         *,
         index: str,
         actions: Iterable[dict],
-    ) -> Tuple:
+        refresh: bool = True,
+    ) -> Tuple[int, List[Any]]:
+        """Sends the actions in chunks of `bulk_chunk_size` actions, using `bulk_thread_count` threads. With `refresh`,
+        it waits until the written documents are visible to searches."""
+        bulk_kwargs = dict(
+            client=self.__client__,
+            index=index,
+            actions=actions,
+            chunk_size=self.bulk_chunk_size,
+            raise_on_error=True,
+            refresh="wait_for" if refresh else False,
+        )
+
         with self.error_handling(index=index):
-            return helpers.bulk(
-                client=self.__client__,
-                index=index,
-                actions=actions,
-                raise_on_error=True,
-                refresh="wait_for",
-            )
+            if self.bulk_thread_count <= 1:
+                return self.bulk_helpers.bulk(**bulk_kwargs)
+
+            success, failed = 0, []
+            for ok, item in self.bulk_helpers.parallel_bulk(thread_count=self.bulk_thread_count, **bulk_kwargs):
+                if ok:
+                    success += 1
+                else:
+                    failed.append(item)
+
+            return success, failed
 
     def _reindex(
         self,
@@ -518,11 +539,12 @@ class OpenSearchClient(IClientAdapter):
                     ignore=400,
                 )
 
-    def index_documents(self, index: str, docs: List[Dict[str, Any]]) -> int:
+    def index_documents(self, index: str, docs: List[Dict[str, Any]], refresh: bool = True) -> int:
         actions = (self._doc2bulk_action(index, doc) for doc in docs)
         success, failed = self.bulk(
             index=index,
             actions=actions,
+            refresh=refresh,
         )
         return len(failed)
 
@@ -607,6 +629,10 @@ class OpenSearchClient(IClientAdapter):
                 wait_for_active_shards=self.index_shards,
             )
 
+    def refresh_index(self, index: str):
+        with self.error_handling(index=index):
+            self.__client__.indices.refresh(index=index)
+
     def clone_index(
         self,
         source_index: str,
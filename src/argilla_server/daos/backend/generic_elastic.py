@@ -12,7 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import dataclasses
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from argilla_server.commons.models import TaskType
 from argilla_server.constants import PROTECTED_METADATA_FIELD_PREFIX
@@ -39,6 +42,7 @@ from argilla_server.errors.task_errors import MetadataLimitExceededError
 from argilla_server.logging import LoggingMixin
 from argilla_server.pydantic_v1 import BaseModel, Field
 from argilla_server.settings import settings
+from argilla_server.utils.concurrency import run_blocking
 
 
 def dataset_records_index(dataset_id: str) -> str:
@@ -52,6 +56,71 @@ class PaginatedSortInfo(BaseModel):
     next_search_params: Optional[Any] = None
 
 
+@dataclasses.dataclass
+class DatasetMapping:
+    """The index mapping of a dataset records as known by the server: the index schema and the metadata fields and
+    vectors (with their dimensions) already configured."""
+
+    schema: Dict[str, Any]
+    metadata_fields: Set[str] = dataclasses.field(default_factory=set)
+    vectors: Dict[str, int] = dataclasses.field(default_factory=dict)
+    expires_at: float = 0.0
+
+    def covers(self, metadata_values: Optional[Dict[str, Any]], vectors_cfg: Optional[Dict[str, int]]) -> bool:
+        """Returns True if the given metadata fields and vectors are already configured in the mapping"""
+        return set(metadata_values or {}).issubset(self.metadata_fields) and all(
+            self.vectors.get(name) == dimension for name, dimension in (vectors_cfg or {}).items()
+        )
+
+
+class DatasetMappingsCache:
+    """Per-dataset cache of the records index mappings, so bulk writes don't introspect and reconfigure the index
+    mapping on every batch. Entries expire after `ttl` seconds, bounding how long changes made to the index by other
+    processes can go unnoticed (a `ttl` of 0 disables the cache)."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[str, DatasetMapping] = {}
+        self._lock = threading.Lock()
+
+    def get(self, index: str) -> Optional[DatasetMapping]:
+        with self._lock:
+            entry = self._entries.get(index)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[index]
+                return None
+
+            return entry
+
+    def set(self, index: str, schema: Dict[str, Any]) -> None:
+        if self.ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[index] = DatasetMapping(schema=schema, expires_at=time.monotonic() + self.ttl)
+
+    def update(
+        self,
+        index: str,
+        schema: Dict[str, Any],
+        metadata_values: Optional[Dict[str, Any]],
+        vectors_cfg: Optional[Dict[str, int]],
+    ) -> None:
+        """Registers a mapping change, only for already cached (and not invalidated meanwhile) datasets."""
+        with self._lock:
+            entry = self._entries.get(index)
+            if entry is None:
+                return
+
+            entry.schema = schema
+            entry.metadata_fields.update(metadata_values or {})
+            entry.vectors.update(vectors_cfg or {})
+
+    def invalidate(self, index: str) -> None:
+        with self._lock:
+            self._entries.pop(index, None)
+
+
 class GenericElasticEngineBackend(LoggingMixin):
     """
     Encapsulates logic about the communication, queries and index mapping
@@ -84,6 +153,8 @@ class GenericElasticEngineBackend(LoggingMixin):
                     index_shards=settings.es_records_index_shards,
                     ssl_verify=settings.elasticsearch_ssl_verify,
                     ca_path=settings.elasticsearch_ca_path,
+                    bulk_chunk_size=settings.es_bulk_chunk_size,
+                    bulk_thread_count=settings.es_bulk_thread_count,
                 ),
                 metrics={**ALL_METRICS},
                 mappings={
@@ -109,6 +180,8 @@ class GenericElasticEngineBackend(LoggingMixin):
         self._common_records_mappings = tasks_common_mappings()
         self._common_records_settings = tasks_common_settings()
 
+        self._mappings_cache = DatasetMappingsCache(ttl=settings.es_records_mappings_cache_ttl)
+
     @property
     def client(self) -> IClientAdapter:
         """The elasticsearch client"""
@@ -143,7 +216,15 @@ class GenericElasticEngineBackend(LoggingMixin):
 
     def get_schema(self, id: str) -> Dict[str, Any]:
         index = dataset_records_index(id)
-        return self.client.get_index_schema(index=index)
+
+        cached_mapping = self._mappings_cache.get(index)
+        if cached_mapping is not None:
+            return cached_mapping.schema
+
+        schema = self.client.get_index_schema(index=index)
+        self._mappings_cache.set(index, schema)
+
+        return schema
 
     async def update_records_content(
         self,
@@ -152,7 +233,8 @@ class GenericElasticEngineBackend(LoggingMixin):
         query: Optional[BaseDatasetsQuery],
     ) -> Tuple[int, int]:
         index = dataset_records_index(id)
-        response = self.client.update_docs_by_query(
+        response = await run_blocking(
+            self.client.update_docs_by_query,
             index=index,
             data=content,
             query=query,
@@ -166,7 +248,8 @@ class GenericElasticEngineBackend(LoggingMixin):
         query: Optional[BaseDatasetsQuery],
     ) -> Tuple[int, int]:
         index = dataset_records_index(id)
-        total, deleted = self.client.delete_docs_by_query(
+        total, deleted = await run_blocking(
+            self.client.delete_docs_by_query,
             index=index,
             query=query,
         )
@@ -236,6 +319,16 @@ class GenericElasticEngineBackend(LoggingMixin):
         vectors_cfg: Optional[Dict[str, Any]] = None,
         force_recreate: bool = False,
     ) -> None:
+        index = dataset_records_index(id)
+
+        if force_recreate:
+            self._mappings_cache.invalidate(index)
+        else:
+            cached_mapping = self._mappings_cache.get(index)
+            if cached_mapping is not None and cached_mapping.covers(metadata_values, vectors_cfg):
+                # The index exists and there are no new metadata fields or vectors to configure
+                return
+
         _mappings = self._common_records_mappings
         task_mappings = self.get_task_mapping(task).copy()
         for k in task_mappings:
@@ -244,7 +337,6 @@ class GenericElasticEngineBackend(LoggingMixin):
             else:
                 _mappings[k] = {**_mappings.get(k, {}), **task_mappings[k]}
 
-        index = dataset_records_index(id)
         self.client.create_index(
             index=index,
             settings=self._common_records_settings,
@@ -263,6 +355,14 @@ class GenericElasticEngineBackend(LoggingMixin):
                 vectors_cfg=vectors_cfg,
             )
 
+        if self._mappings_cache.get(index) is not None:
+            self._mappings_cache.update(
+                index,
+                schema=self.client.get_index_schema(index=index),
+                metadata_values=metadata_values,
+                vectors_cfg=vectors_cfg,
+            )
+
     def _configure_vectors_fields(
         self,
         index: str,
@@ -327,6 +427,7 @@ class GenericElasticEngineBackend(LoggingMixin):
 
     def delete(self, id: str):
         index = dataset_records_index(id)
+        self._mappings_cache.invalidate(index)
         try:
             self.client.delete_index(
                 index=index,
@@ -352,6 +453,7 @@ class GenericElasticEngineBackend(LoggingMixin):
     def copy(self, id_from: str, id_to: str):
         index_from = dataset_records_index(id_from)
         index_to = dataset_records_index(id_to)
+        self._mappings_cache.invalidate(index_to)
 
         self.client.copy_index(
             source_index=index_from,
@@ -359,7 +461,10 @@ class GenericElasticEngineBackend(LoggingMixin):
         )
 
     def close(self, id: str):
-        return self.client.close_index(index=dataset_records_index(id))
+        index = dataset_records_index(id)
+        self._mappings_cache.invalidate(index)
+
+        return self.client.close_index(index=index)
 
     def create_datasets_index(self, force_recreate: bool = False):
         self.client.create_index(
@@ -487,7 +592,10 @@ class GenericElasticEngineBackend(LoggingMixin):
             property=field,
         )
 
-    def add_dataset_records(self, id: str, documents: List[dict]) -> int:
+    def add_dataset_records(self, id: str, documents: List[dict], refresh: bool = True) -> int:
         index = dataset_records_index(id)
 
-        return self.client.index_documents(index=index, docs=documents)
+        return self.client.index_documents(index=index, docs=documents, refresh=refresh)
+
+    def refresh(self, id: str):
+        self.client.refresh_index(index=dataset_records_index(id))
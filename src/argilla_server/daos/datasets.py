@@ -191,6 +191,10 @@ class DatasetsDAO:
         """Close a dataset. It's mean that release all related resources, like elasticsearch index"""
         self._es.close(dataset.id)
 
+    def refresh(self, dataset: DatasetDB):
+        """Make all the records written to a dataset visible to searches"""
+        self._es.refresh(dataset.id)
+
     def save_settings(
         self,
         dataset: DatasetDB,
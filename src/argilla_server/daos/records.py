@@ -25,6 +25,7 @@ from argilla_server.daos.backend.search.model import BaseRecordsQuery, SortableF
 from argilla_server.daos.models.datasets import DatasetDB
 from argilla_server.daos.models.records import DaoRecordsSearch, DaoRecordsSearchResults, RecordDB
 from argilla_server.errors import ClosedDatasetError, MissingDatasetRecordsError
+from argilla_server.utils.concurrency import run_blocking
 
 
 class DatasetRecordsDAO:
@@ -62,6 +63,7 @@ class DatasetRecordsDAO:
         dataset: DatasetDB,
         records: List[RecordDB],
         record_class: Type[RecordDB],
+        refresh: bool = True,
     ) -> int:
         """
         Add records to dataset
@@ -74,6 +76,8 @@ class DatasetRecordsDAO:
             The list of records
         record_class:
             Record class used to convert records to
+        refresh:
+            If True, wait until the added records are visible to searches
         Returns
         -------
             The number of failed records
@@ -122,6 +126,7 @@ class DatasetRecordsDAO:
         return self._es.add_dataset_records(
             id=dataset.id,
             documents=documents,
+            refresh=refresh,
         )
 
     def compute_metric(
@@ -246,7 +251,8 @@ class DatasetRecordsDAO:
         dataset: DatasetDB,
         record: RecordDB,
     ):
-        self._es.update_record(
+        await run_blocking(
+            self._es.update_record,
             dataset_id=dataset.id,
             record_id=record.id,
             content=record.dict(exclude_none=True),
@@ -257,7 +263,8 @@ class DatasetRecordsDAO:
         dataset: DatasetDB,
         id: str,
     ) -> Optional[Dict[str, Any]]:
-        return self._es.find_record_by_id(
+        return await run_blocking(
+            self._es.find_record_by_id,
             dataset_id=dataset.id,
             record_id=id,
         )
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import os
+import time
 from collections import OrderedDict
 from sqlite3 import Connection as SQLite3Connection
 from typing import TYPE_CHECKING, Generator
@@ -19,8 +20,10 @@ from typing import TYPE_CHECKING, Generator
 from sqlalchemy import event, make_url
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 import argilla_server
+from argilla_server.instrumentation import record_span
 from argilla_server.settings import settings
 
 if TYPE_CHECKING:
@@ -48,6 +51,32 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
         cursor.close()
 
 
+@event.listens_for(Engine, "before_cursor_execute")
+def start_query_span(conn, cursor, statement, parameters, context, executemany):
+    if settings.enable_metrics and context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def finish_query_span(conn, cursor, statement, parameters, context, executemany):
+    started_at = getattr(context, "_query_started_at", None)
+    if started_at is not None:
+        record_span("db.execute", time.perf_counter() - started_at)
+
+
+@event.listens_for(Session, "before_flush")
+def start_flush_span(session, flush_context, instances):
+    if settings.enable_metrics:
+        session.info["flush_started_at"] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def finish_flush_span(session, flush_context):
+    started_at = session.info.pop("flush_started_at", None)
+    if started_at is not None:
+        record_span("db.flush", time.perf_counter() - started_at)
+
+
 async_engine = create_async_engine(settings.database_url)
 AsyncSessionLocal = async_sessionmaker(autocommit=False, expire_on_commit=False, bind=async_engine)
 
@@ -55,6 +55,13 @@ class RecordInclude(str, Enum):
     vectors = "vectors"
 
 
+class RecordIndexProperty(str, Enum):
+    metadata = "metadata"
+    responses = "responses"
+    suggestions = "suggestions"
+    vectors = "vectors"
+
+
 class QuestionType(str, Enum):
     text = "text"
     rating = "rating"
@@ -85,6 +92,12 @@ class SimilarityOrder(str, Enum):
     least_similar = "least_similar"
 
 
+class VectorStorageType(str, Enum):
+    float32 = "float32"
+    float16 = "float16"
+    int8 = "int8"
+
+
 class OptionsOrder(str, Enum):
     natural = "natural"
     suggestion = "suggestion"
@@ -0,0 +1,123 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import bisect
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """A Prometheus-style histogram: observations are counted into cumulative `le` buckets per labels values."""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[labelname]) for labelname in self.labelnames)
+        # Series keep the (non cumulative) count per bucket, the +Inf bucket count and the sum of values
+        position = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+
+            series[position] += 1
+            series[-1] += value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+
+        with self._lock:
+            series = [(key, values.copy()) for key, values in self._series.items()]
+
+        for key, values in sorted(series):
+            labels = list(zip(self.labelnames, key))
+
+            count = 0
+            for bound, bucket_count in zip([*self.buckets, "+Inf"], values[:-1]):
+                count += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels([*labels, ('le', str(bound))])} {count}")
+
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {values[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._histograms: Dict[str, Histogram] = {}
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), **kwargs) -> Histogram:
+        if name in self._histograms:
+            raise ValueError(f"Metric `{name}` is already registered")
+
+        histogram = self._histograms[name] = Histogram(name, documentation, labelnames, **kwargs)
+
+        return histogram
+
+    def clear(self) -> None:
+        for histogram in self._histograms.values():
+            histogram.clear()
+
+    def render(self) -> str:
+        """Renders all the registered metrics using the Prometheus text exposition format."""
+        lines = []
+        for histogram in self._histograms.values():
+            lines.extend(histogram.collect())
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+registry = MetricsRegistry()
+
+http_request_duration_seconds = registry.histogram(
+    "argilla_http_request_duration_seconds",
+    "Duration of the HTTP requests handled by the server",
+    labelnames=["method", "route", "status_code"],
+)
+
+span_duration_seconds = registry.histogram(
+    "argilla_span_duration_seconds",
+    "Duration of the instrumented operations (database queries, search engine calls, validation, ...)",
+    labelnames=["span"],
+)
@@ -0,0 +1,76 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from argilla_server.instrumentation.metrics import http_request_duration_seconds
+from argilla_server.instrumentation.spans import SPAN_SERIALIZATION, record_span, request_spans
+from argilla_server.settings import settings
+
+ROUTE_UNMATCHED = "other"
+
+
+class InstrumentationMiddleware:
+    """Times the HTTP requests and the spans recorded while handling them, which are also returned to the client
+    using the `Server-Timing` response header.
+
+    The serialization span goes from the endpoint function returning until the response starts being sent."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.enable_metrics:
+            return await self.app(scope, receive, send)
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        with request_spans() as spans:
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code
+
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if spans.endpoint_finished_at is not None:
+                        record_span(SPAN_SERIALIZATION, time.perf_counter() - spans.endpoint_finished_at)
+
+                    server_timing = spans.server_timing()
+                    if server_timing:
+                        MutableHeaders(scope=message).append("Server-Timing", server_timing)
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                http_request_duration_seconds.observe(
+                    time.perf_counter() - started_at,
+                    method=scope["method"],
+                    route=_route_template(scope),
+                    status_code=str(status_code),
+                )
+
+
+def _route_template(scope: Scope) -> str:
+    # Routes are labeled by their path template so the number of series doesn't grow with the path parameters
+    route = scope.get("route")
+    if route is None:
+        return ROUTE_UNMATCHED
+
+    return f"{scope.get('root_path', '')}{route.path}"
@@ -0,0 +1,79 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Tuple
+
+PROFILER_DEFAULT_DURATION = 5.0
+PROFILER_MAX_DURATION = 60.0
+PROFILER_DEFAULT_INTERVAL = 0.005
+
+
+class ProfilerBusyError(Exception):
+    pass
+
+
+class SamplingProfiler:
+    """Samples the stacks of all the server threads (the event loop one included) at a fixed interval, without
+    tracing every call, so it can be run on a live server.
+
+    Only one profile can be taken at a time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def profile(self, duration: float, interval: float = PROFILER_DEFAULT_INTERVAL) -> "Counter[Tuple[str, ...]]":
+        """Samples the threads stacks for `duration` seconds, blocking the calling thread, and returns how many times
+        each stack (from the outermost frame) was sampled."""
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already being taken")
+
+        try:
+            return self._sample(duration, interval)
+        finally:
+            self._lock.release()
+
+    def _sample(self, duration: float, interval: float) -> "Counter[Tuple[str, ...]]":
+        stacks = Counter()
+        current_thread_id = threading.get_ident()
+        finishes_at = time.monotonic() + duration
+
+        while time.monotonic() < finishes_at:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == current_thread_id:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+
+                stacks[tuple(reversed(stack))] += 1
+
+            time.sleep(interval)
+
+        return stacks
+
+
+def format_collapsed_stacks(stacks: "Counter[Tuple[str, ...]]") -> str:
+    """Formats the sampled stacks using the collapsed stacks format (one `frame;frame;... count` line per stack)
+    supported by flame graph tools."""
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in stacks.most_common())
+
+
+profiler = SamplingProfiler()
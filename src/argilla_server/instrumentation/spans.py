@@ -0,0 +1,157 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import contextlib
+import dataclasses
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from argilla_server.instrumentation.metrics import span_duration_seconds
+from argilla_server.settings import settings
+
+SPAN_ENDPOINT = "endpoint"
+SPAN_SERIALIZATION = "serialization"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclasses.dataclass
+class SpanStats:
+    count: int = 0
+    duration: float = 0.0
+
+
+@dataclasses.dataclass
+class RequestSpans:
+    """The spans recorded while handling a request, aggregated by name."""
+
+    spans: Dict[str, SpanStats] = dataclasses.field(default_factory=dict)
+    endpoint_finished_at: Optional[float] = None
+
+    def add(self, name: str, duration: float) -> None:
+        stats = self.spans.setdefault(name, SpanStats())
+        stats.count += 1
+        stats.duration += duration
+
+    def server_timing(self) -> str:
+        """Returns the spans as a `Server-Timing` header value (durations in milliseconds)."""
+        return ", ".join(
+            f'{name};dur={stats.duration * 1000:.3f};desc="count={stats.count}"' for name, stats in self.spans.items()
+        )
+
+
+_request_spans: ContextVar[Optional[RequestSpans]] = ContextVar("request_spans", default=None)
+
+
+def current_request_spans() -> Optional[RequestSpans]:
+    return _request_spans.get()
+
+
+@contextlib.contextmanager
+def request_spans() -> Iterator[RequestSpans]:
+    """Collects the spans recorded inside the block (including the ones from tasks and threads started inside it)."""
+    spans = RequestSpans()
+    token = _request_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _request_spans.reset(token)
+
+
+def record_span(name: str, duration: float) -> None:
+    if not settings.enable_metrics:
+        return
+
+    span_duration_seconds.observe(duration, span=name)
+
+    spans = _request_spans.get()
+    if spans is not None:
+        spans.add(name, duration)
+
+
+@contextlib.contextmanager
+def span(name: str) -> Iterator[None]:
+    """Times the block as a span named `name`, usable from sync and async code."""
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, time.perf_counter() - started_at)
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """Decorates a function (sync or async) so each call is timed as a span named `name`."""
+
+    def decorator(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_endpoint(endpoint: F) -> F:
+    """Times an API endpoint function, keeping when it finished so the response serialization can be timed too."""
+    if getattr(endpoint, "__instrumented__", False):
+        return endpoint
+
+    def _finish(started_at: float) -> None:
+        finished_at = time.perf_counter()
+        record_span(SPAN_ENDPOINT, finished_at - started_at)
+
+        spans = _request_spans.get()
+        if spans is not None:
+            spans.endpoint_finished_at = finished_at
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _finish(started_at)
+
+        wrapper = async_wrapper
+    else:
+
+        @functools.wraps(endpoint)
+        def sync_wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                _finish(started_at)
+
+        wrapper = sync_wrapper
+
+    wrapper.__instrumented__ = True
+
+    return wrapper
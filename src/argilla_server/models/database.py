@@ -17,11 +17,12 @@ from datetime import datetime
 from typing import Any, List, Optional, Union
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import JSON, ForeignKey, String, Text, UniqueConstraint, and_, sql
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.ext.mutable import MutableDict, MutableList
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from argilla_server.enums import (
     DatasetStatus,
@@ -34,6 +35,7 @@ from argilla_server.enums import (
 from argilla_server.models.base import DatabaseModel
 from argilla_server.models.metadata_properties import MetadataPropertySettings
 from argilla_server.models.mixins import inserted_at_current_value
+from argilla_server.models.vectors import VectorValueType
 from argilla_server.pydantic_v1 import parse_obj_as
 from argilla_server.schemas.v1.questions import QuestionSettings
 
@@ -51,6 +53,9 @@ __all__ = [
     "MetadataProperty",
     "Vector",
     "VectorSettings",
+    "DatasetCounters",
+    "DatasetUserCounters",
+    "RecordOutbox",
 ]
 
 _USER_API_KEY_BYTES_LENGTH = 80
@@ -135,7 +140,7 @@ class Suggestion(DatabaseModel):
 class Vector(DatabaseModel):
     __tablename__ = "vectors"
 
-    value: Mapped[List[Any]] = mapped_column(JSON)
+    value: Mapped[np.ndarray] = mapped_column(VectorValueType)
     record_id: Mapped[UUID] = mapped_column(ForeignKey("records.id", ondelete="CASCADE"), index=True)
     vector_settings_id: Mapped[UUID] = mapped_column(ForeignKey("vectors_settings.id", ondelete="CASCADE"), index=True)
 
@@ -147,6 +152,13 @@ class Vector(DatabaseModel):
     )
     __upsertable_columns__ = {"value"}
 
+    @validates("value")
+    def validate_value(self, key: str, value: Any) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+
+        return np.asarray(value, dtype=np.float32)
+
     def __repr__(self) -> str:
         return (
             f"Vector(id={self.id}, vector_settings_id={self.vector_settings_id}, record_id={self.record_id}, "
@@ -215,7 +227,7 @@ class Record(DatabaseModel):
             f"inserted_at={str(self.inserted_at)!r}, updated_at={str(self.updated_at)!r})"
         )
 
-    def vector_value_by_vector_settings(self, vector_settings: "VectorSettings") -> Union[List[float], None]:
+    def vector_value_by_vector_settings(self, vector_settings: "VectorSettings") -> Union[np.ndarray, None]:
         for vector in self.vectors:
             if vector.vector_settings_id == vector_settings.id:
                 return vector.value
@@ -381,6 +393,70 @@ class Dataset(DatabaseModel):
         )
 
 
+class DatasetCounters(DatabaseModel):
+    __tablename__ = "datasets_counters"
+
+    records: Mapped[int] = mapped_column(default=0)
+    submitted: Mapped[int] = mapped_column(default=0)
+    discarded: Mapped[int] = mapped_column(default=0)
+    conflicting: Mapped[int] = mapped_column(default=0)
+    dataset_id: Mapped[UUID] = mapped_column(ForeignKey("datasets.id", ondelete="CASCADE"), unique=True, index=True)
+
+    __upsertable_columns__ = {"records", "submitted", "discarded", "conflicting"}
+
+    @property
+    def pending(self) -> int:
+        return self.records - self.submitted - self.discarded - self.conflicting
+
+    def __repr__(self):
+        return (
+            f"DatasetCounters(id={str(self.id)!r}, dataset_id={str(self.dataset_id)!r}, records={self.records!r}, "
+            f"submitted={self.submitted!r}, discarded={self.discarded!r}, conflicting={self.conflicting!r}, "
+            f"inserted_at={str(self.inserted_at)!r}, updated_at={str(self.updated_at)!r})"
+        )
+
+
+class DatasetUserCounters(DatabaseModel):
+    __tablename__ = "datasets_users_counters"
+
+    submitted: Mapped[int] = mapped_column(default=0)
+    discarded: Mapped[int] = mapped_column(default=0)
+    draft: Mapped[int] = mapped_column(default=0)
+    dataset_id: Mapped[UUID] = mapped_column(ForeignKey("datasets.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
+
+    __table_args__ = (UniqueConstraint("dataset_id", "user_id", name="dataset_user_counters_dataset_id_user_id_uq"),)
+    __upsertable_columns__ = {"submitted", "discarded", "draft"}
+
+    @property
+    def responses(self) -> int:
+        return self.submitted + self.discarded + self.draft
+
+    def __repr__(self):
+        return (
+            f"DatasetUserCounters(id={str(self.id)!r}, dataset_id={str(self.dataset_id)!r}, "
+            f"user_id={str(self.user_id)!r}, submitted={self.submitted!r}, discarded={self.discarded!r}, "
+            f"draft={self.draft!r}, inserted_at={str(self.inserted_at)!r}, updated_at={str(self.updated_at)!r})"
+        )
+
+
+class RecordOutbox(DatabaseModel):
+    __tablename__ = "records_outbox"
+
+    record_id: Mapped[UUID] = mapped_column(ForeignKey("records.id", ondelete="CASCADE"), unique=True, index=True)
+    dataset_id: Mapped[UUID] = mapped_column(ForeignKey("datasets.id", ondelete="CASCADE"), index=True)
+    attempts: Mapped[int] = mapped_column(default=0, server_default="0")
+
+    __upsertable_columns__ = {"attempts"}
+
+    def __repr__(self):
+        return (
+            f"RecordOutbox(id={str(self.id)!r}, record_id={str(self.record_id)!r}, "
+            f"dataset_id={str(self.dataset_id)!r}, attempts={self.attempts!r}, inserted_at={str(self.inserted_at)!r}, "
+            f"updated_at={str(self.updated_at)!r})"
+        )
+
+
 class WorkspaceUser(DatabaseModel):
     __tablename__ = "workspaces_users"
 
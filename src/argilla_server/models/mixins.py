@@ -143,6 +143,31 @@ class CRUDMixin:
 
         return result.scalars().all()
 
+    @classmethod
+    async def increment_many(
+        cls,
+        db: "AsyncSession",
+        objects: List[Dict[str, Any]],
+        constraints: List["InstrumentedAttribute[Any]"],
+        autocommit: bool = True,
+    ) -> None:
+        """Inserts the objects or, if they already exist, adds their upsertable column values to the stored ones."""
+        if len(objects) == 0:
+            raise ValueError("Cannot increment empty list of objects")
+
+        insert_stmt = _INSERT_FUNC[db.bind.dialect.name](cls).values(objects)
+
+        columns_to_update = {
+            column: getattr(cls, column) + insert_stmt.excluded[column] for column in cls.__upsertable_columns__
+        }
+        if hasattr(cls, "updated_at"):
+            columns_to_update["updated_at"] = datetime.utcnow()
+
+        await db.execute(insert_stmt.on_conflict_do_update(index_elements=constraints, set_=columns_to_update))
+
+        if autocommit:
+            await db.commit()
+
     @classmethod
     async def upsert(
         cls,
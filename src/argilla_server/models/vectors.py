@@ -0,0 +1,107 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Any, List, Optional, Sequence, Union
+
+import numpy as np
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+from argilla_server.enums import VectorStorageType
+
+__all__ = ["VectorValueType", "encode_vector", "decode_vector", "vector_to_list"]
+
+# Vectors are stored as a 4 bytes header, followed by the packed (little-endian) vector values. The first header byte
+# identifies the storage type and the rest of them are reserved (and keep the values aligned).
+_HEADER_SIZE = 4
+_STORAGE_TYPES_CODES = {
+    VectorStorageType.float32: 1,
+    VectorStorageType.float16: 2,
+    VectorStorageType.int8: 3,
+}
+_STORAGE_TYPES_BY_CODE = {code: storage_type for storage_type, code in _STORAGE_TYPES_CODES.items()}
+_INT8_MAX = 127
+
+VectorValue = Union[np.ndarray, Sequence[float]]
+
+
+def encode_vector(value: VectorValue, storage_type: VectorStorageType = VectorStorageType.float32) -> bytes:
+    header = bytes([_STORAGE_TYPES_CODES[storage_type], 0, 0, 0])
+    value = np.asarray(value, dtype="<f4")
+
+    if storage_type == VectorStorageType.float32:
+        return header + value.tobytes()
+    elif storage_type == VectorStorageType.float16:
+        return header + value.astype("<f2").tobytes()
+    elif storage_type == VectorStorageType.int8:
+        # Symmetric quantization, scaling the values so the max absolute value is mapped to 127
+        max_value = float(np.max(np.abs(value))) if value.size else 0.0
+        scale = max_value / _INT8_MAX if max_value else 1.0
+        quantized = np.round(value / scale).astype(np.int8)
+        return header + np.float32(scale).astype("<f4").tobytes() + quantized.tobytes()
+
+    raise ValueError(f"Vector storage type {storage_type} is not supported")
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    """Returns the float32 vector stored in `data`. Float32 vectors are read-only views over `data` (no copies)"""
+    storage_type = _STORAGE_TYPES_BY_CODE.get(data[0]) if data else None
+
+    if storage_type == VectorStorageType.float32:
+        return np.frombuffer(data, dtype="<f4", offset=_HEADER_SIZE)
+    elif storage_type == VectorStorageType.float16:
+        return np.frombuffer(data, dtype="<f2", offset=_HEADER_SIZE).astype(np.float32)
+    elif storage_type == VectorStorageType.int8:
+        scale = np.frombuffer(data, dtype="<f4", count=1, offset=_HEADER_SIZE)[0]
+        return np.frombuffer(data, dtype=np.int8, offset=_HEADER_SIZE + 4) * scale
+
+    raise ValueError("Stored vector has an unknown format")
+
+
+def vector_to_list(value: Optional[VectorValue]) -> Optional[List[float]]:
+    """
+    Converts a vector to a list of floats. Float32 values are widened to float64 as they are, so a stored `0.1` is
+    returned as `0.10000000149011612` (the float32 value closest to `0.1`).
+    """
+    if value is None:
+        return None
+
+    return np.asarray(value).astype(np.float64).tolist()
+
+
+class VectorValueType(TypeDecorator):
+    """Stores vectors values as packed binary data, returning them as float32 NumPy arrays"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[VectorValue], dialect: Any) -> Optional[bytes]:
+        from argilla_server.settings import settings
+
+        if value is None:
+            return None
+
+        return encode_vector(value, settings.vectors_storage_type)
+
+    def process_result_value(self, value: Optional[bytes], dialect: Any) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+
+        return decode_vector(value)
+
+    def compare_values(self, x: Any, y: Any) -> bool:
+        if x is None or y is None:
+            return x is y
+
+        return np.array_equal(x, y)
@@ -234,6 +234,13 @@ class DatasetPolicy:
 
         return is_allowed
 
+    @classmethod
+    def refresh(cls, dataset: DatasetDB) -> PolicyAction:
+        async def is_allowed(actor: User) -> bool:
+            return actor.is_owner or await _exists_workspace_user_by_user_and_workspace_name(actor, dataset.workspace)
+
+        return is_allowed
+
     @classmethod
     def copy(cls, dataset: DatasetDB, target_workspace: Workspace) -> PolicyAction:
         async def is_allowed(actor: User) -> bool:
@@ -255,6 +262,12 @@ class DatasetPolicy:
         return is_allowed
 
 
+class ProfilerPolicyV1:
+    @classmethod
+    async def profile(cls, actor: User) -> bool:
+        return actor.is_owner
+
+
 class DatasetPolicyV1:
     @classmethod
     def list(cls, workspace_id: Optional[UUID] = None) -> PolicyAction:
@@ -68,6 +68,13 @@ class DatasetProgress(BaseModel):
     pending: int
 
 
+class DatasetIndexingStatus(BaseModel):
+    pending: int
+    failed: int
+    oldest_pending_at: Optional[datetime]
+    lag: float
+
+
 class Dataset(BaseModel):
     id: UUID
     name: str
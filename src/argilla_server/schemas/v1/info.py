@@ -23,3 +23,4 @@ class Status(BaseModel):
     version: str
     search_engine: dict
     memory: dict
+    users_cache: dict
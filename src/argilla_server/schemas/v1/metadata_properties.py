@@ -35,6 +35,9 @@ METADATA_PROPERTY_CREATE_TITLE_MAX_LENGTH = 500
 TERMS_METADATA_PROPERTY_VALUES_MIN_ITEMS = 1
 TERMS_METADATA_PROPERTY_VALUES_MAX_ITEMS = 250
 
+TERMS_METADATA_METRICS_SIZE_GE = 1
+TERMS_METADATA_METRICS_SIZE_LE = 1000
+
 try:
     from typing import Annotated
 except ImportError:
@@ -49,6 +52,7 @@ class TermsMetadataMetrics(BaseModel):
     type: Literal[MetadataPropertyType.terms] = Field(MetadataPropertyType.terms, const=True)
     total: int
     values: List[TermCount] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
 
 
 NT = TypeVar("NT", int, float)
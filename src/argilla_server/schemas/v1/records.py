@@ -20,12 +20,14 @@ import fastapi
 from typing_extensions import Annotated
 
 from argilla_server.enums import RecordInclude, RecordSortField, SimilarityOrder, SortOrder
+from argilla_server.models.vectors import vector_to_list
 from argilla_server.pydantic_v1 import BaseModel, Field, StrictStr, root_validator, validator
 from argilla_server.pydantic_v1.utils import GetterDict
 from argilla_server.schemas.base import UpdateSchema
 from argilla_server.schemas.v1.metadata_properties import MetadataPropertyName
 from argilla_server.schemas.v1.responses import Response, ResponseFilterScope, UserResponseCreate
 from argilla_server.schemas.v1.suggestions import Suggestion, SuggestionCreate, SuggestionFilterScope
+from argilla_server.schemas.v1.vectors import VectorValue
 from argilla_server.search_engine import TextQuery
 
 RECORDS_CREATE_MIN_ITEMS = 1
@@ -43,6 +45,9 @@ TERMS_FILTER_VALUES_MAX_ITEMS = 250
 SEARCH_RECORDS_QUERY_SORT_MIN_ITEMS = 1
 SEARCH_RECORDS_QUERY_SORT_MAX_ITEMS = 10
 
+SEARCH_RECORDS_SIMILARITY_QUERIES_MIN_ITEMS = 1
+SEARCH_RECORDS_SIMILARITY_QUERIES_MAX_ITEMS = 500
+
 
 class RecordGetterDict(GetterDict):
     def get(self, key: str, default: Any) -> Any:
@@ -57,7 +62,7 @@ class RecordGetterDict(GetterDict):
 
         if key == "vectors":
             if self._obj.is_relationship_loaded("vectors"):
-                return {vector.vector_settings.name: vector.value for vector in self._obj.vectors}
+                return {vector.vector_settings.name: vector_to_list(vector.value) for vector in self._obj.vectors}
             else:
                 return default
 
@@ -89,7 +94,7 @@ class RecordCreate(BaseModel):
     external_id: Optional[str]
     responses: Optional[List[UserResponseCreate]]
     suggestions: Optional[List[SuggestionCreate]]
-    vectors: Optional[Dict[str, List[float]]]
+    vectors: Optional[Dict[str, VectorValue]]
 
     @validator("responses")
     @classmethod
@@ -123,7 +128,7 @@ class RecordCreate(BaseModel):
 class RecordUpdate(UpdateSchema):
     metadata_: Optional[Dict[str, Any]] = Field(None, alias="metadata")
     suggestions: Optional[List[SuggestionCreate]] = None
-    vectors: Optional[Dict[str, List[float]]]
+    vectors: Optional[Dict[str, VectorValue]]
 
     @property
     def metadata(self) -> Optional[Dict[str, Any]]:
@@ -203,6 +208,7 @@ class Records(BaseModel):
     items: List[Record]
     # TODO(@frascuchon): Make it required once fetch records without metadata filter computes also the total
     total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class RecordsCreate(BaseModel):
@@ -318,3 +324,37 @@ class SearchRecord(BaseModel):
 class SearchRecordsResult(BaseModel):
     items: List[SearchRecord]
     total: int = 0
+    next_cursor: Optional[str] = None
+
+
+class RecordsSimilarityQuery(BaseModel):
+    record_id: Optional[UUID] = None
+    value: Optional[List[float]] = None
+
+    @root_validator(skip_on_failure=True)
+    def check_required(cls, values: dict) -> dict:
+        """Check that either 'record_id' or 'value' is provided"""
+        record_id = values.get("record_id")
+        value = values.get("value")
+
+        if bool(record_id) == bool(value):
+            raise ValueError("Either 'record_id' or 'value' must be provided")
+
+        return values
+
+
+class SearchRecordsSimilarityQuery(BaseModel):
+    name: str
+    queries: List[RecordsSimilarityQuery] = Field(
+        ...,
+        min_items=SEARCH_RECORDS_SIMILARITY_QUERIES_MIN_ITEMS,
+        max_items=SEARCH_RECORDS_SIMILARITY_QUERIES_MAX_ITEMS,
+    )
+    order: SimilarityOrder = SimilarityOrder.most_similar
+    text: Optional[TextQuery] = None
+    filters: Optional[Filters]
+
+
+class SearchRecordsSimilarityResult(BaseModel):
+    # One result for each one of the queries, in the same order
+    items: List[SearchRecordsResult]
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from argilla_server.pydantic_v1 import BaseModel, Field, validator
@@ -24,6 +24,8 @@ RECORDS_BULK_CREATE_MAX_ITEMS = 500
 RECORDS_BULK_UPSERT_MIN_ITEMS = 1
 RECORDS_BULK_UPSERT_MAX_ITEMS = 500
 
+RECORDS_BULK_STREAM_DEFAULT_CHUNK_SIZE = 500
+
 
 class RecordsBulk(BaseModel):
     items: List[Record]
@@ -53,3 +55,11 @@ class RecordsBulkUpsert(RecordsBulkCreate):
     items: List[RecordUpsert] = Field(
         ..., min_items=RECORDS_BULK_UPSERT_MIN_ITEMS, max_items=RECORDS_BULK_UPSERT_MAX_ITEMS
     )
+
+
+class RecordsBulkChunkResult(BaseModel):
+    chunk: int
+    items: int
+    created: int = 0
+    updated: int = 0
+    error: Optional[str] = None
@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 from datetime import datetime
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Sequence
 from uuid import UUID
 
 from typing_extensions import Annotated
@@ -50,7 +50,7 @@ class VectorSettings(BaseModel):
     class Config:
         orm_mode = True
 
-    def check_vector(self, value: List[float]) -> None:
+    def check_vector(self, value: Sequence[float]) -> None:
         num_elements = len(value)
 
         if num_elements != self.dimensions:
@@ -12,13 +12,69 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List
+import base64
+import binascii
+from typing import Any, Callable, Dict, Iterator
 from uuid import UUID
 
+import numpy as np
+
 from argilla_server.schemas.base import BaseModel
 
 
+class VectorValue(np.ndarray):
+    """
+    Vector value received from the API. It can be provided as a list of numbers or as a base64 string with the
+    packed (little-endian) float32 vector values. Values are validated as float32 NumPy arrays (base64 values are
+    read-only views over the decoded bytes, so no copies are made).
+    """
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[..., Any]]:
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(
+            anyOf=[
+                {"type": "array", "items": {"type": "number"}},
+                {"type": "string", "format": "byte", "description": "Base64 encoded little-endian float32 values"},
+            ]
+        )
+
+    @classmethod
+    def validate(cls, value: Any) -> np.ndarray:
+        if isinstance(value, str):
+            return cls._from_base64(value)
+
+        if isinstance(value, np.ndarray):
+            vector = value.astype(np.float32, copy=False)
+        elif isinstance(value, (list, tuple)) and all(
+            isinstance(item, (int, float)) and not isinstance(item, bool) for item in value
+        ):
+            vector = np.asarray(value, dtype=np.float32)
+        else:
+            raise ValueError("vector value must be a list of numbers or a base64 encoded string")
+
+        if vector.ndim != 1:
+            raise ValueError("vector value must be a list of numbers or a base64 encoded string")
+
+        return vector
+
+    @staticmethod
+    def _from_base64(value: str) -> np.ndarray:
+        try:
+            data = base64.b64decode(value, validate=True)
+        except binascii.Error as e:
+            raise ValueError("vector value is not a valid base64 encoded string") from e
+
+        if len(data) % np.dtype("<f4").itemsize != 0:
+            raise ValueError("base64 encoded vector value must contain packed float32 values")
+
+        return np.frombuffer(data, dtype="<f4")
+
+
 class Vector(BaseModel):
     record_id: UUID
     vector_settings_id: UUID
-    value: List[float]
+    value: VectorValue
@@ -12,14 +12,41 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from ..settings import settings
 from .base import *
 from .elasticsearch import ElasticSearchEngine
 from .opensearch import OpenSearchEngine
+from .sql import SQLSearchEngine
+
+_search_engine: Optional[SearchEngine] = None
+
+
+async def open_search_engine() -> SearchEngine:
+    """Creates the process-wide search engine instance (if not created yet) so its connection pool can be shared
+    across requests. It's expected to be called once at application startup."""
+    global _search_engine
+
+    if _search_engine is None:
+        _search_engine = await SearchEngine.new_instance_by_name(settings.search_engine)
+
+    return _search_engine
+
+
+async def close_search_engine() -> None:
+    """Closes the process-wide search engine instance (if any), releasing its pooled connections."""
+    global _search_engine
+
+    if _search_engine is not None:
+        engine, _search_engine = _search_engine, None
+        await engine.close()
 
 
 async def get_search_engine() -> AsyncGenerator[SearchEngine, None]:
-    async with SearchEngine.get_by_name(settings.search_engine) as engine:
-        yield engine
+    if _search_engine is not None:
+        yield _search_engine
+    else:
+        # No shared engine has been opened (e.g. CLI commands), so a short-lived one is used instead
+        async with SearchEngine.get_by_name(settings.search_engine) as engine:
+            yield engine
@@ -11,8 +11,14 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import asyncio
+import base64
 import dataclasses
+import inspect
+import json
+import time
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from typing import (
     Any,
@@ -20,9 +26,11 @@ from typing import (
     ClassVar,
     Dict,
     Generic,
+    Hashable,
     Iterable,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -31,19 +39,24 @@ from uuid import UUID
 
 from argilla_server.enums import (
     MetadataPropertyType,
+    RecordIndexProperty,
     RecordSortField,
     ResponseStatus,
     ResponseStatusFilter,
     SimilarityOrder,
     SortOrder,
 )
+from argilla_server.instrumentation import instrumented
 from argilla_server.models import Dataset, MetadataProperty, Record, Response, Suggestion, User, Vector, VectorSettings
 from argilla_server.pydantic_v1 import BaseModel, Field, root_validator
 from argilla_server.pydantic_v1.generics import GenericModel
+from argilla_server.settings import settings
 
 __all__ = [
     "SearchEngine",
+    "SEARCH_CURSOR_START",
     "TextQuery",
+    "SimilarityQuery",
     "MetadataFilter",
     "TermsMetadataFilter",
     "IntegerMetadataFilter",
@@ -56,6 +69,7 @@ __all__ = [
     "TermsMetadataMetrics",
     "IntegerMetadataMetrics",
     "FloatMetadataMetrics",
+    "MetadataMetricsCache",
     "SuggestionFilterScope",
     "ResponseFilterScope",
     "MetadataFilterScope",
@@ -127,6 +141,14 @@ class TextQuery(BaseModel):
     field: Optional[str] = None
 
 
+@dataclasses.dataclass
+class SimilarityQuery:
+    """One of the queries of a multiple similarity search. Either `value` or `record` must be provided"""
+
+    value: Optional[List[float]] = None
+    record: Optional[Record] = None
+
+
 class UserResponseStatusFilter(BaseModel):
     statuses: List[ResponseStatusFilter]
     user: Optional[User] = None
@@ -208,14 +230,22 @@ class FloatMetadataFilter(NumericMetadataFilter[float]):
     _json_model = _RangeModel[float]
 
 
+SEARCH_CURSOR_START = "*"
+
+
 class SearchResponseItem(BaseModel):
     record_id: UUID
     score: Optional[float]
+    # The record as returned by the API, only returned when searching `with_records` by engines storing them and the
+    # stored record is up to date
+    record: Optional[Dict[str, Any]] = None
 
 
 class SearchResponses(BaseModel):
     items: List[SearchResponseItem]
     total: int = 0
+    # Only returned when searching with a cursor, `None` once there are no more results
+    next_cursor: Optional[str] = None
 
 
 class SortBy(BaseModel):
@@ -234,6 +264,8 @@ class TermsMetadataMetrics(BaseModel):
     type: MetadataPropertyType = Field(MetadataPropertyType.terms)
     total: int
     values: List[TermCount] = Field(default_factory=list)
+    # Only returned when computing the top `size` terms, `None` once there are no more terms
+    next_cursor: Optional[str] = None
 
 
 class NumericMetadataMetrics(GenericModel, Generic[NT]):
@@ -252,9 +284,92 @@ class FloatMetadataMetrics(NumericMetadataMetrics[float]):
 MetadataMetrics = Union[TermsMetadataMetrics, IntegerMetadataMetrics, FloatMetadataMetrics]
 
 
+def encode_terms_metrics_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode()).decode()
+
+
+def decode_terms_metrics_cursor(cursor: str) -> int:
+    try:
+        offset = json.loads(base64.urlsafe_b64decode(cursor.encode()))["offset"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Metrics cursor {cursor!r} is not valid") from e
+
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError(f"Metrics cursor {cursor!r} is not valid")
+
+    return offset
+
+
+@dataclasses.dataclass
+class MetadataMetricsCache:
+    """
+    In-process LRU cache for the computed metadata properties metrics.
+
+    Entries are tagged with the generation of their dataset, which is increased every time the dataset records change,
+    so invalidating all the metrics of a dataset doesn't depend on the number of cached entries. Since records can also
+    be written by other processes, entries expire after `ttl` seconds too (a `ttl` of 0 disables the cache).
+    """
+
+    ttl: float = dataclasses.field(default_factory=lambda: settings.search_engine_metadata_metrics_cache_ttl)
+    max_entries: int = 1024
+
+    _entries: "OrderedDict[Tuple[UUID, Hashable], Tuple[int, float, MetadataMetrics]]" = dataclasses.field(
+        default_factory=OrderedDict, init=False
+    )
+    _generations: Dict[UUID, int] = dataclasses.field(default_factory=dict, init=False)
+
+    def generation(self, dataset_id: UUID) -> int:
+        return self._generations.get(dataset_id, 0)
+
+    def get(self, dataset_id: UUID, key: Hashable) -> Optional[MetadataMetrics]:
+        entry = self._entries.get((dataset_id, key))
+        if entry is None:
+            return None
+
+        generation, expires_at, metrics = entry
+        if generation != self.generation(dataset_id) or expires_at <= time.monotonic():
+            del self._entries[(dataset_id, key)]
+            return None
+
+        self._entries.move_to_end((dataset_id, key))
+        return metrics
+
+    def set(self, dataset_id: UUID, key: Hashable, metrics: MetadataMetrics, generation: int):
+        """Caches metrics computed at the given dataset `generation`, unless the dataset records changed meanwhile"""
+        if self.ttl <= 0 or generation != self.generation(dataset_id):
+            return
+
+        self._entries[(dataset_id, key)] = (generation, time.monotonic() + self.ttl, metrics)
+        self._entries.move_to_end((dataset_id, key))
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, dataset_id: UUID):
+        self._generations[dataset_id] = self.generation(dataset_id) + 1
+
+
 class SearchEngine(metaclass=ABCMeta):
     registered_classes = {}
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Calls to the public engine methods are timed as "search_engine.<method>" spans
+        for name, attribute in list(cls.__dict__.items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(attribute):
+                setattr(cls, name, instrumented(f"search_engine.{name}")(attribute))
+
+    @property
+    def metrics_cache(self) -> MetadataMetricsCache:
+        """Cache for the computed metadata properties metrics, that must be invalidated by the engines on records
+        changes. It's created on first use, so engines don't need to initialize it."""
+        metrics_cache = self.__dict__.get("_metrics_cache")
+        if metrics_cache is None:
+            metrics_cache = self.__dict__["_metrics_cache"] = MetadataMetricsCache()
+
+        return metrics_cache
+
     @classmethod
     @abstractmethod
     async def new_instance(cls) -> "SearchEngine":
@@ -277,19 +392,21 @@ class SearchEngine(metaclass=ABCMeta):
         return decorator
 
     @classmethod
-    @asynccontextmanager
-    async def get_by_name(cls, engine_name: str) -> AsyncGenerator["SearchEngine", None]:
+    async def new_instance_by_name(cls, engine_name: str) -> "SearchEngine":
         engine_name = engine_name.lower().strip()
 
         if engine_name not in cls.registered_classes:
             raise ValueError(f"No engine class registered for '{engine_name}'")
 
-        engine_class = cls.registered_classes[engine_name]
+        return await cls.registered_classes[engine_name].new_instance()
 
+    @classmethod
+    @asynccontextmanager
+    async def get_by_name(cls, engine_name: str) -> AsyncGenerator["SearchEngine", None]:
         engine = None
 
         try:
-            engine = await engine_class.new_instance()
+            engine = await cls.new_instance_by_name(engine_name)
             yield engine
         except Exception as e:
             raise e
@@ -305,6 +422,34 @@ class SearchEngine(metaclass=ABCMeta):
     async def delete_index(self, dataset: Dataset):
         pass
 
+    @abstractmethod
+    async def create_reindex_index(self, dataset: Dataset) -> str:
+        """Creates a new index for the dataset that won't serve searches until `swap_reindex_index` is called. Until
+        then, the dataset records writes are applied to both indices"""
+        pass
+
+    @abstractmethod
+    async def reindex_records(self, dataset: Dataset, records: Iterable[Record], index_name: str):
+        """Indexes the dataset records into an index created with `create_reindex_index`"""
+        pass
+
+    @abstractmethod
+    async def list_reindex_records_ids(
+        self, dataset: Dataset, index_name: str, after: Optional[UUID] = None, limit: int = 100
+    ) -> List[UUID]:
+        """Lists (sorted) the ids of the records indexed into an index created with `create_reindex_index`"""
+        pass
+
+    @abstractmethod
+    async def delete_reindex_records(self, dataset: Dataset, records_ids: Iterable[UUID], index_name: str):
+        """Deletes the dataset records from an index created with `create_reindex_index`"""
+        pass
+
+    @abstractmethod
+    async def swap_reindex_index(self, dataset: Dataset, index_name: str):
+        """Atomically replaces the index serving the dataset by `index_name` and deletes the previous one"""
+        pass
+
     @abstractmethod
     async def configure_metadata_property(self, dataset: Dataset, metadata_property: MetadataProperty):
         pass
@@ -313,6 +458,13 @@ class SearchEngine(metaclass=ABCMeta):
     async def index_records(self, dataset: Dataset, records: Iterable[Record]):
         pass
 
+    @abstractmethod
+    async def partial_update_records(
+        self, dataset: Dataset, records: Iterable[Record], properties: Iterable[RecordIndexProperty]
+    ):
+        """Updates only the given properties of the already indexed records, leaving the rest of the document as is"""
+        pass
+
     @abstractmethod
     async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
         pass
@@ -321,6 +473,11 @@ class SearchEngine(metaclass=ABCMeta):
     async def update_record_response(self, response: Response):
         pass
 
+    @abstractmethod
+    async def update_records_responses(self, responses: Iterable[Response]):
+        """Updates the given responses of the indexed records using a single bulk request"""
+        pass
+
     @abstractmethod
     async def delete_record_response(self, response: Response):
         pass
@@ -347,11 +504,46 @@ class SearchEngine(metaclass=ABCMeta):
         # END TODO
         offset: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
+        with_records: bool = False,
     ) -> SearchResponses:
+        """Searches the dataset records paginating with `offset` and `limit` or, when a `cursor` is provided, with
+        cursors (`SEARCH_CURSOR_START` starts a new cursor pagination and next pages use the returned `next_cursor`).
+
+        With `with_records`, engines storing the records return them in the response items when they are up to date,
+        so they don't need to be read from the database."""
         pass
 
+    async def compute_metrics_for(
+        self, metadata_property: MetadataProperty, size: Optional[int] = None, cursor: Optional[str] = None
+    ) -> MetadataMetrics:
+        """Computes the metadata property metrics. For terms properties, only the `size` most frequent terms are
+        returned when a `size` is provided, along with a `next_cursor` to get the following ones.
+
+        Terms are ranked by frequency, which requires computing all the previous terms to get a page, so engines only
+        compute up to their `max_terms_size` most frequent terms. Pagination ends (without `next_cursor`) once that
+        cap is reached, even if the property has more distinct terms.
+
+        Metrics are kept in the engine `metrics_cache` until the dataset records change."""
+        if cursor is not None and size is None:
+            raise ValueError("`cursor` can only be used together with `size`")
+
+        offset = decode_terms_metrics_cursor(cursor) if cursor is not None else 0
+
+        dataset_id, key = metadata_property.dataset_id, (metadata_property.id, size, offset)
+
+        metrics = self.metrics_cache.get(dataset_id, key)
+        if metrics is None:
+            generation = self.metrics_cache.generation(dataset_id)
+            metrics = await self._compute_metrics_for(metadata_property, size=size, offset=offset)
+            self.metrics_cache.set(dataset_id, key, metrics, generation)
+
+        return metrics
+
     @abstractmethod
-    async def compute_metrics_for(self, metadata_property: MetadataProperty) -> MetadataMetrics:
+    async def _compute_metrics_for(
+        self, metadata_property: MetadataProperty, size: Optional[int] = None, offset: int = 0
+    ) -> MetadataMetrics:
         pass
 
     async def configure_index_vectors(self, vector_settings: VectorSettings):
@@ -379,3 +571,38 @@ class SearchEngine(metaclass=ABCMeta):
         threshold: Optional[float] = None,
     ) -> SearchResponses:
         pass
+
+    async def similarity_search_many(
+        self,
+        dataset: Dataset,
+        vector_settings: VectorSettings,
+        queries: List[SimilarityQuery],
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+        max_results: int = 100,
+        order: SimilarityOrder = SimilarityOrder.most_similar,
+        threshold: Optional[float] = None,
+    ) -> List[SearchResponses]:
+        """
+        Runs a similarity search for each one of the `queries`, returning their responses in the same order.
+
+        By default, searches are run concurrently (at most `settings.search_engine_max_concurrent_searches` at once)
+        using `similarity_search`. Engines supporting batched searches can override it.
+        """
+        semaphore = asyncio.Semaphore(settings.search_engine_max_concurrent_searches)
+
+        async def _similarity_search(similarity_query: SimilarityQuery) -> SearchResponses:
+            async with semaphore:
+                return await self.similarity_search(
+                    dataset=dataset,
+                    vector_settings=vector_settings,
+                    value=similarity_query.value,
+                    record=similarity_query.record,
+                    query=query,
+                    filter=filter,
+                    max_results=max_results,
+                    order=order,
+                    threshold=threshold,
+                )
+
+        return list(await asyncio.gather(*[_similarity_search(similarity_query) for similarity_query in queries]))
@@ -12,12 +12,22 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import base64
 import dataclasses
+import json
 from abc import abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Union
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
-from argilla_server.enums import FieldType, MetadataPropertyType, RecordSortField, ResponseStatusFilter, SimilarityOrder
+from argilla_server.enums import (
+    FieldType,
+    MetadataPropertyType,
+    RecordIndexProperty,
+    RecordSortField,
+    ResponseStatusFilter,
+    SimilarityOrder,
+)
 from argilla_server.models import (
     Dataset,
     Field,
@@ -31,7 +41,9 @@ from argilla_server.models import (
     Vector,
     VectorSettings,
 )
+from argilla_server.models.vectors import vector_to_list
 from argilla_server.search_engine.base import (
+    SEARCH_CURSOR_START,
     AndFilter,
     Filter,
     FilterScope,
@@ -49,6 +61,7 @@ from argilla_server.search_engine.base import (
     SearchEngine,
     SearchResponseItem,
     SearchResponses,
+    SimilarityQuery,
     SortBy,
     SuggestionFilterScope,
     TermsFilter,
@@ -56,15 +69,28 @@ from argilla_server.search_engine.base import (
     TermsMetadataMetrics,
     TextQuery,
     UserResponseStatusFilter,
+    encode_terms_metrics_cursor,
 )
 
 ALL_RESPONSES_STATUSES_FIELD = "all_responses_statuses"
+# Not indexed field storing the record as returned by the API, so search hits can be used without reading the database
+RECORD_SOURCE_FIELD = "record"
 
 
 def es_index_name_for_dataset(dataset: Dataset):
     return f"rg.{dataset.id}"
 
 
+def es_reindex_alias_for_index(index_name: str) -> str:
+    # Alias of the new index of a dataset being reindexed, so writes can be applied to both indices meanwhile
+    return f"{index_name}.reindex"
+
+
+def es_versioned_index_name_for_dataset(dataset: Dataset) -> str:
+    # Reindexed datasets are served by versioned indexes behind an alias named as the original index
+    return f"{es_index_name_for_dataset(dataset)}.{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}"
+
+
 def es_terms_query(field_name: str, values: List[str]) -> dict:
     return {"terms": {field_name: values}}
 
@@ -192,6 +218,34 @@ def es_script_for_delete_user_response(user: User) -> str:
     return f'ctx._source["responses"].remove("{es_path_for_user(user)}")'
 
 
+def es_script_for_merge_object(property: str) -> str:
+    return (
+        f"if (ctx._source.{property} == null) {{ ctx._source.{property} = params.{property}; }} "
+        f"else {{ ctx._source.{property}.putAll(params.{property}); }}"
+    )
+
+
+def es_bulk_errors_without_missing_deletes(errors: List[dict]) -> List[dict]:
+    """Deleting a document missing in the index (like a record not indexed yet) is not considered an error"""
+    return [error for error in errors if error.get("delete", {}).get("status") != 404]
+
+
+def es_bulk_errors_without_missing_documents(errors: List[dict]) -> List[dict]:
+    return [error for error in errors if not all(item.get("status") == 404 for item in error.values())]
+
+
+def es_encode_search_cursor(pit_id: str, search_after: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"pit_id": pit_id, "search_after": search_after}).encode()).decode()
+
+
+def es_decode_search_cursor(cursor: str) -> Tuple[str, List[Any]]:
+    try:
+        decoded_cursor = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return decoded_cursor["pit_id"], decoded_cursor["search_after"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Search cursor {cursor!r} is not valid") from e
+
+
 def es_path_for_user(user: User) -> str:
     return str(user.id)
 
@@ -272,12 +326,18 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
     number_of_shards: int
     number_of_replicas: int
 
+    # Max number of most frequent terms computed for terms metadata properties, so it caps their pagination too
     # See https://www.elastic.co/guide/en/elasticsearch/reference/current/search-settings.html#search-settings-max-buckets
     max_terms_size: int = 2**14
     # See https://www.elastic.co/guide/en/elasticsearch/reference/5.1/index-modules.html#dynamic-index-settings
     max_result_window: int = 500000
     # See https://www.elastic.co/guide/en/elasticsearch/reference/current/mapping-settings-limit.html#mapping-settings-limit
     default_total_fields_limit: int = 2000
+    # See https://www.elastic.co/guide/en/elasticsearch/reference/current/point-in-time-api.html#point-in-time-keep-alive
+    cursor_keep_alive: str = "5m"
+
+    # Whether documents store the record as returned by the API (see `RECORD_SOURCE_FIELD`)
+    hydrate_records: bool = False
 
     async def create_index(self, dataset: Dataset):
         settings = self._configure_index_settings()
@@ -290,71 +350,165 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         mapping = es_mapping_for_metadata_property(metadata_property)
         index_name = await self._get_dataset_index(dataset)
 
-        await self.put_index_mapping_request(index_name, mapping)
+        await self._write_index_mapping_request(index_name, mapping)
+        self.metrics_cache.invalidate(dataset.id)
 
     async def delete_index(self, dataset: Dataset):
         index_name = es_index_name_for_dataset(dataset)
 
-        await self._delete_index_request(index_name)
+        for aliased_index_name in await self._get_alias_indices_request(index_name) or [index_name]:
+            await self._delete_index_request(aliased_index_name)
+        for reindex_index_name in await self._get_alias_indices_request(es_reindex_alias_for_index(index_name)):
+            await self._delete_index_request(reindex_index_name)
+
+        self.metrics_cache.invalidate(dataset.id)
+
+    async def create_reindex_index(self, dataset: Dataset) -> str:
+        settings = self._configure_index_settings()
+        mappings = self._configure_index_mappings(dataset)
+
+        reindex_alias = es_reindex_alias_for_index(es_index_name_for_dataset(dataset))
+        # Indices of previous reindexes that were never completed are not used anymore
+        for reindex_index_name in await self._get_alias_indices_request(reindex_alias):
+            await self._delete_index_request(reindex_index_name)
+
+        index_name = es_versioned_index_name_for_dataset(dataset)
+        await self._create_index_request(index_name, mappings, settings)
+        await self._update_aliases_request([{"add": {"index": index_name, "alias": reindex_alias}}])
+
+        return index_name
+
+    async def reindex_records(self, dataset: Dataset, records: Iterable[Record], index_name: str):
+        await self._bulk_op_request(self._index_records_bulk_actions(index_name, records))
+
+    async def list_reindex_records_ids(
+        self, dataset: Dataset, index_name: str, after: Optional[UUID] = None, limit: int = 100
+    ) -> List[UUID]:
+        if after is None:
+            await self._refresh_index_request(index_name)
+
+        response = await self._index_search_request(
+            index_name,
+            query={"match_all": {}},
+            size=limit,
+            sort="id:asc",
+            search_after=[str(after)] if after else None,
+        )
+
+        return [UUID(hit["_id"]) for hit in response["hits"]["hits"]]
+
+    async def delete_reindex_records(self, dataset: Dataset, records_ids: Iterable[UUID], index_name: str):
+        await self._bulk_op_request(
+            [{"_op_type": "delete", "_id": record_id, "_index": index_name} for record_id in records_ids]
+        )
+
+    async def swap_reindex_index(self, dataset: Dataset, index_name: str):
+        alias = es_index_name_for_dataset(dataset)
+        aliased_indices = await self._get_alias_indices_request(alias)
+        reindex_alias = es_reindex_alias_for_index(alias)
+
+        actions = [{"remove": {"index": aliased_index, "alias": alias}} for aliased_index in aliased_indices]
+        if not aliased_indices and await self._index_exists_request(alias):
+            # Datasets indexed before using aliases have a regular index with the alias name
+            actions.append({"remove_index": {"index": alias}})
+        actions.append({"add": {"index": index_name, "alias": alias}})
+        if index_name in await self._get_alias_indices_request(reindex_alias):
+            actions.append({"remove": {"index": index_name, "alias": reindex_alias}})
+
+        await self._refresh_index_request(index_name)
+        await self._update_aliases_request(actions)
+
+        for aliased_index in aliased_indices:
+            if aliased_index != index_name:
+                await self._delete_index_request(aliased_index)
+
+        self.metrics_cache.invalidate(dataset.id)
 
     async def index_records(self, dataset: Dataset, records: Iterable[Record]):
         index_name = await self._get_dataset_index(dataset)
 
+        await self._write_bulk_op_request(self._index_records_bulk_actions(index_name, records))
+        self.metrics_cache.invalidate(dataset.id)
+
+    async def partial_update_records(
+        self, dataset: Dataset, records: Iterable[Record], properties: Iterable[RecordIndexProperty]
+    ):
+        index_name = await self._get_dataset_index(dataset)
+        properties = set(properties)
+
         bulk_actions = [
             {
-                # If document exist, we update source with latest version
-                "_op_type": "index",  # TODO: Review and maybe change to partial update
+                "_op_type": "update",
                 "_id": record.id,
                 "_index": index_name,
-                **self._map_record_to_es_document(record),
+                "script": self._script_for_record_partial_update(dataset, record, properties),
             }
             for record in records
         ]
 
-        await self._bulk_op_request(bulk_actions)
+        await self._write_bulk_op_request(bulk_actions)
+
+        if RecordIndexProperty.metadata in properties:
+            self.metrics_cache.invalidate(dataset.id)
 
     async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
         index_name = await self._get_dataset_index(dataset)
 
         bulk_actions = [{"_op_type": "delete", "_id": record.id, "_index": index_name} for record in records]
 
-        await self._bulk_op_request(bulk_actions)
+        await self._write_bulk_op_request(bulk_actions)
+        self.metrics_cache.invalidate(dataset.id)
 
     async def update_record_response(self, response: Response):
         record = response.record
         index_name = await self._get_dataset_index(record.dataset)
 
-        es_responses = self._map_record_responses_to_es([response])
+        await self._write_update_document_request(
+            index_name, id=record.id, body={"doc": self._responses_update_doc([response])}
+        )
+
+    async def update_records_responses(self, responses: Iterable[Response]):
+        bulk_actions = [
+            {
+                "_op_type": "update",
+                "_id": response.record_id,
+                "_index": await self._get_dataset_index(response.record.dataset),
+                "doc": self._responses_update_doc([response]),
+            }
+            for response in responses
+        ]
 
-        await self._update_document_request(index_name, id=record.id, body={"doc": {"responses": es_responses}})
+        if bulk_actions:
+            await self._write_bulk_op_request(bulk_actions)
 
     async def delete_record_response(self, response: Response):
         record = response.record
         index_name = await self._get_dataset_index(record.dataset)
 
-        await self._update_document_request(
-            index_name, id=record.id, body={"script": es_script_for_delete_user_response(response.user)}
-        )
+        script = es_script_for_delete_user_response(response.user)
+        if self.hydrate_records:
+            script += f'; ctx._source.{RECORD_SOURCE_FIELD}?.responses?.remove("{response.user_id}")'
+
+        await self._write_update_document_request(index_name, id=record.id, body={"script": script})
 
     async def update_record_suggestion(self, suggestion: Suggestion):
         index_name = await self._get_dataset_index(suggestion.record.dataset)
 
-        es_suggestions = self._map_record_suggestions_to_es([suggestion])
+        doc = {"suggestions": self._map_record_suggestions_to_es([suggestion])}
+        if self.hydrate_records:
+            # Partial documents are merged into the stored ones, so only the updated suggestion is replaced
+            doc[RECORD_SOURCE_FIELD] = {"suggestions": self._map_record_suggestions_to_source([suggestion])}
 
-        await self._update_document_request(
-            index_name,
-            id=suggestion.record_id,
-            body={"doc": {"suggestions": es_suggestions}},
-        )
+        await self._write_update_document_request(index_name, id=suggestion.record_id, body={"doc": doc})
 
     async def delete_record_suggestion(self, suggestion: Suggestion):
         index_name = await self._get_dataset_index(suggestion.record.dataset)
 
-        await self._update_document_request(
-            index_name,
-            id=suggestion.record_id,
-            body={"script": f'ctx._source["suggestions"].remove("{suggestion.question.name}")'},
-        )
+        script = f'ctx._source["suggestions"].remove("{suggestion.question.name}")'
+        if self.hydrate_records:
+            script += f'; ctx._source.{RECORD_SOURCE_FIELD}?.suggestions?.remove("{suggestion.question_id}")'
+
+        await self._write_update_document_request(index_name, id=suggestion.record_id, body={"script": script})
 
     async def set_records_vectors(self, dataset: Dataset, vectors: Iterable[Vector]):
         index_name = await self._get_dataset_index(dataset)
@@ -364,12 +518,12 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
                 "_op_type": "update",
                 "_id": vector.record_id,
                 "_index": index_name,
-                "doc": {es_field_for_vector_settings(vector.vector_settings): vector.value},
+                "doc": {es_field_for_vector_settings(vector.vector_settings): vector_to_list(vector.value)},
             }
             for vector in vectors
         ]
 
-        await self._bulk_op_request(bulk_actions)
+        await self._write_bulk_op_request(bulk_actions)
 
     async def similarity_search(
         self,
@@ -394,6 +548,60 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             filter = _unify_user_response_status_filter_with_filter(user_response_status_filter, filter)
         # END TODO
 
+        vector_value, record_id = self._get_similarity_query_vector(
+            vector_settings, SimilarityQuery(value=value, record=record), order
+        )
+        query_filters = self._build_similarity_search_query_filters(dataset, query, filter)
+
+        index = await self._get_dataset_index(dataset)
+        response = await self._request_similarity_search(
+            index=index,
+            vector_settings=vector_settings,
+            value=vector_value,
+            k=max_results,
+            excluded_id=record_id,
+            query_filters=query_filters,
+        )
+
+        return await self._process_search_response(response, threshold)
+
+    async def similarity_search_many(
+        self,
+        dataset: Dataset,
+        vector_settings: VectorSettings,
+        queries: List[SimilarityQuery],
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+        max_results: int = 100,
+        order: SimilarityOrder = SimilarityOrder.most_similar,
+        threshold: Optional[float] = None,
+    ) -> List[SearchResponses]:
+        # Filters are built once and shared by all the similarity search requests
+        query_filters = self._build_similarity_search_query_filters(dataset, query, filter)
+
+        searches = []
+        for similarity_query in queries:
+            vector_value, record_id = self._get_similarity_query_vector(vector_settings, similarity_query, order)
+            searches.append(
+                self._build_similarity_search_request_body(
+                    vector_settings=vector_settings,
+                    value=vector_value,
+                    k=max_results,
+                    excluded_id=record_id,
+                    query_filters=query_filters,
+                )
+            )
+
+        index = await self._get_dataset_index(dataset)
+        responses = await self._multi_search_request(index, searches)
+
+        return [await self._process_search_response(response, threshold) for response in responses]
+
+    def _get_similarity_query_vector(
+        self, vector_settings: VectorSettings, similarity_query: SimilarityQuery, order: SimilarityOrder
+    ) -> Tuple[List[float], Optional[UUID]]:
+        """Returns the vector value to search for and the id of the record to exclude from the results (if any)"""
+        value, record = vector_to_list(similarity_query.value), similarity_query.record
         if bool(value) == bool(record):
             raise ValueError("Must provide either vector value or record to compute the similarity search")
 
@@ -402,7 +610,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         if not vector_value:
             record_id = record.id
-            vector_value = record.vector_value_by_vector_settings(vector_settings)
+            vector_value = vector_to_list(record.vector_value_by_vector_settings(vector_settings))
 
         if not vector_value:
             raise ValueError("Cannot find a vector value to apply with provided info")
@@ -410,6 +618,11 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         if order == SimilarityOrder.least_similar:
             vector_value = self._inverse_vector(vector_value)
 
+        return vector_value, record_id
+
+    def _build_similarity_search_query_filters(
+        self, dataset: Dataset, query: Optional[Union[TextQuery, str]] = None, filter: Optional[Filter] = None
+    ) -> List[dict]:
         query_filters = []
         if filter:
             # Wrapping filter in a list to use easily on each engine implementation
@@ -418,17 +631,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         if query:
             query_filters.append(self._build_text_query(dataset, text=query))
 
-        index = await self._get_dataset_index(dataset)
-        response = await self._request_similarity_search(
-            index=index,
-            vector_settings=vector_settings,
-            value=vector_value,
-            k=max_results,
-            excluded_id=record_id,
-            query_filters=query_filters,
-        )
-
-        return await self._process_search_response(response, threshold)
+        return query_filters
 
     def build_elasticsearch_filter(self, filter: Filter) -> Dict[str, Any]:
         if isinstance(filter, AndFilter):
@@ -509,9 +712,113 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             document["suggestions"] = self._map_record_suggestions_to_es(record.suggestions)
         if record.vectors:
             document["vectors"] = self._map_record_vectors_to_es(record.vectors)
+        if self.hydrate_records:
+            document[RECORD_SOURCE_FIELD] = self._map_record_to_source(record)
 
         return document
 
+    def _script_for_record_partial_update(
+        self, dataset: Dataset, record: Record, properties: Set[RecordIndexProperty]
+    ) -> Dict[str, Any]:
+        # Metadata and suggestions are replaced as a whole while responses and vectors are merged into the existing ones
+        source = ["ctx._source.updated_at = params.updated_at;"]
+        params = {"updated_at": record.updated_at}
+
+        if RecordIndexProperty.metadata in properties:
+            source.append("ctx._source.metadata = params.metadata;")
+            params["metadata"] = self._map_record_metadata_to_es(record.metadata_ or {}, dataset.metadata_properties)
+        if RecordIndexProperty.suggestions in properties:
+            source.append("ctx._source.suggestions = params.suggestions;")
+            params["suggestions"] = self._map_record_suggestions_to_es(record.suggestions)
+        if RecordIndexProperty.responses in properties:
+            source.append(es_script_for_merge_object("responses"))
+            params["responses"] = self._map_record_responses_to_es(record.responses)
+        if RecordIndexProperty.vectors in properties:
+            source.append(es_script_for_merge_object("vectors"))
+            params["vectors"] = self._map_record_vectors_to_es(record.vectors)
+
+        if self.hydrate_records:
+            source.append(self._script_for_record_source_partial_update(record, properties, params))
+
+        return {"source": " ".join(source), "params": params}
+
+    def _script_for_record_source_partial_update(
+        self, record: Record, properties: Set[RecordIndexProperty], params: Dict[str, Any]
+    ) -> str:
+        # The stored record is updated along with the document, so it keeps the same `updated_at` version
+        source = ["record.updated_at = params.updated_at;"]
+
+        if RecordIndexProperty.metadata in properties:
+            source.append("record.metadata = params.record_metadata;")
+            params["record_metadata"] = record.metadata_
+        if RecordIndexProperty.suggestions in properties:
+            source.append("record.suggestions = params.record_suggestions;")
+            params["record_suggestions"] = self._map_record_suggestions_to_source(record.suggestions)
+        if RecordIndexProperty.responses in properties:
+            source.append("record.responses.putAll(params.record_responses);")
+            params["record_responses"] = self._map_record_responses_to_source(record.responses)
+
+        # Records partially created by merging responses or suggestions into documents without one are left as they are
+        return (
+            f"def record = ctx._source.{RECORD_SOURCE_FIELD}; "
+            f"if (record != null && record.id != null) {{ {' '.join(source)} }}"
+        )
+
+    def _responses_update_doc(self, responses: List[Response]) -> Dict[str, Any]:
+        doc = {"responses": self._map_record_responses_to_es(responses)}
+        if self.hydrate_records:
+            # Partial documents are merged into the stored ones, so only the updated responses are replaced
+            doc[RECORD_SOURCE_FIELD] = {"responses": self._map_record_responses_to_source(responses)}
+
+        return doc
+
+    @classmethod
+    def _map_record_to_source(cls, record: Record) -> Dict[str, Any]:
+        # Vectors are not included since they're not needed by records listings unless explicitly requested.
+        # Responses and suggestions are keyed by user and question so they can be updated independently
+        return {
+            "id": str(record.id),
+            "fields": record.fields,
+            "metadata": record.metadata_,
+            "external_id": record.external_id,
+            "dataset_id": str(record.dataset_id),
+            "inserted_at": record.inserted_at,
+            "updated_at": record.updated_at,
+            "responses": cls._map_record_responses_to_source(record.responses),
+            "suggestions": cls._map_record_suggestions_to_source(record.suggestions),
+        }
+
+    @staticmethod
+    def _map_record_responses_to_source(responses: List[Response]) -> Dict[str, Any]:
+        return {
+            str(response.user_id): {
+                "id": str(response.id),
+                "values": response.values,
+                "status": response.status,
+                "record_id": str(response.record_id),
+                "user_id": str(response.user_id),
+                "inserted_at": response.inserted_at,
+                "updated_at": response.updated_at,
+            }
+            for response in responses
+        }
+
+    @staticmethod
+    def _map_record_suggestions_to_source(suggestions: List[Suggestion]) -> Dict[str, Any]:
+        return {
+            str(suggestion.question_id): {
+                "id": str(suggestion.id),
+                "question_id": str(suggestion.question_id),
+                "type": suggestion.type,
+                "value": suggestion.value,
+                "agent": suggestion.agent,
+                "score": suggestion.score,
+                "inserted_at": suggestion.inserted_at,
+                "updated_at": suggestion.updated_at,
+            }
+            for suggestion in suggestions
+        }
+
     @staticmethod
     def _map_record_responses_to_es(responses: List[Response]) -> Dict[str, Any]:
         return {
@@ -536,7 +843,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
     @staticmethod
     def _map_record_vectors_to_es(vectors: List[Vector]) -> Dict[str, List[float]]:
-        return {es_path_for_vector_settings(vector.vector_settings): vector.value for vector in vectors}
+        return {es_path_for_vector_settings(vector.vector_settings): vector_to_list(vector.value) for vector in vectors}
 
     @staticmethod
     def _map_record_metadata_to_es(
@@ -555,7 +862,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         index = await self._get_dataset_index(vector_settings.dataset)
 
         mappings = self._mapping_for_vector_settings(vector_settings)
-        await self.put_index_mapping_request(index, mappings)
+        await self._write_index_mapping_request(index, mappings)
 
     async def search(
         self,
@@ -571,6 +878,8 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         offset: int = 0,
         limit: int = 100,
         user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        with_records: bool = False,
     ) -> SearchResponses:
         # See https://www.elastic.co/guide/en/elasticsearch/reference/current/search-search.html
 
@@ -606,15 +915,67 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         index = await self._get_dataset_index(dataset)
 
         es_sort = self.build_elasticsearch_sort(sort) if sort else None
-        response = await self._index_search_request(index, query=es_query, size=limit, from_=offset, sort=es_sort)
+        source = False
+        if with_records and self.hydrate_records:
+            # The document `updated_at` is needed too, to check that the stored record is up to date
+            source = [RECORD_SOURCE_FIELD, RecordSortField.updated_at.value]
+
+        if cursor is not None:
+            return await self._search_with_cursor(
+                index, query=es_query, sort=es_sort, limit=limit, cursor=cursor, source=source
+            )
+
+        response = await self._index_search_request(
+            index, query=es_query, size=limit, from_=offset, sort=es_sort, source=source
+        )
 
         return await self._process_search_response(response)
 
-    async def compute_metrics_for(self, metadata_property: MetadataProperty) -> MetadataMetrics:
+    async def _search_with_cursor(
+        self,
+        index: str,
+        query: dict,
+        sort: Optional[str],
+        limit: int,
+        cursor: str,
+        source: Union[bool, List[str]] = False,
+    ) -> SearchResponses:
+        # See https://www.elastic.co/guide/en/elasticsearch/reference/current/paginate-search-results.html#search-after
+        # A point in time keeps the results (and the `random_score` used for user queues) stable between pages
+        if cursor == SEARCH_CURSOR_START:
+            pit_id, search_after = await self._open_point_in_time_request(index, self.cursor_keep_alive), None
+        else:
+            pit_id, search_after = es_decode_search_cursor(cursor)
+
+        response = await self._index_search_request(
+            index,
+            query=query,
+            size=limit,
+            # The record id is used as tiebreaker so no record is skipped or repeated between pages
+            sort=f"{sort or '_score:desc'},id:asc",
+            point_in_time={"id": pit_id, "keep_alive": self.cursor_keep_alive},
+            search_after=search_after,
+            source=source,
+        )
+
+        search_responses = await self._process_search_response(response)
+
+        hits = response["hits"]["hits"]
+        pit_id = response.get("pit_id", pit_id)
+        if len(hits) < limit:
+            await self._close_point_in_time_request(pit_id)
+        else:
+            search_responses.next_cursor = es_encode_search_cursor(pit_id, hits[-1]["sort"])
+
+        return search_responses
+
+    async def _compute_metrics_for(
+        self, metadata_property: MetadataProperty, size: Optional[int] = None, offset: int = 0
+    ) -> MetadataMetrics:
         index_name = await self._get_dataset_index(metadata_property.dataset)
 
         if metadata_property.type == MetadataPropertyType.terms:
-            return await self._metrics_for_terms_property(index_name, metadata_property)
+            return await self._metrics_for_terms_property(index_name, metadata_property, size=size, offset=offset)
 
         if metadata_property.type in [MetadataPropertyType.float, MetadataPropertyType.integer]:
             return await self._metrics_for_numeric_property(index_name, metadata_property)
@@ -634,20 +995,36 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         return metrics_class(min=stats["min"], max=stats["max"])
 
     async def _metrics_for_terms_property(
-        self, index_name: str, metadata_property: MetadataProperty, query: Optional[dict] = None
+        self,
+        index_name: str,
+        metadata_property: MetadataProperty,
+        query: Optional[dict] = None,
+        size: Optional[int] = None,
+        offset: int = 0,
     ) -> TermsMetadataMetrics:
         field_name = es_field_for_metadata_property(metadata_property)
         query = query or {"match_all": {}}
 
-        total_terms = await self.__value_count_aggregation(index_name, field_name=field_name, query=query)
+        # Buckets can only be paginated requesting all the previous ones, so one more bucket than the page is
+        # requested to know if there are more terms without computing all of them
+        terms_size = self.max_terms_size if size is None else min(offset + size + 1, self.max_terms_size)
+
+        total_terms, terms_buckets = await self.__terms_with_value_count_aggregations(
+            index_name, field_name=field_name, query=query, size=terms_size
+        )
         if total_terms == 0:
             return TermsMetadataMetrics(total=total_terms)
 
-        terms_buckets = await self.__terms_aggregation(index_name, field_name=field_name, query=query, size=total_terms)
+        if size is None:
+            page_buckets, next_cursor = terms_buckets, None
+        else:
+            page_buckets = terms_buckets[offset : offset + size]
+            next_cursor = encode_terms_metrics_cursor(offset + size) if len(terms_buckets) > offset + size else None
+
         terms_values = [
-            TermsMetadataMetrics.TermCount(term=bucket["key"], count=bucket["doc_count"]) for bucket in terms_buckets
+            TermsMetadataMetrics.TermCount(term=bucket["key"], count=bucket["doc_count"]) for bucket in page_buckets
         ]
-        return TermsMetadataMetrics(total=total_terms, values=terms_values)
+        return TermsMetadataMetrics(total=total_terms, values=terms_values, next_cursor=next_cursor)
 
     def _configure_index_mappings(self, dataset: Dataset) -> dict:
         return {
@@ -665,9 +1042,17 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
                 **self._mapping_for_suggestions(dataset.questions),
                 **self._mapping_for_metadata_properties(dataset.metadata_properties),
                 **self._mapping_for_vectors_settings(dataset.vectors_settings),
+                **self._mapping_for_record_source(),
             },
         }
 
+    def _mapping_for_record_source(self) -> dict:
+        if not self.hydrate_records:
+            return {}
+
+        # See https://www.elastic.co/guide/en/elasticsearch/reference/current/enabled.html
+        return {RECORD_SOURCE_FIELD: {"type": "object", "enabled": False}}
+
     async def _process_search_response(
         self, response: dict, score_threshold: Optional[float] = None
     ) -> SearchResponses:
@@ -676,11 +1061,27 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         if score_threshold is not None:
             hits = filter(lambda hit: hit["_score"] >= score_threshold, hits)
 
-        items = [SearchResponseItem(record_id=UUID(hit["_id"]), score=hit["_score"]) for hit in hits]
+        items = [
+            SearchResponseItem(record_id=UUID(hit["_id"]), score=hit["_score"], record=self._get_hit_record(hit))
+            for hit in hits
+        ]
         total = response["hits"]["total"]["value"]
 
         return SearchResponses(items=items, total=total)
 
+    @staticmethod
+    def _get_hit_record(hit: dict) -> Optional[Dict[str, Any]]:
+        source = hit.get("_source") or {}
+        record = source.get(RECORD_SOURCE_FIELD)
+
+        # Stored records are discarded when they are not complete or don't have the same version as the document,
+        # which could happen for documents indexed before storing records or updated by operations not maintaining them
+        updated_at = source.get(RecordSortField.updated_at.value)
+        if record is None or record.get("id") is None or updated_at is None or record.get("updated_at") != updated_at:
+            return None
+
+        return record
+
     @staticmethod
     def _build_text_query(dataset: Dataset, text: Optional[Union[TextQuery, str]] = None) -> dict:
         if text is None:
@@ -747,11 +1148,60 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             ],
         ]
 
+    def _index_records_bulk_actions(self, index_name: str, records: Iterable[Record]) -> List[Dict[str, Any]]:
+        return [
+            {
+                # If document exist, we update source with latest version
+                "_op_type": "index",  # TODO: Review and maybe change to partial update
+                "_id": record.id,
+                "_index": index_name,
+                **self._map_record_to_es_document(record),
+            }
+            for record in records
+        ]
+
     async def _get_dataset_index(self, dataset: Dataset):
         index_name = es_index_name_for_dataset(dataset)
 
         return index_name
 
+    # Writes to a dataset index are applied to the new index of the dataset too while it's being reindexed, so no
+    # write is lost when the new index replaces the current one. The new index is looked up before writing to the
+    # current one, so writes done while the indices are swapped always reach the new index.
+
+    async def _write_bulk_op_request(self, actions: List[Dict[str, Any]]):
+        reindex_actions = []
+        for index_name in {action["_index"] for action in actions}:
+            for reindex_index_name in await self._get_alias_indices_request(es_reindex_alias_for_index(index_name)):
+                reindex_actions += [
+                    {**action, "_index": reindex_index_name} for action in actions if action["_index"] == index_name
+                ]
+
+        await self._bulk_op_request(actions)
+        if reindex_actions:
+            # Documents not reindexed yet are written (with their latest changes) by the reindex itself
+            await self._bulk_op_request(reindex_actions, ignore_missing_documents=True)
+
+    async def _write_update_document_request(self, index_name: str, id: str, body: dict):
+        reindex_indices = await self._get_alias_indices_request(es_reindex_alias_for_index(index_name))
+
+        await self._update_document_request(index_name, id=id, body=body)
+        if reindex_indices:
+            await self._bulk_op_request(
+                [
+                    {"_op_type": "update", "_id": id, "_index": reindex_index_name, **body}
+                    for reindex_index_name in reindex_indices
+                ],
+                ignore_missing_documents=True,
+            )
+
+    async def _write_index_mapping_request(self, index_name: str, mappings: dict):
+        reindex_indices = await self._get_alias_indices_request(es_reindex_alias_for_index(index_name))
+
+        await self.put_index_mapping_request(index_name, mappings)
+        for reindex_index_name in reindex_indices:
+            await self.put_index_mapping_request(reindex_index_name, mappings)
+
     def _mapping_for_vectors_settings(self, vectors_settings: List[VectorSettings]) -> dict:
         mappings = {}
         for vector in vectors_settings:
@@ -759,21 +1209,20 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         return mappings
 
-    async def __terms_aggregation(self, index_name: str, field_name: str, query: dict, size: int) -> List[dict]:
-        aggregation_name = "terms_agg"
-
-        terms_agg = {aggregation_name: {"terms": {"field": field_name, "size": min(size, self.max_terms_size)}}}
-
-        response = await self._index_search_request(index_name, query=query, aggregations=terms_agg, size=0)
-        return response["aggregations"][aggregation_name]["buckets"]
-
-    async def __value_count_aggregation(self, index_name: str, field_name: str, query: dict) -> int:
-        aggregation_name = "count_values"
-
-        value_count_agg = {aggregation_name: {"value_count": {"field": field_name}}}
+    async def __terms_with_value_count_aggregations(
+        self, index_name: str, field_name: str, query: dict, size: int
+    ) -> Tuple[int, List[dict]]:
+        # Both aggregations are computed in a single request. Terms are sorted by key too when they have the same
+        # count, so pages are always computed with the same terms order
+        aggregations = {
+            "count_values": {"value_count": {"field": field_name}},
+            "terms_agg": {
+                "terms": {"field": field_name, "size": size, "order": [{"_count": "desc"}, {"_key": "asc"}]},
+            },
+        }
 
-        response = await self._index_search_request(index_name, query=query, aggregations=value_count_agg, size=0)
-        return response["aggregations"][aggregation_name]["value"]
+        response = await self._index_search_request(index_name, query=query, aggregations=aggregations, size=0)
+        return response["aggregations"]["count_values"]["value"], response["aggregations"]["terms_agg"]["buckets"]
 
     async def __stats_aggregation(self, index_name: str, field_name: str, query: dict) -> dict:
         # See https://www.elastic.co/guide/en/elasticsearch/reference/current/search-aggregations-metrics-stats-aggregation.html
@@ -799,6 +1248,21 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         """Defines one mapping property configuration for a vector_setting definition"""
         pass
 
+    @abstractmethod
+    def _build_similarity_search_request_body(
+        self,
+        vector_settings: VectorSettings,
+        value: List[float],
+        k: int,
+        excluded_id: Optional[UUID] = None,
+        query_filters: Optional[List[dict]] = None,
+    ) -> dict:
+        """
+        Builds the similarity search request body based on a vector configuration, a vector value,
+        the `k` number of results to retrieve and an optional filter configuration to apply
+        """
+        pass
+
     @abstractmethod
     async def _request_similarity_search(
         self,
@@ -815,6 +1279,11 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         """
         pass
 
+    @abstractmethod
+    async def _multi_search_request(self, index: str, searches: List[dict]) -> List[dict]:
+        """Executes several search requests (bodies) at once, returning their responses in the same order"""
+        pass
+
     @abstractmethod
     async def _create_index_request(self, index_name: str, mappings: dict, settings: dict) -> None:
         """Executes request for index creation"""
@@ -844,8 +1313,20 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         from_: Optional[int] = None,
         sort: Optional[str] = None,
         aggregations: Optional[dict] = None,
+        point_in_time: Optional[dict] = None,
+        search_after: Optional[List[Any]] = None,
     ) -> dict:
-        """Executes request for search documents on a index"""
+        """Executes request for search documents on a index (or on a point in time, if provided)"""
+        pass
+
+    @abstractmethod
+    async def _open_point_in_time_request(self, index: str, keep_alive: str) -> str:
+        """Executes request for opening a point in time on a index, returning its id"""
+        pass
+
+    @abstractmethod
+    async def _close_point_in_time_request(self, pit_id: str):
+        """Executes request for closing a point in time"""
         pass
 
     @abstractmethod
@@ -854,10 +1335,21 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         pass
 
     @abstractmethod
-    async def _bulk_op_request(self, actions: List[Dict[str, Any]]):
-        """Executes request for bulk operations"""
+    async def _bulk_op_request(self, actions: List[Dict[str, Any]], ignore_missing_documents: bool = False):
+        """Executes request for bulk operations. Operations on missing documents fail unless they're deletes, or
+        `ignore_missing_documents` is True"""
         pass
 
     @abstractmethod
     async def _refresh_index_request(self, index_name: str):
         pass
+
+    @abstractmethod
+    async def _get_alias_indices_request(self, alias: str) -> List[str]:
+        """Executes request for getting the indices behind an alias (empty if the alias does not exist)"""
+        pass
+
+    @abstractmethod
+    async def _update_aliases_request(self, actions: List[dict]):
+        """Executes request for atomically applying a list of alias actions"""
+        pass
@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 import dataclasses
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
 from elasticsearch8 import AsyncElasticsearch, helpers
@@ -23,6 +23,8 @@ from argilla_server.search_engine import SearchEngine
 from argilla_server.search_engine.commons import (
     BaseElasticAndOpenSearchEngine,
     es_bool_query,
+    es_bulk_errors_without_missing_deletes,
+    es_bulk_errors_without_missing_documents,
     es_field_for_vector_settings,
     es_ids_query,
 )
@@ -53,12 +55,15 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
             ca_certs=settings.elasticsearch_ca_path,
             retry_on_timeout=True,
             max_retries=5,
+            connections_per_node=settings.elasticsearch_connections_per_node,
+            request_timeout=settings.elasticsearch_request_timeout,
         )
         return cls(
             config=config,
             number_of_shards=settings.es_records_index_shards,
             number_of_replicas=settings.es_records_index_replicas,
             default_total_fields_limit=settings.es_mapping_total_fields_limit,
+            hydrate_records=settings.search_engine_hydrate_records,
         )
 
     async def close(self):
@@ -80,9 +85,8 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
             }
         }
 
-    async def _request_similarity_search(
+    def _build_similarity_search_request_body(
         self,
-        index: str,
         vector_settings: VectorSettings,
         value: List[float],
         k: int,
@@ -110,7 +114,34 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
             )
 
             knn_query["filter"] = bool_filter_query
-        return await self.client.search(index=index, knn=knn_query, _source=False, track_total_hits=True, size=k)
+        return {"knn": knn_query, "_source": False, "track_total_hits": True, "size": k}
+
+    async def _request_similarity_search(
+        self,
+        index: str,
+        vector_settings: VectorSettings,
+        value: List[float],
+        k: int,
+        excluded_id: Optional[UUID] = None,
+        query_filters: Optional[List[dict]] = None,
+    ) -> dict:
+        body = self._build_similarity_search_request_body(vector_settings, value, k, excluded_id, query_filters)
+        return await self.client.search(index=index, **body)
+
+    async def _multi_search_request(self, index: str, searches: List[dict]) -> List[dict]:
+        # See https://www.elastic.co/guide/en/elasticsearch/reference/current/search-multi-search.html
+        response = await self.client.msearch(
+            index=index,
+            searches=[line for search in searches for line in ({}, search)],
+            max_concurrent_searches=settings.search_engine_max_concurrent_searches,
+        )
+
+        responses = response["responses"]
+        errors = [response["error"] for response in responses if "error" in response]
+        if errors:
+            raise RuntimeError(errors)
+
+        return responses
 
     async def _create_index_request(self, index_name: str, mappings: dict, settings: dict) -> None:
         await self.client.indices.create(index=index_name, settings=settings, mappings=mappings)
@@ -133,26 +164,52 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
         from_: Optional[int] = None,
         sort: Optional[str] = None,
         aggregations: Optional[dict] = None,
+        point_in_time: Optional[dict] = None,
+        search_after: Optional[List[Any]] = None,
+        source: Union[bool, List[str]] = False,
     ) -> dict:
         return await self.client.search(
-            index=index,
+            # Searches on a point in time cannot specify the index
+            index=None if point_in_time else index,
             query=query,
             from_=from_,
             size=size,
-            source=False,
+            source=source,
             aggregations=aggregations,
             sort=sort,
+            pit=point_in_time,
+            search_after=search_after,
             track_total_hits=True,
         )
 
+    async def _open_point_in_time_request(self, index: str, keep_alive: str) -> str:
+        response = await self.client.open_point_in_time(index=index, keep_alive=keep_alive)
+        return response["id"]
+
+    async def _close_point_in_time_request(self, pit_id: str):
+        await self.client.close_point_in_time(id=pit_id)
+
     async def _index_exists_request(self, index_name: str) -> bool:
         return await self.client.indices.exists(index=index_name)
 
-    async def _bulk_op_request(self, actions: List[Dict[str, Any]]):
+    async def _bulk_op_request(self, actions: List[Dict[str, Any]], ignore_missing_documents: bool = False):
         # https://www.elastic.co/guide/en/elasticsearch/reference/current/indices-refresh.html#refresh-api-desc
         _, errors = await helpers.async_bulk(client=self.client, actions=actions, raise_on_error=False, refresh=True)
+        errors = es_bulk_errors_without_missing_deletes(errors)
+        if ignore_missing_documents:
+            errors = es_bulk_errors_without_missing_documents(errors)
         if errors:
             raise RuntimeError(errors)
 
     async def _refresh_index_request(self, index_name: str):
         await self.client.indices.refresh(index=index_name)
+
+    async def _get_alias_indices_request(self, alias: str) -> List[str]:
+        if not await self.client.indices.exists_alias(name=alias):
+            return []
+
+        response = await self.client.indices.get_alias(name=alias)
+        return list(response.body)
+
+    async def _update_aliases_request(self, actions: List[dict]):
+        await self.client.indices.update_aliases(actions=actions)
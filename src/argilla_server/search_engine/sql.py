@@ -0,0 +1,922 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import base64
+import dataclasses
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncGenerator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import (
+    Float,
+    Integer,
+    String,
+    Text,
+    Uuid,
+    and_,
+    bindparam,
+    case,
+    cast,
+    column,
+    delete,
+    exists,
+    false,
+    func,
+    insert,
+    literal_column,
+    not_,
+    null,
+    or_,
+    select,
+    table,
+    true,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_object_session
+from sqlalchemy.sql import ColumnElement, Select
+from starlette.concurrency import run_in_threadpool
+
+from argilla_server.database import AsyncSessionLocal
+from argilla_server.enums import (
+    FieldType,
+    MetadataPropertyType,
+    QuestionType,
+    RecordIndexProperty,
+    ResponseStatusFilter,
+    SimilarityOrder,
+    SortOrder,
+)
+from argilla_server.models import (
+    Dataset,
+    Field,
+    MetadataProperty,
+    Question,
+    Record,
+    Response,
+    Suggestion,
+    Vector,
+    VectorSettings,
+)
+from argilla_server.models.vectors import vector_to_list
+from argilla_server.search_engine.base import (
+    SEARCH_CURSOR_START,
+    AndFilter,
+    Filter,
+    FilterScope,
+    FloatMetadataMetrics,
+    IntegerMetadataMetrics,
+    MetadataFilter,
+    MetadataFilterScope,
+    MetadataMetrics,
+    Order,
+    RangeFilter,
+    RecordFilterScope,
+    ResponseFilterScope,
+    SearchEngine,
+    SearchResponseItem,
+    SearchResponses,
+    SimilarityQuery,
+    SortBy,
+    SuggestionFilterScope,
+    TermsFilter,
+    TermsMetadataMetrics,
+    TextQuery,
+    UserResponseStatusFilter,
+    encode_terms_metrics_cursor,
+)
+from argilla_server.search_engine.commons import (
+    _unify_metadata_filters_with_filter,
+    _unify_sort_by_with_order,
+    _unify_user_response_status_filter_with_filter,
+    is_response_status_scope,
+)
+from argilla_server.search_engine.vector_index import Neighbours, VectorIndex
+from argilla_server.settings import settings
+
+POSTGRESQL_DIALECT = "postgresql"
+# See https://www.postgresql.org/docs/current/textsearch-dictionaries.html#TEXTSEARCH-SIMPLE-DICTIONARY
+POSTGRESQL_TEXT_SEARCH_CONFIG = "simple"
+
+# Full-text index of the records text fields, with a row for each record field. On SQLite, the rows are indexed by the
+# `records_texts_fts` FTS5 table (kept in sync by triggers), while on PostgreSQL a GIN index of their `to_tsvector`
+# document is used. See the `d2c3227988e8` database migration.
+records_texts_table = table(
+    "records_texts",
+    column("id", Integer),
+    column("record_id", Uuid),
+    column("field_name", String),
+    column("text", Text),
+)
+records_texts_fts_table = table("records_texts_fts", column("rowid", Integer), column("text", Text))
+
+# Vectors updated during this period before the last loaded vector are loaded again on every search, so vectors written
+# by transactions committed after others with a later `updated_at` are not missed
+VECTOR_INDEX_REFRESH_MARGIN = timedelta(seconds=5)
+
+
+def sql_encode_search_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode()).decode()
+
+
+def sql_decode_search_cursor(cursor: str) -> int:
+    try:
+        offset = json.loads(base64.urlsafe_b64decode(cursor.encode()))["offset"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Search cursor {cursor!r} is not valid") from e
+
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError(f"Search cursor {cursor!r} is not valid")
+
+    return offset
+
+
+def sql_json_path(path: Tuple[str, ...]) -> str:
+    # See https://www.sqlite.org/json1.html#path_arguments
+    return "$" + "".join(f'."{key}"' for key in path)
+
+
+def sql_json_elements(dialect: str, column: ColumnElement, path: Tuple[str, ...]):
+    """
+    Returns a table valued function with a `value` column for each element of the JSON array found at `path` inside
+    the `column` JSON document. Scalar values are returned as a single element, so they can be filtered (and
+    aggregated) the same way search engines handle single and multi-valued fields.
+    """
+    if dialect == POSTGRESQL_DIALECT:
+        value = cast(column, postgresql.JSONB).op("#>", return_type=postgresql.JSONB)(_pg_json_path(path))
+        array_value = case((func.jsonb_typeof(value) == "array", value), else_=func.jsonb_build_array(value))
+
+        return func.jsonb_array_elements_text(array_value).table_valued("value")
+
+    # See https://www.sqlite.org/json1.html#jeach
+    return func.json_each(column, sql_json_path(path)).table_valued("value")
+
+
+def _pg_json_path(path: Tuple[str, ...]):
+    return bindparam(None, list(path), type_=postgresql.ARRAY(Text))
+
+
+def _epoch_millis_to_datetime(value: Optional[float]) -> Optional[datetime]:
+    # Date range filters use epoch milliseconds, as search engines do
+    return datetime.utcfromtimestamp(value / 1000) if value is not None else None
+
+
+def _text_query_terms(q: str) -> List[str]:
+    # Terms without any letter or digit have no tokens to search for, so they are ignored as search engines do
+    return [term for term in q.split() if any(char.isalnum() for char in term)]
+
+
+def _pg_text_search_config() -> ColumnElement:
+    return literal_column(f"'{POSTGRESQL_TEXT_SEARCH_CONFIG}'::regconfig")
+
+
+@dataclasses.dataclass
+class _VectorIndexEntry:
+    """In-process vector index together with the state needed to keep it in sync with the database"""
+
+    index: VectorIndex
+    # Serializes the index operations, that run in worker threads so they don't block the event loop
+    lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock)
+    # Max `Vector.updated_at` loaded from the database, so only newer vectors are loaded on following searches
+    loaded_until: Optional[datetime] = None
+
+
+@dataclasses.dataclass
+class _DatasetSchema:
+    """Dataset configuration needed to build the records SQL queries, loaded once per search"""
+
+    id: Any
+    text_fields: List[str]
+    questions_types: Dict[str, QuestionType]
+    metadata_properties_types: Dict[str, MetadataPropertyType]
+
+
+@dataclasses.dataclass
+class _RecordsQueryBuilder:
+    """Translates the search engine queries, filters and sorts into SQL expressions over the dataset records"""
+
+    dialect: str
+    schema: _DatasetSchema
+
+    def build_where(self, query: Optional[Union[TextQuery, str]], filter: Optional[Filter]) -> List[ColumnElement]:
+        where = [Record.dataset_id == self.schema.id]
+
+        if query is not None:
+            where.append(self.build_text_query(query))
+        if filter:
+            where.append(self.build_filter(filter))
+
+        return where
+
+    def build_text_query(self, text: Union[TextQuery, str]) -> ColumnElement:
+        if isinstance(text, str):
+            text = TextQuery(q=text)
+
+        field_names = [text.field] if text.field else self.schema.text_fields
+        terms = _text_query_terms(text.q)
+        if not field_names or not terms:
+            return false()
+
+        # Every term must be found in some of the fields (like `cross_fields` with `and` operator does)
+        return and_(true(), *[Record.id.in_(self._text_term_records_ids(field_names, term)) for term in terms])
+
+    def build_text_query_score(self, text: Optional[Union[TextQuery, str]]) -> Optional[ColumnElement]:
+        # Only PostgreSQL is able to rank the text query matches
+        if text is None or self.dialect != POSTGRESQL_DIALECT:
+            return None
+
+        if isinstance(text, str):
+            text = TextQuery(q=text)
+
+        field_names = [text.field] if text.field else self.schema.text_fields
+        if not field_names:
+            return None
+
+        fields_ranks = func.ts_rank(self._pg_document(records_texts_table.c.text), self._pg_query(text.q))
+
+        return (
+            select(func.sum(fields_ranks))
+            .where(records_texts_table.c.record_id == Record.id, records_texts_table.c.field_name.in_(field_names))
+            .scalar_subquery()
+        )
+
+    def build_filter(self, filter: Filter) -> ColumnElement:
+        if isinstance(filter, AndFilter):
+            return and_(true(), *[self.build_filter(f) for f in filter.filters])
+
+        # This is a special case for response status filter, since it's compound by multiple filters
+        if is_response_status_scope(filter.scope):
+            status_filter = UserResponseStatusFilter(
+                user=filter.scope.user, statuses=[ResponseStatusFilter(v) for v in filter.values]
+            )
+            return self.build_response_status_filter(status_filter)
+
+        if isinstance(filter, TermsFilter):
+
+            def condition(value: ColumnElement) -> ColumnElement:
+                return cast(value, String).in_(filter.values)
+
+        elif isinstance(filter, RangeFilter):
+
+            def condition(value: ColumnElement) -> ColumnElement:
+                return self._range_condition(cast(value, Float), filter.ge, filter.le)
+
+        else:
+            raise ValueError(f"Cannot process request for filter {filter}")
+
+        if isinstance(filter.scope, RecordFilterScope):
+            column = self._record_column(filter.scope.property)
+            if isinstance(filter, RangeFilter):
+                ge, le = _epoch_millis_to_datetime(filter.ge), _epoch_millis_to_datetime(filter.le)
+                return self._range_condition(column, ge, le)
+            return column.in_(filter.values)
+
+        values_query, value = self._scope_values_query(filter.scope)
+
+        return exists(values_query.where(condition(value)))
+
+    def build_response_status_filter(self, status_filter: UserResponseStatusFilter) -> ColumnElement:
+        responses_query = select(Response.id).where(Response.record_id == Record.id)
+        if status_filter.user is not None:
+            responses_query = responses_query.where(Response.user_id == status_filter.user.id)
+
+        filters = []
+        if status_filter.has_pending_status:
+            filters.append(not_(exists(responses_query)))
+        if status_filter.response_statuses:
+            filters.append(exists(responses_query.where(Response.status.in_(status_filter.response_statuses))))
+
+        return or_(false(), *filters)
+
+    def build_order_by(self, sort: Optional[List[Order]], score: Optional[ColumnElement]) -> List[ColumnElement]:
+        order_by = []
+
+        for order in sort or []:
+            if isinstance(order.scope, RecordFilterScope):
+                sort_value = self._record_column(order.scope.property)
+            else:
+                values_query, value = self._scope_values_query(order.scope)
+                if self._is_numeric_scope(order.scope):
+                    value = cast(value, Float)
+                # Multi-valued fields are sorted using their min value for ascending sorts and the max one for
+                # descending sorts
+                aggregation = func.min if order.order == SortOrder.asc else func.max
+                sort_value = values_query.with_only_columns(aggregation(value)).scalar_subquery()
+
+            order_by.append(sort_value.asc() if order.order == SortOrder.asc else sort_value.desc())
+
+        if not order_by and score is not None:
+            order_by.append(score.desc())
+
+        # The record id is used as tiebreaker so pagination is stable
+        return [*order_by, Record.inserted_at.asc(), Record.id.asc()]
+
+    def _text_term_records_ids(self, field_names: List[str], term: str) -> Select:
+        """Returns a query with the ids of the records with some of the fields matching the term (using the index)"""
+        query = select(records_texts_table.c.record_id).where(records_texts_table.c.field_name.in_(field_names))
+
+        if self.dialect == POSTGRESQL_DIALECT:
+            return query.where(self._pg_document(records_texts_table.c.text).op("@@")(self._pg_query(term)))
+
+        # Terms are searched as FTS5 phrases, so their characters are not parsed as FTS5 query syntax
+        # See https://www.sqlite.org/fts5.html#fts5_strings
+        phrase = '"' + term.replace('"', '""') + '"'
+
+        return query.join(records_texts_fts_table, records_texts_fts_table.c.rowid == records_texts_table.c.id).where(
+            records_texts_fts_table.c.text.match(phrase)
+        )
+
+    def _scope_values_query(self, scope: FilterScope) -> Tuple[Select, ColumnElement]:
+        """Returns a query correlated to the records table with the values of the scope and the values column"""
+        if isinstance(scope, MetadataFilterScope):
+            values = sql_json_elements(self.dialect, Record.metadata_, (scope.metadata_property,))
+            return select(values.c.value).select_from(values), values.c.value
+
+        if isinstance(scope, SuggestionFilterScope):
+            query = (
+                select(Suggestion.id)
+                .join(Question, Question.id == Suggestion.question_id)
+                .where(Suggestion.record_id == Record.id, Question.name == scope.question)
+            )
+            if scope.property in ("value", "score"):
+                values = sql_json_elements(self.dialect, getattr(Suggestion, scope.property), ())
+                return query.join(values, true()), values.c.value
+            elif scope.property in ("agent", "type"):
+                return query, getattr(Suggestion, scope.property)
+
+        if isinstance(scope, ResponseFilterScope) and scope.question is not None:
+            values = sql_json_elements(self.dialect, Response.values, (scope.question, "value"))
+            query = select(Response.id).join(values, true()).where(Response.record_id == Record.id)
+            if scope.user is not None:
+                query = query.where(Response.user_id == scope.user.id)
+            return query, values.c.value
+
+        raise ValueError(f"Cannot process request for search scope {scope}")
+
+    def _is_numeric_scope(self, scope: FilterScope) -> bool:
+        if isinstance(scope, MetadataFilterScope):
+            return self.schema.metadata_properties_types.get(scope.metadata_property) in (
+                MetadataPropertyType.integer,
+                MetadataPropertyType.float,
+            )
+        if isinstance(scope, SuggestionFilterScope) and scope.property == "score":
+            return True
+        if isinstance(scope, (SuggestionFilterScope, ResponseFilterScope)):
+            return self.schema.questions_types.get(scope.question) == QuestionType.rating
+
+        return False
+
+    @staticmethod
+    def _record_column(property: str) -> ColumnElement:
+        if property not in ("inserted_at", "updated_at"):
+            raise ValueError(f"Cannot process request for record property {property}")
+
+        return getattr(Record, property)
+
+    @staticmethod
+    def _range_condition(value: ColumnElement, ge: Optional[Any], le: Optional[Any]) -> ColumnElement:
+        conditions = []
+        if ge is not None:
+            conditions.append(value >= ge)
+        if le is not None:
+            conditions.append(value <= le)
+
+        return and_(true(), *conditions)
+
+    @staticmethod
+    def _pg_document(text: ColumnElement) -> ColumnElement:
+        # The expression must be the same used by the full-text index (with the configuration as a literal instead of
+        # a bound parameter), so PostgreSQL uses the index
+        # See https://www.postgresql.org/docs/current/textsearch-tables.html#TEXTSEARCH-TABLES-INDEX
+        return func.to_tsvector(_pg_text_search_config(), text)
+
+    @staticmethod
+    def _pg_query(q: str) -> ColumnElement:
+        return func.plainto_tsquery(_pg_text_search_config(), q)
+
+
+@SearchEngine.register(engine_name="sql")
+@dataclasses.dataclass
+class SQLSearchEngine(SearchEngine):
+    """
+    Search engine running in-process on top of the application database, so no search cluster is required.
+
+    Records are searched directly on the database tables, so most indexing operations are no-ops since the database is
+    always up to date. The exceptions are:
+
+    - The records text fields, that are written to a full-text index in the database (SQLite FTS5 or a PostgreSQL GIN
+    index) as records are indexed. Index changes are written in the transaction of the indexed records session, so
+    they are committed (or rolled back) together with the records changes.
+    - The vectors, that are kept in in-process vector indexes (one per vector settings) built from the database on the
+    first similarity search and updated as records are indexed. Before every similarity search, vectors written since
+    the last load (e.g. by other server workers) are loaded too.
+
+    It's intended for small single-node deployments and testing environments.
+    """
+
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+    vector_index: str = "ivf"
+    vector_index_load_batch_size: int = 10000
+    # Max number of most frequent terms computed for terms metadata properties, so it caps their pagination too
+    max_terms_size: int = 2**14
+
+    _vector_indexes: Dict[Tuple[UUID, UUID], _VectorIndexEntry] = dataclasses.field(default_factory=dict, init=False)
+    _vector_indexes_lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock, init=False)
+
+    @classmethod
+    async def new_instance(cls) -> "SQLSearchEngine":
+        return cls(vector_index=settings.search_engine_vector_index)
+
+    async def close(self):
+        pass
+
+    async def info(self) -> dict:
+        async with self._get_db() as db:
+            return {"distribution": "sql", "dialect": db.bind.dialect.name}
+
+    async def create_index(self, dataset: Dataset):
+        pass
+
+    async def delete_index(self, dataset: Dataset):
+        for dataset_id, vector_settings_id in list(self._vector_indexes):
+            if dataset_id == dataset.id:
+                del self._vector_indexes[(dataset_id, vector_settings_id)]
+
+        self.metrics_cache.invalidate(dataset.id)
+
+    async def create_reindex_index(self, dataset: Dataset) -> str:
+        return str(dataset.id)
+
+    async def reindex_records(self, dataset: Dataset, records: Iterable[Record], index_name: str):
+        # Reindexed records are not written by the caller, so the full-text index changes are committed here
+        await self._index_records(dataset, list(records), commit=True)
+
+    async def list_reindex_records_ids(
+        self, dataset: Dataset, index_name: str, after: Optional[UUID] = None, limit: int = 100
+    ) -> List[UUID]:
+        return []
+
+    async def delete_reindex_records(self, dataset: Dataset, records_ids: Iterable[UUID], index_name: str):
+        pass
+
+    async def swap_reindex_index(self, dataset: Dataset, index_name: str):
+        self.metrics_cache.invalidate(dataset.id)
+
+    async def configure_metadata_property(self, dataset: Dataset, metadata_property: MetadataProperty):
+        self.metrics_cache.invalidate(dataset.id)
+
+    async def index_records(self, dataset: Dataset, records: Iterable[Record]):
+        await self._index_records(dataset, list(records))
+
+    async def partial_update_records(
+        self, dataset: Dataset, records: Iterable[Record], properties: Iterable[RecordIndexProperty]
+    ):
+        # Records fields cannot be partially updated, so the full-text index is always up to date here
+        properties = set(properties)
+
+        if RecordIndexProperty.metadata in properties:
+            self.metrics_cache.invalidate(dataset.id)
+
+        if RecordIndexProperty.vectors in properties and self._has_vector_indexes(dataset):
+            await self.set_records_vectors(dataset, [vector for record in records for vector in record.vectors])
+
+    async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
+        records = list(records)
+        if records:
+            async with self._get_records_db(records) as db:
+                await self._delete_records_texts(db, records)
+
+        self.metrics_cache.invalidate(dataset.id)
+
+        if not self._has_vector_indexes(dataset):
+            return
+
+        records_ids = [record.id for record in records]
+        for (dataset_id, _), vector_index_entry in list(self._vector_indexes.items()):
+            if dataset_id == dataset.id:
+                async with vector_index_entry.lock:
+                    vector_index_entry.index.delete(records_ids)
+
+    async def update_record_response(self, response: Response):
+        pass
+
+    async def update_records_responses(self, responses: Iterable[Response]):
+        pass
+
+    async def delete_record_response(self, response: Response):
+        pass
+
+    async def update_record_suggestion(self, suggestion: Suggestion):
+        pass
+
+    async def delete_record_suggestion(self, suggestion: Suggestion):
+        pass
+
+    async def set_records_vectors(self, dataset: Dataset, vectors: Iterable[Vector]):
+        vectors_by_settings_id: Dict[UUID, List[Vector]] = {}
+        for vector in vectors:
+            vectors_by_settings_id.setdefault(vector.vector_settings_id, []).append(vector)
+
+        for vector_settings_id, settings_vectors in vectors_by_settings_id.items():
+            vector_index_entry = self._vector_indexes.get((dataset.id, vector_settings_id))
+            # Vector indexes not built yet will load the vectors from the database once they are needed
+            if vector_index_entry is not None:
+                async with vector_index_entry.lock:
+                    await run_in_threadpool(
+                        vector_index_entry.index.upsert,
+                        [vector.record_id for vector in settings_vectors],
+                        np.asarray([vector.value for vector in settings_vectors], dtype=np.float32),
+                    )
+
+    async def search(
+        self,
+        dataset: Dataset,
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[List[Order]] = None,
+        user_response_status_filter: Optional[UserResponseStatusFilter] = None,
+        metadata_filters: Optional[List[MetadataFilter]] = None,
+        sort_by: Optional[List[SortBy]] = None,
+        offset: int = 0,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        with_records: bool = False,
+    ) -> SearchResponses:
+        if metadata_filters:
+            filter = _unify_metadata_filters_with_filter(metadata_filters, filter)
+        if user_response_status_filter and user_response_status_filter.statuses:
+            filter = _unify_user_response_status_filter_with_filter(user_response_status_filter, filter)
+
+        if sort_by:
+            sort = _unify_sort_by_with_order(sort_by, sort)
+
+        # Cursors keep the offset of the next page, since results are always sorted using the record id as tiebreaker
+        if cursor is not None:
+            offset = 0 if cursor == SEARCH_CURSOR_START else sql_decode_search_cursor(cursor)
+
+        async with self._get_db() as db:
+            query_builder = await self._get_records_query_builder(db, dataset)
+
+            where = query_builder.build_where(query, filter)
+            score = query_builder.build_text_query_score(query)
+            order_by = query_builder.build_order_by(sort, score)
+
+            total = (await db.execute(select(func.count(Record.id)).where(*where))).scalar_one()
+
+            records_query = select(Record.id, score if score is not None else null())
+            result = await db.execute(records_query.where(*where).order_by(*order_by).offset(offset).limit(limit))
+
+            items = [SearchResponseItem(record_id=record_id, score=score) for record_id, score in result.all()]
+
+        search_responses = SearchResponses(items=items, total=total)
+        if cursor is not None and offset + len(items) < total:
+            search_responses.next_cursor = sql_encode_search_cursor(offset + len(items))
+
+        return search_responses
+
+    async def _compute_metrics_for(
+        self, metadata_property: MetadataProperty, size: Optional[int] = None, offset: int = 0
+    ) -> MetadataMetrics:
+        async with self._get_db() as db:
+            values = sql_json_elements(db.bind.dialect.name, Record.metadata_, (metadata_property.name,))
+            records_values = (
+                select(values.c.value)
+                .select_from(Record)
+                .join(values, true())
+                .where(Record.dataset_id == metadata_property.dataset_id, values.c.value.is_not(None))
+            )
+
+            if metadata_property.type == MetadataPropertyType.terms:
+                return await self._metrics_for_terms_property(
+                    db, records_values, values.c.value, size=size, offset=offset
+                )
+
+            if metadata_property.type in [MetadataPropertyType.float, MetadataPropertyType.integer]:
+                return await self._metrics_for_numeric_property(
+                    db, metadata_property, records_values, cast(values.c.value, Float)
+                )
+
+    async def similarity_search(
+        self,
+        dataset: Dataset,
+        vector_settings: VectorSettings,
+        value: Optional[List[float]] = None,
+        record: Optional[Record] = None,
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+        user_response_status_filter: Optional[UserResponseStatusFilter] = None,
+        metadata_filters: Optional[List[MetadataFilter]] = None,
+        max_results: int = 100,
+        order: SimilarityOrder = SimilarityOrder.most_similar,
+        threshold: Optional[float] = None,
+    ) -> SearchResponses:
+        if metadata_filters:
+            filter = _unify_metadata_filters_with_filter(metadata_filters, filter)
+        if user_response_status_filter and user_response_status_filter.statuses:
+            filter = _unify_user_response_status_filter_with_filter(user_response_status_filter, filter)
+
+        [responses] = await self.similarity_search_many(
+            dataset,
+            vector_settings,
+            [SimilarityQuery(value=value, record=record)],
+            query=query,
+            filter=filter,
+            max_results=max_results,
+            order=order,
+            threshold=threshold,
+        )
+
+        return responses
+
+    async def similarity_search_many(
+        self,
+        dataset: Dataset,
+        vector_settings: VectorSettings,
+        queries: List[SimilarityQuery],
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+        max_results: int = 100,
+        order: SimilarityOrder = SimilarityOrder.most_similar,
+        threshold: Optional[float] = None,
+    ) -> List[SearchResponses]:
+        query_vectors, excluded_ids = [], []
+        for similarity_query in queries:
+            query_vector, excluded_id = self._get_similarity_query_vector(vector_settings, similarity_query)
+            query_vectors.append(query_vector)
+            excluded_ids.append(excluded_id)
+
+        query_vectors = np.asarray(query_vectors, dtype=np.float32).reshape(len(queries), vector_settings.dimensions)
+        if order == SimilarityOrder.least_similar:
+            # The most similar vectors to the inverse vector are the least similar ones to the vector
+            query_vectors = -query_vectors
+
+        async with self._get_db() as db:
+            vector_index_entry = await self._get_vector_index(db, dataset, vector_settings)
+
+            # Filtered records are computed once and shared by all the queries
+            records_ids = None
+            if query is not None or filter:
+                query_builder = await self._get_records_query_builder(db, dataset)
+                result = await db.execute(select(Record.id).where(*query_builder.build_where(query, filter)))
+                records_ids = result.scalars().all()
+
+            queries_neighbours = await self._search_vector_index(
+                db, dataset, vector_index_entry, query_vectors, max_results, records_ids, excluded_ids
+            )
+
+        responses = []
+        for neighbours in queries_neighbours:
+            items = []
+            for record_id, similarity in neighbours:
+                # Scores are normalized to [0, 1] as search engines do for cosine similarity
+                # See https://www.elastic.co/guide/en/elasticsearch/reference/current/dense-vector.html#dense-vector-similarity
+                score = (1 + similarity) / 2
+                if threshold is not None and score < threshold:
+                    break
+                items.append(SearchResponseItem(record_id=record_id, score=score))
+
+            responses.append(SearchResponses(items=items, total=len(items)))
+
+        return responses
+
+    @staticmethod
+    def _get_similarity_query_vector(
+        vector_settings: VectorSettings, similarity_query: SimilarityQuery
+    ) -> Tuple[np.ndarray, Optional[UUID]]:
+        """Returns the vector value to search for and the id of the record to exclude from the results (if any)"""
+        value, record = vector_to_list(similarity_query.value), similarity_query.record
+        if bool(value) == bool(record):
+            raise ValueError("Must provide either vector value or record to compute the similarity search")
+
+        vector_value = value
+        excluded_id = None
+
+        if not vector_value:
+            excluded_id = record.id
+            vector_value = record.vector_value_by_vector_settings(vector_settings)
+
+        if vector_value is None or len(vector_value) == 0:
+            raise ValueError("Cannot find a vector value to apply with provided info")
+
+        if len(vector_value) != vector_settings.dimensions:
+            raise ValueError(f"Expected vectors of {vector_settings.dimensions} dimensions but got {len(vector_value)}")
+
+        return np.asarray(vector_value, dtype=np.float32), excluded_id
+
+    async def _search_vector_index(
+        self,
+        db: AsyncSession,
+        dataset: Dataset,
+        vector_index_entry: _VectorIndexEntry,
+        query_vectors: np.ndarray,
+        k: int,
+        records_ids: Optional[List[UUID]] = None,
+        excluded_ids: Optional[List[Optional[UUID]]] = None,
+    ) -> List[Neighbours]:
+        excluded_ids = excluded_ids or [None] * len(query_vectors)
+
+        while True:
+            async with vector_index_entry.lock:
+                search_neighbours = await run_in_threadpool(
+                    vector_index_entry.index.search, query_vectors, k + 1, ids=records_ids
+                )
+
+            queries_neighbours = [
+                [neighbour for neighbour in neighbours if neighbour[0] != excluded_id][:k]
+                for neighbours, excluded_id in zip(search_neighbours, excluded_ids)
+            ]
+
+            if records_ids is not None:
+                return queries_neighbours
+
+            # Vectors of records that no longer exist (e.g. rolled back writes) are removed and the search repeated
+            neighbours_ids = {record_id for neighbours in queries_neighbours for record_id, _ in neighbours}
+            result = await db.execute(
+                select(Record.id).where(Record.dataset_id == dataset.id, Record.id.in_(neighbours_ids))
+            )
+            existing_ids = set(result.scalars().all())
+
+            stale_ids = [record_id for record_id in neighbours_ids if record_id not in existing_ids]
+            if not stale_ids:
+                return queries_neighbours
+
+            async with vector_index_entry.lock:
+                vector_index_entry.index.delete(stale_ids)
+
+    async def _get_vector_index(
+        self, db: AsyncSession, dataset: Dataset, vector_settings: VectorSettings
+    ) -> _VectorIndexEntry:
+        key = (dataset.id, vector_settings.id)
+
+        async with self._vector_indexes_lock:
+            if key not in self._vector_indexes:
+                vector_index = VectorIndex.new_instance_by_name(self.vector_index, vector_settings.dimensions)
+                self._vector_indexes[key] = _VectorIndexEntry(index=vector_index)
+
+            vector_index_entry = self._vector_indexes[key]
+
+        async with vector_index_entry.lock:
+            await self._load_vector_index(db, vector_settings, vector_index_entry)
+
+        return vector_index_entry
+
+    async def _load_vector_index(
+        self, db: AsyncSession, vector_settings: VectorSettings, vector_index_entry: _VectorIndexEntry
+    ) -> None:
+        """Loads into the index the vectors written since the last load (all of them the first time)"""
+        query = select(Vector.record_id, Vector.value, Vector.updated_at).filter_by(
+            vector_settings_id=vector_settings.id
+        )
+
+        loaded_until = vector_index_entry.loaded_until
+        if loaded_until is not None:
+            query = query.filter(Vector.updated_at > min(loaded_until, datetime.utcnow() - VECTOR_INDEX_REFRESH_MARGIN))
+
+        result = await db.stream(query)
+        async for vectors in result.partitions(self.vector_index_load_batch_size):
+            await run_in_threadpool(
+                vector_index_entry.index.upsert,
+                [record_id for record_id, _, _ in vectors],
+                np.asarray([value for _, value, _ in vectors], dtype=np.float32),
+            )
+            vectors_loaded_until = max(updated_at for _, _, updated_at in vectors)
+            if loaded_until is None or vectors_loaded_until > loaded_until:
+                loaded_until = vectors_loaded_until
+
+        vector_index_entry.loaded_until = loaded_until
+
+    def _has_vector_indexes(self, dataset: Dataset) -> bool:
+        return any(dataset_id == dataset.id for dataset_id, _ in self._vector_indexes)
+
+    async def _metrics_for_terms_property(
+        self,
+        db: AsyncSession,
+        records_values: Select,
+        value: ColumnElement,
+        size: Optional[int] = None,
+        offset: int = 0,
+    ) -> TermsMetadataMetrics:
+        records_values = records_values.subquery()
+
+        total_terms = (await db.execute(select(func.count()).select_from(records_values))).scalar_one()
+        if total_terms == 0:
+            return TermsMetadataMetrics(total=total_terms)
+
+        # One more term than the page is fetched to know if there are more terms
+        limit = self.max_terms_size if size is None else min(size + 1, self.max_terms_size - offset)
+        if limit <= 0:
+            return TermsMetadataMetrics(total=total_terms)
+
+        term, count = cast(records_values.c.value, String), func.count()
+        result = await db.execute(
+            select(term, count).group_by(term).order_by(count.desc(), term.asc()).offset(offset).limit(limit)
+        )
+        terms_values = [TermsMetadataMetrics.TermCount(term=term, count=count) for term, count in result.all()]
+
+        next_cursor = None
+        if size is not None and len(terms_values) > size:
+            terms_values, next_cursor = terms_values[:size], encode_terms_metrics_cursor(offset + size)
+
+        return TermsMetadataMetrics(total=total_terms, values=terms_values, next_cursor=next_cursor)
+
+    async def _metrics_for_numeric_property(
+        self, db: AsyncSession, metadata_property: MetadataProperty, records_values: Select, value: ColumnElement
+    ) -> Union[IntegerMetadataMetrics, FloatMetadataMetrics]:
+        result = await db.execute(records_values.with_only_columns(func.min(value), func.max(value)))
+        min_value, max_value = result.one()
+
+        metrics_class = (
+            IntegerMetadataMetrics if metadata_property.type == MetadataPropertyType.integer else FloatMetadataMetrics
+        )
+
+        return metrics_class(min=min_value, max=max_value)
+
+    async def _get_records_query_builder(self, db: AsyncSession, dataset: Dataset) -> _RecordsQueryBuilder:
+        questions = (await db.execute(select(Question.name, Question.settings).filter_by(dataset_id=dataset.id))).all()
+        metadata_properties = (
+            await db.execute(select(MetadataProperty.name, MetadataProperty.settings).filter_by(dataset_id=dataset.id))
+        ).all()
+
+        schema = _DatasetSchema(
+            id=dataset.id,
+            text_fields=await self._get_text_fields_names(db, dataset),
+            questions_types={name: question_settings.get("type") for name, question_settings in questions},
+            metadata_properties_types={
+                name: metadata_property_settings.get("type") for name, metadata_property_settings in metadata_properties
+            },
+        )
+
+        return _RecordsQueryBuilder(dialect=db.bind.dialect.name, schema=schema)
+
+    async def _index_records(self, dataset: Dataset, records: List[Record], commit: bool = False) -> None:
+        if records:
+            async with self._get_records_db(records, commit=commit) as db:
+                await self._delete_records_texts(db, records)
+                await self._insert_records_texts(db, dataset, records)
+
+        self.metrics_cache.invalidate(dataset.id)
+
+        if self._has_vector_indexes(dataset):
+            await self.set_records_vectors(dataset, [vector for record in records for vector in record.vectors])
+
+    async def _insert_records_texts(self, db: AsyncSession, dataset: Dataset, records: List[Record]) -> None:
+        text_fields_names = await self._get_text_fields_names(db, dataset)
+
+        records_texts = [
+            {"record_id": record.id, "field_name": field_name, "text": record.fields[field_name]}
+            for record in records
+            for field_name in text_fields_names
+            if isinstance(record.fields.get(field_name), str)
+        ]
+        if records_texts:
+            await db.execute(insert(records_texts_table), records_texts)
+
+    @staticmethod
+    async def _delete_records_texts(db: AsyncSession, records: List[Record]) -> None:
+        records_ids = [record.id for record in records]
+        await db.execute(delete(records_texts_table).where(records_texts_table.c.record_id.in_(records_ids)))
+
+    @staticmethod
+    async def _get_text_fields_names(db: AsyncSession, dataset: Dataset) -> List[str]:
+        fields = (await db.execute(select(Field.name, Field.settings).filter_by(dataset_id=dataset.id))).all()
+
+        return [name for name, field_settings in fields if field_settings.get("type") == FieldType.text]
+
+    @asynccontextmanager
+    async def _get_records_db(self, records: List[Record], commit: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Yields the session the records are attached to, so the full-text index changes are written in the same
+        transaction as the records changes. A new session is used for records not attached to any session.
+        """
+        records_db = next(filter(None, map(async_object_session, records)), None)
+        if records_db is None:
+            async with self._get_db() as db:
+                yield db
+                await db.commit()
+            return
+
+        async with records_db.begin_nested():
+            yield records_db
+
+        if commit:
+            await records_db.commit()
+
+    @asynccontextmanager
+    async def _get_db(self) -> AsyncGenerator[AsyncSession, None]:
+        async with self.session_factory() as db:
+            yield db
@@ -0,0 +1,271 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+__all__ = ["VectorIndex", "FlatVectorIndex", "IVFVectorIndex"]
+
+# Neighbours found for a query, as (id, cosine similarity) tuples sorted from the most to the least similar
+Neighbours = List[Tuple[Hashable, float]]
+
+
+class VectorIndex(metaclass=ABCMeta):
+    """In-process index of vectors of the same dimensions, searched using cosine similarity"""
+
+    registered_classes = {}
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+
+    @classmethod
+    def register(cls, index_name: str):
+        def decorator(index_class):
+            cls.registered_classes[index_name] = index_class
+            return index_class
+
+        return decorator
+
+    @classmethod
+    def new_instance_by_name(cls, index_name: str, dimensions: int, **kwargs: Any) -> "VectorIndex":
+        index_name = index_name.lower().strip()
+
+        if index_name not in cls.registered_classes:
+            raise ValueError(f"No vector index class registered for '{index_name}'")
+
+        return cls.registered_classes[index_name](dimensions=dimensions, **kwargs)
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def upsert(self, ids: Sequence[Hashable], vectors: np.ndarray):
+        """Adds the vectors to the index, replacing the vectors already indexed with the same ids"""
+        pass
+
+    @abstractmethod
+    def delete(self, ids: Sequence[Hashable]):
+        """Removes the vectors with the given ids from the index (unknown ids are ignored)"""
+        pass
+
+    @abstractmethod
+    def search(self, queries: np.ndarray, k: int, ids: Optional[Sequence[Hashable]] = None) -> List[Neighbours]:
+        """
+        Returns the `k` most similar vectors for each one of the queries (a matrix with one query per row). If `ids`
+        are provided, only the vectors with those ids are compared with the queries.
+        """
+        pass
+
+
+@VectorIndex.register(index_name="flat")
+class FlatVectorIndex(VectorIndex):
+    """
+    Exact vector index comparing the queries with all the indexed vectors.
+
+    Vectors are normalized and kept in a contiguous float32 matrix, so cosine similarities for a batch of queries are
+    computed with a single matrix product. Deleted vectors leave a free slot that is reused by the following upserts.
+    """
+
+    _initial_capacity = 1024
+
+    def __init__(self, dimensions: int):
+        super().__init__(dimensions)
+
+        self._vectors = np.zeros((0, dimensions), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._ids: List[Optional[Hashable]] = []
+        self._slots_by_id: Dict[Hashable, int] = {}
+        self._free_slots: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots_by_id)
+
+    def upsert(self, ids: Sequence[Hashable], vectors: np.ndarray):
+        vectors = self._normalize(self._as_matrix(vectors))
+        if len(ids) != len(vectors):
+            raise ValueError(f"Expected {len(ids)} vectors but got {len(vectors)}")
+
+        slots = np.fromiter((self._slot_for_id(id) for id in ids), dtype=np.int64, count=len(ids))
+
+        self._vectors[slots] = vectors
+        self._alive[slots] = True
+        self._on_vectors_upserted(slots)
+
+    def delete(self, ids: Sequence[Hashable]):
+        for id in ids:
+            slot = self._slots_by_id.pop(id, None)
+            if slot is None:
+                continue
+
+            self._alive[slot] = False
+            self._ids[slot] = None
+            self._free_slots.append(slot)
+
+    def search(self, queries: np.ndarray, k: int, ids: Optional[Sequence[Hashable]] = None) -> List[Neighbours]:
+        queries = self._normalize(self._as_matrix(queries))
+        slots = self._alive_slots() if ids is None else self._slots_for_ids(ids)
+
+        # Similarities for all the queries are computed at once, with one row per query
+        return [self._top_k(slots, similarities, k) for similarities in queries @ self._vectors[slots].T]
+
+    def _top_k(self, slots: np.ndarray, similarities: np.ndarray, k: int) -> Neighbours:
+        if k <= 0:
+            return []
+
+        if k < len(similarities):
+            # Partial sort of the `k` best similarities, that are then sorted
+            top_k = np.argpartition(-similarities, k - 1)[:k]
+        else:
+            top_k = np.arange(len(similarities))
+
+        top_k = top_k[np.argsort(-similarities[top_k], kind="stable")]
+
+        return [(self._ids[slot], float(similarities[index])) for slot, index in zip(slots[top_k], top_k)]
+
+    def _alive_slots(self) -> np.ndarray:
+        return np.flatnonzero(self._alive)
+
+    def _slots_for_ids(self, ids: Sequence[Hashable]) -> np.ndarray:
+        slots = (self._slots_by_id.get(id) for id in ids)
+
+        return np.fromiter((slot for slot in slots if slot is not None), dtype=np.int64)
+
+    def _on_vectors_upserted(self, slots: np.ndarray):
+        pass
+
+    def _slot_for_id(self, id: Hashable) -> int:
+        slot = self._slots_by_id.get(id)
+        if slot is not None:
+            return slot
+
+        if not self._free_slots:
+            self._grow()
+
+        slot = self._free_slots.pop()
+        self._slots_by_id[id] = slot
+        self._ids[slot] = id
+
+        return slot
+
+    def _grow(self):
+        capacity = len(self._ids)
+        new_capacity = max(self._initial_capacity, capacity * 2)
+
+        self._vectors = np.concatenate(
+            [self._vectors, np.zeros((new_capacity - capacity, self.dimensions), dtype=np.float32)]
+        )
+        self._alive = np.concatenate([self._alive, np.zeros(new_capacity - capacity, dtype=bool)])
+        self._ids.extend([None] * (new_capacity - capacity))
+        # Free slots are popped from the end, so the lowest slots are used first
+        self._free_slots.extend(reversed(range(capacity, new_capacity)))
+
+    def _as_matrix(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+
+        if vectors.shape[1] != self.dimensions:
+            raise ValueError(f"Expected vectors of {self.dimensions} dimensions but got {vectors.shape[1]}")
+
+        return vectors
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms != 0)
+
+
+@VectorIndex.register(index_name="ivf")
+class IVFVectorIndex(FlatVectorIndex):
+    """
+    Inverted file vector index. Vectors are clustered around `sqrt(n)` centroids (computed with spherical k-means) and
+    queries are only compared, exactly, with the vectors of the `n_probes` clusters whose centroids are the most
+    similar to the query.
+
+    The index behaves as a flat index until it has `min_train_size` vectors, and it's retrained once the number of
+    vectors doubles since the last training so clusters stay balanced while vectors are upserted.
+    """
+
+    def __init__(self, dimensions: int, n_probes: int = 8, min_train_size: int = 4096, train_iterations: int = 10):
+        super().__init__(dimensions)
+
+        self.n_probes = n_probes
+        self.min_train_size = min_train_size
+        self.train_iterations = train_iterations
+
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int64)
+        self._trained_size = 0
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def search(self, queries: np.ndarray, k: int, ids: Optional[Sequence[Hashable]] = None) -> List[Neighbours]:
+        # Searches restricted to some vectors are exact, since they are usually the result of selective filters
+        if not self.is_trained or ids is not None:
+            return super().search(queries, k, ids)
+
+        queries = self._normalize(self._as_matrix(queries))
+        alive_slots = self._alive_slots()
+        alive_assignments = self._assignments[alive_slots]
+
+        n_probes = min(self.n_probes, len(self._centroids))
+        probes = np.argpartition(-(queries @ self._centroids.T), n_probes - 1, axis=1)[:, :n_probes]
+
+        neighbours = []
+        for query, query_probes in zip(queries, probes):
+            slots = alive_slots[np.isin(alive_assignments, query_probes)]
+            if len(slots) < k:
+                # Not enough vectors in the probed clusters, so all of them are compared
+                slots = alive_slots
+
+            neighbours.append(self._top_k(slots, self._vectors[slots] @ query, k))
+
+        return neighbours
+
+    def _on_vectors_upserted(self, slots: np.ndarray):
+        if len(self._assignments) < len(self._alive):
+            new_assignments = np.zeros(len(self._alive) - len(self._assignments), dtype=np.int64)
+            self._assignments = np.concatenate([self._assignments, new_assignments])
+
+        if len(self) >= max(self.min_train_size, 2 * self._trained_size):
+            self._train()
+        elif self.is_trained:
+            self._assignments[slots] = np.argmax(self._vectors[slots] @ self._centroids.T, axis=1)
+
+    def _train(self):
+        alive_slots = self._alive_slots()
+        vectors = self._vectors[alive_slots]
+        n_lists = max(1, int(np.sqrt(len(vectors))))
+
+        # Deterministic initialization, so the same vectors always produce the same index
+        rng = np.random.default_rng(seed=len(vectors))
+        centroids = vectors[rng.choice(len(vectors), size=n_lists, replace=False)]
+
+        for _ in range(self.train_iterations):
+            assignments = np.argmax(vectors @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, vectors)
+            # Empty clusters keep their previous centroid
+            centroids = np.where(np.bincount(assignments, minlength=n_lists)[:, None] > 0, sums, centroids)
+            centroids = self._normalize(centroids)
+
+        self._centroids = centroids
+        self._assignments[alive_slots] = np.argmax(vectors @ centroids.T, axis=1)
+        self._trained_size = len(vectors)
@@ -21,6 +21,7 @@ from starlette.authentication import AuthCredentials, AuthenticationBackend, Bas
 from argilla_server.constants import API_KEY_HEADER_NAME
 from argilla_server.contexts import accounts
 from argilla_server.security.authentication.userinfo import UserInfo
+from argilla_server.security.authentication.users_cache import users_cache
 
 
 class APIKeyAuthenticationBackend(AuthenticationBackend):
@@ -35,7 +36,9 @@ class APIKeyAuthenticationBackend(AuthenticationBackend):
             return None
 
         db = request.state.db
-        user = await accounts.get_user_by_api_key(db, api_key=api_key)
+        user = await users_cache.get_or_load(
+            db, ("api_key", api_key), lambda: accounts.get_user_by_api_key(db, api_key=api_key)
+        )
         if not user:
             return None
 
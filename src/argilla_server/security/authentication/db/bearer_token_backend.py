@@ -21,6 +21,7 @@ from starlette.authentication import AuthCredentials, AuthenticationBackend, Bas
 from argilla_server.contexts import accounts
 from argilla_server.security.authentication.jwt import JWT
 from argilla_server.security.authentication.userinfo import UserInfo
+from argilla_server.security.authentication.users_cache import users_cache
 
 
 class BearerTokenAuthenticationBackend(AuthenticationBackend):
@@ -38,7 +39,9 @@ class BearerTokenAuthenticationBackend(AuthenticationBackend):
         username = JWT.decode(token).get("username")
 
         db = request.state.db
-        user = await accounts.get_user_by_username(db, username)
+        user = await users_cache.get_or_load(
+            db, ("username", username), lambda: accounts.get_user_by_username(db, username)
+        )
         if not user:
             return None
 
@@ -26,6 +26,7 @@ from argilla_server.errors import UnauthorizedError
 from argilla_server.models import User
 from argilla_server.security.authentication.db import APIKeyAuthenticationBackend, BearerTokenAuthenticationBackend
 from argilla_server.security.authentication.userinfo import UserInfo
+from argilla_server.security.authentication.users_cache import users_cache
 
 
 class AuthenticationProvider:
@@ -57,7 +58,9 @@ class AuthenticationProvider:
         if not userinfo:
             raise UnauthorizedError()
 
-        user = await accounts.get_user_by_username(db, userinfo.username)
+        user = await users_cache.get_or_load(
+            db, ("username", userinfo.username), lambda: accounts.get_user_by_username(db, userinfo.username)
+        )
         if not user:
             raise UnauthorizedError()
 
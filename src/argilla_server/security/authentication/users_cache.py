@@ -0,0 +1,151 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, NamedTuple, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from argilla_server.models import User, Workspace, WorkspaceUser
+from argilla_server.security.settings import settings
+
+_Model = TypeVar("_Model")
+
+
+class _CacheEntry(NamedTuple):
+    user: User
+    expires_at: float
+
+
+class UsersCache:
+    """In-process TTL/LRU cache of authenticated users.
+
+    Users are stored as detached snapshots (with their workspaces) and merged into the request session on every hit,
+    so they can be used exactly as a user loaded from the database. Entries are invalidated once the changes to users,
+    workspaces or workspace users made through the ORM in this process are committed. Changes made from other
+    processes (e.g. other server workers or the CLI) are only visible once the cached entry expires.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    async def get_or_load(
+        self, db: AsyncSession, key: Hashable, load: Callable[[], Awaitable[Optional[User]]]
+    ) -> Optional[User]:
+        if not self.enabled:
+            return await load()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return await db.merge(entry.user, load=False)
+
+        self.misses += 1
+        user = await load()
+        if user is None:
+            self._entries.pop(key, None)
+            return None
+
+        self._entries[key] = _CacheEntry(user=_detached_copy(user), expires_at=time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return user
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        for key in [key for key, entry in self._entries.items() if entry.user.id == user_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def _detached_copy(instance: _Model) -> _Model:
+    mapper = inspect(instance).mapper
+
+    copy = mapper.class_(**{attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs})
+    if isinstance(instance, User):
+        workspaces = [_detached_copy(workspace) for workspace in instance.workspaces]
+        set_committed_value(copy, "workspaces", workspaces)
+
+    make_transient_to_detached(copy)
+
+    return copy
+
+
+users_cache = UsersCache(ttl=settings.users_cache_ttl, max_size=settings.users_cache_max_size)
+
+
+# Key of the session info holding the users to invalidate when the session commits
+_PENDING_INVALIDATIONS = "users_cache_pending_invalidations"
+
+
+def _invalidate_on_commit(instance, user_id: Optional[UUID]) -> None:
+    """Invalidates the user (or all users if `user_id` is None) once the changes are committed, so a concurrent load
+    between the flush and the commit can't put the old data back into the cache"""
+    session = object_session(instance)
+    if session is None:
+        _invalidate(user_id)
+    else:
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(user_id)
+
+
+def _invalidate(user_id: Optional[UUID]) -> None:
+    if user_id is None:
+        users_cache.clear()
+    else:
+        users_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        _invalidate(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, user: User) -> None:
+    _invalidate_on_commit(user, user.id)
+
+
+@event.listens_for(WorkspaceUser, "after_insert")
+@event.listens_for(WorkspaceUser, "after_delete")
+def _invalidate_workspace_user(mapper, connection, workspace_user: WorkspaceUser) -> None:
+    _invalidate_on_commit(workspace_user, workspace_user.user_id)
+
+
+@event.listens_for(Workspace, "after_update")
+@event.listens_for(Workspace, "after_delete")
+def _invalidate_workspace(mapper, connection, workspace: Workspace) -> None:
+    _invalidate_on_commit(workspace, None)
@@ -39,12 +39,22 @@ class Settings(BaseSettings):
     oauth_cfg:
         The path to the oauth yaml configuration file. Default=.oauth.yaml
 
+    users_cache_ttl:
+        Seconds an authenticated user is kept in the in-process users cache. Set to 0 to disable the cache. The cache
+        is only invalidated in the server process making the changes: with several server workers, a deleted user or
+        a rotated API key keeps being accepted by the other workers for up to this number of seconds. Default=0
+
+    users_cache_max_size:
+        Max number of authenticated users kept in the in-process users cache. Default=1000
+
     """
 
     secret_key: str = uuid4().hex
     algorithm: str = "HS256"
     token_expiration: int = 24 * 60 * 60  # 1 day
     oauth_cfg: str = ".oauth.yaml"
+    users_cache_ttl: float = 0
+    users_cache_max_size: int = 1000
 
     _oauth_settings: Optional["OAuth2Settings"] = PrivateAttr(None)
 
@@ -28,6 +28,7 @@ from argilla_server.errors import EntityAlreadyExistsError, EntityNotFoundError,
 from argilla_server.models import User, Workspace
 from argilla_server.policies import DatasetPolicy, DatasetSettingsPolicy, is_authorized
 from argilla_server.schemas.v0.datasets import CreateDatasetRequest, Dataset
+from argilla_server.utils.concurrency import run_blocking
 
 
 class ServiceBaseDataset(BaseDatasetDB):
@@ -74,7 +75,7 @@ class DatasetsService:
             new_dataset.created_at = date_now
             new_dataset.last_updated = date_now
 
-            return self.__dao__.create_dataset(new_dataset)
+            return await run_blocking(self.__dao__.create_dataset, new_dataset)
 
     async def find_by_name(
         self,
@@ -84,7 +85,9 @@ class DatasetsService:
         as_dataset_class: Type[ServiceDataset] = ServiceBaseDataset,
         task: Optional[Union[str, Enum]] = None,
     ) -> ServiceDataset:
-        found_dataset = self.__dao__.find_by_name(name=name, workspace=workspace, as_dataset_class=as_dataset_class)
+        found_dataset = await run_blocking(
+            self.__dao__.find_by_name, name=name, workspace=workspace, as_dataset_class=as_dataset_class
+        )
 
         if found_dataset is None:
             raise EntityNotFoundError(name=name, type=ServiceDataset)
@@ -103,7 +106,7 @@ class DatasetsService:
                 "You don't have the necessary permissions to delete this dataset. "
                 "Only administrators can delete datasets"
             )
-        self.__dao__.delete_dataset(dataset)
+        await run_blocking(self.__dao__.delete_dataset, dataset)
 
     async def update(
         self,
@@ -124,7 +127,7 @@ class DatasetsService:
         dataset.metadata = {**found.metadata, **(metadata or {})}
         updated = found.copy(update={**dataset.dict(by_alias=True), "last_updated": datetime.utcnow()})
 
-        return self.__dao__.update_dataset(updated)
+        return await run_blocking(self.__dao__.update_dataset, updated)
 
     async def list(
         self,
@@ -147,7 +150,9 @@ class DatasetsService:
         else:  # no workspaces
             workspace_names = accessible_workspace_names
 
-        return self.__dao__.list_datasets(workspaces=workspace_names, task2dataset_map=task2dataset_map)
+        return await run_blocking(
+            self.__dao__.list_datasets, workspaces=workspace_names, task2dataset_map=task2dataset_map
+        )
 
     async def close(self, user: User, dataset: ServiceDataset):
         if not await is_authorized(user, DatasetPolicy.close(dataset)):
@@ -155,7 +160,7 @@ class DatasetsService:
                 "You don't have the necessary permissions to close this dataset. "
                 "Only administrators can close datasets"
             )
-        self.__dao__.close(dataset)
+        await run_blocking(self.__dao__.close, dataset)
 
     async def open(self, user: User, dataset: ServiceDataset):
         if not await is_authorized(user, DatasetPolicy.open(dataset)):
@@ -163,7 +168,12 @@ class DatasetsService:
                 "You don't have the necessary permissions to open this dataset. "
                 "Only administrators can open datasets"
             )
-        self.__dao__.open(dataset)
+        await run_blocking(self.__dao__.open, dataset)
+
+    async def refresh(self, user: User, dataset: ServiceDataset):
+        if not await is_authorized(user, DatasetPolicy.refresh(dataset)):
+            raise ForbiddenOperationError("You don't have the necessary permissions to refresh this dataset.")
+        await run_blocking(self.__dao__.refresh, dataset)
 
     async def copy_dataset(
         self,
@@ -180,7 +190,7 @@ class DatasetsService:
         if not target_workspace:
             raise EntityNotFoundError(name=target_workspace_name, type=Workspace)
 
-        if self.__dao__.find_by_name_and_workspace(name=copy_name, workspace=target_workspace_name):
+        if await run_blocking(self.__dao__.find_by_name_and_workspace, name=copy_name, workspace=target_workspace_name):
             raise EntityAlreadyExistsError(name=copy_name, workspace=target_workspace_name, type=Dataset)
 
         if not await is_authorized(user, DatasetPolicy.copy(dataset, target_workspace=target_workspace)):
@@ -206,7 +216,7 @@ class DatasetsService:
             "copied_from": dataset.name,
         }
 
-        self.__dao__.copy(source=dataset, target=dataset_copy)
+        await run_blocking(self.__dao__.copy, source=dataset, target=dataset_copy)
 
         return dataset_copy
 
@@ -216,7 +226,7 @@ class DatasetsService:
         dataset: ServiceDataset,
         class_type: Type[ServiceDatasetSettings],
     ) -> ServiceDatasetSettings:
-        settings = self.__dao__.load_settings(dataset=dataset, as_class=class_type)
+        settings = await run_blocking(self.__dao__.load_settings, dataset=dataset, as_class=class_type)
         if not settings:
             raise EntityNotFoundError(name=dataset.name, type=class_type)
 
@@ -233,7 +243,7 @@ class DatasetsService:
         if not await is_authorized(user, DatasetSettingsPolicy.save(dataset)):
             raise ForbiddenOperationError("You don't have the necessary permissions to save settings for this dataset.")
 
-        self.__dao__.save_settings(dataset=dataset, settings=settings)
+        await run_blocking(self.__dao__.save_settings, dataset=dataset, settings=settings)
         return settings
 
     async def delete_settings(self, user: User, dataset: ServiceDataset) -> None:
@@ -242,4 +252,4 @@ class DatasetsService:
                 "You don't have the necessary permissions to delete settings for this dataset."
             )
 
-        self.__dao__.delete_settings(dataset=dataset)
+        await run_blocking(self.__dao__.delete_settings, dataset=dataset)
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, ClassVar, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from typing import Any, ClassVar, Dict, Generic, Iterable, List, Optional, Set, TypeVar, Union
 
 from argilla_server.pydantic_v1 import BaseModel, Field
 from argilla_server.services.search.model import ServiceRecordsQuery
@@ -57,6 +57,17 @@ class ServicePythonMetric(ServiceBaseMetric, Generic[ServiceRecord]):
         """Add an extra filter required for the metric"""
         return query
 
+    def record_fields(self) -> Optional[Set[str]]:
+        """
+        The record fields read by the metric. If provided, only those fields are fetched and the metric is applied
+        over the raw records data instead of parsed records, so records are streamed with a small memory footprint
+
+        Returns
+        -------
+            The record fields (dotted paths are allowed), or ``None`` to apply the metric over parsed records
+        """
+        return None
+
 
 ServiceMetric = TypeVar("ServiceMetric", bound=ServiceBaseMetric)
 
@@ -120,6 +131,23 @@ class ServiceBaseTaskMetrics(BaseModel):
         """
         return {}
 
+    @classmethod
+    def records_metrics(cls, records: List[ServiceRecord]) -> List[Dict[str, Any]]:
+        """
+        Computes the record metrics for a batch of records. Override it if the record
+        metrics can be computed faster for the whole batch at once
+
+        Parameters
+        ----------
+        records:
+            The records used for calculate metrics fields
+
+        Returns
+        -------
+            A list with the calculated metrics fields for each record, in the same order
+        """
+        return [cls.record_metrics(record) for record in records]
+
 
 class CommonTasksMetrics(ServiceBaseTaskMetrics, Generic[ServiceRecord]):
     """Common task metrics"""
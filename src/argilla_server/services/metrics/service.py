@@ -95,16 +95,17 @@ class MetricsService:
         if isinstance(metric, ServicePythonMetric):
             query = query or ServiceBaseRecordsQuery()
             query = metric.prepare_query(query)
+            record_fields = metric.record_fields()
             records = self.__dao__.scan_dataset(
                 dataset,
                 search=DaoRecordsSearch(query=query, sort=SortConfig(shuffle=metric.shuffle_records)),
                 limit=metric.records_to_fetch,
-                exclude_fields={
-                    "vectors",
-                    "metrics",
-                    "metadata",
-                },  # Load records more efficiently
+                include_fields=record_fields,
+                # Load records more efficiently
+                exclude_fields=None if record_fields else {"vectors", "metrics", "metadata"},
             )
+            if record_fields:
+                return metric.apply(records)
             return metric.apply(map(record_class.parse_obj, records))
 
         return self.__dao__.compute_metric(
@@ -28,6 +28,8 @@ from argilla_server.policies import DatasetPolicy, is_authorized
 from argilla_server.services.datasets import ServiceDataset
 from argilla_server.services.search.model import ServiceBaseRecordsQuery
 from argilla_server.services.tasks.commons import ServiceRecord
+from argilla_server.settings import settings
+from argilla_server.utils.concurrency import run_blocking
 
 
 @dataclasses.dataclass
@@ -57,20 +59,25 @@ class RecordsStorageService:
         dataset: ServiceDataset,
         records: List[ServiceRecord],
         record_type: Type[ServiceRecord],
+        refresh: Optional[bool] = None,
     ) -> int:
-        """Store a set of records"""
+        """Store a set of records. With `refresh`, it waits until they are visible to searches (if not provided,
+        the `es_bulk_refresh` setting is used)"""
         await telemetry.track_bulk(task=dataset.task, records=len(records))
 
         metrics = TasksFactory.get_task_metrics(dataset.task)
         if metrics:
-            for record in records:
-                record.metrics = metrics.record_metrics(record)
+            records_metrics = await run_blocking(metrics.records_metrics, records)
+            for record, record_metrics in zip(records, records_metrics):
+                record.metrics = record_metrics
 
         try:
-            return self.__dao__.add_records(
+            return await run_blocking(
+                self.__dao__.add_records,
                 dataset=dataset,
                 records=records,
                 record_class=record_type,
+                refresh=settings.es_bulk_refresh if refresh is None else refresh,
             )
         except WrongLogDataError as ex:
             raise BulkDataError(
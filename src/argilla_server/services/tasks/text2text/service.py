@@ -56,11 +56,13 @@ class Text2TextService:
         self,
         dataset: ServiceDataset,
         records: List[ServiceText2TextRecord],
+        refresh: Optional[bool] = None,
     ):
         failed = await self.__storage__.store_records(
             dataset=dataset,
             records=records,
             record_type=ServiceText2TextRecord,
+            refresh=refresh,
         )
         return BulkResponse(dataset=dataset.name, processed=len(records), failed=failed)
 
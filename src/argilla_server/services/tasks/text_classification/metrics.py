@@ -12,20 +12,24 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, ClassVar, Dict, Iterable, List
+from collections import Counter
+from typing import Any, ClassVar, Dict, Iterable, List, Set, Tuple
 
 from argilla_server.pydantic_v1 import Field
 from argilla_server.services.metrics import ServiceBaseMetric, ServicePythonMetric
 from argilla_server.services.metrics.models import CommonTasksMetrics
 from argilla_server.services.search.model import ServiceRecordsQuery
 from argilla_server.services.tasks.text_classification.model import ServiceTextClassificationRecord
-from argilla_server.utils.dependency import requires_dependencies
 
 
 class F1Metric(ServicePythonMetric):
     """
     A basic f1 computation for text classification
 
+    The metric is computed over all the matched records, which are streamed from the search engine while counting
+    the true positives, false positives and false negatives per label. So, memory usage only depends on the number
+    of labels.
+
     Attributes:
     -----------
         multi_label:
@@ -34,69 +38,77 @@ class F1Metric(ServicePythonMetric):
 
     multi_label: bool = False
 
-    @requires_dependencies("scikit-learn")
-    def apply(self, records: Iterable[ServiceTextClassificationRecord]) -> Any:
-        from sklearn.metrics import precision_recall_fscore_support
+    def record_fields(self) -> Set[str]:
+        return {"predicted", "annotated_as", "predicted_as"}
+
+    def apply(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        # Keeps the labels in the order they're found
+        labels: Dict[str, None] = {}
+        true_positives, false_positives, false_negatives = Counter(), Counter(), Counter()
 
-        filtered_records = list(filter(lambda r: r.predicted is not None, records))
-        # TODO: This must be precomputed with using a global dataset metric
-        ds_labels = {label for record in filtered_records for label in record.annotated_as + record.predicted_as}
+        for record in records:
+            if record.get("predicted") is None:
+                continue
+
+            annotations = record.get("annotated_as") or []
+            predictions = record.get("predicted_as") or []
+            if not self.multi_label:
+                if not annotations or not predictions:
+                    continue
+                annotations, predictions = annotations[:1], predictions[:1]
 
-        if not len(ds_labels):
+            annotations, predictions = set(annotations), set(predictions)
+            labels.update(dict.fromkeys(annotations | predictions))
+
+            true_positives.update(annotations & predictions)
+            false_positives.update(predictions - annotations)
+            false_negatives.update(annotations - predictions)
+
+        if not labels:
             return {}
 
-        labels_mapping = {label: i for i, label in enumerate(ds_labels)}
-        y_true, y_pred = ([], [])
-        for record in filtered_records:
-            annotations = record.annotated_as
-            predictions = record.predicted_as
+        per_label, precisions, recalls, f1s = {}, [], [], []
+        for label in labels:
+            tp, fp, fn = true_positives[label], false_positives[label], false_negatives[label]
+            precision, recall, f1 = self._precision_recall_f1(tp, fp, fn)
 
-            if not self.multi_label:
-                y_true.append(labels_mapping[annotations[0]])
-                y_pred.append(labels_mapping[predictions[0]])
-
-            else:
-                y_true.append([labels_mapping[label] for label in annotations])
-                y_pred.append([labels_mapping[label] for label in predictions])
-
-        if self.multi_label:
-            from sklearn.preprocessing import MultiLabelBinarizer
-
-            mlb = MultiLabelBinarizer(classes=list(labels_mapping.values()))
-            y_true = mlb.fit_transform(y_true)
-            y_pred = mlb.fit_transform(y_pred)
-
-        micro_p, micro_r, micro_f, _ = precision_recall_fscore_support(y_true=y_true, y_pred=y_pred, average="micro")
-        macro_p, macro_r, macro_f, _ = precision_recall_fscore_support(y_true=y_true, y_pred=y_pred, average="macro")
-
-        per_label = {}
-        for label, p, r, f, s in zip(
-            labels_mapping.keys(),
-            *precision_recall_fscore_support(
-                y_true=y_true,
-                y_pred=y_pred,
-                average=None,
-            ),
-        ):
             per_label.update(
                 {
-                    f"{label}_precision": p.tolist(),
-                    f"{label}_recall": r.tolist(),
-                    f"{label}_f1": f.tolist(),
-                    f"{label}_support": s.tolist(),
+                    f"{label}_precision": precision,
+                    f"{label}_recall": recall,
+                    f"{label}_f1": f1,
+                    f"{label}_support": tp + fn,
                 }
             )
+            precisions.append(precision)
+            recalls.append(recall)
+            f1s.append(f1)
+
+        micro_p, micro_r, micro_f = self._precision_recall_f1(
+            sum(true_positives.values()),
+            sum(false_positives.values()),
+            sum(false_negatives.values()),
+        )
 
         return {
-            "precision_macro": macro_p,
-            "recall_macro": macro_r,
-            "f1_macro": macro_f,
+            "precision_macro": sum(precisions) / len(labels),
+            "recall_macro": sum(recalls) / len(labels),
+            "f1_macro": sum(f1s) / len(labels),
             "precision_micro": micro_p,
             "recall_micro": micro_r,
             "f1_micro": micro_f,
             **per_label,
         }
 
+    @staticmethod
+    def _precision_recall_f1(tp: int, fp: int, fn: int) -> Tuple[float, float, float]:
+        """Computes the precision, recall and f1 from the confusion counts, using 0 for the 0/0 cases"""
+
+        def safe_divide(numerator: int, denominator: int) -> float:
+            return numerator / denominator if denominator else 0.0
+
+        return safe_divide(tp, tp + fp), safe_divide(tp, tp + fn), safe_divide(2 * tp, 2 * tp + fp + fn)
+
 
 class DatasetLabels(ServicePythonMetric):
     id: str = Field("dataset_labels", const=True)
@@ -115,20 +127,22 @@ class DatasetLabels(ServicePythonMetric):
         query.query_text = text
         return query
 
+    def record_fields(self) -> Set[str]:
+        return {"annotation.labels.class_label", "prediction.labels.class_label"}
+
     def apply(
         self,
-        records: Iterable[ServiceTextClassificationRecord],
+        records: Iterable[Dict[str, Any]],
     ) -> Dict[str, Any]:
         ds_labels = set()
-        for _ in range(0, self.records_to_fetch):  # Only a few of records will be parsed
+        for _ in range(0, self.records_to_fetch):  # Only a few of records will be read
             record = next(records, None)
             if record is None:
                 break
 
-            if record.annotation:
-                ds_labels.update([label.class_label for label in record.annotation.labels])
-            if record.prediction:
-                ds_labels.update([label.class_label for label in record.prediction.labels])
+            for annotation in (record.get("annotation"), record.get("prediction")):
+                if annotation:
+                    ds_labels.update([label["class_label"] for label in annotation.get("labels") or []])
         return {"labels": ds_labels or []}
 
 
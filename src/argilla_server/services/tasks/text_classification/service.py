@@ -73,6 +73,7 @@ class TextClassificationService:
         self,
         dataset: ServiceTextClassificationDataset,
         records: List[ServiceTextClassificationRecord],
+        refresh: Optional[bool] = None,
     ):
         if not records:
             return BulkResponse(dataset=dataset.name, processed=0)
@@ -84,6 +85,7 @@ class TextClassificationService:
             dataset=dataset,
             records=records,
             record_type=ServiceTextClassificationRecord,
+            refresh=refresh,
         )
         return BulkResponse(dataset=dataset.name, processed=len(records), failed=failed)
 
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import math
+from collections import Counter
 from typing import Any, ClassVar, Dict, Iterable, List, Optional, Set, Tuple
 
 from argilla_server.pydantic_v1 import BaseModel, Field
@@ -23,42 +25,53 @@ from argilla_server.services.tasks.token_classification.model import (
     ServiceTokenClassificationAnnotation,
     ServiceTokenClassificationRecord,
 )
+from argilla_server.settings import settings
 from argilla_server.utils import SpanUtils
+from argilla_server.utils.concurrency import get_process_pool
 
 
-class F1Metric(ServicePythonMetric[ServiceTokenClassificationRecord]):
+class F1Metric(ServicePythonMetric):
     """The F1 metric based on entity-level.
 
     We follow the convention of `CoNLL 2003 <https://aclanthology.org/W03-0419/>`_, where:
     `"precision is the percentage of named entities found by the learning system that are correct.
     Recall is the percentage of named entities present in the corpus that are found by the system.
     A named entity is correct only if it is an exact match (...).”`
+
+    The metric is computed over all the matched records, which are streamed from the search engine while counting
+    the predicted, annotated and correct entities per label.
     """
 
-    def apply(self, records: Iterable[ServiceTokenClassificationRecord]) -> Dict[str, Any]:
-        # store entities per label in dicts
-        predicted_entities = {}
-        annotated_entities = {}
+    def record_fields(self) -> Set[str]:
+        return {"annotation.entities", "prediction.entities"}
+
+    def apply(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        # store entities counts per label in dicts
+        predicted_counts, annotated_counts, correct_counts = Counter(), Counter(), Counter()
 
-        # extract entities per label to dicts
+        # count the entities per label, matching the predicted and annotated ones of each record
         for rec in records:
-            if rec.prediction:
-                self._add_entities_to_dict(rec.prediction.entities, predicted_entities)
-            if rec.annotation:
-                self._add_entities_to_dict(rec.annotation.entities, annotated_entities)
+            predicted_entities = self._entities_per_label(rec.get("prediction"))
+            annotated_entities = self._entities_per_label(rec.get("annotation"))
+
+            for label, annotated in annotated_entities.items():
+                annotated_counts[label] += len(annotated)
+                correct_counts[label] += len(annotated & predicted_entities.get(label, set()))
+            for label, predicted in predicted_entities.items():
+                predicted_counts[label] += len(predicted)
 
         # store precision, recall, and f1 per label
         per_label_metrics = {}
 
         annotated_total, predicted_total, correct_total = 0, 0, 0
         precision_macro, recall_macro = 0, 0
-        for label, annotated in annotated_entities.items():
-            predicted = predicted_entities.get(label, set())
-            correct = len(annotated & predicted)
+        for label, annotated in annotated_counts.items():
+            predicted = predicted_counts[label]
+            correct = correct_counts[label]
 
             # safe divides are used to cover the 0/0 cases
-            precision = self._safe_divide(correct, len(predicted))
-            recall = self._safe_divide(correct, len(annotated))
+            precision = self._safe_divide(correct, predicted)
+            recall = self._safe_divide(correct, annotated)
             per_label_metrics.update(
                 {
                     f"{label}_precision": precision,
@@ -67,12 +80,12 @@ class F1Metric(ServicePythonMetric[ServiceTokenClassificationRecord]):
                 }
             )
 
-            annotated_total += len(annotated)
-            predicted_total += len(predicted)
+            annotated_total += annotated
+            predicted_total += predicted
             correct_total += correct
 
-            precision_macro += precision / len(annotated_entities)
-            recall_macro += recall / len(annotated_entities)
+            precision_macro += precision / len(annotated_counts)
+            recall_macro += recall / len(annotated_counts)
 
         # store macro and micro averaged precision, recall and f1
         averaged_metrics = {
@@ -94,13 +107,12 @@ class F1Metric(ServicePythonMetric[ServiceTokenClassificationRecord]):
         return {**averaged_metrics, **per_label_metrics}
 
     @staticmethod
-    def _add_entities_to_dict(entities: List[EntitySpan], dictionary: Dict[str, Set[Tuple[int, int]]]):
+    def _entities_per_label(annotation: Optional[Dict[str, Any]]) -> Dict[str, Set[Tuple[int, int]]]:
         """Helper function for the apply method."""
-        for ent in entities:
-            try:
-                dictionary[ent.label].add((ent.start, ent.end))
-            except KeyError:
-                dictionary[ent.label] = {(ent.start, ent.end)}
+        entities = {}
+        for ent in (annotation or {}).get("entities") or []:
+            entities.setdefault(ent["label"], set()).add((ent["start"], ent["end"]))
+        return entities
 
     @staticmethod
     def _safe_divide(numerator, denominator):
@@ -127,21 +139,23 @@ class DatasetLabels(ServicePythonMetric):
         query.query_text = text
         return query
 
+    def record_fields(self) -> Set[str]:
+        return {"annotation.entities.label", "prediction.entities.label"}
+
     def apply(
         self,
-        records: Iterable[ServiceTokenClassificationRecord],
+        records: Iterable[Dict[str, Any]],
     ) -> Dict[str, Any]:
         ds_labels = set()
 
-        for _ in range(0, self.records_to_fetch):  # Only a few of records will be parsed
-            record: ServiceTokenClassificationRecord = next(records, None)
+        for _ in range(0, self.records_to_fetch):  # Only a few of records will be read
+            record = next(records, None)
             if record is None:
                 break
 
-            if record.annotation:
-                ds_labels.update([entity.label for entity in record.annotation.entities])
-            if record.prediction:
-                ds_labels.update([entity.label for entity in record.prediction.entities])
+            for annotation in (record.get("annotation"), record.get("prediction")):
+                if annotation:
+                    ds_labels.update([entity["label"] for entity in annotation.get("entities") or []])
         return {"labels": ds_labels or []}
 
 
@@ -172,6 +186,43 @@ class TokenMetrics(BaseModel):
     capitalness: Optional[str] = None
 
 
+# Plain record data used to compute the record metrics: text, tokens and the predicted and annotated entities, as
+# (label, start, end, score) tuples
+_EntityData = Tuple[str, int, int, float]
+_RecordMetricsData = Tuple[str, List[str], List[_EntityData], List[_EntityData]]
+
+
+def _compute_records_metrics(records_data: List[_RecordMetricsData]) -> List[Dict[str, Any]]:
+    """Computes the record metrics for a batch of records data, as stored in elasticsearch (see `TokenMetrics` and
+    `MentionMetrics`). The capitalness is computed once per distinct value in the batch"""
+    capitalness_by_value: Dict[str, Optional[str]] = {}
+
+    def capitalness(value: str) -> Optional[str]:
+        try:
+            return capitalness_by_value[value]
+        except KeyError:
+            capitalness_by_value[value] = TokenClassificationMetrics.capitalness(value)
+            return capitalness_by_value[value]
+
+    def mentions_metrics(text: str, entities: List[_EntityData]) -> List[Dict[str, Any]]:
+        # Same as the record mentions: one mention per distinct value
+        mentions = {text[start:end]: (label, score) for label, start, end, score in entities}
+        return [
+            {"value": value, "label": label, "score": score, "capitalness": capitalness(value)}
+            for value, (label, score) in mentions.items()
+        ]
+
+    return [
+        {
+            "text_length": len(text),
+            "tokens": [{"value": token, "capitalness": capitalness(token)} for token in tokens],
+            "predicted": {"mentions": mentions_metrics(text, predicted_entities)},
+            "annotated": {"mentions": mentions_metrics(text, annotated_entities)},
+        }
+        for text, tokens, predicted_entities, annotated_entities in records_data
+    ]
+
+
 class TokenClassificationMetrics(CommonTasksMetrics[ServiceTokenClassificationRecord]):
     """Configured metrics for token classification"""
 
@@ -197,50 +248,42 @@ class TokenClassificationMetrics(CommonTasksMetrics[ServiceTokenClassificationRe
         return None
 
     @staticmethod
-    def mentions_metrics(record: ServiceTokenClassificationRecord, mentions: List[Tuple[str, EntitySpan]]):
-        def mention_tokens_length(entity: EntitySpan) -> int:
-            """Compute mention tokens length"""
-            return len(
-                set(
-                    [
-                        token_idx
-                        for i in range(entity.start, entity.end)
-                        for token_idx in [record.span_utils.char_to_token_idx.get(i)]
-                        if token_idx is not None
-                    ]
-                )
-            )
+    def _record_metrics_data(record: ServiceTokenClassificationRecord) -> _RecordMetricsData:
+        """Extracts the plain record data needed to compute its metrics, so it can be sent to worker processes.
+        Mentions are resolved from the entities offsets when computing the metrics"""
+
+        def entities_data(entities: Set[EntitySpan]) -> List[_EntityData]:
+            return [(entity.label, entity.start, entity.end, entity.score) for entity in entities]
+
+        return (
+            record.all_text(),
+            list(record.tokens),
+            entities_data(record.predicted_entities()),
+            entities_data(record.annotated_entities()),
+        )
 
-        return [
-            MentionMetrics(
-                value=mention,
-                label=entity.label,
-                score=entity.score,
-                capitalness=TokenClassificationMetrics.capitalness(mention),
-            )
-            for mention, entity in mentions
-        ]
+    @classmethod
+    def record_metrics(cls, record: ServiceTokenClassificationRecord) -> Dict[str, Any]:
+        """Compute metrics at record level"""
+        return _compute_records_metrics([cls._record_metrics_data(record)])[0]
 
     @classmethod
-    def build_tokens_metrics(cls, record: ServiceTokenClassificationRecord) -> List[TokenMetrics]:
+    def records_metrics(cls, records: List[ServiceTokenClassificationRecord]) -> List[Dict[str, Any]]:
+        """Compute metrics at record level for a batch of records. Large batches are split across the worker
+        processes, if enabled"""
+        records_data = [cls._record_metrics_data(record) for record in records]
+
+        process_pool = get_process_pool() if len(records_data) >= settings.metrics_processes_min_records else None
+        if process_pool is None:
+            return _compute_records_metrics(records_data)
+
+        chunk_size = math.ceil(len(records_data) / settings.metrics_processes)
+        chunks = [records_data[i : i + chunk_size] for i in range(0, len(records_data), chunk_size)]
+
         return [
-            TokenMetrics(value=token_value, capitalness=cls.capitalness(token_value))
-            for token_idx, token_value in enumerate(record.tokens)
+            metrics for chunk_metrics in process_pool.map(_compute_records_metrics, chunks) for metrics in chunk_metrics
         ]
 
-    @classmethod
-    def record_metrics(cls, record: ServiceTokenClassificationRecord) -> Dict[str, Any]:
-        """Compute metrics at record level"""
-        base_metrics = super(TokenClassificationMetrics, cls).record_metrics(record)
-
-        tokens_metrics = cls.build_tokens_metrics(record)
-        return {
-            **base_metrics,
-            "tokens": tokens_metrics,
-            "predicted": {"mentions": cls.mentions_metrics(record, record.predicted_mentions())},
-            "annotated": {"mentions": cls.mentions_metrics(record, record.annotated_mentions())},
-        }
-
     @staticmethod
     def _compute_iob_tags(
         span_utils: SpanUtils,
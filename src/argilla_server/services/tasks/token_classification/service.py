@@ -60,11 +60,13 @@ class TokenClassificationService:
         self,
         dataset: ServiceBaseDataset,
         records: List[ServiceTokenClassificationRecord],
+        refresh: Optional[bool] = None,
     ):
         failed = await self.__storage__.store_records(
             dataset=dataset,
             records=records,
             record_type=ServiceTokenClassificationRecord,
+            refresh=refresh,
         )
         return BulkResponse(dataset=dataset.name, processed=len(records), failed=failed)
 
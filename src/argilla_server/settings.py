@@ -30,6 +30,7 @@ from argilla_server.constants import (
     DEFAULT_SPAN_OPTIONS_MAX_ITEMS,
     DEFAULT_TELEMETRY_KEY,
 )
+from argilla_server.enums import VectorStorageType
 from argilla_server.pydantic_v1 import BaseSettings, Field, root_validator, validator
 
 
@@ -58,6 +59,90 @@ class Settings(BaseSettings):
     es_records_index_replicas:
         Configures the number of shard replicas for dataset records index creation. Default=0
 
+    es_records_mappings_cache_ttl: (ES_RECORDS_MAPPINGS_CACHE_TTL env var)
+        Seconds the (v0) dataset records index mappings are cached for, so logging records doesn't read and
+        reconfigure the index mapping on every bulk unless new metadata fields or vectors show up. Set it to 0 to
+        disable the cache. Default=60
+
+    es_bulk_refresh: (ES_BULK_REFRESH env var)
+        If True, (v0) bulk writes wait until the written records are visible to searches before returning. If False,
+        they return right after writing them (async ingest mode) and clients needing to read their writes can refresh
+        the dataset with the `PUT /api/datasets/{name}:refresh` endpoint. Bulk requests can override it using the
+        `refresh` query param. Default=True
+
+    es_bulk_chunk_size: (ES_BULK_CHUNK_SIZE env var)
+        Max number of records sent to the search engine per bulk request by (v0) bulk writes. Default=500
+
+    es_bulk_thread_count: (ES_BULK_THREAD_COUNT env var)
+        Number of threads used by (v0) bulk writes to send the bulk requests to the search engine in parallel.
+        Default=1
+
+    metrics_processes: (METRICS_PROCESSES env var)
+        Number of worker processes used to compute the (v0) records metrics of large bulk writes. Set it to 0 to
+        compute them in the server process. Default=0
+
+    metrics_processes_min_records: (METRICS_PROCESSES_MIN_RECORDS env var)
+        Min number of records a (v0) bulk write must have to compute its records metrics in the worker processes.
+        Default=1000
+
+    elasticsearch_connections_per_node: (ELASTICSEARCH_CONNECTIONS_PER_NODE env var)
+        Max number of pooled connections kept alive per search engine node. Default=10
+
+    elasticsearch_request_timeout: (ELASTICSEARCH_REQUEST_TIMEOUT env var)
+        Timeout in seconds for requests sent to the search engine. Default=10
+
+    elasticsearch_sync_client_max_threads: (ELASTICSEARCH_SYNC_CLIENT_MAX_THREADS env var)
+        Max number of worker threads used to run blocking (v0) search engine calls. Default=20
+
+    search_engine: (SEARCH_ENGINE env var)
+        The search engine used for datasets records: "elasticsearch", "opensearch" or "sql". The "sql" engine
+        searches the records directly on the database (using a full-text index of the records text fields stored
+        in the database too), so no search cluster is required. Default="elasticsearch"
+
+    search_engine_vector_index: (SEARCH_ENGINE_VECTOR_INDEX env var)
+        The in-process vector index used by the "sql" search engine for similarity searches: "flat" (exact) or "ivf"
+        (inverted file index, exact for small number of vectors). Default="ivf"
+
+    search_engine_max_concurrent_searches: (SEARCH_ENGINE_MAX_CONCURRENT_SEARCHES env var)
+        Max number of searches run concurrently by the search engine when multiple similarity searches are
+        requested at once. Default=8
+
+    search_engine_metadata_metrics_cache_ttl: (SEARCH_ENGINE_METADATA_METRICS_CACHE_TTL env var)
+        Seconds the computed metadata properties metrics are cached for by the search engine, unless the dataset
+        records change before. Set it to 0 to disable the cache. Default=60
+
+    search_engine_hydrate_records: (SEARCH_ENGINE_HYDRATE_RECORDS env var)
+        If True, the "elasticsearch" and "opensearch" search engines also store the records as returned by the API,
+        so records listings are built straight from the search hits instead of reading them from the database.
+        Stored records are only used when their `updated_at` matches the database one (checked with a single query by
+        records ids), so changed records are read from the database. Responses and suggestions don't change the record
+        `updated_at`, so they are eventually consistent: they're served as stored by the search engine, which is kept
+        in sync by the writes updating them. Datasets indexed before enabling it must be reindexed. Default=False
+
+    search_engine_outbox_enabled: (SEARCH_ENGINE_OUTBOX_ENABLED env var)
+        If True, records written by bulk operations are committed to an outbox and indexed by a background
+        indexer instead of inside the write transaction. Default=False
+
+    search_engine_outbox_batch_size: (SEARCH_ENGINE_OUTBOX_BATCH_SIZE env var)
+        Max number of outbox records indexed by the background indexer at once. Default=1000
+
+    search_engine_outbox_poll_interval: (SEARCH_ENGINE_OUTBOX_POLL_INTERVAL env var)
+        Seconds the background indexer waits before polling the outbox again once it's empty. Default=1
+
+    search_engine_outbox_max_attempts: (SEARCH_ENGINE_OUTBOX_MAX_ATTEMPTS env var)
+        Max number of times the background indexer tries to index an outbox record. Records failing more times are
+        reported as failed by the dataset indexing status, and only indexed again once they're written again.
+        Default=5
+
+    enable_metrics: (ENABLE_METRICS env var)
+        If True, the server times the requests and their spans (database queries, search engine calls, validation
+        and serialization), exposing them as Prometheus histograms at /metrics and in the `Server-Timing` response
+        header. Default=False
+
+    enable_profiler: (ENABLE_PROFILER env var)
+        If True, owners can take a sampling profile of the running server using the /api/v1/profiler endpoint.
+        Default=False
+
     disable_es_index_template_creation: (DISABLE_ES_INDEX_TEMPLATE_CREATION env var)
          Allowing advanced users to create their own es index settings and mappings. Default=False
 
@@ -75,6 +160,21 @@ class Settings(BaseSettings):
     elasticsearch: str = "http://localhost:9200"
     elasticsearch_ssl_verify: bool = True
     elasticsearch_ca_path: Optional[str] = None
+    elasticsearch_connections_per_node: int = Field(
+        default=10,
+        gt=0,
+        description="Max number of pooled connections kept alive per search engine node",
+    )
+    elasticsearch_request_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Timeout (in seconds) for requests sent to the search engine",
+    )
+    elasticsearch_sync_client_max_threads: int = Field(
+        default=20,
+        gt=0,
+        description="Max number of worker threads used to run blocking search engine calls from async handlers",
+    )
     cors_origins: List[str] = ["*"]
 
     docs_enabled: bool = True
@@ -96,13 +196,78 @@ class Settings(BaseSettings):
     es_records_index_replicas: int = 0
 
     es_mapping_total_fields_limit: int = 2000
+    es_bulk_refresh: bool = Field(
+        default=True,
+        description="If True, bulk writes wait until the written records are visible to searches before returning",
+    )
+    es_bulk_chunk_size: int = Field(
+        default=500,
+        gt=0,
+        description="Max number of records sent to the search engine per bulk request",
+    )
+    es_bulk_thread_count: int = Field(
+        default=1,
+        gt=0,
+        description="Number of threads sending the bulk requests to the search engine in parallel",
+    )
+    es_records_mappings_cache_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds the dataset records index mappings are cached for by bulk writes (0 disables the cache)",
+    )
+    metrics_processes: int = Field(
+        default=0,
+        ge=0,
+        description="Number of worker processes computing the records metrics of large bulk writes (0 disables them)",
+    )
+    metrics_processes_min_records: int = Field(
+        default=1000,
+        gt=0,
+        description="Min number of records a bulk write must have to compute its records metrics in worker processes",
+    )
 
     search_engine: str = "elasticsearch"
+    search_engine_vector_index: str = "ivf"
+    search_engine_max_concurrent_searches: int = Field(
+        default=8,
+        gt=0,
+        description="Max number of searches run concurrently by the search engine for a multiple similarity search",
+    )
+    search_engine_metadata_metrics_cache_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds the computed metadata properties metrics are cached for (0 disables the cache)."
+        " Cached metrics are also discarded as soon as the dataset records change",
+    )
+    search_engine_hydrate_records: bool = Field(
+        default=False,
+        description="If True, records listings are built from the records stored by the search engine when up to date",
+    )
+    search_engine_outbox_enabled: bool = False
+    search_engine_outbox_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        description="Max number of outbox records indexed by the background indexer at once",
+    )
+    search_engine_outbox_poll_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds the background indexer waits before polling the outbox again once it's empty",
+    )
+    search_engine_outbox_max_attempts: int = Field(
+        default=5,
+        gt=0,
+        description="Max number of times the background indexer tries to index an outbox record",
+    )
 
     vectors_fields_limit: int = Field(
         default=5,
         description="Max number of supported vectors per record",
     )
+    vectors_storage_type: VectorStorageType = Field(
+        default=VectorStorageType.float32,
+        description="Binary format used to store new vectors values: float32, float16 or int8 (quantized)",
+    )
 
     metadata_fields_limit: int = Field(
         default=50,
@@ -133,6 +298,16 @@ class Settings(BaseSettings):
         description="If True, show a warning when Hugging Face space persistent storage is disabled",
     )
 
+    # Instrumentation settings
+    enable_metrics: bool = Field(
+        default=False,
+        description="If True, time the requests and their spans, exposing them at `/metrics` (Prometheus format)",
+    )
+    enable_profiler: bool = Field(
+        default=False,
+        description="If True, allow owners to take sampling profiles of the server with the profiler endpoint",
+    )
+
     # See also the telemetry.py module
     enable_telemetry: bool = True
     telemetry_key: str = DEFAULT_TELEMETRY_KEY
@@ -12,11 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server import instrumentation
 from argilla_server.contexts import datasets
 from argilla_server.database import get_async_db
 from argilla_server.errors import future as errors
@@ -24,6 +25,7 @@ from argilla_server.models import User
 from argilla_server.policies import RecordPolicyV1, authorize
 from argilla_server.schemas.v1.responses import Response, ResponseBulk, ResponseBulkError, ResponseUpsert
 from argilla_server.search_engine import SearchEngine, get_search_engine
+from argilla_server.validators.responses import ResponseUpsertValidator
 
 
 class UpsertResponsesInBulkUseCase:
@@ -32,23 +34,42 @@ class UpsertResponsesInBulkUseCase:
         self.search_engine = search_engine
 
     async def execute(self, responses: List[ResponseUpsert], user: User) -> List[ResponseBulk]:
-        responses_bulk_items = []
+        responses_bulk_items: List[Optional[ResponseBulk]] = []
+        valid_items_positions, records_responses_upserts = [], []
 
         all_records = await datasets.get_records_by_ids(self.db, [item.record_id for item in responses])
         non_empty_records = [r for r in all_records if r is not None]
 
         await datasets.preload_records_relationships_before_validate(self.db, non_empty_records)
-        for item, record in zip(responses, all_records):
-            try:
-                if record is None:
-                    raise errors.NotFoundError(f"Record with id `{item.record_id}` not found")
-
-                await authorize(user, RecordPolicyV1.create_response(record))
-                response = await datasets.upsert_response(self.db, self.search_engine, record, user, item)
-            except Exception as err:
-                responses_bulk_items.append(ResponseBulk(item=None, error=ResponseBulkError(detail=str(err))))
-            else:
-                responses_bulk_items.append(ResponseBulk(item=Response.from_orm(response), error=None))
+        with instrumentation.span("validation"):
+            for item, record in zip(responses, all_records):
+                try:
+                    if record is None:
+                        raise errors.NotFoundError(f"Record with id `{item.record_id}` not found")
+
+                    await authorize(user, RecordPolicyV1.create_response(record))
+                    ResponseUpsertValidator(item).validate_for(record)
+                except Exception as err:
+                    responses_bulk_items.append(ResponseBulk(item=None, error=ResponseBulkError(detail=str(err))))
+                else:
+                    valid_items_positions.append(len(responses_bulk_items))
+                    records_responses_upserts.append((record, item))
+                    responses_bulk_items.append(None)
+
+        if not records_responses_upserts:
+            return responses_bulk_items
+
+        try:
+            upserted_responses = await datasets.upsert_responses(
+                self.db, self.search_engine, user, records_responses_upserts
+            )
+        except Exception as err:
+            await self.db.rollback()
+            for position in valid_items_positions:
+                responses_bulk_items[position] = ResponseBulk(item=None, error=ResponseBulkError(detail=str(err)))
+        else:
+            for position, response in zip(valid_items_positions, upserted_responses):
+                responses_bulk_items[position] = ResponseBulk(item=Response.from_orm(response), error=None)
 
         return responses_bulk_items
 
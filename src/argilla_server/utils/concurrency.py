@@ -0,0 +1,91 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+import anyio
+from anyio import CapacityLimiter
+
+from argilla_server.settings import settings
+
+T = TypeVar("T")
+
+_LIMITER: Optional[CapacityLimiter] = None
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_limiter() -> CapacityLimiter:
+    global _LIMITER
+
+    # The limiter must be created inside a running event loop, so it's lazily initialized on first use
+    if _LIMITER is None:
+        _LIMITER = CapacityLimiter(settings.elasticsearch_sync_client_max_threads)
+
+    return _LIMITER
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Runs a blocking function in a bounded worker thread pool, so it does not block the event loop
+
+    Parameters
+    ----------
+    func:
+        The blocking function to run
+    args:
+        Positional arguments passed to the function
+    kwargs:
+        Keyword arguments passed to the function
+
+    Returns
+    -------
+        The function result
+    """
+    return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs), limiter=_get_limiter())
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Returns the shared process pool used to run CPU-bound work, like computing the records metrics of large bulks
+
+    Returns
+    -------
+        The process pool, or ``None`` if it's disabled by the `metrics_processes` setting
+    """
+    global _PROCESS_POOL
+
+    if settings.metrics_processes < 1:
+        return None
+
+    # Worker processes are only spawned when the pool is used for the first time. They are started with "spawn",
+    # since forking a process running an event loop and client connections pools is not safe
+    if _PROCESS_POOL is None:
+        _PROCESS_POOL = ProcessPoolExecutor(
+            max_workers=settings.metrics_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    return _PROCESS_POOL
+
+
+def shutdown_process_pool() -> None:
+    """Shuts down the shared process pool, if it was started"""
+    global _PROCESS_POOL
+
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(wait=True)
+        _PROCESS_POOL = None
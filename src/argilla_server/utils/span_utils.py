@@ -12,7 +12,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Dict, List, Optional, Tuple
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 class SpanUtils:
@@ -25,26 +27,29 @@ class SpanUtils:
         tokens: The tokens of the text.
     """
 
+    __slots__ = ("_text", "_tokens", "_token_starts", "_token_ends", "_token_to_char_idx", "_char_to_token_idx")
+
     def __init__(self, text: str, tokens: List[str]):
         self._text, self._tokens = text, tokens
 
-        self._token_to_char_idx: Dict[int, Tuple[int, int]] = {}
-        self._start_to_token_idx: Dict[int, int] = {}
-        self._end_to_token_idx: Dict[int, int] = {}
-        self._char_to_token_idx: Dict[int, int] = {}
+        # The start/end char indexes of the tokens. Both are sorted, so the token starting/ending at a char index
+        # is found by bisection, without keeping any per char mapping
+        self._token_starts = array("q")
+        self._token_ends = array("q")
+
+        # Only built on demand, by the `token_to_char_idx` and `char_to_token_idx` properties
+        self._token_to_char_idx: Optional[Dict[int, Tuple[int, int]]] = None
+        self._char_to_token_idx: Optional[Dict[int, int]] = None
 
         end_idx = 0
-        for idx, token in enumerate(tokens):
+        for token in tokens:
             start_idx = text.find(token, end_idx)
             if start_idx == -1:
                 raise ValueError(f"Token '{token}' not found in text: {text}")
             end_idx = start_idx + len(token)
 
-            self._token_to_char_idx[idx] = (start_idx, end_idx)
-            self._start_to_token_idx[start_idx] = idx
-            self._end_to_token_idx[end_idx] = idx
-            for i in range(start_idx, end_idx):
-                self._char_to_token_idx[i] = idx
+            self._token_starts.append(start_idx)
+            self._token_ends.append(end_idx)
 
             # convention: skip first white space after a token
             try:
@@ -67,21 +72,54 @@ class SpanUtils:
     @property
     def token_to_char_idx(self) -> Dict[int, Tuple[int, int]]:
         """The token index to start/end char index mapping."""
+        if self._token_to_char_idx is None:
+            self._token_to_char_idx = {
+                idx: (start_idx, end_idx) for idx, (start_idx, end_idx) in enumerate(self._token_offsets())
+            }
         return self._token_to_char_idx
 
     @property
     def char_to_token_idx(self) -> Dict[int, int]:
         """The char index to token index mapping."""
+        if self._char_to_token_idx is None:
+            self._char_to_token_idx = {
+                char_idx: idx
+                for idx, (start_idx, end_idx) in enumerate(self._token_offsets())
+                for char_idx in range(start_idx, end_idx)
+            }
         return self._char_to_token_idx
 
-    def validate(self, spans: List[Tuple[str, int, int]]):
-        """Validates the alignment of span boundaries and tokens.
+    def _token_offsets(self) -> Iterable[Tuple[int, int]]:
+        return zip(self._token_starts, self._token_ends)
+
+    @staticmethod
+    def _find_token_idx(char_indexes: array, char_idx: int) -> int:
+        """Finds the index of the (last) token with the given start/end char index.
+
+        Raises:
+            KeyError: If no token starts/ends at the char index.
+        """
+        idx = bisect_right(char_indexes, char_idx) - 1
+        if idx < 0 or char_indexes[idx] != char_idx:
+            raise KeyError(char_idx)
+        return idx
+
+    def _is_aligned(self, char_start: int, char_end: int) -> bool:
+        try:
+            self._find_token_idx(self._token_starts, char_start)
+            self._find_token_idx(self._token_ends, char_end)
+        except KeyError:
+            return False
+        return True
+
+    def validation_error(self, spans: List[Tuple[str, int, int]]) -> Optional[str]:
+        """Checks the alignment of span boundaries and tokens.
 
         Args:
             spans: A list of spans.
 
-        Raises:
-            ValueError: If a span is invalid, or if a span is not aligned with the tokens.
+        Returns:
+            The error message if a span is invalid, or if a span is not aligned with the tokens. None otherwise.
         """
         not_valid_spans_errors, misaligned_spans_errors = [], []
 
@@ -89,25 +127,37 @@ class SpanUtils:
             char_start, char_end = span[1], span[2]
             if char_end - char_start < 1:
                 not_valid_spans_errors.append(span)
-            elif None in (
-                self._start_to_token_idx.get(char_start),
-                self._end_to_token_idx.get(char_end),
-            ):
+            elif not self._is_aligned(char_start, char_end):
                 span_str = self.text[char_start:char_end]
                 message = f"{span} - {repr(span_str)}"
                 misaligned_spans_errors.append(message)
 
-        if not_valid_spans_errors or misaligned_spans_errors:
-            message = ""
-            if not_valid_spans_errors:
-                message += f"Following entity spans are not valid: {not_valid_spans_errors}\n"
+        if not not_valid_spans_errors and not misaligned_spans_errors:
+            return None
 
-            if misaligned_spans_errors:
-                spans = "\n".join(misaligned_spans_errors)
-                message += "Following entity spans are not aligned with provided tokenization\n"
-                message += f"Spans:\n{spans}\n"
-                message += f"Tokens:\n{self.tokens}"
+        message = ""
+        if not_valid_spans_errors:
+            message += f"Following entity spans are not valid: {not_valid_spans_errors}\n"
 
+        if misaligned_spans_errors:
+            spans = "\n".join(misaligned_spans_errors)
+            message += "Following entity spans are not aligned with provided tokenization\n"
+            message += f"Spans:\n{spans}\n"
+            message += f"Tokens:\n{self.tokens}"
+
+        return message
+
+    def validate(self, spans: List[Tuple[str, int, int]]):
+        """Validates the alignment of span boundaries and tokens.
+
+        Args:
+            spans: A list of spans.
+
+        Raises:
+            ValueError: If a span is invalid, or if a span is not aligned with the tokens.
+        """
+        message = self.validation_error(spans)
+        if message is not None:
             raise ValueError(message)
 
     def correct(self, spans: List[Tuple[str, int, int]]) -> List[Tuple[str, int, int]]:
@@ -157,8 +207,8 @@ class SpanUtils:
 
         tags = ["O"] * len(self.tokens)
         for span in spans:
-            start_token_idx = self._start_to_token_idx[span[1]]
-            end_token_idx = self._end_to_token_idx[span[2]]
+            start_token_idx = self._find_token_idx(self._token_starts, span[1])
+            end_token_idx = self._find_token_idx(self._token_ends, span[2])
 
             tags[start_token_idx] = f"B-{span[0]}"
             for token_idx in range(start_token_idx + 1, end_token_idx + 1):
@@ -199,7 +249,7 @@ class SpanUtils:
                 continue
 
             if prefix == "U":
-                start_idx, end_idx = self._token_to_char_idx[idx]
+                start_idx, end_idx = self._token_starts[idx], self._token_ends[idx]
                 spans.append((entity, start_idx, end_idx))
                 start_idx = None
                 continue
@@ -207,20 +257,20 @@ class SpanUtils:
             if prefix == "L":
                 # If no start prefix, we just assume "L" == "U":
                 if start_idx is None:
-                    start_idx, end_idx = self._token_to_char_idx[idx]
+                    start_idx, end_idx = self._token_starts[idx], self._token_ends[idx]
                 else:
-                    _, end_idx = self._token_to_char_idx[idx]
+                    end_idx = self._token_ends[idx]
                 spans.append((entity, start_idx, end_idx))
                 start_idx = None
                 continue
 
             if prefix == "B":
-                start_idx, end_idx = self._token_to_char_idx[idx]
+                start_idx, end_idx = self._token_starts[idx], self._token_ends[idx]
             elif prefix == "I":
                 # If "B" is missing, we just assume "I" starts the span
                 if start_idx is None:
-                    start_idx = self._token_to_char_idx[idx][0]
-                end_idx = self._token_to_char_idx[idx][1]
+                    start_idx = self._token_starts[idx]
+                end_idx = self._token_ends[idx]
             else:
                 raise ValueError("Tags are not in the IOB or BILOU format!")
 
@@ -12,13 +12,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List
+import numpy as np
 
 from argilla_server.models import VectorSettings
 
 
 class VectorValidator:
-    def __init__(self, value: List[float]):
+    def __init__(self, value: np.ndarray):
         self._value = value
 
     def validate_for(self, vector_settings: VectorSettings):
@@ -0,0 +1,189 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import contextlib
+import itertools
+from typing import Any, Dict, List
+
+import pytest
+from argilla_server.bulk.records_bulk import CreateRecordsBulk, UpsertRecordsBulk
+from argilla_server.contexts import datasets
+from argilla_server.enums import ResponseStatus
+from argilla_server.models import Record
+from argilla_server.schemas.v1.records import RecordsUpdate
+from argilla_server.schemas.v1.records_bulk import RecordsBulkCreate, RecordsBulkUpsert
+from argilla_server.schemas.v1.responses import ResponsesBulkCreate
+from argilla_server.search_engine import SQLSearchEngine, TextQuery
+from argilla_server.use_cases.responses.upsert_responses_in_bulk import UpsertResponsesInBulkUseCase
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.benchmarks.conftest import BenchmarkDataset, StubSearchEngine
+from tests.benchmarks.runner import BENCHMARK_MAX_REGRESSION, BENCHMARK_RECORDS, BenchmarkRunner, check_regression
+from tests.factories import OwnerFactory
+
+
+async def _create_records(
+    db: AsyncSession, search_engine: StubSearchEngine, benchmark_dataset: BenchmarkDataset, positions: range
+) -> List[Record]:
+    records_bulk = await CreateRecordsBulk(db, search_engine).create_records_bulk(
+        benchmark_dataset.dataset,
+        RecordsBulkCreate(items=[benchmark_dataset.record_create(position) for position in positions]),
+    )
+
+    return records_bulk.items
+
+
+@pytest.mark.asyncio
+class TestRecordsLifecycleBenchmarks:
+    async def test_create_records_bulk(
+        self,
+        db: AsyncSession,
+        stub_search_engine: StubSearchEngine,
+        benchmark_dataset: BenchmarkDataset,
+        benchmark_runner: BenchmarkRunner,
+        benchmark_baseline: Dict[str, Dict[str, Any]],
+    ):
+        batches = itertools.count()
+
+        async def setup() -> RecordsBulkCreate:
+            start = next(batches) * BENCHMARK_RECORDS
+            items = [benchmark_dataset.record_create(position) for position in range(start, start + BENCHMARK_RECORDS)]
+
+            return RecordsBulkCreate(items=items)
+
+        async def create_records_bulk(bulk_create: RecordsBulkCreate) -> None:
+            await CreateRecordsBulk(db, stub_search_engine).create_records_bulk(benchmark_dataset.dataset, bulk_create)
+
+        result = await benchmark_runner.run(
+            "create_records_bulk", benchmark_dataset.shape, BENCHMARK_RECORDS, create_records_bulk, setup
+        )
+
+        check_regression(result, benchmark_baseline, BENCHMARK_MAX_REGRESSION)
+
+    async def test_upsert_records_bulk(
+        self,
+        db: AsyncSession,
+        stub_search_engine: StubSearchEngine,
+        benchmark_dataset: BenchmarkDataset,
+        benchmark_runner: BenchmarkRunner,
+        benchmark_baseline: Dict[str, Dict[str, Any]],
+    ):
+        records = await _create_records(db, stub_search_engine, benchmark_dataset, range(BENCHMARK_RECORDS))
+
+        async def setup() -> RecordsBulkUpsert:
+            items = [
+                {**benchmark_dataset.record_create(position), "id": str(record.id)}
+                for position, record in enumerate(records)
+            ]
+
+            return RecordsBulkUpsert(items=items)
+
+        async def upsert_records_bulk(bulk_upsert: RecordsBulkUpsert) -> None:
+            await UpsertRecordsBulk(db, stub_search_engine).upsert_records_bulk(benchmark_dataset.dataset, bulk_upsert)
+
+        result = await benchmark_runner.run(
+            "upsert_records_bulk", benchmark_dataset.shape, BENCHMARK_RECORDS, upsert_records_bulk, setup
+        )
+
+        check_regression(result, benchmark_baseline, BENCHMARK_MAX_REGRESSION)
+
+    async def test_update_records(
+        self,
+        db: AsyncSession,
+        stub_search_engine: StubSearchEngine,
+        benchmark_dataset: BenchmarkDataset,
+        benchmark_runner: BenchmarkRunner,
+        benchmark_baseline: Dict[str, Dict[str, Any]],
+    ):
+        records = await _create_records(db, stub_search_engine, benchmark_dataset, range(BENCHMARK_RECORDS))
+        rounds = itertools.count()
+
+        async def setup() -> RecordsUpdate:
+            round = next(rounds)
+            items = [
+                {"id": str(record.id), "metadata": benchmark_dataset.metadata(position + round)}
+                for position, record in enumerate(records)
+            ]
+
+            return RecordsUpdate(items=items)
+
+        async def update_records(records_update: RecordsUpdate) -> None:
+            await datasets.update_records(db, stub_search_engine, benchmark_dataset.dataset, records_update)
+
+        result = await benchmark_runner.run(
+            "update_records", benchmark_dataset.shape, BENCHMARK_RECORDS, update_records, setup
+        )
+
+        check_regression(result, benchmark_baseline, BENCHMARK_MAX_REGRESSION)
+
+    async def test_upsert_responses_in_bulk(
+        self,
+        db: AsyncSession,
+        stub_search_engine: StubSearchEngine,
+        benchmark_dataset: BenchmarkDataset,
+        benchmark_runner: BenchmarkRunner,
+        benchmark_baseline: Dict[str, Dict[str, Any]],
+    ):
+        owner = await OwnerFactory.create()
+        records = await _create_records(db, stub_search_engine, benchmark_dataset, range(BENCHMARK_RECORDS))
+        rounds = itertools.count()
+
+        async def setup() -> ResponsesBulkCreate:
+            round = next(rounds)
+            items = [
+                {
+                    "record_id": str(record.id),
+                    "values": benchmark_dataset.response_values(position + round),
+                    "status": ResponseStatus.submitted,
+                }
+                for position, record in enumerate(records)
+            ]
+
+            return ResponsesBulkCreate(items=items)
+
+        async def upsert_responses_in_bulk(responses_bulk: ResponsesBulkCreate) -> None:
+            await UpsertResponsesInBulkUseCase(db, stub_search_engine).execute(responses_bulk.items, owner)
+
+        result = await benchmark_runner.run(
+            "upsert_responses_in_bulk", benchmark_dataset.shape, BENCHMARK_RECORDS, upsert_responses_in_bulk, setup
+        )
+
+        check_regression(result, benchmark_baseline, BENCHMARK_MAX_REGRESSION)
+
+    async def test_search(
+        self,
+        db: AsyncSession,
+        stub_search_engine: StubSearchEngine,
+        benchmark_dataset: BenchmarkDataset,
+        benchmark_runner: BenchmarkRunner,
+        benchmark_baseline: Dict[str, Dict[str, Any]],
+    ):
+        records = await _create_records(db, stub_search_engine, benchmark_dataset, range(BENCHMARK_RECORDS))
+        # The SQL search engine searches the records on the database, so there is no search cluster involved
+        search_engine = SQLSearchEngine(session_factory=lambda: contextlib.nullcontext(db))
+        await search_engine.index_records(benchmark_dataset.dataset, records)
+
+        async def search(_: None) -> None:
+            responses = await search_engine.search(
+                benchmark_dataset.dataset, query=TextQuery(q="record"), limit=BENCHMARK_RECORDS
+            )
+            assert responses.total == BENCHMARK_RECORDS
+
+            await datasets.get_records_by_ids(
+                db, [item.record_id for item in responses.items], dataset_id=benchmark_dataset.dataset.id
+            )
+
+        result = await benchmark_runner.run("search", benchmark_dataset.shape, BENCHMARK_RECORDS, search)
+
+        check_regression(result, benchmark_baseline, BENCHMARK_MAX_REGRESSION)
@@ -0,0 +1,252 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import dataclasses
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Generator, Iterable, List, Optional
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+from argilla_server.enums import DatasetStatus, RecordIndexProperty
+from argilla_server.models import Dataset, MetadataProperty, Record, Response, Suggestion, Vector, VectorSettings
+from argilla_server.search_engine import SearchEngine, SearchResponses
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.benchmarks.runner import (
+    BENCHMARK_BASELINE,
+    BENCHMARK_JSON,
+    BenchmarkRunner,
+    format_results,
+    load_baseline,
+    save_results,
+)
+from tests.factories import (
+    DatasetFactory,
+    FloatMetadataPropertyFactory,
+    IntegerMetadataPropertyFactory,
+    LabelSelectionQuestionFactory,
+    MultiLabelSelectionQuestionFactory,
+    RatingQuestionFactory,
+    TermsMetadataPropertyFactory,
+    TextFieldFactory,
+    TextQuestionFactory,
+    VectorSettingsFactory,
+)
+
+if TYPE_CHECKING:
+    from _pytest.terminal import TerminalReporter
+
+benchmark_runner_key = pytest.StashKey[BenchmarkRunner]()
+
+VECTOR_DIMENSIONS = 64
+
+
+class StubSearchEngine(SearchEngine):
+    """A search engine doing nothing, so benchmarks only measure the database and the application code."""
+
+    @classmethod
+    async def new_instance(cls) -> "StubSearchEngine":
+        return cls()
+
+    async def close(self):
+        pass
+
+    async def info(self) -> dict:
+        return {}
+
+    async def create_index(self, dataset: Dataset):
+        pass
+
+    async def delete_index(self, dataset: Dataset):
+        pass
+
+    async def create_reindex_index(self, dataset: Dataset) -> str:
+        return ""
+
+    async def reindex_records(self, dataset: Dataset, records: Iterable[Record], index_name: str):
+        pass
+
+    async def list_reindex_records_ids(
+        self, dataset: Dataset, index_name: str, after: Optional[UUID] = None, limit: int = 100
+    ) -> List[UUID]:
+        return []
+
+    async def delete_reindex_records(self, dataset: Dataset, records_ids: Iterable[UUID], index_name: str):
+        pass
+
+    async def swap_reindex_index(self, dataset: Dataset, index_name: str):
+        pass
+
+    async def configure_metadata_property(self, dataset: Dataset, metadata_property: MetadataProperty):
+        pass
+
+    async def configure_index_vectors(self, vector_settings: VectorSettings):
+        pass
+
+    async def index_records(self, dataset: Dataset, records: Iterable[Record]):
+        pass
+
+    async def partial_update_records(
+        self, dataset: Dataset, records: Iterable[Record], properties: Iterable[RecordIndexProperty]
+    ):
+        pass
+
+    async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
+        pass
+
+    async def update_record_response(self, response: Response):
+        pass
+
+    async def update_records_responses(self, responses: Iterable[Response]):
+        pass
+
+    async def delete_record_response(self, response: Response):
+        pass
+
+    async def update_record_suggestion(self, suggestion: Suggestion):
+        pass
+
+    async def delete_record_suggestion(self, suggestion: Suggestion):
+        pass
+
+    async def search(self, dataset: Dataset, *args, **kwargs) -> SearchResponses:
+        return SearchResponses(items=[], total=0)
+
+    async def _compute_metrics_for(self, metadata_property: MetadataProperty, size=None, offset=0):
+        pass
+
+    async def set_records_vectors(self, dataset: Dataset, vectors: Iterable[Vector]):
+        pass
+
+    async def similarity_search(self, dataset: Dataset, *args, **kwargs) -> SearchResponses:
+        return SearchResponses(items=[], total=0)
+
+
+@dataclasses.dataclass
+class BenchmarkDataset:
+    """A dataset with a given shape ("minimal" or "rich") and the payloads benchmarks write to it."""
+
+    shape: str
+    dataset: Dataset
+
+    @property
+    def is_rich(self) -> bool:
+        return self.shape == "rich"
+
+    def record_create(self, position: int) -> Dict[str, Any]:
+        record = {"fields": {"text": f"This is the text of the record number {position}"}}
+        if self.is_rich:
+            record["fields"]["context"] = f"Some context for the record number {position} " * 10
+            record["metadata"] = self.metadata(position)
+            record["suggestions"] = [
+                {"question_id": str(self._question_id("label")), "value": f"option{position % 3 + 1}", "score": 0.5},
+                {"question_id": str(self._question_id("topics")), "value": ["option1", "option3"]},
+            ]
+            record["vectors"] = {"embedding": [(position + i) % 10 / 10 for i in range(VECTOR_DIMENSIONS)]}
+
+        return record
+
+    def metadata(self, position: int) -> Dict[str, Any]:
+        return {"category": ["a", "b", "c"][position % 3], "position": position, "score": position / 100}
+
+    def response_values(self, position: int) -> Dict[str, Any]:
+        values = {"label": {"value": f"option{position % 3 + 1}"}}
+        if self.is_rich:
+            values["topics"] = {"value": ["option2"]}
+            values["rating"] = {"value": position % 10 + 1}
+            values["comment"] = {"value": f"A comment for the record number {position}"}
+
+        return values
+
+    def _question_id(self, name: str):
+        return next(question.id for question in self.dataset.questions if question.name == name)
+
+
+async def _create_minimal_dataset() -> Dataset:
+    return await DatasetFactory.create(
+        status=DatasetStatus.ready,
+        fields=[await TextFieldFactory.create(name="text", required=True)],
+        questions=[await LabelSelectionQuestionFactory.create(name="label", required=False)],
+    )
+
+
+async def _create_rich_dataset() -> Dataset:
+    dataset = await DatasetFactory.create(
+        status=DatasetStatus.ready,
+        fields=[
+            await TextFieldFactory.create(name="text", required=True),
+            await TextFieldFactory.create(name="context", required=False),
+        ],
+        questions=[
+            await LabelSelectionQuestionFactory.create(name="label", required=False),
+            await MultiLabelSelectionQuestionFactory.create(name="topics", required=False),
+            await RatingQuestionFactory.create(name="rating", required=False),
+            await TextQuestionFactory.create(name="comment", required=False),
+        ],
+        metadata_properties=[
+            await TermsMetadataPropertyFactory.create(name="category"),
+            await IntegerMetadataPropertyFactory.create(name="position"),
+            await FloatMetadataPropertyFactory.create(name="score"),
+        ],
+    )
+    await VectorSettingsFactory.create(name="embedding", dimensions=VECTOR_DIMENSIONS, dataset=dataset)
+
+    return dataset
+
+
+@pytest.fixture(scope="session")
+def benchmark_runner(request: pytest.FixtureRequest) -> Generator[BenchmarkRunner, None, None]:
+    runner = BenchmarkRunner()
+    request.config.stash[benchmark_runner_key] = runner
+
+    yield runner
+
+    if BENCHMARK_JSON:
+        save_results(BENCHMARK_JSON, runner.results)
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline() -> Dict[str, Dict[str, Any]]:
+    return load_baseline(BENCHMARK_BASELINE) if BENCHMARK_BASELINE else {}
+
+
+@pytest.fixture
+def stub_search_engine() -> StubSearchEngine:
+    return StubSearchEngine()
+
+
+@pytest_asyncio.fixture(params=["minimal", "rich"])
+async def benchmark_dataset(request: pytest.FixtureRequest, db: AsyncSession) -> AsyncGenerator[BenchmarkDataset, None]:
+    if request.param == "rich":
+        dataset = await _create_rich_dataset()
+    else:
+        dataset = await _create_minimal_dataset()
+
+    await db.refresh(dataset)
+    await dataset.awaitable_attrs.fields
+    await dataset.awaitable_attrs.questions
+    await dataset.awaitable_attrs.metadata_properties
+    await dataset.awaitable_attrs.vectors_settings
+
+    yield BenchmarkDataset(shape=request.param, dataset=dataset)
+
+
+def pytest_terminal_summary(terminalreporter: "TerminalReporter", config: pytest.Config) -> None:
+    runner = config.stash.get(benchmark_runner_key, None)
+    if runner is None or not runner.results:
+        return
+
+    terminalreporter.section("benchmarks")
+    for line in format_results(runner.results):
+        terminalreporter.write_line(line)
@@ -0,0 +1,164 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Benchmarks for the records hot paths. They are not collected with the tests, run them with `pdm run benchmark`.
+
+Configured with the env vars:
+    ARGILLA_BENCHMARK_RECORDS: records written or searched on each round. Default=200
+    ARGILLA_BENCHMARK_ROUNDS: measured rounds. Default=5
+    ARGILLA_BENCHMARK_WARMUP_ROUNDS: rounds run before measuring. Default=1
+    ARGILLA_BENCHMARK_JSON: file where results are saved, to be used as a baseline later
+    ARGILLA_BENCHMARK_BASELINE: results file to compare with, failing benchmarks whose throughput regressed
+    ARGILLA_BENCHMARK_MAX_REGRESSION: ratio the throughput can regress from the baseline. Default=0.2
+"""
+import dataclasses
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+BENCHMARK_ROUNDS = int(os.getenv("ARGILLA_BENCHMARK_ROUNDS", "5"))
+BENCHMARK_WARMUP_ROUNDS = int(os.getenv("ARGILLA_BENCHMARK_WARMUP_ROUNDS", "1"))
+BENCHMARK_RECORDS = int(os.getenv("ARGILLA_BENCHMARK_RECORDS", "200"))
+BENCHMARK_JSON = os.getenv("ARGILLA_BENCHMARK_JSON")
+BENCHMARK_BASELINE = os.getenv("ARGILLA_BENCHMARK_BASELINE")
+BENCHMARK_MAX_REGRESSION = float(os.getenv("ARGILLA_BENCHMARK_MAX_REGRESSION", "0.2"))
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    operation: str
+    shape: str
+    records: int
+    latencies: List[float]
+    peak_memory: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.operation}[{self.shape}]"
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records * len(self.latencies) / sum(self.latencies)
+
+    @property
+    def p50(self) -> float:
+        return self._percentile(50)
+
+    @property
+    def p99(self) -> float:
+        return self._percentile(99)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "shape": self.shape,
+            "records": self.records,
+            "rounds": len(self.latencies),
+            "records_per_second": self.records_per_second,
+            "p50": self.p50,
+            "p99": self.p99,
+            "peak_memory": self.peak_memory,
+        }
+
+    def _percentile(self, percentile: int) -> float:
+        if len(self.latencies) == 1:
+            return self.latencies[0]
+
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[percentile - 1]
+
+
+class BenchmarkRunner:
+    """Runs an async operation for a number of rounds, measuring its latency on each round and, on an extra round
+    traced with `tracemalloc` (so tracing doesn't slow down the timed ones), the peak memory it allocates.
+
+    `setup` runs before each round out of the measurements and its result is passed to the operation."""
+
+    def __init__(self, rounds: int = BENCHMARK_ROUNDS, warmup_rounds: int = BENCHMARK_WARMUP_ROUNDS):
+        self.rounds = rounds
+        self.warmup_rounds = warmup_rounds
+        self.results: List[BenchmarkResult] = []
+
+    async def run(
+        self,
+        operation: str,
+        shape: str,
+        records: int,
+        fn: Callable[[Any], Awaitable[Any]],
+        setup: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> BenchmarkResult:
+        async def _setup() -> Any:
+            return await setup() if setup else None
+
+        for _ in range(self.warmup_rounds):
+            await fn(await _setup())
+
+        latencies = []
+        for _ in range(self.rounds):
+            args = await _setup()
+            started_at = time.perf_counter()
+            await fn(args)
+            latencies.append(time.perf_counter() - started_at)
+
+        args = await _setup()
+        tracemalloc.start()
+        try:
+            await fn(args)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = BenchmarkResult(
+            operation=operation, shape=shape, records=records, latencies=latencies, peak_memory=peak_memory
+        )
+        self.results.append(result)
+
+        return result
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    results = json.loads(Path(path).read_text())
+
+    return {f"{result['operation']}[{result['shape']}]": result for result in results}
+
+
+def check_regression(result: BenchmarkResult, baseline: Dict[str, Dict[str, Any]], max_regression: float) -> None:
+    """Fails when the throughput of `result` is more than `max_regression` (as a ratio) below its baseline."""
+    if result.name not in baseline:
+        return
+
+    expected = baseline[result.name]["records_per_second"] * (1 - max_regression)
+    assert result.records_per_second >= expected, (
+        f"{result.name} throughput regressed: {result.records_per_second:.1f} records/sec,"
+        f" baseline {baseline[result.name]['records_per_second']:.1f} records/sec"
+    )
+
+
+def save_results(path: str, results: List[BenchmarkResult]) -> None:
+    Path(path).write_text(json.dumps([result.as_dict() for result in results], indent=2))
+
+
+def format_results(results: List[BenchmarkResult]) -> List[str]:
+    lines = [f"{'benchmark':<48}{'records/sec':>14}{'p50 (ms)':>12}{'p99 (ms)':>12}{'peak mem (MiB)':>16}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<48}{result.records_per_second:>14.1f}{result.p50 * 1000:>12.2f}{result.p99 * 1000:>12.2f}"
+            f"{result.peak_memory / 2**20:>16.2f}"
+        )
+
+    return lines
@@ -112,6 +112,7 @@ def async_db_proxy(mocker: "MockerFixture", sync_db: "Session") -> "AsyncSession
     async_session = AsyncSession()
     async_session.sync_session = sync_db
     async_session._proxied = sync_db
+    async_session.bind = sync_db.bind
     async_session.close = mocker.AsyncMock()
 
     return async_session
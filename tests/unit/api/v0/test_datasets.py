@@ -12,14 +12,16 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import pytest
 from argilla_server.apis.v0.models.text_classification import TextClassificationBulkRequest
 from argilla_server.commons.models import TaskType
 from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.daos.backend import GenericElasticEngineBackend
 from argilla_server.models import UserRole
 from argilla_server.schemas.v0.datasets import Dataset
+from argilla_server.settings import settings
 
 from tests.factories import (
     AnnotatorFactory,
@@ -28,6 +30,9 @@ from tests.factories import (
     WorkspaceFactory,
 )
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 @pytest.mark.asyncio
 class TestSuiteDatasetApi:
@@ -379,6 +384,104 @@ class TestSuiteDatasetApi:
         )
         assert response.status_code == 200
 
+    @pytest.mark.parametrize("role", [UserRole.owner, UserRole.admin, UserRole.annotator])
+    async def test_refresh_dataset(
+        self, async_client: "AsyncClient", mocker: "MockerFixture", owner_auth_header: dict, role: UserRole
+    ):
+        dataset = await DatasetFactory.create()
+        workspace_name = dataset.workspace.name
+        await self.create_mock_dataset(
+            async_client, dataset_name=dataset.name, headers=owner_auth_header, workspace=workspace_name
+        )
+        refresh_spy = mocker.spy(GenericElasticEngineBackend, "refresh")
+
+        user = await UserFactory.create(role=role, workspaces=[dataset.workspace])
+
+        response = await async_client.put(
+            f"/api/datasets/{dataset.name}:refresh?workspace={workspace_name}",
+            headers={API_KEY_HEADER_NAME: user.api_key},
+        )
+
+        assert response.status_code == 200
+        refresh_spy.assert_called_once()
+
+    @pytest.mark.parametrize("role", [UserRole.admin, UserRole.annotator])
+    async def test_refresh_dataset_without_permissions(
+        self, async_client: "AsyncClient", mocker: "MockerFixture", owner_auth_header: dict, role: UserRole
+    ):
+        dataset = await DatasetFactory.create()
+        workspace_name = dataset.workspace.name
+        await self.create_mock_dataset(
+            async_client, dataset_name=dataset.name, headers=owner_auth_header, workspace=workspace_name
+        )
+        refresh_spy = mocker.spy(GenericElasticEngineBackend, "refresh")
+
+        user = await UserFactory.create(role=role)
+
+        response = await async_client.put(
+            f"/api/datasets/{dataset.name}:refresh?workspace={workspace_name}",
+            headers={API_KEY_HEADER_NAME: user.api_key},
+        )
+
+        assert response.status_code == 403
+        refresh_spy.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "task, record",
+        [
+            (TaskType.text_classification, {"inputs": {"text": "This is a text"}}),
+            (TaskType.token_classification, {"text": "This is a text", "tokens": ["This", "is", "a", "text"]}),
+            (TaskType.text2text, {"text": "This is a text"}),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "es_bulk_refresh, refresh_param, expected_refresh",
+        [
+            (True, None, True),
+            (False, None, False),
+            (True, "false", False),
+            (False, "true", True),
+        ],
+    )
+    async def test_bulk_records_with_refresh(
+        self,
+        async_client: "AsyncClient",
+        mocker: "MockerFixture",
+        owner_auth_header: dict,
+        task: TaskType,
+        record: Dict[str, Any],
+        es_bulk_refresh: bool,
+        refresh_param: Optional[str],
+        expected_refresh: bool,
+    ):
+        dataset = await DatasetFactory.create()
+        workspace_name = dataset.workspace.name
+        response = await async_client.post(
+            "/api/datasets",
+            json={"name": dataset.name, "workspace": workspace_name, "task": task.value},
+            headers=owner_auth_header,
+        )
+        assert response.status_code == 200
+
+        mocker.patch.object(settings, "es_bulk_refresh", es_bulk_refresh)
+        add_records_spy = mocker.spy(GenericElasticEngineBackend, "add_dataset_records")
+
+        params = {"workspace": workspace_name}
+        if refresh_param is not None:
+            params["refresh"] = refresh_param
+
+        response = await async_client.post(
+            f"/api/datasets/{dataset.name}/{task.value}:bulk",
+            json={"records": [record]},
+            params=params,
+            headers=owner_auth_header,
+        )
+
+        assert response.status_code == 200, response.json()
+        assert response.json()["processed"] == 1
+        add_records_spy.assert_called_once()
+        assert add_records_spy.call_args.kwargs["refresh"] == expected_refresh
+
     @pytest.mark.parametrize("role", [UserRole.owner, UserRole.admin])
     async def test_delete_records(self, async_client: "AsyncClient", owner_auth_header: dict, role: UserRole):
         dataset = await DatasetFactory.create()
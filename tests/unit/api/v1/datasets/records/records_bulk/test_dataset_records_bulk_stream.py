@@ -0,0 +1,137 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+from typing import List
+from uuid import UUID, uuid4
+
+import pytest
+from argilla_server.enums import DatasetStatus
+from argilla_server.models import Dataset, Record
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import DatasetFactory, RecordFactory, TextFieldFactory
+
+
+@pytest.mark.asyncio
+class TestDatasetRecordsBulkStream:
+    def url(self, dataset_id: UUID) -> str:
+        return f"/api/v1/datasets/{dataset_id}/records/bulk/stream"
+
+    @pytest.fixture(autouse=True)
+    def stream_session(self, mocker: MockerFixture, db: AsyncSession) -> None:
+        mocker.patch(
+            "argilla_server.apis.v1.handlers.datasets.records_bulk.AsyncSessionLocal",
+            return_value=db,
+        )
+
+    async def _create_dataset(self) -> Dataset:
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="prompt", dataset=dataset)
+
+        return dataset
+
+    def ndjson(self, items: List[dict]) -> str:
+        return "\n".join(json.dumps(item) for item in items) + "\n"
+
+    def results(self, content: str) -> List[dict]:
+        return [json.loads(line) for line in content.splitlines()]
+
+    async def test_create_dataset_records_bulk_stream(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        dataset = await self._create_dataset()
+        items = [{"fields": {"prompt": f"prompt {i}"}, "external_id": f"{i}"} for i in range(5)]
+
+        response = await async_client.post(
+            self.url(dataset.id), headers=owner_auth_header, params={"chunk_size": 2}, content=self.ndjson(items)
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert self.results(response.text) == [
+            {"chunk": 0, "items": 2, "created": 2, "updated": 0},
+            {"chunk": 1, "items": 2, "created": 2, "updated": 0},
+            {"chunk": 2, "items": 1, "created": 1, "updated": 0},
+        ]
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 5
+
+    async def test_upsert_dataset_records_bulk_stream(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        dataset = await self._create_dataset()
+        records = await RecordFactory.create_batch(2, dataset=dataset, fields={"prompt": "prompt"})
+        items = [{"id": str(record.id), "metadata": {"key": "value"}} for record in records]
+        items.append({"fields": {"prompt": "new prompt"}})
+
+        response = await async_client.put(self.url(dataset.id), headers=owner_auth_header, content=self.ndjson(items))
+
+        assert response.status_code == 200
+        assert self.results(response.text) == [{"chunk": 0, "items": 3, "created": 1, "updated": 2}]
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 3
+
+    async def test_create_dataset_records_bulk_stream_with_invalid_chunk(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        dataset = await self._create_dataset()
+        items = [
+            {"fields": {"prompt": "prompt 0"}},
+            {"fields": {"prompt": "prompt 1"}},
+            {"fields": {"unknown": "prompt 2"}},
+            {"fields": {"prompt": "prompt 3"}},
+        ]
+
+        response = await async_client.post(
+            self.url(dataset.id), headers=owner_auth_header, params={"chunk_size": 2}, content=self.ndjson(items)
+        )
+
+        assert response.status_code == 200
+        results = self.results(response.text)
+        assert results[0] == {"chunk": 0, "items": 2, "created": 2, "updated": 0}
+        assert results[1]["chunk"] == 1
+        assert "error" in results[1]
+        assert len(results) == 2
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 2
+
+    async def test_create_dataset_records_bulk_stream_with_invalid_line(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        dataset = await self._create_dataset()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"chunk_size": 1},
+            content='{"fields": {"prompt": "prompt"}}\nnot json\n',
+        )
+
+        assert response.status_code == 200
+        results = self.results(response.text)
+        assert results[0] == {"chunk": 0, "items": 1, "created": 1, "updated": 0}
+        assert results[1]["chunk"] == 1
+        assert results[1]["error"].startswith("Line 2 is not valid")
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 1
+
+    async def test_create_dataset_records_bulk_stream_with_nonexistent_dataset_id(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset_id = uuid4()
+
+        response = await async_client.post(self.url(dataset_id), headers=owner_auth_header, content="")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Dataset with id `{dataset_id}` not found"}
@@ -11,11 +11,14 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import base64
 from uuid import UUID
 
+import numpy as np
 import pytest
 from argilla_server.enums import DatasetStatus
 from argilla_server.models import Dataset, Vector
+from argilla_server.models.vectors import vector_to_list
 from httpx import AsyncClient
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -73,7 +76,7 @@ class TestDatasetRecordsBulkWithVectors:
         for record in response_json["items"]:
             assert str(vector.record_id) == record["id"]
             assert vector.vector_settings_id == vector_settings.id
-            assert record["vectors"] == {vector_settings.name: vector.value}
+            assert record["vectors"] == {vector_settings.name: vector_to_list(vector.value)}
 
     async def test_update_records_with_new_vectors_in_bulk(
         self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
@@ -104,7 +107,7 @@ class TestDatasetRecordsBulkWithVectors:
         for record in records:
             assert str(vector.record_id) == record["id"]
             assert vector.vector_settings_id == vector_settings.id
-            assert record["vectors"] == {vector_settings.name: vector.value}
+            assert record["vectors"] == {vector_settings.name: vector_to_list(vector.value)}
 
     async def test_create_records_with_vectors_in_bulk_upsert(
         self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
@@ -136,7 +139,7 @@ class TestDatasetRecordsBulkWithVectors:
         for record in response_json["items"]:
             assert str(vector.record_id) == record["id"]
             assert vector.vector_settings_id == vector_settings.id
-            assert record["vectors"] == {vector_settings.name: vector.value}
+            assert record["vectors"] == {vector_settings.name: vector_to_list(vector.value)}
 
     async def test_update_record_vectors_in_bulk(
         self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
@@ -170,7 +173,7 @@ class TestDatasetRecordsBulkWithVectors:
         for record in records:
             assert str(vector.record_id) == record["id"]
             assert vector.vector_settings_id == vector_settings.id
-            assert record["vectors"] == {vector_settings.name: vector.value}
+            assert record["vectors"] == {vector_settings.name: vector_to_list(vector.value)}
 
     async def test_update_record_with_vectors_with_new_vectors_in_bulk(
         self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
@@ -206,8 +209,8 @@ class TestDatasetRecordsBulkWithVectors:
         assert len(records) == 1
         for record in records:
             assert record["vectors"] == {
-                vector_settings.name: vector.value,
-                other_vector_settings.name: other_vector.value,
+                vector_settings.name: vector_to_list(vector.value),
+                other_vector_settings.name: vector_to_list(other_vector.value),
             }
 
     async def test_create_record_with_wrong_vector_name_in_bulk(
@@ -324,6 +327,55 @@ class TestDatasetRecordsBulkWithVectors:
             f"vector name={vector_settings.name} must have 10 elements, got 5 elements"
         }
 
+    async def test_create_record_with_base64_vectors_in_bulk(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        dataset = await self.test_dataset()
+        vector_settings = dataset.vector_settings_by_name("prompt_embeddings")
+        value = [0.1 * idx for idx in range(vector_settings.dimensions)]
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={
+                "items": [
+                    {
+                        "fields": {"prompt": "Does exercise help reduce stress?"},
+                        "vectors": {
+                            vector_settings.name: base64.b64encode(np.asarray(value, dtype="<f4").tobytes()).decode()
+                        },
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 201, response.json()
+        vector = (await db.execute(select(Vector))).scalar_one()
+        assert vector_to_list(vector.value) == pytest.approx(value)
+        assert response.json()["items"][0]["vectors"] == {vector_settings.name: vector_to_list(vector.value)}
+
+    async def test_create_record_with_invalid_base64_vector_in_bulk(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        dataset = await self.test_dataset()
+        vector_settings = dataset.vector_settings_by_name("prompt_embeddings")
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={
+                "items": [
+                    {
+                        "fields": {"prompt": "Does exercise help reduce stress?"},
+                        "vectors": {vector_settings.name: base64.b64encode(b"abc").decode()},
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 422, response.json()
+        assert (await db.execute(select(func.count(Vector.id)))).scalar_one() == 0
+
     async def _configure_dataset_fields(self, dataset: Dataset) -> None:
         await TextFieldFactory.create(name="prompt", dataset=dataset)
         await TextFieldFactory.create(name="response", dataset=dataset)
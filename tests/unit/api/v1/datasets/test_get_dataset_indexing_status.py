@@ -0,0 +1,78 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from uuid import UUID, uuid4
+
+import pytest
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.contexts import outbox
+from argilla_server.enums import UserRole
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import DatasetFactory, RecordFactory, UserFactory
+
+
+@pytest.mark.asyncio
+class TestGetDatasetIndexingStatus:
+    def url(self, dataset_id: UUID) -> str:
+        return f"/api/v1/datasets/{dataset_id}/indexing-status"
+
+    async def test_get_dataset_indexing_status(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(3, dataset=dataset)
+        await outbox.enqueue_records(db, records)
+        await db.commit()
+
+        response = await async_client.get(self.url(dataset.id), headers=owner_auth_header)
+
+        assert response.status_code == 200
+        response_json = response.json()
+        assert response_json["pending"] == 3
+        assert response_json["failed"] == 0
+        assert response_json["oldest_pending_at"] is not None
+        assert response_json["lag"] >= 0
+
+    async def test_get_dataset_indexing_status_without_pending_records(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.get(self.url(dataset.id), headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert response.json() == {"pending": 0, "failed": 0, "oldest_pending_at": None, "lag": 0.0}
+
+    @pytest.mark.parametrize("user_role", [UserRole.admin, UserRole.annotator])
+    async def test_get_dataset_indexing_status_as_restricted_user_from_different_workspace(
+        self, async_client: AsyncClient, user_role: UserRole
+    ):
+        dataset = await DatasetFactory.create()
+        user = await UserFactory.create(workspaces=[(await DatasetFactory.create()).workspace], role=user_role)
+
+        response = await async_client.get(self.url(dataset.id), headers={API_KEY_HEADER_NAME: user.api_key})
+
+        assert response.status_code == 403
+
+    async def test_get_dataset_indexing_status_with_nonexistent_dataset_id(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset_id = uuid4()
+
+        response = await async_client.get(self.url(dataset_id), headers=owner_auth_header)
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Dataset with id `{dataset_id}` not found"}
@@ -19,7 +19,7 @@ from argilla_server.constants import API_KEY_HEADER_NAME
 from argilla_server.enums import ResponseStatus, UserRole
 from httpx import AsyncClient
 
-from tests.factories import DatasetFactory, RecordFactory, ResponseFactory, UserFactory
+from tests.factories import DatasetFactory, RecordFactory, ResponseFactory, TextQuestionFactory, UserFactory
 
 
 @pytest.mark.asyncio
@@ -111,6 +111,49 @@ class TestGetDatasetProgress:
             "pending": 0,
         }
 
+    async def test_get_dataset_progress_after_records_and_responses_changes(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        await TextQuestionFactory.create(name="text", required=True, dataset=dataset)
+        record = await RecordFactory.create(dataset=dataset)
+        other_record = await RecordFactory.create(dataset=dataset)
+        await ResponseFactory.create(record=other_record, status=ResponseStatus.discarded)
+
+        # Counters are computed the first time they are requested and incrementally updated from there on
+        response = await async_client.get(self.url(dataset.id), headers=owner_auth_header)
+        assert response.json() == {"total": 2, "submitted": 0, "discarded": 1, "conflicting": 0, "pending": 1}
+
+        response = await async_client.post(
+            f"/api/v1/records/{record.id}/responses",
+            headers=owner_auth_header,
+            json={"values": {"text": {"value": "text"}}, "status": ResponseStatus.submitted},
+        )
+        assert response.status_code == 201
+        response_id = response.json()["id"]
+
+        response = await async_client.get(self.url(dataset.id), headers=owner_auth_header)
+        assert response.json() == {"total": 2, "submitted": 1, "discarded": 1, "conflicting": 0, "pending": 0}
+
+        response = await async_client.put(
+            f"/api/v1/responses/{response_id}",
+            headers=owner_auth_header,
+            json={"values": {"text": {"value": "text"}}, "status": ResponseStatus.draft},
+        )
+        assert response.status_code == 200
+
+        response = await async_client.get(self.url(dataset.id), headers=owner_auth_header)
+        assert response.json() == {"total": 2, "submitted": 0, "discarded": 1, "conflicting": 0, "pending": 1}
+
+        response = await async_client.delete(f"/api/v1/responses/{response_id}", headers=owner_auth_header)
+        assert response.status_code == 200
+
+        response = await async_client.delete(f"/api/v1/records/{other_record.id}", headers=owner_auth_header)
+        assert response.status_code == 200
+
+        response = await async_client.get(self.url(dataset.id), headers=owner_auth_header)
+        assert response.json() == {"total": 1, "submitted": 0, "discarded": 0, "conflicting": 0, "pending": 1}
+
     @pytest.mark.parametrize("user_role", [UserRole.admin, UserRole.annotator])
     async def test_get_dataset_progress_as_restricted_user(self, async_client: AsyncClient, user_role: UserRole):
         dataset = await DatasetFactory.create()
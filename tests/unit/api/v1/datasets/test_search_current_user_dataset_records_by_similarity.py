@@ -0,0 +1,229 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from uuid import UUID
+
+import pytest
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.enums import SimilarityOrder
+from argilla_server.models import User
+from argilla_server.schemas.v1.records import SEARCH_RECORDS_SIMILARITY_QUERIES_MAX_ITEMS
+from argilla_server.search_engine import (
+    AndFilter,
+    ResponseFilterScope,
+    SearchEngine,
+    SearchResponseItem,
+    SearchResponses,
+    SimilarityQuery,
+    TermsFilter,
+)
+from httpx import AsyncClient
+
+from tests.factories import (
+    AnnotatorFactory,
+    DatasetFactory,
+    LabelSelectionQuestionFactory,
+    RecordFactory,
+    TextFieldFactory,
+    VectorFactory,
+    VectorSettingsFactory,
+)
+
+
+@pytest.mark.asyncio
+class TestSearchCurrentUserDatasetRecordsBySimilarity:
+    def url(self, dataset_id: UUID) -> str:
+        return f"/api/v1/me/datasets/{dataset_id}/records/search/similarity"
+
+    async def test_search_by_similarity(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        await TextFieldFactory.create(name="input", dataset=dataset)
+        vector_settings = await VectorSettingsFactory.create(name="vector", dimensions=3, dataset=dataset)
+
+        record_a = await RecordFactory.create(dataset=dataset)
+        record_b = await RecordFactory.create(dataset=dataset)
+        record_c = await RecordFactory.create(dataset=dataset)
+        await VectorFactory.create(value=[1.0, 2.0, 3.0], vector_settings=vector_settings, record=record_a)
+
+        mock_search_engine.similarity_search_many.return_value = [
+            SearchResponses(
+                items=[
+                    SearchResponseItem(record_id=record_b.id, score=0.9),
+                    SearchResponseItem(record_id=record_c.id, score=0.8),
+                ],
+                total=2,
+            ),
+            SearchResponses(items=[SearchResponseItem(record_id=record_b.id, score=0.7)], total=1),
+        ]
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"limit": 2},
+            json={
+                "name": vector_settings.name,
+                "queries": [{"record_id": str(record_a.id)}, {"value": [3.0, 2.0, 1.0]}],
+                "order": SimilarityOrder.least_similar,
+            },
+        )
+
+        assert response.status_code == 200, response.json()
+
+        response_json = response.json()
+        assert [
+            [(item["record"]["id"], item["query_score"]) for item in result["items"]]
+            for result in response_json["items"]
+        ] == [[(str(record_b.id), 0.9), (str(record_c.id), 0.8)], [(str(record_b.id), 0.7)]]
+        assert [result["total"] for result in response_json["items"]] == [2, 1]
+
+        mock_search_engine.similarity_search_many.assert_called_once()
+        call_kwargs = mock_search_engine.similarity_search_many.call_args.kwargs
+        assert call_kwargs["dataset"] == dataset
+        assert call_kwargs["vector_settings"] == vector_settings
+        assert [query.record.id for query in call_kwargs["queries"][:1]] == [record_a.id]
+        assert call_kwargs["queries"][1] == SimilarityQuery(value=[3.0, 2.0, 1.0])
+        assert call_kwargs["query"] is None
+        assert call_kwargs["filter"] is None
+        assert call_kwargs["max_results"] == 2
+        assert call_kwargs["order"] == SimilarityOrder.least_similar
+
+    async def test_search_by_similarity_with_filter(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner: User, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        question = await LabelSelectionQuestionFactory.create(dataset=dataset)
+        vector_settings = await VectorSettingsFactory.create(name="vector", dimensions=3, dataset=dataset)
+
+        mock_search_engine.similarity_search_many.return_value = [SearchResponses(items=[], total=0)]
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={
+                "name": vector_settings.name,
+                "queries": [{"value": [1.0, 2.0, 3.0]}],
+                "filters": {
+                    "and": [
+                        {
+                            "type": "terms",
+                            "scope": {"entity": "response", "question": question.name},
+                            "values": ["value-a"],
+                        }
+                    ],
+                },
+            },
+        )
+
+        assert response.status_code == 200, response.json()
+        assert response.json() == {"items": [{"items": [], "total": 0}]}
+
+        call_kwargs = mock_search_engine.similarity_search_many.call_args.kwargs
+        assert call_kwargs["filter"] == AndFilter(
+            filters=[TermsFilter(scope=ResponseFilterScope(question=question.name, user=owner), values=["value-a"])]
+        )
+
+    async def test_search_by_similarity_with_record_from_other_dataset(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        vector_settings = await VectorSettingsFactory.create(name="vector", dimensions=3, dataset=dataset)
+        record = await RecordFactory.create()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"name": vector_settings.name, "queries": [{"record_id": str(record.id)}]},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": f"Record with id `{record.id}` not found in dataset `{dataset.id}`."}
+        mock_search_engine.similarity_search_many.assert_not_called()
+
+    async def test_search_by_similarity_with_record_without_vector(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        vector_settings = await VectorSettingsFactory.create(name="vector", dimensions=3, dataset=dataset)
+        record = await RecordFactory.create(dataset=dataset)
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"name": vector_settings.name, "queries": [{"record_id": str(record.id)}]},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {
+            "detail": f"Record `{record.id}` does not have a vector for vector settings `{vector_settings.name}`"
+        }
+        mock_search_engine.similarity_search_many.assert_not_called()
+
+    async def test_search_by_similarity_with_non_existent_vector_settings(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"name": "non-existent", "queries": [{"value": [1.0, 2.0, 3.0]}]},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": f"Vector `non-existent` not found in dataset `{dataset.id}`."}
+
+    async def test_search_by_similarity_with_invalid_query(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        vector_settings = await VectorSettingsFactory.create(name="vector", dimensions=3, dataset=dataset)
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"name": vector_settings.name, "queries": [{}]},
+        )
+
+        assert response.status_code == 422
+
+    async def test_search_by_similarity_with_too_many_queries(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        vector_settings = await VectorSettingsFactory.create(name="vector", dimensions=3, dataset=dataset)
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={
+                "name": vector_settings.name,
+                "queries": [{"value": [1.0, 2.0, 3.0]}] * (SEARCH_RECORDS_SIMILARITY_QUERIES_MAX_ITEMS + 1),
+            },
+        )
+
+        assert response.status_code == 422
+
+    async def test_search_by_similarity_as_annotator_without_workspace(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine
+    ):
+        dataset = await DatasetFactory.create()
+        vector_settings = await VectorSettingsFactory.create(name="vector", dimensions=3, dataset=dataset)
+        annotator = await AnnotatorFactory.create()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers={API_KEY_HEADER_NAME: annotator.api_key},
+            json={"name": vector_settings.name, "queries": [{"value": [1.0, 2.0, 3.0]}]},
+        )
+
+        assert response.status_code == 403
+        mock_search_engine.similarity_search_many.assert_not_called()
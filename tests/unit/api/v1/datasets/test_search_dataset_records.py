@@ -19,6 +19,7 @@ from argilla_server.apis.v1.handlers.datasets.records import LIST_DATASET_RECORD
 from argilla_server.constants import API_KEY_HEADER_NAME
 from argilla_server.enums import RecordInclude, SortOrder
 from argilla_server.search_engine import (
+    SEARCH_CURSOR_START,
     AndFilter,
     Order,
     RangeFilter,
@@ -28,6 +29,7 @@ from argilla_server.search_engine import (
     SearchResponses,
     SuggestionFilterScope,
     TermsFilter,
+    TextQuery,
 )
 from httpx import AsyncClient
 
@@ -190,6 +192,67 @@ class TestSearchDatasetRecords:
 
         assert response.status_code == 422
 
+    async def test_with_cursor(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        record = await RecordFactory.create(dataset=dataset)
+
+        mock_search_engine.search.return_value = SearchResponses(
+            items=[SearchResponseItem(record_id=record.id, score=1.0)], total=2, next_cursor="next-cursor"
+        )
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"cursor": SEARCH_CURSOR_START, "limit": 1},
+            json={"query": {"text": {"q": "text"}}},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] == "next-cursor"
+        assert [item["record"]["id"] for item in response.json()["items"]] == [str(record.id)]
+
+        mock_search_engine.search.assert_called_once_with(
+            dataset=dataset,
+            query=TextQuery(q="text"),
+            metadata_filters=[],
+            offset=0,
+            limit=1,
+            cursor=SEARCH_CURSOR_START,
+            sort_by=None,
+            user_response_status_filter=None,
+        )
+
+    async def test_with_cursor_and_offset(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"cursor": SEARCH_CURSOR_START, "offset": 10},
+            json={"query": {"text": {"q": "text"}}},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "`offset` cannot be used when paginating with `cursor`"}
+
+    async def test_with_invalid_cursor(
+        self, async_client: AsyncClient, mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        mock_search_engine.search.side_effect = ValueError("Search cursor 'invalid' is not valid")
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"cursor": "invalid"},
+            json={"query": {"text": {"q": "text"}}},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "Search cursor 'invalid' is not valid"}
+
     async def test_with_invalid_lower_limit(self, async_client: AsyncClient, owner_auth_header: dict):
         response = await async_client.post(
             self.url(uuid4()),
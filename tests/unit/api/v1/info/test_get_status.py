@@ -34,3 +34,4 @@ class TestGetStatus:
         assert response_json["version"] == __version__
         assert "search_engine" in response_json
         assert "memory" in response_json
+        assert "users_cache" in response_json
@@ -0,0 +1,71 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.models import UserRole
+from argilla_server.settings import settings
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from tests.factories import UserFactory
+
+
+@pytest.mark.asyncio
+class TestGetProfile:
+    def url(self) -> str:
+        return "/api/v1/profiler"
+
+    async def test_get_profile(self, async_client: AsyncClient, owner_auth_header: dict, mocker: MockerFixture):
+        mocker.patch.object(settings, "enable_profiler", True)
+
+        response = await async_client.get(self.url(), headers=owner_auth_header, params={"duration": 0.05})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+
+        lines = response.text.splitlines()
+        assert lines
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert stack
+            assert int(count) > 0
+
+    async def test_get_profile_with_profiler_disabled(self, async_client: AsyncClient, owner_auth_header: dict):
+        response = await async_client.get(self.url(), headers=owner_auth_header, params={"duration": 0.05})
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Profiler is not enabled"}
+
+    async def test_get_profile_with_invalid_duration(
+        self, async_client: AsyncClient, owner_auth_header: dict, mocker: MockerFixture
+    ):
+        mocker.patch.object(settings, "enable_profiler", True)
+
+        response = await async_client.get(self.url(), headers=owner_auth_header, params={"duration": 600})
+
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize("user_role", [UserRole.admin, UserRole.annotator])
+    async def test_get_profile_as_non_owner(
+        self, async_client: AsyncClient, mocker: MockerFixture, user_role: UserRole
+    ):
+        mocker.patch.object(settings, "enable_profiler", True)
+        user = await UserFactory.create(role=user_role)
+
+        response = await async_client.get(
+            self.url(), headers={API_KEY_HEADER_NAME: user.api_key}, params={"duration": 0.05}
+        )
+
+        assert response.status_code == 403
@@ -13,7 +13,6 @@
 #  limitations under the License.
 import os
 from datetime import datetime
-from unittest.mock import call
 from uuid import UUID, uuid4
 
 import pytest
@@ -150,11 +149,7 @@ class TestCreateCurrentUserResponsesBulk:
 
         response_to_create = (await db.execute(select(Response).filter_by(id=response_to_create_id))).scalar_one()
         await db.refresh(response_to_update)
-        expected_calls = [
-            call(response_to_create),
-            call(response_to_update),
-        ]
-        mock_search_engine.update_record_response.assert_has_calls(expected_calls)
+        mock_search_engine.update_records_responses.assert_called_once_with([response_to_create, response_to_update])
 
     async def test_response_to_create(
         self,
@@ -207,7 +202,7 @@ class TestCreateCurrentUserResponsesBulk:
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 1
 
         response = (await db.execute(select(Response).filter_by(id=response_id))).scalar_one()
-        mock_search_engine.update_record_response.assert_called_once_with(response)
+        mock_search_engine.update_records_responses.assert_called_once_with([response])
 
     async def test_response_to_create_with_non_existent_record(
         self, async_client: AsyncClient, db: AsyncSession, mock_search_engine: SearchEngine, owner_auth_header: dict
@@ -240,7 +235,7 @@ class TestCreateCurrentUserResponsesBulk:
         }
 
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 0
-        assert not mock_search_engine.update_record_response.called
+        assert not mock_search_engine.update_records_responses.called
 
     async def test_response_to_update(
         self,
@@ -298,7 +293,7 @@ class TestCreateCurrentUserResponsesBulk:
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 1
 
         await db.refresh(response)
-        mock_search_engine.update_record_response.assert_called_once_with(response)
+        mock_search_engine.update_records_responses.assert_called_once_with([response])
 
     async def test_invalid_response(
         self, async_client: AsyncClient, db: AsyncSession, mock_search_engine: SearchEngine, owner_auth_header: dict
@@ -333,7 +328,7 @@ class TestCreateCurrentUserResponsesBulk:
         }
 
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 0
-        assert not mock_search_engine.update_record_response.called
+        assert not mock_search_engine.update_records_responses.called
 
     async def test_unauthorized_response(
         self, async_client: AsyncClient, mock_search_engine: SearchEngine, db: AsyncSession
@@ -368,7 +363,50 @@ class TestCreateCurrentUserResponsesBulk:
         }
 
         assert (await db.execute(select(func.count(Response.id)))).scalar() == 0
-        assert not mock_search_engine.update_record_response.called
+        assert not mock_search_engine.update_records_responses.called
+
+    async def test_multiple_responses_for_the_same_record(
+        self,
+        async_client: AsyncClient,
+        db: AsyncSession,
+        mock_search_engine: SearchEngine,
+        owner: User,
+        owner_auth_header: dict,
+    ):
+        dataset = await DatasetFactory.create()
+        await RatingQuestionFactory.create(name="prompt-quality", required=True, dataset=dataset)
+
+        record = await RecordFactory.create(dataset=dataset)
+
+        resp = await async_client.post(
+            self.url(),
+            headers=owner_auth_header,
+            json={
+                "items": [
+                    {
+                        "values": {"prompt-quality": {"value": 1}},
+                        "status": ResponseStatus.draft,
+                        "record_id": str(record.id),
+                    },
+                    {
+                        "values": {"prompt-quality": {"value": 5}},
+                        "status": ResponseStatus.submitted,
+                        "record_id": str(record.id),
+                    },
+                ],
+            },
+        )
+
+        assert resp.status_code == 200
+
+        resp_json = resp.json()
+        assert resp_json["items"][0] == resp_json["items"][1]
+        assert resp_json["items"][1]["item"]["values"] == {"prompt-quality": {"value": 5}}
+        assert resp_json["items"][1]["item"]["status"] == ResponseStatus.submitted
+
+        response = (await db.execute(select(Response).filter_by(record_id=record.id, user_id=owner.id))).scalar_one()
+        assert response.status == ResponseStatus.submitted
+        mock_search_engine.update_records_responses.assert_called_once_with([response])
 
     async def test_no_responses(self, async_client: AsyncClient, owner_auth_header: dict):
         resp = await async_client.post(
@@ -25,6 +25,7 @@ from argilla_server.enums import (
     DatasetStatus,
     OptionsOrder,
     RecordInclude,
+    RecordIndexProperty,
     ResponseStatusFilter,
     SimilarityOrder,
 )
@@ -42,6 +43,7 @@ from argilla_server.models import (
     Vector,
     VectorSettings,
 )
+from argilla_server.models.vectors import vector_to_list
 from argilla_server.schemas.v1.datasets import (
     DATASET_GUIDELINES_MAX_LENGTH,
     DATASET_NAME_MAX_LENGTH,
@@ -2288,17 +2290,17 @@ class TestSuiteDatasets:
         assert (
             vector_a.record_id == record_a.id
             and vector_a.vector_settings_id == vector_settings_a.id
-            and vector_a.value == [5, 6, 7, 8, 9]
+            and vector_to_list(vector_a.value) == [5, 6, 7, 8, 9]
         )
         assert (
             vector_b.record_id == record_b.id
             and vector_b.vector_settings_id == vector_settings_a.id
-            and vector_b.value == [100, 101, 102, 103, 104]
+            and vector_to_list(vector_b.value) == [100, 101, 102, 103, 104]
         )
         assert (
             vector_c.record_id == record_c.id
             and vector_c.vector_settings_id == vector_settings_b.id
-            and vector_c.value == [200, 201, 202, 203, 204]
+            and vector_to_list(vector_c.value) == [200, 201, 202, 203, 204]
         )
 
     async def test_create_dataset_records_with_invalid_vector(
@@ -2960,7 +2962,9 @@ class TestSuiteDatasets:
         }
 
         # it should be called only with the first three records (metadata was updated for them)
-        mock_search_engine.index_records.assert_called_once_with(dataset, records[:3])
+        mock_search_engine.partial_update_records.assert_called_once_with(
+            dataset, records[:3], {RecordIndexProperty.metadata}
+        )
 
     async def test_update_dataset_records_with_suggestions(
         self, async_client: "AsyncClient", mock_search_engine: "SearchEngine", owner_auth_header: dict
@@ -3068,6 +3072,11 @@ class TestSuiteDatasets:
         assert records[3].suggestions[2].value == "suggestion updated 3 3"
 
         mock_search_engine.index_records.assert_not_called()
+        mock_search_engine.partial_update_records.assert_called_once_with(
+            dataset, [records[0], records[1], records[3]], {RecordIndexProperty.suggestions}
+        )
+        indexed_records = mock_search_engine.partial_update_records.call_args.args[1]
+        assert [suggestion.value for suggestion in indexed_records[1].suggestions] == ["suggestion updated 1 1"]
 
     async def test_update_dataset_records_with_empty_list_of_suggestions(
         self, async_client: "AsyncClient", owner_auth_header: dict
@@ -3150,23 +3159,25 @@ class TestSuiteDatasets:
 
         # Record 0
         await records[0].awaitable_attrs.vectors
-        assert records[0].vectors[0].value == [0.1, 0.1, 0.1, 0.1, 0.1]
-        assert records[0].vectors[1].value == [1.1, 1.1, 1.1, 1.1, 1.1]
-        assert records[0].vectors[2].value == [2.1, 2.1, 2.1, 2.1, 2.1]
+        assert vector_to_list(records[0].vectors[0].value) == pytest.approx([0.1, 0.1, 0.1, 0.1, 0.1])
+        assert vector_to_list(records[0].vectors[1].value) == pytest.approx([1.1, 1.1, 1.1, 1.1, 1.1])
+        assert vector_to_list(records[0].vectors[2].value) == pytest.approx([2.1, 2.1, 2.1, 2.1, 2.1])
 
         # Record 1
         await records[1].awaitable_attrs.vectors
-        assert records[1].vectors[0].value == [3.1, 3.1, 3.1, 3.1, 3.1]
-        assert records[1].vectors[1].value == [4, 4, 4, 4, 4]
-        assert records[1].vectors[2].value == [5, 5, 5, 5, 5]
+        assert vector_to_list(records[1].vectors[0].value) == pytest.approx([3.1, 3.1, 3.1, 3.1, 3.1])
+        assert vector_to_list(records[1].vectors[1].value) == pytest.approx([4, 4, 4, 4, 4])
+        assert vector_to_list(records[1].vectors[2].value) == pytest.approx([5, 5, 5, 5, 5])
 
         # Record 2
         await records[2].awaitable_attrs.vectors
-        assert records[2].vectors[0].value == [4.1, 4.1, 4.1, 4.1, 4.1]
-        assert records[2].vectors[1].value == [5.1, 5.1, 5.1, 5.1, 5.1]
-        assert records[2].vectors[2].value == [6.1, 6.1, 6.1, 6.1, 6.1]
+        assert vector_to_list(records[2].vectors[0].value) == pytest.approx([4.1, 4.1, 4.1, 4.1, 4.1])
+        assert vector_to_list(records[2].vectors[1].value) == pytest.approx([5.1, 5.1, 5.1, 5.1, 5.1])
+        assert vector_to_list(records[2].vectors[2].value) == pytest.approx([6.1, 6.1, 6.1, 6.1, 6.1])
 
-        mock_search_engine.index_records.assert_called_once_with(dataset, records[:3])
+        mock_search_engine.partial_update_records.assert_called_once_with(
+            dataset, records[:3], {RecordIndexProperty.vectors}
+        )
 
     async def test_update_dataset_records_with_invalid_metadata(
         self, async_client: "AsyncClient", owner_auth_header: dict
@@ -4319,7 +4330,9 @@ class TestSuiteDatasets:
             total=2,
         )
 
-        query_json = {"query": {"vector": {"name": vector_settings.name, "value": selected_vector.value}}}
+        query_json = {
+            "query": {"vector": {"name": vector_settings.name, "value": vector_to_list(selected_vector.value)}}
+        }
         response = await async_client.post(
             f"/api/v1/me/datasets/{dataset.id}/records/search",
             headers=owner_auth_header,
@@ -4337,7 +4350,7 @@ class TestSuiteDatasets:
             dataset=dataset,
             vector_settings=vector_settings,
             record=None,
-            value=selected_vector.value,
+            value=vector_to_list(selected_vector.value),
             query=None,
             order=SimilarityOrder.most_similar,
             max_results=10,
@@ -4366,7 +4379,7 @@ class TestSuiteDatasets:
         query_json = {
             "query": {
                 "text": {"q": "Test query"},
-                "vector": {"name": vector_settings.name, "value": selected_vector.value},
+                "vector": {"name": vector_settings.name, "value": vector_to_list(selected_vector.value)},
             }
         }
         response = await async_client.post(
@@ -4386,7 +4399,7 @@ class TestSuiteDatasets:
             dataset=dataset,
             vector_settings=vector_settings,
             record=None,
-            value=selected_vector.value,
+            value=vector_to_list(selected_vector.value),
             query=TextQuery(q="Test query"),
             order=SimilarityOrder.most_similar,
             max_results=10,
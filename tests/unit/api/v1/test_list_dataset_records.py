@@ -12,7 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List, Optional, Tuple, Type, Union
+from datetime import timedelta
+from typing import TYPE_CHECKING, List, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 import pytest
@@ -30,6 +31,7 @@ from argilla_server.search_engine import (
     SortBy,
     TermsMetadataFilter,
 )
+from argilla_server.settings import settings
 from httpx import AsyncClient
 
 from tests.factories import (
@@ -50,6 +52,9 @@ from tests.factories import (
     WorkspaceFactory,
 )
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 @pytest.mark.asyncio
 class TestSuiteListDatasetRecords:
@@ -632,6 +637,154 @@ class TestSuiteListDatasetRecords:
             sort_by=expected_sorts_by,
         )
 
+    async def test_list_dataset_records_with_cursor(
+        self, async_client: "AsyncClient", mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+
+        mock_search_engine.search.return_value = SearchResponses(
+            total=2, items=[SearchResponseItem(record_id=records[1].id, score=1.0)], next_cursor=None
+        )
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/records",
+            params={"cursor": "previous-cursor", "limit": 1},
+            headers=owner_auth_header,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] is None
+        assert [item["id"] for item in response.json()["items"]] == [str(records[1].id)]
+        assert mock_search_engine.search.call_args.kwargs["cursor"] == "previous-cursor"
+
+    async def test_list_dataset_records_without_cursor(
+        self, async_client: "AsyncClient", mock_search_engine: SearchEngine, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+
+        mock_search_engine.search.return_value = SearchResponses(total=0, items=[])
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}/records", headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert "next_cursor" not in response.json()
+        assert "cursor" not in mock_search_engine.search.call_args.kwargs
+
+    async def test_list_current_user_dataset_records_with_hydrated_records(
+        self,
+        async_client: "AsyncClient",
+        mock_search_engine: SearchEngine,
+        mocker: "MockerFixture",
+        owner: User,
+        owner_auth_header: dict,
+    ):
+        mocker.patch.object(settings, "search_engine_hydrate_records", True)
+
+        dataset = await DatasetFactory.create()
+        record_a, record_b = await RecordFactory.create_batch(2, dataset=dataset)
+        response_b = await ResponseFactory.create(record=record_b, user=owner)
+
+        other_user_id, hit_response = str(uuid4()), {
+            "id": str(uuid4()),
+            "values": None,
+            "status": "discarded",
+            "record_id": str(record_a.id),
+            "user_id": str(owner.id),
+            "inserted_at": record_a.inserted_at.isoformat(),
+            "updated_at": record_a.updated_at.isoformat(),
+        }
+        hit_record = {
+            "id": str(record_a.id),
+            "fields": {"text": "stored text"},
+            "metadata": None,
+            "external_id": None,
+            "dataset_id": str(dataset.id),
+            "inserted_at": record_a.inserted_at.isoformat(),
+            "updated_at": record_a.updated_at.isoformat(),
+            "responses": {str(owner.id): hit_response, other_user_id: {**hit_response, "user_id": other_user_id}},
+            "suggestions": {},
+        }
+
+        mock_search_engine.search.return_value = SearchResponses(
+            total=2,
+            items=[
+                SearchResponseItem(record_id=record_a.id, score=1.0, record=hit_record),
+                SearchResponseItem(record_id=record_b.id, score=1.0),
+            ],
+        )
+
+        response = await async_client.get(
+            f"/api/v1/me/datasets/{dataset.id}/records",
+            params={"include": RecordInclude.responses.value},
+            headers=owner_auth_header,
+        )
+
+        assert response.status_code == 200
+
+        item_a, item_b = response.json()["items"]
+        assert item_a["fields"] == {"text": "stored text"}
+        assert item_a["responses"] == [hit_response]
+        assert item_b["id"] == str(record_b.id)
+        assert [response["id"] for response in item_b["responses"]] == [str(response_b.id)]
+        assert mock_search_engine.search.call_args.kwargs["with_records"] is True
+
+    async def test_list_dataset_records_with_outdated_hydrated_records(
+        self,
+        async_client: "AsyncClient",
+        mock_search_engine: SearchEngine,
+        mocker: "MockerFixture",
+        owner_auth_header: dict,
+    ):
+        mocker.patch.object(settings, "search_engine_hydrate_records", True)
+
+        dataset = await DatasetFactory.create()
+        record = await RecordFactory.create(dataset=dataset, fields={"text": "database text"})
+        hit_record = {
+            "id": str(record.id),
+            "fields": {"text": "stored text"},
+            "metadata": None,
+            "external_id": None,
+            "dataset_id": str(dataset.id),
+            "inserted_at": record.inserted_at.isoformat(),
+            "updated_at": (record.updated_at - timedelta(seconds=1)).isoformat(),
+        }
+
+        mock_search_engine.search.return_value = SearchResponses(
+            total=1, items=[SearchResponseItem(record_id=record.id, score=1.0, record=hit_record)]
+        )
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}/records", headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert [item["fields"] for item in response.json()["items"]] == [{"text": "database text"}]
+
+    async def test_list_dataset_records_with_hydrated_records_including_vectors(
+        self,
+        async_client: "AsyncClient",
+        mock_search_engine: SearchEngine,
+        mocker: "MockerFixture",
+        owner_auth_header: dict,
+    ):
+        mocker.patch.object(settings, "search_engine_hydrate_records", True)
+
+        dataset = await DatasetFactory.create()
+        record = await RecordFactory.create(dataset=dataset)
+
+        mock_search_engine.search.return_value = SearchResponses(
+            total=1, items=[SearchResponseItem(record_id=record.id, score=1.0)]
+        )
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/records",
+            params={"include": RecordInclude.vectors.value},
+            headers=owner_auth_header,
+        )
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [str(record.id)]
+        assert "with_records" not in mock_search_engine.search.call_args.kwargs
+
     async def test_list_dataset_records_with_sort_by_with_wrong_sort_order_value(
         self, async_client: "AsyncClient", owner_auth_header: dict
     ):
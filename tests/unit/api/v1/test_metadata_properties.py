@@ -48,7 +48,7 @@ class TestSuiteMetadataProperties:
             (
                 TermsMetadataPropertyFactory,
                 TermsMetadataMetrics(total=10, values=[TermsMetadataMetrics.TermCount(term="term", count=10)]),
-                {"type": "terms", "total": 10, "values": [{"term": "term", "count": 10}]},
+                {"type": "terms", "total": 10, "values": [{"term": "term", "count": 10}], "next_cursor": None},
             ),
             (
                 IntegerMetadataPropertyFactory,
@@ -87,6 +87,60 @@ class TestSuiteMetadataProperties:
         assert response.status_code == 200
         assert response.json() == expected_json
 
+    async def test_get_metadata_property_metrics_with_size_and_cursor(
+        self, async_client: "AsyncClient", mock_search_engine: "SearchEngine", owner_auth_header: dict
+    ):
+        metadata_property = await TermsMetadataPropertyFactory.create()
+
+        mock_search_engine.compute_metrics_for.return_value = TermsMetadataMetrics(
+            total=10, values=[TermsMetadataMetrics.TermCount(term="b", count=3)], next_cursor="next-cursor"
+        )
+
+        response = await async_client.get(
+            f"/api/v1/metadata-properties/{metadata_property.id}/metrics",
+            headers=owner_auth_header,
+            params={"size": 1, "cursor": "cursor"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "type": "terms",
+            "total": 10,
+            "values": [{"term": "b", "count": 3}],
+            "next_cursor": "next-cursor",
+        }
+        mock_search_engine.compute_metrics_for.assert_called_once_with(metadata_property, size=1, cursor="cursor")
+
+    @pytest.mark.parametrize("size", [0, 1001])
+    async def test_get_metadata_property_metrics_with_invalid_size(
+        self, async_client: "AsyncClient", owner_auth_header: dict, size: int
+    ):
+        metadata_property = await TermsMetadataPropertyFactory.create()
+
+        response = await async_client.get(
+            f"/api/v1/metadata-properties/{metadata_property.id}/metrics",
+            headers=owner_auth_header,
+            params={"size": size},
+        )
+
+        assert response.status_code == 422
+
+    async def test_get_metadata_property_metrics_with_invalid_cursor(
+        self, async_client: "AsyncClient", mock_search_engine: "SearchEngine", owner_auth_header: dict
+    ):
+        metadata_property = await TermsMetadataPropertyFactory.create()
+
+        mock_search_engine.compute_metrics_for.side_effect = ValueError("Metrics cursor 'invalid' is not valid")
+
+        response = await async_client.get(
+            f"/api/v1/metadata-properties/{metadata_property.id}/metrics",
+            headers=owner_auth_header,
+            params={"size": 1, "cursor": "invalid"},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "Metrics cursor 'invalid' is not valid"}
+
     async def test_get_metadata_property_metrics_without_authentication(self, async_client: "AsyncClient"):
         metadata_property = await TermsMetadataPropertyFactory.create()
 
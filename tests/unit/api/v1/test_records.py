@@ -19,7 +19,7 @@ from uuid import UUID, uuid4
 
 import pytest
 from argilla_server.constants import API_KEY_HEADER_NAME
-from argilla_server.enums import ResponseStatus
+from argilla_server.enums import RecordIndexProperty, ResponseStatus
 from argilla_server.models import Dataset, Record, Response, Suggestion, User, UserRole
 from argilla_server.search_engine import SearchEngine, SearchResponseItem, SearchResponses
 from sqlalchemy import func, select
@@ -222,7 +222,11 @@ class TestSuiteRecords:
             "inserted_at": record.inserted_at.isoformat(),
             "updated_at": record.updated_at.isoformat(),
         }
-        mock_search_engine.index_records.assert_called_once_with(dataset, [record])
+        mock_search_engine.partial_update_records.assert_called_once_with(
+            dataset,
+            [record],
+            {RecordIndexProperty.metadata, RecordIndexProperty.suggestions, RecordIndexProperty.vectors},
+        )
 
     async def test_update_record_with_null_metadata(
         self, async_client: "AsyncClient", mock_search_engine: SearchEngine, owner_auth_header: dict
@@ -255,7 +259,9 @@ class TestSuiteRecords:
             "inserted_at": record.inserted_at.isoformat(),
             "updated_at": record.updated_at.isoformat(),
         }
-        mock_search_engine.index_records.assert_called_once_with(dataset, [record])
+        mock_search_engine.partial_update_records.assert_called_once_with(
+            dataset, [record], {RecordIndexProperty.metadata}
+        )
 
     async def test_update_record_with_no_metadata(
         self, async_client: "AsyncClient", mock_search_engine: SearchEngine, owner_auth_header: dict
@@ -282,7 +288,7 @@ class TestSuiteRecords:
             "inserted_at": record.inserted_at.isoformat(),
             "updated_at": record.updated_at.isoformat(),
         }
-        mock_search_engine.index_records.assert_not_called()
+        mock_search_engine.partial_update_records.assert_not_called()
 
     async def test_update_record_with_list_terms_metadata(
         self, async_client: "AsyncClient", mock_search_engine: SearchEngine, owner_auth_header: dict
@@ -316,7 +322,9 @@ class TestSuiteRecords:
             "inserted_at": record.inserted_at.isoformat(),
             "updated_at": record.updated_at.isoformat(),
         }
-        mock_search_engine.index_records.assert_called_once_with(dataset, [record])
+        mock_search_engine.partial_update_records.assert_called_once_with(
+            dataset, [record], {RecordIndexProperty.metadata}
+        )
 
     async def test_update_record_with_no_suggestions(
         self, async_client: "AsyncClient", db: "AsyncSession", mock_search_engine: SearchEngine, owner_auth_header: dict
@@ -344,6 +352,9 @@ class TestSuiteRecords:
             "updated_at": record.updated_at.isoformat(),
         }
         assert (await db.execute(select(Suggestion).where(Suggestion.id == suggestion.id))).scalar_one_or_none() is None
+        mock_search_engine.partial_update_records.assert_called_once_with(
+            record.dataset, [record], {RecordIndexProperty.suggestions}
+        )
 
     @pytest.mark.parametrize(
         ["MetadataPropertyFactoryClass", "create_value", "update_value", "expected_error"],
@@ -0,0 +1,79 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from uuid import uuid4
+
+from argilla_server.enums import ResponseStatus
+from argilla_server.models import Dataset, DatasetCounters, DatasetUserCounters, Record, Response
+from sqlalchemy.orm import Session
+from typer import Typer
+from typer.testing import CliRunner
+
+from tests.factories import UserSyncFactory, WorkspaceSyncFactory
+
+
+class TestCliDatabaseRebuildCounters:
+    def _create_dataset(self, sync_db: Session) -> Dataset:
+        user = UserSyncFactory.create()
+        other_user = UserSyncFactory.create()
+        dataset = Dataset(name="dataset", workspace=WorkspaceSyncFactory.create())
+
+        dataset.records = [
+            Record(fields={}, responses=[Response(status=ResponseStatus.submitted, user=user)]),
+            Record(fields={}, responses=[Response(status=ResponseStatus.discarded, user=user)]),
+            Record(
+                fields={},
+                responses=[
+                    Response(status=ResponseStatus.submitted, user=user),
+                    Response(status=ResponseStatus.discarded, user=other_user),
+                ],
+            ),
+            Record(fields={}, responses=[Response(status=ResponseStatus.draft, user=other_user)]),
+            Record(fields={}),
+        ]
+
+        sync_db.add(dataset)
+        sync_db.flush()
+
+        return dataset
+
+    def test_rebuild_counters(self, sync_db: Session, cli_runner: CliRunner, cli: Typer):
+        dataset = self._create_dataset(sync_db)
+
+        result = cli_runner.invoke(cli, "database rebuild-counters")
+
+        assert result.exit_code == 0, result.output
+
+        dataset_counters = sync_db.query(DatasetCounters).filter_by(dataset_id=dataset.id).one()
+        assert dataset_counters.records == 5
+        assert dataset_counters.submitted == 1
+        assert dataset_counters.discarded == 1
+        assert dataset_counters.conflicting == 1
+        assert dataset_counters.pending == 2
+
+        users_counters = sync_db.query(DatasetUserCounters).filter_by(dataset_id=dataset.id).all()
+        assert sorted((c.submitted, c.discarded, c.draft) for c in users_counters) == [(0, 1, 1), (2, 1, 0)]
+
+    def test_rebuild_counters_with_dataset_id(self, sync_db: Session, cli_runner: CliRunner, cli: Typer):
+        dataset = self._create_dataset(sync_db)
+
+        result = cli_runner.invoke(cli, f"database rebuild-counters --feedback-dataset-id {dataset.id}")
+
+        assert result.exit_code == 0, result.output
+        assert sync_db.query(DatasetCounters).filter_by(dataset_id=dataset.id).one().records == 5
+
+    def test_rebuild_counters_with_nonexistent_dataset_id(self, cli_runner: CliRunner, cli: Typer):
+        result = cli_runner.invoke(cli, f"database rebuild-counters --feedback-dataset-id {uuid4()}")
+
+        assert result.exit_code == 1
@@ -12,11 +12,38 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
+import pytest
+from argilla_server.cli.search_engine.reindex import CATCH_UP_MARGIN
+from argilla_server.models import Dataset, Record
+from argilla_server.search_engine import SearchEngine
+from pytest_mock import MockerFixture
+from sqlalchemy.orm import Session
 from typer import Typer
 from typer.testing import CliRunner
 
+from tests.factories import WorkspaceSyncFactory
+
+
+@pytest.fixture
+def search_engine_mock(mocker: MockerFixture) -> AsyncMock:
+    search_engine = AsyncMock(SearchEngine)
+    search_engine.create_reindex_index.return_value = "rg.reindex"
+    search_engine.list_reindex_records_ids.return_value = []
+
+    async def get_search_engine():
+        yield search_engine
+
+    mocker.patch("argilla_server.cli.search_engine.reindex.get_search_engine", get_search_engine)
+
+    return search_engine
+
 
 class TestCliServerSearchEngineReindex:
     # TODO: This test should create multiple datasets and records so they are reindexed.
@@ -32,3 +59,235 @@ class TestCliServerSearchEngineReindex:
         result = cli_runner.invoke(cli, f"search-engine reindex --feedback-dataset-id {uuid4()}")
 
         assert result.exit_code == 1
+
+    def test_reindex_with_batch_size(
+        self, sync_db: Session, cli_runner: CliRunner, cli: Typer, search_engine_mock: AsyncMock
+    ):
+        dataset = self._create_dataset(sync_db, records=5)
+
+        result = cli_runner.invoke(cli, "search-engine reindex --batch-size 2 --concurrency 2")
+
+        assert result.exit_code == 0, result.output
+        assert "Reindexed 5 records from 1 feedback datasets" in result.output
+
+        search_engine_mock.create_reindex_index.assert_called_once()
+        search_engine_mock.delete_index.assert_not_called()
+        # Records are indexed by their partitions, and once more by the catch-up pass given that they were all
+        # updated within the catch-up margin
+        assert search_engine_mock.reindex_records.call_count == 6
+        indexed_records_ids = [
+            record.id for call in search_engine_mock.reindex_records.call_args_list[:3] for record in call.args[1]
+        ]
+        assert sorted(indexed_records_ids) == sorted(record.id for record in dataset.records)
+        caught_up_records_ids = [
+            record.id for call in search_engine_mock.reindex_records.call_args_list[3:] for record in call.args[1]
+        ]
+        assert caught_up_records_ids == sorted(record.id for record in dataset.records)
+        assert {call.args[2] for call in search_engine_mock.reindex_records.call_args_list} == {"rg.reindex"}
+        search_engine_mock.swap_reindex_index.assert_called_once()
+        assert search_engine_mock.swap_reindex_index.call_args.args[1] == "rg.reindex"
+
+    def test_reindex_with_checkpoint_file(
+        self, sync_db: Session, cli_runner: CliRunner, cli: Typer, search_engine_mock: AsyncMock, tmp_path: Path
+    ):
+        dataset = self._create_dataset(sync_db, records=3)
+        checkpoint_file = tmp_path / "checkpoint.json"
+
+        result = cli_runner.invoke(cli, f"search-engine reindex --batch-size 2 --checkpoint-file {checkpoint_file}")
+
+        assert result.exit_code == 0, result.output
+        events = [json.loads(line) for line in checkpoint_file.read_text().splitlines()]
+        assert [event["event"] for event in events] == [
+            "dataset_started",
+            "partition_done",
+            "partition_done",
+            "dataset_done",
+        ]
+        assert {event["dataset_id"] for event in events} == {str(dataset.id)}
+        assert events[0]["batch_size"] == 2
+
+        search_engine_mock.reset_mock()
+        result = cli_runner.invoke(cli, f"search-engine reindex --batch-size 5 --checkpoint-file {checkpoint_file}")
+
+        assert result.exit_code == 0, result.output
+        search_engine_mock.create_reindex_index.assert_not_called()
+        search_engine_mock.reindex_records.assert_not_called()
+        search_engine_mock.swap_reindex_index.assert_not_called()
+
+    def test_reindex_resumes_from_checkpoint_file(
+        self, sync_db: Session, cli_runner: CliRunner, cli: Typer, search_engine_mock: AsyncMock, tmp_path: Path
+    ):
+        dataset = self._create_dataset(sync_db, records=4)
+        records_ids = sorted(record.id for record in dataset.records)
+
+        checkpoint_file = tmp_path / "checkpoint.json"
+        self._write_checkpoint(
+            checkpoint_file,
+            dataset,
+            started_at=datetime.utcnow().isoformat(),
+            partitions=[str(records_ids[1])],
+        )
+
+        result = cli_runner.invoke(cli, f"search-engine reindex --batch-size 2 --checkpoint-file {checkpoint_file}")
+
+        assert result.exit_code == 0, result.output
+        assert "Reindexed 2 records from 1 feedback datasets" in result.output
+
+        search_engine_mock.create_reindex_index.assert_not_called()
+        search_engine_mock.reindex_records.assert_called_once()
+        assert [record.id for record in search_engine_mock.reindex_records.call_args.args[1]] == records_ids[2:]
+        assert search_engine_mock.reindex_records.call_args.args[2] == "rg.resumed"
+        search_engine_mock.swap_reindex_index.assert_called_once()
+
+    def test_reindex_with_records_updated_during_reindex(
+        self, sync_db: Session, cli_runner: CliRunner, cli: Typer, search_engine_mock: AsyncMock, tmp_path: Path
+    ):
+        dataset = self._create_dataset(sync_db, records=4)
+        records_ids = sorted(record.id for record in dataset.records)
+
+        checkpoint_file = tmp_path / "checkpoint.json"
+        self._write_checkpoint(
+            checkpoint_file,
+            dataset,
+            started_at=(datetime.utcnow() - timedelta(minutes=1)).isoformat(),
+            partitions=[str(records_ids[1]), str(records_ids[3])],
+        )
+
+        result = cli_runner.invoke(cli, f"search-engine reindex --batch-size 2 --checkpoint-file {checkpoint_file}")
+
+        assert result.exit_code == 0, result.output
+        indexed_records_ids = [
+            record.id for call in search_engine_mock.reindex_records.call_args_list for record in call.args[1]
+        ]
+        assert indexed_records_ids == records_ids
+        search_engine_mock.swap_reindex_index.assert_called_once()
+
+    def test_reindex_with_records_updated_during_catch_up(
+        self, sync_db: Session, cli_runner: CliRunner, cli: Typer, search_engine_mock: AsyncMock, tmp_path: Path
+    ):
+        dataset = self._create_dataset(sync_db, records=4)
+        records = sorted(dataset.records, key=lambda record: record.id)
+        records_ids = [record.id for record in records]
+
+        checkpoint_file = tmp_path / "checkpoint.json"
+        self._write_checkpoint(
+            checkpoint_file,
+            dataset,
+            started_at=(datetime.utcnow() - timedelta(minutes=1)).isoformat(),
+            partitions=[str(records_ids[1]), str(records_ids[3])],
+        )
+
+        async def reindex_records(dataset: Dataset, records_to_reindex: List[Record], index_name: str) -> None:
+            records[2].updated_at = datetime.utcnow()
+            sync_db.flush()
+
+        search_engine_mock.reindex_records.side_effect = reindex_records
+
+        result = cli_runner.invoke(cli, f"search-engine reindex --batch-size 2 --checkpoint-file {checkpoint_file}")
+
+        # Writes done during the catch-up are applied to the new index by the search engine, so a single pass is done
+        assert result.exit_code == 0, result.output
+        indexed_records_ids = [
+            record.id for call in search_engine_mock.reindex_records.call_args_list for record in call.args[1]
+        ]
+        assert indexed_records_ids == records_ids
+        search_engine_mock.swap_reindex_index.assert_called_once()
+
+    def test_reindex_with_records_deleted_during_reindex(
+        self, sync_db: Session, cli_runner: CliRunner, cli: Typer, search_engine_mock: AsyncMock
+    ):
+        dataset = self._create_dataset(sync_db, records=3)
+        records_ids = sorted(record.id for record in dataset.records)
+        deleted_records_ids = sorted([uuid4(), uuid4()])
+
+        search_engine_mock.list_reindex_records_ids.side_effect = [
+            [records_ids[0], deleted_records_ids[0]],
+            [records_ids[1], records_ids[2], deleted_records_ids[1]],
+            [],
+        ]
+
+        result = cli_runner.invoke(cli, "search-engine reindex --batch-size 3")
+
+        assert result.exit_code == 0, result.output
+        assert [call.kwargs["after"] for call in search_engine_mock.list_reindex_records_ids.call_args_list] == [
+            None,
+            deleted_records_ids[0],
+            deleted_records_ids[1],
+        ]
+        assert [call.args[1] for call in search_engine_mock.delete_reindex_records.call_args_list] == [
+            [deleted_records_ids[0]],
+            [deleted_records_ids[1]],
+        ]
+        search_engine_mock.swap_reindex_index.assert_called_once()
+
+    def test_reindex_started_at_is_taken_from_the_database(
+        self, sync_db: Session, cli_runner: CliRunner, cli: Typer, search_engine_mock: AsyncMock, tmp_path: Path
+    ):
+        dataset = self._create_dataset(sync_db, records=2)
+        last_updated_at = datetime(2024, 1, 1)
+        for record in dataset.records:
+            record.updated_at = last_updated_at
+        sync_db.flush()
+
+        checkpoint_file = tmp_path / "checkpoint.json"
+        result = cli_runner.invoke(cli, f"search-engine reindex --checkpoint-file {checkpoint_file}")
+
+        assert result.exit_code == 0, result.output
+        started_event = json.loads(checkpoint_file.read_text().splitlines()[0])
+        assert datetime.fromisoformat(started_event["started_at"]) == last_updated_at - CATCH_UP_MARGIN
+
+    def test_reindex_resuming_from_checkpoint_file_with_other_batch_size(
+        self, sync_db: Session, cli_runner: CliRunner, cli: Typer, search_engine_mock: AsyncMock, tmp_path: Path
+    ):
+        dataset = self._create_dataset(sync_db, records=4)
+        records_ids = sorted(record.id for record in dataset.records)
+
+        checkpoint_file = tmp_path / "checkpoint.json"
+        self._write_checkpoint(
+            checkpoint_file, dataset, started_at=datetime.utcnow().isoformat(), partitions=[str(records_ids[1])]
+        )
+
+        result = cli_runner.invoke(cli, f"search-engine reindex --batch-size 3 --checkpoint-file {checkpoint_file}")
+
+        assert result.exit_code == 1
+        assert "batch size 2" in result.output
+        search_engine_mock.reindex_records.assert_not_called()
+
+    def test_reindex_with_failing_partition(
+        self, sync_db: Session, cli_runner: CliRunner, cli: Typer, search_engine_mock: AsyncMock
+    ):
+        self._create_dataset(sync_db, records=10)
+        search_engine_mock.reindex_records.side_effect = Exception("reindex error")
+
+        result = cli_runner.invoke(cli, "search-engine reindex --batch-size 1 --concurrency 1")
+
+        assert result.exit_code == 1
+        assert str(result.exception) == "reindex error"
+        search_engine_mock.reindex_records.assert_called_once()
+        search_engine_mock.swap_reindex_index.assert_not_called()
+
+    def _write_checkpoint(self, path: Path, dataset: Dataset, started_at: str, partitions: List[str]) -> None:
+        events = [
+            {
+                "event": "dataset_started",
+                "dataset_id": str(dataset.id),
+                "index_name": "rg.resumed",
+                "started_at": started_at,
+                "batch_size": 2,
+            }
+        ]
+        events += [
+            {"event": "partition_done", "dataset_id": str(dataset.id), "partition_end": partition}
+            for partition in partitions
+        ]
+
+        path.write_text("".join(f"{json.dumps(event)}\n" for event in events))
+
+    def _create_dataset(self, sync_db: Session, records: int) -> Dataset:
+        dataset = Dataset(name="dataset", workspace=WorkspaceSyncFactory.create())
+        dataset.records = [Record(fields={}) for _ in range(records)]
+
+        sync_db.add(dataset)
+        sync_db.flush()
+
+        return dataset
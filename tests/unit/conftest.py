@@ -27,6 +27,7 @@ from argilla_server.daos.records import DatasetRecordsDAO
 from argilla_server.database import get_async_db
 from argilla_server.models import User, UserRole, Workspace
 from argilla_server.search_engine import SearchEngine, get_search_engine
+from argilla_server.security.authentication.users_cache import users_cache
 from argilla_server.settings import settings
 from argilla_server.telemetry import TelemetryClient
 from httpx import AsyncClient
@@ -105,6 +106,13 @@ async def async_client(
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_users_cache() -> Generator[None, None, None]:
+    users_cache.clear()
+    yield
+    users_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def test_telemetry(mocker: "MockerFixture") -> "MagicMock":
     mock_telemetry = mocker.Mock(TelemetryClient)
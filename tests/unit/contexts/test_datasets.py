@@ -0,0 +1,82 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from uuid import uuid4
+
+import pytest
+from argilla_server.contexts import datasets
+from argilla_server.enums import RecordInclude
+from argilla_server.schemas.v1.records import RecordIncludeParam
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import (
+    DatasetFactory,
+    RecordFactory,
+    ResponseFactory,
+    SuggestionFactory,
+    UserFactory,
+    VectorFactory,
+    VectorSettingsFactory,
+)
+
+
+@pytest.mark.asyncio
+class TestGetRecordsByIds:
+    async def test_get_records_by_ids(self, db: AsyncSession):
+        dataset = await DatasetFactory.create()
+        record_a, record_b = await RecordFactory.create_batch(2, dataset=dataset)
+        other_dataset_record = await RecordFactory.create()
+
+        records = await datasets.get_records_by_ids(
+            db, [record_b.id, uuid4(), other_dataset_record.id, record_a.id], dataset_id=dataset.id
+        )
+
+        assert records == [record_b, None, None, record_a]
+
+    async def test_get_records_by_ids_with_include(self, db: AsyncSession):
+        dataset = await DatasetFactory.create()
+        user = await UserFactory.create()
+        vector_settings_a = await VectorSettingsFactory.create(name="vector-a", dimensions=2, dataset=dataset)
+        vector_settings_b = await VectorSettingsFactory.create(name="vector-b", dimensions=2, dataset=dataset)
+        record = await RecordFactory.create(dataset=dataset)
+        user_response = await ResponseFactory.create(record=record, user=user)
+        other_response = await ResponseFactory.create(record=record)
+        suggestions = await SuggestionFactory.create_batch(2, record=record)
+        vector_a = await VectorFactory.create(record=record, vector_settings=vector_settings_a, value=[1.0, 2.0])
+        await VectorFactory.create(record=record, vector_settings=vector_settings_b, value=[3.0, 4.0])
+
+        db.expunge_all()
+        [record] = await datasets.get_records_by_ids(
+            db,
+            [record.id],
+            dataset_id=dataset.id,
+            include=RecordIncludeParam(keys=[RecordInclude.responses, RecordInclude.suggestions]),
+        )
+
+        assert {response.id for response in record.responses} == {user_response.id, other_response.id}
+        assert {suggestion.id for suggestion in record.suggestions} == {suggestion.id for suggestion in suggestions}
+        assert not record.is_relationship_loaded("vectors")
+
+        db.expunge_all()
+        [record] = await datasets.get_records_by_ids(
+            db,
+            [record.id],
+            dataset_id=dataset.id,
+            user_id=user.id,
+            include=RecordIncludeParam(keys=[RecordInclude.responses], vectors=[vector_settings_a.name]),
+        )
+
+        assert [response.id for response in record.responses] == [user_response.id]
+        assert [vector.id for vector in record.vectors] == [vector_a.id]
+        assert record.vectors[0].vector_settings.name == "vector-a"
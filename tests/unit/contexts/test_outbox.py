@@ -0,0 +1,263 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla_server.bulk.records_bulk import CreateRecordsBulk
+from argilla_server.contexts import datasets, outbox
+from argilla_server.enums import DatasetStatus
+from argilla_server.models import Record, RecordOutbox
+from argilla_server.schemas.v1.records_bulk import RecordsBulkCreate
+from argilla_server.search_engine import SearchEngine
+from argilla_server.settings import settings
+from pytest_mock import MockerFixture
+from sqlalchemy import func, select, sql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import DatasetFactory, RecordFactory, SuggestionFactory, TextFieldFactory
+
+
+@pytest.mark.asyncio
+class TestOutbox:
+    async def test_create_records_bulk_with_outbox_enabled(
+        self, db: AsyncSession, mock_search_engine: SearchEngine, mocker: MockerFixture
+    ):
+        mocker.patch.object(settings, "search_engine_outbox_enabled", True)
+
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await TextFieldFactory.create(name="prompt", dataset=dataset)
+        await dataset.awaitable_attrs.fields
+        await dataset.awaitable_attrs.questions
+        await dataset.awaitable_attrs.metadata_properties
+        await dataset.awaitable_attrs.vectors_settings
+
+        bulk_create = RecordsBulkCreate(items=[{"fields": {"prompt": "prompt"}}, {"fields": {"prompt": "prompt"}}])
+        records_bulk = await CreateRecordsBulk(db, mock_search_engine).create_records_bulk(dataset, bulk_create)
+
+        mock_search_engine.index_records.assert_not_called()
+        assert (await db.execute(select(func.count(RecordOutbox.id)))).scalar_one() == 2
+
+        indexing_status = await outbox.get_dataset_indexing_status(db, dataset.id)
+        assert indexing_status.pending == 2
+        assert indexing_status.oldest_pending_at is not None
+
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=10, max_attempts=5) == 2
+
+        mock_search_engine.index_records.assert_called_once()
+        indexed_dataset, indexed_records = mock_search_engine.index_records.call_args.args
+        assert indexed_dataset.id == dataset.id
+        assert {record.id for record in indexed_records} == {record.id for record in records_bulk.items}
+        assert (await db.execute(select(func.count(RecordOutbox.id)))).scalar_one() == 0
+
+        indexing_status = await outbox.get_dataset_indexing_status(db, dataset.id)
+        assert indexing_status.pending == 0
+        assert indexing_status.lag == 0
+
+    async def test_index_pending_records_in_batches(self, db: AsyncSession, mock_search_engine: SearchEngine):
+        dataset = await DatasetFactory.create()
+        other_dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(3, dataset=dataset)
+        other_records = await RecordFactory.create_batch(2, dataset=other_dataset)
+
+        await outbox.enqueue_records(db, records + other_records)
+        await db.commit()
+
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=4, max_attempts=5) == 4
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=4, max_attempts=5) == 1
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=4, max_attempts=5) == 0
+
+        indexed_records_ids = [
+            record.id for args in mock_search_engine.index_records.call_args_list for record in args.args[1]
+        ]
+        assert sorted(indexed_records_ids) == sorted(record.id for record in records + other_records)
+
+    async def test_index_pending_records_without_pending_records(
+        self, db: AsyncSession, mock_search_engine: SearchEngine
+    ):
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=10, max_attempts=5) == 0
+
+        mock_search_engine.index_records.assert_not_called()
+
+    async def test_index_pending_records_with_failing_dataset(
+        self, db: AsyncSession, mock_search_engine: SearchEngine, mocker: MockerFixture
+    ):
+        mocker.patch.object(settings, "search_engine_outbox_max_attempts", 2)
+
+        failing_dataset = await DatasetFactory.create()
+        dataset = await DatasetFactory.create()
+        failing_records = await RecordFactory.create_batch(2, dataset=failing_dataset)
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+
+        await outbox.enqueue_records(db, failing_records + records)
+        await db.commit()
+
+        async def index_records(indexed_dataset, indexed_records):
+            if indexed_dataset.id == failing_dataset.id:
+                raise Exception("indexing error")
+
+        mock_search_engine.index_records.side_effect = index_records
+
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=10, max_attempts=2) == 2
+
+        indexing_status = await outbox.get_dataset_indexing_status(db, failing_dataset.id)
+        assert indexing_status.pending == 2
+        assert indexing_status.failed == 0
+
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=10, max_attempts=2) == 0
+
+        indexing_status = await outbox.get_dataset_indexing_status(db, failing_dataset.id)
+        assert indexing_status.pending == 0
+        assert indexing_status.failed == 2
+
+        mock_search_engine.index_records.reset_mock()
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=10, max_attempts=2) == 0
+        mock_search_engine.index_records.assert_not_called()
+
+    async def test_index_pending_records_prioritizes_records_without_failed_attempts(
+        self, db: AsyncSession, mock_search_engine: SearchEngine
+    ):
+        failing_dataset = await DatasetFactory.create()
+        dataset = await DatasetFactory.create()
+        failing_records = await RecordFactory.create_batch(2, dataset=failing_dataset)
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+
+        await outbox.enqueue_records(db, failing_records)
+        await db.commit()
+
+        mock_search_engine.index_records.side_effect = Exception("indexing error")
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=2, max_attempts=5) == 0
+
+        await outbox.enqueue_records(db, records)
+        await db.commit()
+
+        mock_search_engine.index_records.reset_mock(side_effect=True)
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=2, max_attempts=5) == 2
+
+        indexed_dataset, indexed_records = mock_search_engine.index_records.call_args.args
+        assert indexed_dataset.id == dataset.id
+        assert {record.id for record in indexed_records} == {record.id for record in records}
+
+    async def test_index_pending_records_with_records_deleted_while_indexing(
+        self, db: AsyncSession, mock_search_engine: SearchEngine
+    ):
+        dataset = await DatasetFactory.create()
+        deleted_record, record = await RecordFactory.create_batch(2, dataset=dataset)
+
+        await outbox.enqueue_records(db, [deleted_record, record])
+        await db.commit()
+
+        async def delete_record_while_indexing(*args, **kwargs):
+            await db.execute(sql.delete(Record).filter(Record.id == deleted_record.id))
+
+        mock_search_engine.index_records.side_effect = delete_record_while_indexing
+
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=10, max_attempts=5) == 2
+
+        mock_search_engine.delete_records.assert_called_once()
+        deleted_dataset, deleted_records = mock_search_engine.delete_records.call_args.args
+        assert deleted_dataset.id == dataset.id
+        assert [record.id for record in deleted_records] == [deleted_record.id]
+        assert (await db.execute(select(func.count(RecordOutbox.id)))).scalar_one() == 0
+
+    async def test_enqueue_records_resets_failed_attempts(
+        self, db: AsyncSession, mock_search_engine: SearchEngine, mocker: MockerFixture
+    ):
+        mocker.patch.object(settings, "search_engine_outbox_max_attempts", 1)
+
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+
+        await outbox.enqueue_records(db, records)
+        await db.commit()
+
+        mock_search_engine.index_records.side_effect = Exception("indexing error")
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=10, max_attempts=1) == 0
+        assert (await outbox.get_dataset_indexing_status(db, dataset.id)).failed == 2
+
+        await outbox.enqueue_records(db, records)
+        await db.commit()
+
+        indexing_status = await outbox.get_dataset_indexing_status(db, dataset.id)
+        assert indexing_status.pending == 2
+        assert indexing_status.failed == 0
+
+    async def test_requeue_pending_records(self, db: AsyncSession, mocker: MockerFixture):
+        mocker.patch.object(settings, "search_engine_outbox_enabled", True)
+
+        dataset = await DatasetFactory.create()
+        pending_record, indexed_record = await RecordFactory.create_batch(2, dataset=dataset)
+
+        await outbox.enqueue_records(db, [pending_record])
+        await db.commit()
+        enqueued_at = (await db.execute(select(RecordOutbox.updated_at))).scalar_one()
+
+        assert await outbox.requeue_pending_records(db, [pending_record, indexed_record]) == [indexed_record]
+        await db.commit()
+
+        outbox_records = (await db.execute(select(RecordOutbox))).scalars().all()
+        assert [outbox_record.record_id for outbox_record in outbox_records] == [pending_record.id]
+        assert outbox_records[0].updated_at > enqueued_at
+
+    async def test_requeue_pending_records_with_outbox_disabled(self, db: AsyncSession):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+
+        await outbox.enqueue_records(db, records)
+        await db.commit()
+
+        assert await outbox.requeue_pending_records(db, records) == records
+
+    async def test_delete_pending_records(
+        self, db: AsyncSession, mock_search_engine: SearchEngine, mocker: MockerFixture
+    ):
+        mocker.patch.object(settings, "search_engine_outbox_enabled", True)
+
+        dataset = await DatasetFactory.create()
+        pending_record, indexed_record = await RecordFactory.create_batch(2, dataset=dataset)
+        await outbox.enqueue_records(db, [pending_record])
+        await db.commit()
+
+        await datasets.delete_records(db, mock_search_engine, dataset, [pending_record.id, indexed_record.id])
+
+        mock_search_engine.delete_records.assert_called_once()
+        assert (await db.execute(select(func.count(RecordOutbox.id)))).scalar_one() == 0
+        assert await outbox.index_pending_records(db, mock_search_engine, batch_size=10, max_attempts=5) == 0
+        mock_search_engine.index_records.assert_not_called()
+
+    async def test_delete_suggestion_of_pending_record(
+        self, db: AsyncSession, mock_search_engine: SearchEngine, mocker: MockerFixture
+    ):
+        mocker.patch.object(settings, "search_engine_outbox_enabled", True)
+
+        suggestion = await SuggestionFactory.create()
+        await outbox.enqueue_records(db, [suggestion.record])
+        await db.commit()
+
+        suggestion = await datasets.get_suggestion_by_id(db, suggestion.id)
+        await datasets.delete_suggestion(db, mock_search_engine, suggestion)
+
+        mock_search_engine.delete_record_suggestion.assert_not_called()
+        assert (await db.execute(select(RecordOutbox.record_id))).scalar_one() == suggestion.record_id
+
+    async def test_delete_suggestion_of_indexed_record(
+        self, db: AsyncSession, mock_search_engine: SearchEngine, mocker: MockerFixture
+    ):
+        mocker.patch.object(settings, "search_engine_outbox_enabled", True)
+
+        suggestion = await SuggestionFactory.create()
+
+        suggestion = await datasets.get_suggestion_by_id(db, suggestion.id)
+        await datasets.delete_suggestion(db, mock_search_engine, suggestion)
+
+        mock_search_engine.delete_record_suggestion.assert_called_once_with(suggestion)
+        assert (await db.execute(select(func.count(RecordOutbox.id)))).scalar_one() == 0
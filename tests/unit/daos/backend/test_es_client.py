@@ -16,7 +16,9 @@ import os
 import pytest
 from argilla_server.commons.models import TaskType
 from argilla_server.daos.backend import GenericElasticEngineBackend
+from argilla_server.daos.backend.client_adapters import OpenSearchClient
 from argilla_server.daos.backend.generic_elastic import dataset_records_index
+from pytest_mock import MockerFixture
 
 
 @pytest.mark.skipif("GITHUB_RUN_ID" in os.environ, reason="This test fails often in GitHub actions")
@@ -39,3 +41,41 @@ def test_copy_index_as_alias(es: GenericElasticEngineBackend, opensearch):
     assert es.get_schema(source_id) == es.get_schema(source_id_alias)
 
     es.copy(id_from=source_id_alias, id_to=target_id)
+
+
+class TestBulk:
+    def test_bulk(self, mocker: MockerFixture):
+        client = OpenSearchClient(index_shards=1, config_backend={}, bulk_chunk_size=100)
+        bulk_helpers = mocker.patch.object(client, "bulk_helpers")
+        bulk_helpers.bulk.return_value = (2, [])
+        actions = [{"_id": "1"}, {"_id": "2"}]
+
+        assert client.bulk(index="index", actions=actions) == (2, [])
+
+        bulk_helpers.bulk.assert_called_once_with(
+            client=client.__client__,
+            index="index",
+            actions=actions,
+            chunk_size=100,
+            raise_on_error=True,
+            refresh="wait_for",
+        )
+
+    def test_bulk_without_refresh(self, mocker: MockerFixture):
+        client = OpenSearchClient(index_shards=1, config_backend={})
+        bulk_helpers = mocker.patch.object(client, "bulk_helpers")
+        bulk_helpers.bulk.return_value = (1, [])
+
+        client.bulk(index="index", actions=[{"_id": "1"}], refresh=False)
+
+        assert bulk_helpers.bulk.call_args.kwargs["refresh"] is False
+
+    def test_bulk_with_multiple_threads(self, mocker: MockerFixture):
+        client = OpenSearchClient(index_shards=1, config_backend={}, bulk_thread_count=4)
+        bulk_helpers = mocker.patch.object(client, "bulk_helpers")
+        bulk_helpers.parallel_bulk.return_value = iter([(True, {}), (False, {"error": "failed"}), (True, {})])
+
+        assert client.bulk(index="index", actions=[], refresh=False) == (2, [{"error": "failed"}])
+
+        bulk_helpers.bulk.assert_not_called()
+        assert bulk_helpers.parallel_bulk.call_args.kwargs["thread_count"] == 4
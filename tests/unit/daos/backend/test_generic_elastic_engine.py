@@ -17,8 +17,12 @@ import uuid
 import pytest
 from argilla_server.commons.models import TaskType
 from argilla_server.daos.backend import GenericElasticEngineBackend
+from argilla_server.daos.backend.client_adapters.base import IClientAdapter
+from argilla_server.daos.backend.generic_elastic import dataset_records_index
 from argilla_server.daos.backend.search.model import BaseRecordsQuery
 from argilla_server.errors import InvalidTextSearchError
+from argilla_server.settings import settings
+from pytest_mock import MockerFixture
 
 
 @pytest.fixture(scope="session")
@@ -112,3 +116,91 @@ def test_non_searchable_fields_cannot_be_used_for_search(engine: GenericElasticE
 
     total, _ = engine.search_records(id=dataset_id, query=BaseRecordsQuery(query_text="metadata._protected:value"))
     assert total == 0
+
+
+class TestDatasetMappingsCache:
+    @pytest.fixture
+    def client(self, mocker: MockerFixture) -> IClientAdapter:
+        client = mocker.Mock(IClientAdapter)
+        client.get_index_schema.return_value = {"mappings": {"properties": {"text": {"type": "text"}}}}
+        client.get_property_type.return_value = {}
+
+        return client
+
+    @pytest.fixture
+    def backend(self, client: IClientAdapter) -> GenericElasticEngineBackend:
+        return GenericElasticEngineBackend(client=client, mappings={TaskType.text_classification: {}})
+
+    def test_get_schema_is_cached(self, backend: GenericElasticEngineBackend, client: IClientAdapter):
+        schema = backend.get_schema("dataset")
+
+        assert backend.get_schema("dataset") == schema
+        client.get_index_schema.assert_called_once_with(index=dataset_records_index("dataset"))
+
+    def test_create_dataset_without_mapping_changes(self, backend: GenericElasticEngineBackend, client: IClientAdapter):
+        backend.get_schema("dataset")
+        backend.create_dataset(
+            "dataset", TaskType.text_classification, metadata_values={"a": 1}, vectors_cfg={"vector": 3}
+        )
+        client.reset_mock()
+
+        backend.get_schema("dataset")
+        backend.create_dataset("dataset", TaskType.text_classification, metadata_values={"a": 2})
+        backend.create_dataset(
+            "dataset", TaskType.text_classification, metadata_values={"a": 3}, vectors_cfg={"vector": 3}
+        )
+
+        assert client.mock_calls == []
+
+    def test_create_dataset_with_new_metadata_fields(
+        self, backend: GenericElasticEngineBackend, client: IClientAdapter
+    ):
+        backend.get_schema("dataset")
+        backend.create_dataset("dataset", TaskType.text_classification, metadata_values={"a": 1})
+        client.reset_mock()
+
+        backend.create_dataset("dataset", TaskType.text_classification, metadata_values={"a": 1, "b": 2})
+
+        client.create_index.assert_called_once()
+        client.set_index_mappings.assert_called_once()
+        client.get_index_schema.assert_called_once()
+        assert backend._mappings_cache.get(dataset_records_index("dataset")).metadata_fields == {"a", "b"}
+
+    def test_create_dataset_with_new_vector_dimension(
+        self, backend: GenericElasticEngineBackend, client: IClientAdapter
+    ):
+        backend.get_schema("dataset")
+        backend.create_dataset("dataset", TaskType.text_classification, vectors_cfg={"vector": 3})
+        client.reset_mock()
+
+        backend.create_dataset("dataset", TaskType.text_classification, vectors_cfg={"vector": 4})
+
+        client.configure_index_vectors.assert_called_once_with(
+            index=dataset_records_index("dataset"), vectors={"vector": 4}
+        )
+
+    def test_create_dataset_with_force_recreate(self, backend: GenericElasticEngineBackend, client: IClientAdapter):
+        backend.get_schema("dataset")
+        backend.create_dataset("dataset", TaskType.text_classification, force_recreate=True)
+        client.reset_mock()
+
+        backend.get_schema("dataset")
+
+        client.get_index_schema.assert_called_once()
+
+    def test_delete_invalidates_the_cache(self, backend: GenericElasticEngineBackend, client: IClientAdapter):
+        backend.get_schema("dataset")
+        backend.delete("dataset")
+
+        backend.get_schema("dataset")
+
+        assert client.get_index_schema.call_count == 2
+
+    def test_get_schema_with_cache_disabled(self, mocker: MockerFixture, client: IClientAdapter):
+        mocker.patch.object(settings, "es_records_mappings_cache_ttl", 0)
+        backend = GenericElasticEngineBackend(client=client, mappings={TaskType.text_classification: {}})
+
+        backend.get_schema("dataset")
+        backend.get_schema("dataset")
+
+        assert client.get_index_schema.call_count == 2
@@ -0,0 +1,75 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla_server.instrumentation.metrics import Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    def test_collect(self):
+        histogram = Histogram("test_duration_seconds", "Test duration", labelnames=["name"], buckets=[0.1, 1.0])
+
+        histogram.observe(0.05, name="a")
+        histogram.observe(0.1, name="a")
+        histogram.observe(0.5, name="a")
+        histogram.observe(5, name="a")
+        histogram.observe(0.5, name='b"c')
+
+        assert histogram.collect() == [
+            "# HELP test_duration_seconds Test duration",
+            "# TYPE test_duration_seconds histogram",
+            'test_duration_seconds_bucket{name="a",le="0.1"} 2',
+            'test_duration_seconds_bucket{name="a",le="1.0"} 3',
+            'test_duration_seconds_bucket{name="a",le="+Inf"} 4',
+            'test_duration_seconds_sum{name="a"} 5.65',
+            'test_duration_seconds_count{name="a"} 4',
+            'test_duration_seconds_bucket{name="b\\"c",le="0.1"} 0',
+            'test_duration_seconds_bucket{name="b\\"c",le="1.0"} 1',
+            'test_duration_seconds_bucket{name="b\\"c",le="+Inf"} 1',
+            'test_duration_seconds_sum{name="b\\"c"} 0.5',
+            'test_duration_seconds_count{name="b\\"c"} 1',
+        ]
+
+    def test_collect_without_labels(self):
+        histogram = Histogram("test_duration_seconds", "Test duration", buckets=[1.0])
+
+        histogram.observe(0.5)
+
+        assert histogram.collect()[2:] == [
+            'test_duration_seconds_bucket{le="1.0"} 1',
+            'test_duration_seconds_bucket{le="+Inf"} 1',
+            "test_duration_seconds_sum 0.5",
+            "test_duration_seconds_count 1",
+        ]
+
+
+class TestMetricsRegistry:
+    def test_render(self):
+        registry = MetricsRegistry()
+        registry.histogram("first_seconds", "First").observe(1)
+        registry.histogram("second_seconds", "Second")
+
+        rendered = registry.render()
+
+        assert "# TYPE first_seconds histogram\n" in rendered
+        assert "first_seconds_count 1\n" in rendered
+        assert "# TYPE second_seconds histogram\n" in rendered
+        assert rendered.endswith("\n")
+
+    def test_histogram_already_registered(self):
+        registry = MetricsRegistry()
+        registry.histogram("first_seconds", "First")
+
+        with pytest.raises(ValueError, match="Metric `first_seconds` is already registered"):
+            registry.histogram("first_seconds", "First")
@@ -0,0 +1,72 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Generator
+
+import pytest
+from argilla_server.instrumentation import registry
+from argilla_server.models import Dataset
+from argilla_server.settings import settings
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from tests.factories import DatasetFactory
+
+
+@pytest.fixture
+def enable_metrics(mocker: MockerFixture) -> Generator[None, None, None]:
+    mocker.patch.object(settings, "enable_metrics", True)
+    registry.clear()
+
+    yield
+
+    registry.clear()
+
+
+@pytest.mark.asyncio
+class TestInstrumentationMiddleware:
+    async def test_request_with_metrics_enabled(
+        self, async_client: AsyncClient, owner_auth_header: dict, enable_metrics: None
+    ):
+        dataset: Dataset = await DatasetFactory.create()
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}", headers=owner_auth_header)
+
+        assert response.status_code == 200
+        server_timing = response.headers["Server-Timing"]
+        assert "db.execute;dur=" in server_timing
+        assert "endpoint;dur=" in server_timing
+
+        response = await async_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+        assert (
+            'argilla_http_request_duration_seconds_count{method="GET",route="/api/v1/datasets/{dataset_id}",'
+            'status_code="200"} 1'
+        ) in response.text
+        assert 'argilla_span_duration_seconds_count{span="endpoint"}' in response.text
+        assert 'argilla_span_duration_seconds_count{span="serialization"}' in response.text
+
+    async def test_request_with_metrics_disabled(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset: Dataset = await DatasetFactory.create()
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}", headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert "Server-Timing" not in response.headers
+
+        response = await async_client.get("/metrics")
+
+        assert response.status_code == 404
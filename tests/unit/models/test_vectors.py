@@ -0,0 +1,59 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+from argilla_server.enums import VectorStorageType
+from argilla_server.models.vectors import decode_vector, encode_vector, vector_to_list
+
+
+class TestVectors:
+    def test_encode_and_decode_float32_vector(self):
+        data = encode_vector([0.1, -2.5, 3.0], VectorStorageType.float32)
+
+        assert len(data) == 4 + 3 * 4
+        assert vector_to_list(decode_vector(data)) == pytest.approx([0.1, -2.5, 3.0])
+
+    def test_decode_float32_vector_without_copies(self):
+        data = encode_vector([1.0, 2.0, 3.0])
+
+        vector = decode_vector(data)
+
+        assert vector.dtype == np.float32
+        assert not vector.flags.owndata
+        assert not vector.flags.writeable
+
+    def test_encode_and_decode_float16_vector(self):
+        data = encode_vector([0.1, -2.5, 3.0], VectorStorageType.float16)
+
+        assert len(data) == 4 + 3 * 2
+        assert decode_vector(data).tolist() == pytest.approx([0.1, -2.5, 3.0], abs=1e-3)
+
+    def test_encode_and_decode_int8_vector(self):
+        data = encode_vector([0.1, -2.5, 3.0], VectorStorageType.int8)
+
+        assert len(data) == 4 + 4 + 3
+        assert decode_vector(data).tolist() == pytest.approx([0.1, -2.5, 3.0], abs=3.0 / 127)
+
+    def test_encode_and_decode_int8_zeros_vector(self):
+        data = encode_vector([0.0, 0.0], VectorStorageType.int8)
+
+        assert decode_vector(data).tolist() == [0.0, 0.0]
+
+    def test_decode_vector_with_unknown_format(self):
+        with pytest.raises(ValueError, match="Stored vector has an unknown format"):
+            decode_vector(b"\x09\x00\x00\x00")
+
+    def test_vector_to_list_with_none(self):
+        assert vector_to_list(None) is None
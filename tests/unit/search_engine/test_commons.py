@@ -16,11 +16,19 @@ from typing import Any, Dict, List, Optional, Union
 
 import pytest
 import pytest_asyncio
-from argilla_server.enums import MetadataPropertyType, QuestionType, ResponseStatusFilter, SimilarityOrder
+from argilla_server.enums import (
+    MetadataPropertyType,
+    QuestionType,
+    RecordIndexProperty,
+    ResponseStatusFilter,
+    SimilarityOrder,
+)
 from argilla_server.models import Dataset, Question, Record, User, VectorSettings
 from argilla_server.search_engine import (
+    SEARCH_CURSOR_START,
     FloatMetadataFilter,
     IntegerMetadataFilter,
+    SimilarityQuery,
     SortBy,
     SuggestionFilterScope,
     TermsFilter,
@@ -783,6 +791,26 @@ class TestBaseElasticAndOpenSearchEngine:
         assert results.total == 100
         assert all_results.items[offset : offset + limit] == results.items
 
+    @pytest.mark.parametrize("user_id", [None, "a-user-id"])
+    async def test_search_with_cursor(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        dataset_for_pagination: Dataset,
+        user_id: Optional[str],
+    ):
+        all_results = await search_engine.search(dataset_for_pagination, limit=100, user_id=user_id)
+
+        items, cursor = [], SEARCH_CURSOR_START
+        while cursor is not None:
+            results = await search_engine.search(dataset_for_pagination, limit=30, user_id=user_id, cursor=cursor)
+            assert results.total == 100
+
+            items.extend(results.items)
+            cursor = results.next_cursor
+
+        assert [item.record_id for item in items] == [item.record_id for item in all_results.items]
+
     @pytest.mark.parametrize(
         ("sort_by"),
         [
@@ -841,6 +869,89 @@ class TestBaseElasticAndOpenSearchEngine:
             for record in records
         ]
 
+    async def test_search_with_records(self, search_engine: BaseElasticAndOpenSearchEngine):
+        search_engine.hydrate_records = True
+
+        question = await TextQuestionFactory.create()
+        dataset = await DatasetFactory.create(questions=[question])
+        record = await RecordFactory.create(dataset=dataset, fields={"text": "value"}, metadata_={"key": "value"})
+        response = await ResponseFactory.create(record=record, values={question.name: {"value": "answer"}})
+
+        await refresh_dataset(dataset)
+        await refresh_records([record])
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, [record])
+
+        results = await search_engine.search(dataset, with_records=True)
+
+        assert results.items[0].record == {
+            "id": str(record.id),
+            "fields": {"text": "value"},
+            "metadata": {"key": "value"},
+            "external_id": record.external_id,
+            "dataset_id": str(dataset.id),
+            "inserted_at": record.inserted_at.isoformat(),
+            "updated_at": record.updated_at.isoformat(),
+            "responses": {
+                str(response.user_id): {
+                    "id": str(response.id),
+                    "values": {question.name: {"value": "answer"}},
+                    "status": response.status.value,
+                    "record_id": str(record.id),
+                    "user_id": str(response.user_id),
+                    "inserted_at": response.inserted_at.isoformat(),
+                    "updated_at": response.updated_at.isoformat(),
+                }
+            },
+            "suggestions": {},
+        }
+
+        results = await search_engine.search(dataset)
+        assert results.items[0].record is None
+
+    async def test_search_with_records_after_updating_responses(self, search_engine: BaseElasticAndOpenSearchEngine):
+        search_engine.hydrate_records = True
+
+        question = await TextQuestionFactory.create()
+        dataset = await DatasetFactory.create(questions=[question])
+        record = await RecordFactory.create(dataset=dataset)
+
+        await refresh_dataset(dataset)
+        await refresh_records([record])
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, [record])
+
+        response = await ResponseFactory.create(record=record, values={question.name: {"value": "answer"}})
+        await search_engine.update_record_response(response)
+
+        results = await search_engine.search(dataset, with_records=True)
+        assert list(results.items[0].record["responses"]) == [str(response.user_id)]
+
+        await search_engine.delete_record_response(response)
+
+        results = await search_engine.search(dataset, with_records=True)
+        assert results.items[0].record["responses"] == {}
+
+    async def test_search_with_records_for_documents_without_record(
+        self, search_engine: BaseElasticAndOpenSearchEngine
+    ):
+        dataset = await DatasetFactory.create()
+        record = await RecordFactory.create(dataset=dataset)
+
+        await refresh_dataset(dataset)
+        await refresh_records([record])
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, [record])
+
+        search_engine.hydrate_records = True
+        results = await search_engine.search(dataset, with_records=True)
+
+        assert results.items[0].record_id == record.id
+        assert results.items[0].record is None
+
     async def test_configure_metadata_property(
         self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch
     ):
@@ -944,6 +1055,33 @@ class TestBaseElasticAndOpenSearchEngine:
             for record in records
         ]
 
+    async def test_partial_update_records(self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch):
+        text_fields = await TextFieldFactory.create_batch(1)
+        metadata_properties = await TermsMetadataPropertyFactory.create_batch(2)
+
+        dataset = await DatasetFactory.create(fields=text_fields, metadata_properties=metadata_properties, questions=[])
+        record = await RecordFactory.create(
+            dataset=dataset,
+            fields={field.name: f"This is the value for {field.name}" for field in text_fields},
+            metadata_={metadata_properties[0].name: "a", metadata_properties[1].name: "b"},
+            responses=[],
+        )
+
+        await refresh_dataset(dataset)
+        await refresh_records([record])
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, [record])
+
+        record.metadata_ = {metadata_properties[0].name: "c"}
+        await search_engine.partial_update_records(dataset, [record], [RecordIndexProperty.metadata])
+
+        index_name = es_index_name_for_dataset(dataset)
+
+        es_doc = opensearch.get(index=index_name, id=record.id)["_source"]
+        assert es_doc["metadata"] == {metadata_properties[0].name: "c"}
+        assert es_doc["fields"] == record.fields
+
     async def test_index_records_with_vectors(
         self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch
     ):
@@ -1017,6 +1155,109 @@ class TestBaseElasticAndOpenSearchEngine:
         ]
         assert len(records_to_keep) == 5
 
+    async def test_delete_records_not_indexed(
+        self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch
+    ):
+        text_fields = await TextFieldFactory.create_batch(1)
+        dataset = await DatasetFactory.create(fields=text_fields, questions=[])
+        records = await RecordFactory.create_batch(
+            size=2,
+            dataset=dataset,
+            fields={field.name: f"This is the value for {field.name}" for field in text_fields},
+            responses=[],
+        )
+
+        await refresh_dataset(dataset)
+        await refresh_records(records)
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, records[:1])
+
+        await search_engine.delete_records(dataset, records)
+
+        index_name = es_index_name_for_dataset(dataset)
+        assert opensearch.count(index=index_name)["count"] == 0
+
+    async def test_swap_reindex_index(self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch):
+        text_fields = await TextFieldFactory.create_batch(1)
+        dataset = await DatasetFactory.create(fields=text_fields, questions=[])
+        records = await RecordFactory.create_batch(
+            size=5,
+            dataset=dataset,
+            fields={field.name: f"This is the value for {field.name}" for field in text_fields},
+            responses=[],
+        )
+
+        await refresh_dataset(dataset)
+        await refresh_records(records)
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, records[:2])
+
+        index_name = es_index_name_for_dataset(dataset)
+
+        reindex_index_name = await search_engine.create_reindex_index(dataset)
+        await search_engine.reindex_records(dataset, records, reindex_index_name)
+
+        assert opensearch.count(index=index_name)["count"] == 2
+
+        await search_engine.swap_reindex_index(dataset, reindex_index_name)
+
+        assert opensearch.indices.get_alias(name=index_name) == {reindex_index_name: {"aliases": {index_name: {}}}}
+        assert opensearch.count(index=index_name)["count"] == 5
+
+        next_reindex_index_name = await search_engine.create_reindex_index(dataset)
+        await search_engine.reindex_records(dataset, records[:1], next_reindex_index_name)
+        await search_engine.swap_reindex_index(dataset, next_reindex_index_name)
+
+        assert not opensearch.indices.exists(index=reindex_index_name)
+        assert opensearch.count(index=index_name)["count"] == 1
+
+        await search_engine.delete_index(dataset)
+
+        assert not opensearch.indices.exists(index=next_reindex_index_name)
+        assert not opensearch.indices.exists_alias(name=index_name)
+
+    async def test_writes_during_reindex(self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch):
+        text_fields = await TextFieldFactory.create_batch(1)
+        dataset = await DatasetFactory.create(fields=text_fields, questions=[])
+        records = await RecordFactory.create_batch(
+            size=4,
+            dataset=dataset,
+            fields={field.name: f"This is the value for {field.name}" for field in text_fields},
+            responses=[],
+        )
+
+        await refresh_dataset(dataset)
+        await refresh_records(records)
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, records[:3])
+
+        index_name = es_index_name_for_dataset(dataset)
+        reindex_index_name = await search_engine.create_reindex_index(dataset)
+        await search_engine.reindex_records(dataset, records[:1], reindex_index_name)
+
+        await search_engine.index_records(dataset, records[3:])
+        await search_engine.partial_update_records(dataset, records[:2], [RecordIndexProperty.metadata])
+        await search_engine.delete_records(dataset, records[:1])
+
+        opensearch.indices.refresh(index=reindex_index_name)
+        assert opensearch.count(index=index_name)["count"] == 3
+        assert opensearch.count(index=reindex_index_name)["count"] == 1
+        assert await search_engine.list_reindex_records_ids(dataset, reindex_index_name) == [records[3].id]
+
+        await search_engine.reindex_records(dataset, records[1:3], reindex_index_name)
+        await search_engine.delete_reindex_records(dataset, [records[2].id], reindex_index_name)
+        await search_engine.swap_reindex_index(dataset, reindex_index_name)
+
+        assert opensearch.indices.get_alias(index=reindex_index_name) == {
+            reindex_index_name: {"aliases": {index_name: {}}}
+        }
+        assert sorted(await search_engine.list_reindex_records_ids(dataset, reindex_index_name)) == sorted(
+            [records[1].id, records[3].id]
+        )
+
     async def test_update_record_response(
         self,
         search_engine: BaseElasticAndOpenSearchEngine,
@@ -1055,6 +1296,34 @@ class TestBaseElasticAndOpenSearchEngine:
             },
         }
 
+    async def test_update_records_responses(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset: Dataset,
+    ):
+        records = test_banking_sentiment_dataset.records[:2]
+        question = test_banking_sentiment_dataset.questions[0]
+
+        responses = [
+            await ResponseFactory.create(record=record, values={question.name: {"value": "test"}}) for record in records
+        ]
+        for response in responses:
+            record = await response.awaitable_attrs.record
+            await record.awaitable_attrs.dataset
+        await search_engine.update_records_responses(responses)
+
+        index_name = es_index_name_for_dataset(test_banking_sentiment_dataset)
+
+        for record, response in zip(records, responses):
+            results = opensearch.get(index=index_name, id=record.id)
+            assert results["_source"]["responses"] == {
+                str(response.user.id): {
+                    "values": {question.name: "test"},
+                    "status": response.status.value,
+                }
+            }
+
     @pytest.mark.parametrize("annotators_size", [20, 200, 400])
     async def test_annotators_limits(
         self,
@@ -1163,6 +1432,7 @@ class TestBaseElasticAndOpenSearchEngine:
                         {"count": 3, "term": "negative"},
                         {"count": 1, "term": "positive"},
                     ],
+                    "next_cursor": None,
                 },
             ),
             ("textId", {"max": 8, "min": 0, "type": MetadataPropertyType.integer}),
@@ -1187,10 +1457,26 @@ class TestBaseElasticAndOpenSearchEngine:
         assert metrics.type == property.type
         assert metrics.dict() == expected_metrics
 
+    async def test_compute_metrics_for_terms_property_with_size(
+        self, search_engine: BaseElasticAndOpenSearchEngine, test_banking_sentiment_dataset: Dataset
+    ):
+        property = next(p for p in test_banking_sentiment_dataset.metadata_properties if p.name == "label")
+
+        metrics = await search_engine.compute_metrics_for(property, size=2)
+
+        assert metrics.total == 8
+        assert [(value.term, value.count) for value in metrics.values] == [("neutral", 4), ("negative", 3)]
+        assert metrics.next_cursor is not None
+
+        metrics = await search_engine.compute_metrics_for(property, size=2, cursor=metrics.next_cursor)
+
+        assert [(value.term, value.count) for value in metrics.values] == [("positive", 1)]
+        assert metrics.next_cursor is None
+
     @pytest.mark.parametrize(
         ("property_type", "expected_metrics"),
         [
-            (MetadataPropertyType.terms, {"total": 0, "values": []}),
+            (MetadataPropertyType.terms, {"total": 0, "values": [], "next_cursor": None}),
             (MetadataPropertyType.integer, {"min": None, "max": None}),
             (MetadataPropertyType.float, {"min": None, "max": None}),
         ],
@@ -1272,6 +1558,29 @@ class TestBaseElasticAndOpenSearchEngine:
         assert responses.total == 1
         assert responses.items[0].record_id == selected_record.id
 
+    async def test_similarity_search_many(
+        self,
+        search_engine: BaseElasticAndOpenSearchEngine,
+        opensearch: OpenSearch,
+        test_banking_sentiment_dataset_with_vectors: Dataset,
+    ):
+        selected_records = test_banking_sentiment_dataset_with_vectors.records[:2]
+        vector_settings = test_banking_sentiment_dataset_with_vectors.vectors_settings[0]
+
+        responses = await search_engine.similarity_search_many(
+            dataset=test_banking_sentiment_dataset_with_vectors,
+            vector_settings=vector_settings,
+            queries=[
+                SimilarityQuery(value=selected_records[0].vector_value_by_vector_settings(vector_settings)),
+                SimilarityQuery(record=selected_records[1]),
+            ],
+            max_results=1,
+        )
+
+        assert len(responses) == 2
+        assert responses[0].items[0].record_id == selected_records[0].id
+        assert responses[1].items[0].record_id != selected_records[1].id
+
     async def test_similarity_search_by_vector_value_with_order(
         self,
         search_engine: BaseElasticAndOpenSearchEngine,
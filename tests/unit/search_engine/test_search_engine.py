@@ -0,0 +1,142 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import pytest
+from argilla_server import search_engine
+from argilla_server.search_engine import (
+    IntegerMetadataMetrics,
+    MetadataMetricsCache,
+    SearchEngine,
+    close_search_engine,
+    get_search_engine,
+    open_search_engine,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.asyncio
+class TestSearchEngineLifecycle:
+    async def test_get_search_engine_without_shared_engine(self, mocker: "MockerFixture"):
+        engine = mocker.AsyncMock(SearchEngine)
+        mocker.patch.object(SearchEngine, "new_instance_by_name", return_value=engine)
+
+        async for yielded_engine in get_search_engine():
+            assert yielded_engine == engine
+
+        engine.close.assert_awaited_once()
+
+    async def test_get_search_engine_with_shared_engine(self, mocker: "MockerFixture"):
+        engine = mocker.AsyncMock(SearchEngine)
+        new_instance_by_name_mock = mocker.patch.object(SearchEngine, "new_instance_by_name", return_value=engine)
+
+        try:
+            assert await open_search_engine() == engine
+            assert await open_search_engine() == engine
+
+            for _ in range(3):
+                async for yielded_engine in get_search_engine():
+                    assert yielded_engine == engine
+
+            new_instance_by_name_mock.assert_awaited_once()
+            engine.close.assert_not_awaited()
+        finally:
+            await close_search_engine()
+
+        engine.close.assert_awaited_once()
+        assert search_engine._search_engine is None
+
+    async def test_close_search_engine_without_shared_engine(self):
+        await close_search_engine()
+
+        assert search_engine._search_engine is None
+
+    async def test_new_instance_by_name_with_unknown_engine(self):
+        with pytest.raises(ValueError, match="No engine class registered for 'unknown'"):
+            await SearchEngine.new_instance_by_name("unknown")
+
+
+class TestSearchEngine:
+    def test_metrics_cache_is_created_on_first_use(self, mocker: "MockerFixture"):
+        mocker.patch.multiple(SearchEngine, __abstractmethods__=frozenset())
+        engine = SearchEngine()
+
+        assert isinstance(engine.metrics_cache, MetadataMetricsCache)
+        assert engine.metrics_cache is engine.metrics_cache
+        assert SearchEngine().metrics_cache is not engine.metrics_cache
+
+
+class TestMetadataMetricsCache:
+    def test_get_and_set(self):
+        cache, dataset_id, metrics = MetadataMetricsCache(ttl=60), uuid4(), IntegerMetadataMetrics(min=0, max=10)
+
+        assert cache.get(dataset_id, "key") is None
+
+        cache.set(dataset_id, "key", metrics, cache.generation(dataset_id))
+
+        assert cache.get(dataset_id, "key") == metrics
+        assert cache.get(uuid4(), "key") is None
+
+    def test_invalidate(self):
+        cache, dataset_id, other_dataset_id = MetadataMetricsCache(ttl=60), uuid4(), uuid4()
+        metrics = IntegerMetadataMetrics(min=0, max=10)
+
+        cache.set(dataset_id, "key", metrics, cache.generation(dataset_id))
+        cache.set(other_dataset_id, "key", metrics, cache.generation(other_dataset_id))
+        cache.invalidate(dataset_id)
+
+        assert cache.get(dataset_id, "key") is None
+        assert cache.get(other_dataset_id, "key") == metrics
+
+    def test_set_with_outdated_generation(self):
+        cache, dataset_id = MetadataMetricsCache(ttl=60), uuid4()
+
+        generation = cache.generation(dataset_id)
+        cache.invalidate(dataset_id)
+        cache.set(dataset_id, "key", IntegerMetadataMetrics(min=0, max=10), generation)
+
+        assert cache.get(dataset_id, "key") is None
+
+    def test_set_with_ttl_disabled(self):
+        cache, dataset_id = MetadataMetricsCache(ttl=0), uuid4()
+
+        cache.set(dataset_id, "key", IntegerMetadataMetrics(min=0, max=10), cache.generation(dataset_id))
+
+        assert cache.get(dataset_id, "key") is None
+
+    def test_get_with_expired_entry(self, mocker: "MockerFixture"):
+        cache, dataset_id = MetadataMetricsCache(ttl=60), uuid4()
+        monotonic_mock = mocker.patch("argilla_server.search_engine.base.time.monotonic", return_value=100)
+
+        cache.set(dataset_id, "key", IntegerMetadataMetrics(min=0, max=10), cache.generation(dataset_id))
+        monotonic_mock.return_value = 160
+
+        assert cache.get(dataset_id, "key") is None
+
+    def test_set_evicts_least_recently_used_entries(self):
+        cache, dataset_id = MetadataMetricsCache(ttl=60, max_entries=2), uuid4()
+        metrics = IntegerMetadataMetrics(min=0, max=10)
+
+        for key in ["a", "b"]:
+            cache.set(dataset_id, key, metrics, cache.generation(dataset_id))
+        cache.get(dataset_id, "a")
+        cache.set(dataset_id, "c", metrics, cache.generation(dataset_id))
+
+        assert cache.get(dataset_id, "a") == metrics
+        assert cache.get(dataset_id, "b") is None
+        assert cache.get(dataset_id, "c") == metrics
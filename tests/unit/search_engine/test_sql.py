@@ -0,0 +1,563 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import contextlib
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import pytest
+import pytest_asyncio
+from argilla_server.enums import ResponseStatus, ResponseStatusFilter, SimilarityOrder, SortOrder
+from argilla_server.models import Dataset, Record
+from argilla_server.search_engine import (
+    SEARCH_CURSOR_START,
+    AndFilter,
+    FloatMetadataMetrics,
+    IntegerMetadataMetrics,
+    MetadataFilterScope,
+    Order,
+    RangeFilter,
+    RecordFilterScope,
+    ResponseFilterScope,
+    SearchEngine,
+    SimilarityQuery,
+    SQLSearchEngine,
+    SuggestionFilterScope,
+    TermsFilter,
+    TermsMetadataMetrics,
+    TextQuery,
+    UserResponseStatusFilter,
+)
+from argilla_server.search_engine.base import encode_terms_metrics_cursor
+from argilla_server.search_engine.sql import sql_encode_search_cursor
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import (
+    DatasetFactory,
+    FloatMetadataPropertyFactory,
+    IntegerMetadataPropertyFactory,
+    LabelSelectionQuestionFactory,
+    MultiLabelSelectionQuestionFactory,
+    RatingQuestionFactory,
+    RecordFactory,
+    ResponseFactory,
+    SuggestionFactory,
+    TermsMetadataPropertyFactory,
+    TextFieldFactory,
+    UserFactory,
+    VectorFactory,
+    VectorSettingsFactory,
+)
+
+
+@pytest.fixture
+def search_engine(db: AsyncSession) -> SQLSearchEngine:
+    # The test session is shared with the engine so it can see the (uncommitted) test data
+    return SQLSearchEngine(session_factory=lambda: contextlib.nullcontext(db))
+
+
+@pytest_asyncio.fixture
+async def dataset() -> Dataset:
+    return await DatasetFactory.create(
+        fields=[await TextFieldFactory.create(name="text"), await TextFieldFactory.create(name="label")],
+        questions=[
+            await LabelSelectionQuestionFactory.create(name="label"),
+            await MultiLabelSelectionQuestionFactory.create(name="topics"),
+            await RatingQuestionFactory.create(name="rating"),
+        ],
+        metadata_properties=[
+            await TermsMetadataPropertyFactory.create(name="category"),
+            await IntegerMetadataPropertyFactory.create(name="position"),
+            await FloatMetadataPropertyFactory.create(name="confidence"),
+        ],
+    )
+
+
+@pytest_asyncio.fixture
+async def records(search_engine: SQLSearchEngine, dataset: Dataset) -> List[Record]:
+    records = [
+        await RecordFactory.create(
+            dataset=dataset,
+            fields={"text": "My card payment had the wrong exchange rate", "label": "negative"},
+            metadata_={"category": "payments", "position": 1, "confidence": 0.25},
+        ),
+        await RecordFactory.create(
+            dataset=dataset,
+            fields={"text": "I believe that a card payment I made was cancelled", "label": "neutral"},
+            metadata_={"category": ["payments", "cards"], "position": 2, "confidence": 0.5},
+        ),
+        await RecordFactory.create(
+            dataset=dataset,
+            fields={"text": "Why was I charged for getting cash?", "label": "negative"},
+            metadata_={"category": "cash", "position": 3},
+        ),
+    ]
+    await search_engine.index_records(dataset, records)
+
+    return records
+
+
+@pytest.mark.asyncio
+class TestSQLSearchEngine:
+    async def test_new_instance_by_name(self):
+        engine = await SearchEngine.new_instance_by_name("sql")
+
+        assert isinstance(engine, SQLSearchEngine)
+
+    async def test_search(self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]):
+        await RecordFactory.create(fields={"text": "A record from another dataset"})
+
+        result = await search_engine.search(dataset)
+
+        assert result.total == 3
+        assert [item.record_id for item in result.items] == [record.id for record in records]
+
+    @pytest.mark.parametrize(
+        ("query", "expected_indexes"),
+        [
+            ("card payment", [0, 1]),
+            ("CARD", [0, 1]),
+            ("card cash", []),
+            ("cards", []),
+            ("cash? !", [2]),
+            ('"card" OR cash', []),
+            ("?", []),
+            (TextQuery(q="negative"), [0, 2]),
+            (TextQuery(q="negative", field="text"), []),
+            (TextQuery(q="cash", field="text"), [2]),
+        ],
+    )
+    async def test_search_with_query(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record], query, expected_indexes
+    ):
+        result = await search_engine.search(dataset, query=query)
+
+        assert result.total == len(expected_indexes)
+        assert [item.record_id for item in result.items] == [records[index].id for index in expected_indexes]
+
+    async def test_search_with_query_and_records_not_indexed(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        await RecordFactory.create(dataset=dataset, fields={"text": "A card payment not indexed yet"})
+
+        result = await search_engine.search(dataset, query="card")
+
+        assert [item.record_id for item in result.items] == [records[0].id, records[1].id]
+
+    async def test_search_with_query_and_records_indexed_again(
+        self, search_engine: SQLSearchEngine, db: AsyncSession, dataset: Dataset, records: List[Record]
+    ):
+        records[0].fields = {"text": "My cash withdrawal was declined", "label": "negative"}
+        await db.flush()
+        await search_engine.index_records(dataset, [records[0]])
+
+        assert [item.record_id for item in (await search_engine.search(dataset, query="card")).items] == [records[1].id]
+        assert [item.record_id for item in (await search_engine.search(dataset, query="cash")).items] == [
+            records[0].id,
+            records[2].id,
+        ]
+
+    async def test_search_with_query_and_deleted_records(
+        self, search_engine: SQLSearchEngine, db: AsyncSession, dataset: Dataset, records: List[Record]
+    ):
+        await search_engine.delete_records(dataset, [records[0]])
+
+        result = await search_engine.search(dataset, query="card")
+
+        assert [item.record_id for item in result.items] == [records[1].id]
+
+    async def test_reindex_records(
+        self, search_engine: SQLSearchEngine, db: AsyncSession, dataset: Dataset, records: List[Record]
+    ):
+        await search_engine.delete_records(dataset, records)
+        index_name = await search_engine.create_reindex_index(dataset)
+
+        await search_engine.reindex_records(dataset, records, index_name)
+        await search_engine.swap_reindex_index(dataset, index_name)
+
+        result = await search_engine.search(dataset, query="card")
+        assert [item.record_id for item in result.items] == [records[0].id, records[1].id]
+
+    @pytest.mark.parametrize(
+        ("filter", "expected_indexes"),
+        [
+            (TermsFilter(scope=MetadataFilterScope(metadata_property="category"), values=["payments"]), [0, 1]),
+            (TermsFilter(scope=MetadataFilterScope(metadata_property="category"), values=["cards", "cash"]), [1, 2]),
+            (RangeFilter(scope=MetadataFilterScope(metadata_property="position"), ge=2), [1, 2]),
+            (RangeFilter(scope=MetadataFilterScope(metadata_property="confidence"), le=0.3), [0]),
+            (
+                AndFilter(
+                    filters=[
+                        TermsFilter(scope=MetadataFilterScope(metadata_property="category"), values=["payments"]),
+                        RangeFilter(scope=MetadataFilterScope(metadata_property="position"), ge=2, le=3),
+                    ]
+                ),
+                [1],
+            ),
+        ],
+    )
+    async def test_search_with_metadata_filter(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record], filter, expected_indexes
+    ):
+        result = await search_engine.search(dataset, filter=filter)
+
+        assert result.total == len(expected_indexes)
+        assert [item.record_id for item in result.items] == [records[index].id for index in expected_indexes]
+
+    async def test_search_with_record_filter(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        inserted_at = records[1].inserted_at.timestamp() * 1000
+
+        result = await search_engine.search(
+            dataset, filter=RangeFilter(scope=RecordFilterScope(property="inserted_at"), ge=inserted_at)
+        )
+
+        assert [item.record_id for item in result.items] == [records[1].id, records[2].id]
+
+    async def test_search_with_suggestion_filter(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        label, topics, _ = dataset.questions
+        await SuggestionFactory.create(record=records[0], question=label, value="option1", score=0.9)
+        await SuggestionFactory.create(record=records[1], question=label, value="option2", score=0.4)
+        await SuggestionFactory.create(record=records[1], question=topics, value=["option1", "option3"])
+        await SuggestionFactory.create(record=records[2], question=topics, value=["option2"])
+
+        result = await search_engine.search(
+            dataset,
+            filter=TermsFilter(scope=SuggestionFilterScope(question="label", property="value"), values=["option1"]),
+        )
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+        result = await search_engine.search(
+            dataset,
+            filter=TermsFilter(scope=SuggestionFilterScope(question="topics", property="value"), values=["option3"]),
+        )
+        assert [item.record_id for item in result.items] == [records[1].id]
+
+        result = await search_engine.search(
+            dataset, filter=RangeFilter(scope=SuggestionFilterScope(question="label", property="score"), le=0.5)
+        )
+        assert [item.record_id for item in result.items] == [records[1].id]
+
+    async def test_search_with_response_filters(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        user, other_user = await UserFactory.create(), await UserFactory.create()
+        await ResponseFactory.create(
+            record=records[0], user=user, values={"rating": {"value": 4}}, status=ResponseStatus.submitted
+        )
+        await ResponseFactory.create(
+            record=records[1], user=user, values={"rating": {"value": 8}}, status=ResponseStatus.discarded
+        )
+        await ResponseFactory.create(
+            record=records[2], user=other_user, values={"rating": {"value": 2}}, status=ResponseStatus.submitted
+        )
+
+        result = await search_engine.search(
+            dataset, filter=RangeFilter(scope=ResponseFilterScope(question="rating", user=user), ge=3, le=5)
+        )
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+        result = await search_engine.search(
+            dataset, filter=TermsFilter(scope=ResponseFilterScope(question="rating"), values=["2", "8"])
+        )
+        assert [item.record_id for item in result.items] == [records[1].id, records[2].id]
+
+        result = await search_engine.search(
+            dataset,
+            user_response_status_filter=UserResponseStatusFilter(
+                user=user, statuses=[ResponseStatusFilter.pending, ResponseStatusFilter.discarded]
+            ),
+        )
+        assert [item.record_id for item in result.items] == [records[1].id, records[2].id]
+
+        result = await search_engine.search(
+            dataset,
+            filter=TermsFilter(scope=ResponseFilterScope(property="status"), values=[ResponseStatusFilter.submitted]),
+        )
+        assert [item.record_id for item in result.items] == [records[0].id, records[2].id]
+
+    @pytest.mark.parametrize(
+        ("sort", "expected_indexes"),
+        [
+            ([Order(scope=MetadataFilterScope(metadata_property="position"), order=SortOrder.desc)], [2, 1, 0]),
+            ([Order(scope=MetadataFilterScope(metadata_property="confidence"), order=SortOrder.asc)], [2, 0, 1]),
+            ([Order(scope=RecordFilterScope(property="inserted_at"), order=SortOrder.desc)], [2, 1, 0]),
+        ],
+    )
+    async def test_search_with_sort(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record], sort, expected_indexes
+    ):
+        result = await search_engine.search(dataset, sort=sort)
+
+        assert [item.record_id for item in result.items] == [records[index].id for index in expected_indexes]
+
+    async def test_search_with_offset_and_limit(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        result = await search_engine.search(dataset, offset=1, limit=1)
+
+        assert result.total == 3
+        assert [item.record_id for item in result.items] == [records[1].id]
+
+    async def test_search_with_cursor(self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]):
+        items, cursor = [], SEARCH_CURSOR_START
+        while cursor is not None:
+            result = await search_engine.search(dataset, limit=2, cursor=cursor)
+            assert result.total == 3
+
+            items.extend(result.items)
+            cursor = result.next_cursor
+
+        assert [item.record_id for item in items] == [record.id for record in records]
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", sql_encode_search_cursor(-1)])
+    async def test_search_with_invalid_cursor(self, search_engine: SQLSearchEngine, dataset: Dataset, cursor: str):
+        with pytest.raises(ValueError, match="is not valid"):
+            await search_engine.search(dataset, cursor=cursor)
+
+    async def test_compute_metrics_for_terms_property(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        metrics = await search_engine.compute_metrics_for(dataset.metadata_properties[0])
+
+        assert metrics == TermsMetadataMetrics(
+            total=4,
+            values=[
+                TermsMetadataMetrics.TermCount(term="payments", count=2),
+                TermsMetadataMetrics.TermCount(term="cards", count=1),
+                TermsMetadataMetrics.TermCount(term="cash", count=1),
+            ],
+        )
+
+    async def test_compute_metrics_for_terms_property_with_size(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        metrics = await search_engine.compute_metrics_for(dataset.metadata_properties[0], size=2)
+
+        assert metrics.total == 4
+        assert metrics.values == [
+            TermsMetadataMetrics.TermCount(term="payments", count=2),
+            TermsMetadataMetrics.TermCount(term="cards", count=1),
+        ]
+        assert metrics.next_cursor is not None
+
+        metrics = await search_engine.compute_metrics_for(
+            dataset.metadata_properties[0], size=2, cursor=metrics.next_cursor
+        )
+
+        assert metrics.values == [TermsMetadataMetrics.TermCount(term="cash", count=1)]
+        assert metrics.next_cursor is None
+
+    async def test_compute_metrics_for_terms_property_with_size_beyond_max_terms_size(
+        self, db: AsyncSession, dataset: Dataset, records: List[Record]
+    ):
+        search_engine = SQLSearchEngine(session_factory=lambda: contextlib.nullcontext(db), max_terms_size=2)
+
+        metrics = await search_engine.compute_metrics_for(dataset.metadata_properties[0], size=1)
+
+        assert metrics.values == [TermsMetadataMetrics.TermCount(term="payments", count=2)]
+        assert metrics.next_cursor is not None
+
+        metrics = await search_engine.compute_metrics_for(
+            dataset.metadata_properties[0], size=1, cursor=metrics.next_cursor
+        )
+
+        # Pagination ends once the `max_terms_size` most frequent terms are returned
+        assert metrics.total == 4
+        assert metrics.values == [TermsMetadataMetrics.TermCount(term="cards", count=1)]
+        assert metrics.next_cursor is None
+
+    @pytest.mark.parametrize(
+        ("size", "cursor", "message"),
+        [(1, "not-a-cursor", "is not valid"), (None, encode_terms_metrics_cursor(1), "only be used together")],
+    )
+    async def test_compute_metrics_for_with_invalid_cursor(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, size: Optional[int], cursor: str, message: str
+    ):
+        with pytest.raises(ValueError, match=message):
+            await search_engine.compute_metrics_for(dataset.metadata_properties[0], size=size, cursor=cursor)
+
+    async def test_compute_metrics_for_is_cached_until_records_change(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        category = dataset.metadata_properties[0]
+        metrics = await search_engine.compute_metrics_for(category)
+
+        record = await RecordFactory.create(dataset=dataset, metadata_={"category": "cash"})
+
+        assert await search_engine.compute_metrics_for(category) == metrics
+
+        await search_engine.index_records(dataset, [record])
+
+        metrics = await search_engine.compute_metrics_for(category)
+        assert metrics.total == 5
+        assert TermsMetadataMetrics.TermCount(term="cash", count=2) in metrics.values
+
+    async def test_compute_metrics_for_numeric_properties(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        _, position, confidence = dataset.metadata_properties
+
+        assert await search_engine.compute_metrics_for(position) == IntegerMetadataMetrics(min=1, max=3)
+        assert await search_engine.compute_metrics_for(confidence) == FloatMetadataMetrics(min=0.25, max=0.5)
+
+    async def test_compute_metrics_for_property_without_values(self, search_engine: SQLSearchEngine):
+        metadata_property = await TermsMetadataPropertyFactory.create(name="empty")
+
+        assert await search_engine.compute_metrics_for(metadata_property) == TermsMetadataMetrics(total=0)
+
+    @pytest.mark.parametrize(
+        ("order", "expected_indexes"),
+        [(SimilarityOrder.most_similar, [1, 2]), (SimilarityOrder.least_similar, [2, 1])],
+    )
+    async def test_similarity_search_with_record(
+        self,
+        search_engine: SQLSearchEngine,
+        dataset: Dataset,
+        records: List[Record],
+        order: SimilarityOrder,
+        expected_indexes: List[int],
+    ):
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        for record, value in zip(records, [[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]]):
+            await VectorFactory.create(record=record, vector_settings=vector_settings, value=value)
+        await records[0].awaitable_attrs.vectors
+
+        result = await search_engine.similarity_search(
+            dataset, vector_settings, record=records[0], order=order, max_results=5
+        )
+
+        assert [item.record_id for item in result.items] == [records[index].id for index in expected_indexes]
+        assert result.total == 2
+
+    async def test_similarity_search_with_value_and_filter(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        for record, value in zip(records, [[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]]):
+            await VectorFactory.create(record=record, vector_settings=vector_settings, value=value)
+
+        result = await search_engine.similarity_search(
+            dataset,
+            vector_settings,
+            value=[1.0, 0.0],
+            filter=RangeFilter(scope=MetadataFilterScope(metadata_property="position"), ge=2),
+            threshold=0.6,
+        )
+
+        assert [item.record_id for item in result.items] == [records[1].id]
+        assert result.items[0].score == pytest.approx((1 + 0.9 / (0.81 + 0.01) ** 0.5) / 2)
+
+    async def test_similarity_search_many(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        for record, value in zip(records, [[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]]):
+            await VectorFactory.create(record=record, vector_settings=vector_settings, value=value)
+        await records[2].awaitable_attrs.vectors
+
+        results = await search_engine.similarity_search_many(
+            dataset,
+            vector_settings,
+            [SimilarityQuery(value=[1.0, 0.0]), SimilarityQuery(record=records[2])],
+            filter=RangeFilter(scope=MetadataFilterScope(metadata_property="position"), ge=2),
+            max_results=2,
+        )
+
+        assert [[item.record_id for item in result.items] for result in results] == [
+            [records[1].id, records[2].id],
+            [records[1].id],
+        ]
+
+    async def test_similarity_search_many_with_wrong_dimensions(self, search_engine: SQLSearchEngine, dataset: Dataset):
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+
+        with pytest.raises(ValueError, match="Expected vectors of 2 dimensions but got 3"):
+            await search_engine.similarity_search_many(
+                dataset, vector_settings, [SimilarityQuery(value=[1.0, 0.0]), SimilarityQuery(value=[1.0, 0.0, 0.0])]
+            )
+
+    async def test_similarity_search_with_vectors_indexed_after_building_the_vector_index(
+        self, search_engine: SQLSearchEngine, db: AsyncSession, dataset: Dataset, records: List[Record]
+    ):
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        await VectorFactory.create(record=records[0], vector_settings=vector_settings, value=[1.0, 0.0])
+
+        result = await search_engine.similarity_search(dataset, vector_settings, value=[0.0, 1.0])
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+        await VectorFactory.create(record=records[1], vector_settings=vector_settings, value=[0.0, 1.0])
+        await records[1].awaitable_attrs.vectors
+        await search_engine.index_records(dataset, [records[1]])
+
+        result = await search_engine.similarity_search(dataset, vector_settings, value=[0.0, 1.0])
+        assert [item.record_id for item in result.items] == [records[1].id, records[0].id]
+
+        await db.delete(records[1])
+        await db.flush()
+        await search_engine.delete_records(dataset, [records[1]])
+
+        result = await search_engine.similarity_search(dataset, vector_settings, value=[0.0, 1.0])
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+    async def test_similarity_search_with_vectors_written_by_other_processes(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record]
+    ):
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        await VectorFactory.create(record=records[0], vector_settings=vector_settings, value=[1.0, 0.0])
+
+        result = await search_engine.similarity_search(dataset, vector_settings, value=[0.0, 1.0])
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+        # Vectors written without notifying the search engine, as other server processes do
+        await VectorFactory.create(record=records[1], vector_settings=vector_settings, value=[0.0, 1.0])
+
+        result = await search_engine.similarity_search(dataset, vector_settings, value=[0.0, 1.0])
+        assert [item.record_id for item in result.items] == [records[1].id, records[0].id]
+
+    async def test_similarity_search_loads_only_vectors_written_since_last_load(
+        self, search_engine: SQLSearchEngine, dataset: Dataset, records: List[Record], mocker: MockerFixture
+    ):
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        loaded_at = datetime.utcnow() - timedelta(minutes=1)
+        await VectorFactory.create(
+            record=records[0], vector_settings=vector_settings, value=[1.0, 0.0], updated_at=loaded_at
+        )
+
+        await search_engine.similarity_search(dataset, vector_settings, value=[0.0, 1.0])
+        vector_index = search_engine._vector_indexes[(dataset.id, vector_settings.id)]
+        assert vector_index.loaded_until == loaded_at
+
+        upsert_spy = mocker.spy(vector_index.index, "upsert")
+        await search_engine.similarity_search(dataset, vector_settings, value=[0.0, 1.0])
+        upsert_spy.assert_not_called()
+
+    async def test_similarity_search_with_vectors_of_deleted_records(
+        self, search_engine: SQLSearchEngine, db: AsyncSession, dataset: Dataset, records: List[Record]
+    ):
+        vector_settings = await VectorSettingsFactory.create(dataset=dataset, dimensions=2)
+        for record, value in zip(records, [[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]]):
+            await VectorFactory.create(record=record, vector_settings=vector_settings, value=value)
+
+        await search_engine.similarity_search(dataset, vector_settings, value=[1.0, 0.0])
+        await db.delete(records[0])
+        await db.flush()
+
+        result = await search_engine.similarity_search(dataset, vector_settings, value=[1.0, 0.0], max_results=1)
+
+        assert [item.record_id for item in result.items] == [records[1].id]
@@ -0,0 +1,139 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+from argilla_server.search_engine.vector_index import FlatVectorIndex, IVFVectorIndex, VectorIndex
+
+
+def _random_vectors(size: int, dimensions: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(size, dimensions)).astype(np.float32)
+
+
+class TestVectorIndex:
+    @pytest.mark.parametrize(("index_name", "index_class"), [("flat", FlatVectorIndex), ("IVF", IVFVectorIndex)])
+    def test_new_instance_by_name(self, index_name: str, index_class: type):
+        vector_index = VectorIndex.new_instance_by_name(index_name, dimensions=3)
+
+        assert isinstance(vector_index, index_class)
+        assert vector_index.dimensions == 3
+
+    def test_new_instance_by_name_with_unknown_index(self):
+        with pytest.raises(ValueError, match="No vector index class registered for 'unknown'"):
+            VectorIndex.new_instance_by_name("unknown", dimensions=3)
+
+
+@pytest.mark.parametrize("index_class", [FlatVectorIndex, IVFVectorIndex])
+class TestFlatAndIVFVectorIndex:
+    def test_search(self, index_class: type):
+        vector_index = index_class(dimensions=2)
+        vector_index.upsert(["a", "b", "c"], np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]))
+
+        [neighbours] = vector_index.search(np.array([1.0, 0.1]), k=2)
+
+        assert [id for id, _ in neighbours] == ["a", "b"]
+        assert neighbours[0][1] == pytest.approx(1 / np.sqrt(1.01))
+
+    def test_search_with_batch_of_queries(self, index_class: type):
+        vector_index = index_class(dimensions=2)
+        vector_index.upsert(["a", "b", "c"], np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]))
+
+        neighbours = vector_index.search(np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, -1.0]]), k=1)
+
+        assert [[id for id, _ in query_neighbours] for query_neighbours in neighbours] == [["a"], ["c"], ["a"]]
+
+    def test_search_with_ids(self, index_class: type):
+        vector_index = index_class(dimensions=2)
+        vector_index.upsert(["a", "b", "c"], np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]))
+
+        [neighbours] = vector_index.search(np.array([1.0, 0.0]), k=5, ids=["c", "b", "unknown"])
+
+        assert [id for id, _ in neighbours] == ["b", "c"]
+
+    def test_upsert_replacing_vectors(self, index_class: type):
+        vector_index = index_class(dimensions=2)
+        vector_index.upsert(["a", "b"], np.array([[1.0, 0.0], [0.0, 1.0]]))
+        vector_index.upsert(["a"], np.array([[0.0, -1.0]]))
+
+        [neighbours] = vector_index.search(np.array([0.0, 1.0]), k=5)
+
+        assert len(vector_index) == 2
+        assert [id for id, _ in neighbours] == ["b", "a"]
+
+    def test_delete(self, index_class: type):
+        vector_index = index_class(dimensions=2)
+        vector_index.upsert(["a", "b", "c"], np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]))
+
+        vector_index.delete(["a", "unknown"])
+        vector_index.upsert(["d"], np.array([[0.5, -1.0]]))
+        [neighbours] = vector_index.search(np.array([1.0, 0.0]), k=5)
+
+        assert len(vector_index) == 3
+        assert [id for id, _ in neighbours] == ["b", "d", "c"]
+
+    def test_upsert_with_wrong_dimensions(self, index_class: type):
+        vector_index = index_class(dimensions=2)
+
+        with pytest.raises(ValueError, match="Expected vectors of 2 dimensions but got 3"):
+            vector_index.upsert(["a"], np.array([[1.0, 0.0, 0.0]]))
+
+
+class TestIVFVectorIndex:
+    def test_search_once_trained(self):
+        vectors = _random_vectors(size=2000, dimensions=16)
+        queries = _random_vectors(size=20, dimensions=16, seed=1)
+
+        flat_index, ivf_index = FlatVectorIndex(dimensions=16), IVFVectorIndex(dimensions=16, min_train_size=1000)
+        for vector_index in (flat_index, ivf_index):
+            vector_index.upsert(list(range(len(vectors))), vectors)
+
+        assert ivf_index.is_trained
+
+        exact_neighbours = flat_index.search(queries, k=10)
+        approximate_neighbours = ivf_index.search(queries, k=10)
+
+        recall = np.mean(
+            [
+                len({id for id, _ in exact} & {id for id, _ in approximate}) / 10
+                for exact, approximate in zip(exact_neighbours, approximate_neighbours)
+            ]
+        )
+        assert recall >= 0.5
+        # Similarities of the returned vectors are always exact
+        normalized_vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        for query, neighbours in zip(queries / np.linalg.norm(queries, axis=1, keepdims=True), approximate_neighbours):
+            for id, similarity in neighbours:
+                assert similarity == pytest.approx(normalized_vectors[id] @ query, abs=1e-5)
+
+    def test_upsert_after_training(self):
+        vectors = _random_vectors(size=100, dimensions=4)
+
+        vector_index = IVFVectorIndex(dimensions=4, min_train_size=100, n_probes=1)
+        vector_index.upsert(list(range(len(vectors))), vectors)
+        vector_index.upsert(["new"], np.array([[1.0, 2.0, 3.0, 4.0]]))
+
+        [neighbours] = vector_index.search(np.array([1.0, 2.0, 3.0, 4.0]), k=1)
+
+        assert neighbours[0][0] == "new"
+        assert neighbours[0][1] == pytest.approx(1.0)
+
+    def test_search_with_less_vectors_in_probes_than_k(self):
+        vectors = _random_vectors(size=100, dimensions=4)
+
+        vector_index = IVFVectorIndex(dimensions=4, min_train_size=100, n_probes=1)
+        vector_index.upsert(list(range(len(vectors))), vectors)
+
+        [neighbours] = vector_index.search(vectors[0], k=100)
+
+        assert len(neighbours) == 100
@@ -0,0 +1,138 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla_server.contexts import accounts
+from argilla_server.enums import UserRole
+from argilla_server.models import User
+from argilla_server.security.authentication.users_cache import UsersCache, users_cache
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import UserFactory, WorkspaceFactory
+
+
+@pytest.mark.asyncio
+class TestUsersCache:
+    @pytest.fixture
+    def enabled_users_cache(self, mocker: MockerFixture) -> UsersCache:
+        mocker.patch.object(users_cache, "ttl", 60)
+        return users_cache
+
+    async def test_get_or_load(self, db: AsyncSession):
+        user = await UserFactory.create(workspaces=[await WorkspaceFactory.create(name="workspace")])
+        cache = UsersCache(ttl=60, max_size=10)
+
+        calls = []
+
+        async def load() -> User:
+            calls.append(user.api_key)
+            return await accounts.get_user_by_api_key(db, user.api_key)
+
+        loaded_user = await cache.get_or_load(db, user.api_key, load)
+        cached_user = await cache.get_or_load(db, user.api_key, load)
+
+        assert loaded_user.id == cached_user.id == user.id
+        assert [workspace.name for workspace in cached_user.workspaces] == ["workspace"]
+        assert len(calls) == 1
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    async def test_get_or_load_does_not_cache_missing_users(self, db: AsyncSession):
+        cache = UsersCache(ttl=60, max_size=10)
+
+        async def load() -> None:
+            return None
+
+        assert await cache.get_or_load(db, "missing", load) is None
+        assert await cache.get_or_load(db, "missing", load) is None
+        assert cache.stats() == {"size": 0, "hits": 0, "misses": 2}
+
+    async def test_get_or_load_with_expired_entry(self, db: AsyncSession):
+        user = await UserFactory.create()
+        cache = UsersCache(ttl=0.01, max_size=10)
+
+        async def load() -> User:
+            return await accounts.get_user_by_api_key(db, user.api_key)
+
+        await cache.get_or_load(db, user.api_key, load)
+        cache._entries[user.api_key] = cache._entries[user.api_key]._replace(expires_at=0)
+        await cache.get_or_load(db, user.api_key, load)
+
+        assert cache.stats() == {"size": 1, "hits": 0, "misses": 2}
+
+    async def test_get_or_load_evicts_least_recently_used(self, db: AsyncSession):
+        users = await UserFactory.create_batch(3)
+        cache = UsersCache(ttl=60, max_size=2)
+
+        for user in [users[0], users[1], users[0], users[2]]:
+            await cache.get_or_load(db, user.api_key, lambda: accounts.get_user_by_api_key(db, user.api_key))
+
+        assert list(cache._entries.keys()) == [users[0].api_key, users[2].api_key]
+
+    async def test_get_or_load_with_disabled_cache(self, db: AsyncSession):
+        user = await UserFactory.create()
+        cache = UsersCache(ttl=0, max_size=10)
+
+        await cache.get_or_load(db, user.api_key, lambda: accounts.get_user_by_api_key(db, user.api_key))
+
+        assert cache.stats() == {"size": 0, "hits": 0, "misses": 0}
+
+    async def test_user_update_invalidates_cached_user(self, db: AsyncSession, enabled_users_cache: UsersCache):
+        user = await UserFactory.create(role=UserRole.annotator)
+
+        await enabled_users_cache.get_or_load(db, user.api_key, lambda: accounts.get_user_by_api_key(db, user.api_key))
+        assert enabled_users_cache.stats()["size"] == 1
+
+        await user.update(db, role=UserRole.admin)
+
+        assert enabled_users_cache.stats()["size"] == 0
+
+    async def test_workspace_user_creation_invalidates_cached_user(
+        self, db: AsyncSession, enabled_users_cache: UsersCache
+    ):
+        user = await UserFactory.create()
+        workspace = await WorkspaceFactory.create()
+
+        await enabled_users_cache.get_or_load(db, user.api_key, lambda: accounts.get_user_by_api_key(db, user.api_key))
+        await accounts.create_workspace_user(db, {"workspace_id": workspace.id, "user_id": user.id})
+
+        assert enabled_users_cache.stats()["size"] == 0
+
+    async def test_user_deletion_invalidates_cached_user(self, db: AsyncSession, enabled_users_cache: UsersCache):
+        user = await UserFactory.create()
+
+        await enabled_users_cache.get_or_load(db, user.api_key, lambda: accounts.get_user_by_api_key(db, user.api_key))
+        await accounts.delete_user(db, user)
+
+        assert enabled_users_cache.stats()["size"] == 0
+
+    async def test_user_update_invalidates_cached_user_on_commit(
+        self, db: AsyncSession, enabled_users_cache: UsersCache
+    ):
+        user = await UserFactory.create(role=UserRole.annotator)
+
+        await enabled_users_cache.get_or_load(db, user.api_key, lambda: accounts.get_user_by_api_key(db, user.api_key))
+
+        await user.update(db, role=UserRole.admin, autocommit=False)
+        assert enabled_users_cache.stats()["size"] == 1
+
+        await db.commit()
+        assert enabled_users_cache.stats()["size"] == 0
+
+    async def test_users_cache_is_disabled_by_default(self, db: AsyncSession):
+        user = await UserFactory.create()
+
+        await users_cache.get_or_load(db, user.api_key, lambda: accounts.get_user_by_api_key(db, user.api_key))
+
+        assert users_cache.stats()["size"] == 0
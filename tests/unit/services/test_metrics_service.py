@@ -0,0 +1,40 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from argilla_server.daos.records import DatasetRecordsDAO
+from argilla_server.services.metrics import MetricsService
+from argilla_server.services.tasks.text_classification.metrics import F1Metric
+from argilla_server.services.tasks.text_classification.model import ServiceTextClassificationRecord
+from pytest_mock import MockerFixture
+
+
+class TestSummarizeMetric:
+    def test_summarize_metric_over_record_fields(self, mocker: MockerFixture):
+        dao = mocker.Mock(spec=DatasetRecordsDAO)
+        dao.scan_dataset.return_value = iter(
+            [{"predicted": "ok", "annotated_as": ["positive"], "predicted_as": ["positive"]}]
+        )
+        record_class = mocker.Mock(spec=ServiceTextClassificationRecord)
+
+        summary = MetricsService(dao).summarize_metric(
+            dataset=mocker.Mock(),
+            metric=F1Metric(id="F1", name="F1"),
+            record_class=record_class,
+        )
+
+        assert summary["f1_micro"] == 1.0
+        assert dao.scan_dataset.call_args.kwargs["include_fields"] == {"predicted", "annotated_as", "predicted_as"}
+        assert dao.scan_dataset.call_args.kwargs["exclude_fields"] is None
+        record_class.parse_obj.assert_not_called()
@@ -0,0 +1,90 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import pytest
+from argilla_server.services.tasks.text_classification.metrics import DatasetLabels, F1Metric
+
+
+class TestF1Metric:
+    def test_apply(self):
+        metric = F1Metric(id="F1", name="F1")
+        records = [
+            {"predicted": "ok", "annotated_as": ["positive"], "predicted_as": ["positive"]},
+            {"predicted": "ko", "annotated_as": ["positive"], "predicted_as": ["negative"]},
+            {"predicted": "ok", "annotated_as": ["negative"], "predicted_as": ["negative"]},
+            {"predicted": None, "annotated_as": [], "predicted_as": ["negative"]},
+        ]
+
+        assert metric.apply(records) == {
+            "precision_macro": pytest.approx(0.75),
+            "recall_macro": pytest.approx(0.75),
+            "f1_macro": pytest.approx(2 / 3),
+            "precision_micro": pytest.approx(2 / 3),
+            "recall_micro": pytest.approx(2 / 3),
+            "f1_micro": pytest.approx(2 / 3),
+            "positive_precision": 1.0,
+            "positive_recall": 0.5,
+            "positive_f1": pytest.approx(2 / 3),
+            "positive_support": 2,
+            "negative_precision": 0.5,
+            "negative_recall": 1.0,
+            "negative_f1": pytest.approx(2 / 3),
+            "negative_support": 1,
+        }
+
+    def test_apply_multi_label(self):
+        metric = F1Metric(id="MultiLabelF1", name="MultiLabelF1", multi_label=True)
+        records = [
+            {"predicted": "ko", "annotated_as": ["sports", "news"], "predicted_as": ["sports"]},
+            {"predicted": "ko", "annotated_as": [], "predicted_as": ["news"]},
+        ]
+
+        assert metric.apply(records) == {
+            "precision_macro": 0.5,
+            "recall_macro": 0.5,
+            "f1_macro": 0.5,
+            "precision_micro": 0.5,
+            "recall_micro": 0.5,
+            "f1_micro": 0.5,
+            "sports_precision": 1.0,
+            "sports_recall": 1.0,
+            "sports_f1": 1.0,
+            "sports_support": 1,
+            "news_precision": 0.0,
+            "news_recall": 0.0,
+            "news_f1": 0.0,
+            "news_support": 1,
+        }
+
+    def test_apply_without_predicted_records(self):
+        metric = F1Metric(id="F1", name="F1")
+
+        assert metric.apply([{"predicted": None, "annotated_as": ["positive"], "predicted_as": []}]) == {}
+
+
+class TestDatasetLabels:
+    def test_apply(self):
+        records = [
+            {"annotation": {"labels": [{"class_label": "positive"}]}},
+            {"prediction": {"labels": [{"class_label": "negative"}, {"class_label": "neutral"}]}},
+            {"annotation": None},
+        ]
+
+        assert DatasetLabels().apply(iter(records)) == {"labels": {"positive", "negative", "neutral"}}
+
+    def test_apply_only_reads_records_to_fetch(self):
+        records = [{"annotation": {"labels": [{"class_label": f"label-{index}"}]}} for index in range(10)]
+
+        assert DatasetLabels(records_to_fetch=2).apply(iter(records)) == {"labels": {"label-0", "label-1"}}
@@ -0,0 +1,150 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla_server.services.tasks.token_classification.metrics import (
+    DatasetLabels,
+    F1Metric,
+    TokenClassificationMetrics,
+)
+from argilla_server.services.tasks.token_classification.model import ServiceTokenClassificationRecord
+from argilla_server.settings import settings
+from argilla_server.utils.concurrency import shutdown_process_pool
+from pytest_mock import MockerFixture
+
+
+def _build_record(index: int) -> ServiceTokenClassificationRecord:
+    tokens = ["Paris", "is", "in", "FRANCE", f"iPhone{index}"]
+    return ServiceTokenClassificationRecord(
+        text=" ".join(tokens),
+        tokens=tokens,
+        prediction={"agent": "model", "entities": [{"start": 0, "end": 5, "label": "LOC", "score": 0.8}]},
+        annotation={"agent": "annotator", "entities": [{"start": 12, "end": 18, "label": "LOC"}]},
+    )
+
+
+class TestTokenClassificationMetrics:
+    @pytest.fixture
+    def process_pool(self, mocker: MockerFixture):
+        mocker.patch.object(settings, "metrics_processes", 2)
+        mocker.patch.object(settings, "metrics_processes_min_records", 2)
+        yield
+        shutdown_process_pool()
+
+    def test_record_metrics(self):
+        record = _build_record(0)
+
+        assert TokenClassificationMetrics.record_metrics(record) == {
+            "text_length": 26,
+            "tokens": [
+                {"value": "Paris", "capitalness": "FIRST"},
+                {"value": "is", "capitalness": "LOWER"},
+                {"value": "in", "capitalness": "LOWER"},
+                {"value": "FRANCE", "capitalness": "UPPER"},
+                {"value": "iPhone0", "capitalness": "MIDDLE"},
+            ],
+            "predicted": {"mentions": [{"value": "Paris", "label": "LOC", "score": 0.8, "capitalness": "FIRST"}]},
+            "annotated": {"mentions": [{"value": "FRANCE", "label": "LOC", "score": 1.0, "capitalness": "UPPER"}]},
+        }
+
+    def test_record_metrics_mentions(self):
+        tokens = ["Paris", "and", "Paris", "in", "France"]
+        record = ServiceTokenClassificationRecord(
+            text=" ".join(tokens),
+            tokens=tokens,
+            prediction={
+                "agent": "model",
+                "entities": [
+                    {"start": 0, "end": 5, "label": "LOC", "score": 0.8},
+                    {"start": 10, "end": 15, "label": "LOC", "score": 0.8},
+                    {"start": 19, "end": 25, "label": "LOC", "score": 0.5},
+                ],
+            },
+        )
+
+        metrics = TokenClassificationMetrics.record_metrics(record)
+
+        assert sorted(metrics["predicted"]["mentions"], key=lambda mention: mention["value"]) == [
+            {"value": mention, "label": entity.label, "score": entity.score, "capitalness": "FIRST"}
+            for mention, entity in sorted(record.predicted_mentions())
+        ]
+        assert metrics["annotated"]["mentions"] == []
+
+    def test_records_metrics(self):
+        records = [_build_record(index) for index in range(5)]
+
+        assert TokenClassificationMetrics.records_metrics(records) == [
+            TokenClassificationMetrics.record_metrics(record) for record in records
+        ]
+
+    def test_records_metrics_with_process_pool(self, process_pool):
+        records = [_build_record(index) for index in range(5)]
+
+        assert TokenClassificationMetrics.records_metrics(records) == [
+            TokenClassificationMetrics.record_metrics(record) for record in records
+        ]
+
+    def test_records_metrics_without_records(self, process_pool):
+        assert TokenClassificationMetrics.records_metrics([]) == []
+
+
+class TestF1Metric:
+    def test_apply(self):
+        metric = F1Metric(id="F1", name="F1")
+        records = [
+            {
+                "annotation": {"entities": [{"start": 0, "end": 5, "label": "LOC"}]},
+                "prediction": {"entities": [{"start": 0, "end": 5, "label": "LOC"}]},
+            },
+            {
+                "annotation": {"entities": [{"start": 0, "end": 5, "label": "LOC"}]},
+                "prediction": {"entities": [{"start": 0, "end": 5, "label": "PER"}]},
+            },
+            {"prediction": {"entities": [{"start": 6, "end": 8, "label": "LOC"}]}},
+        ]
+
+        assert metric.apply(records) == {
+            "precision_macro": 0.5,
+            "recall_macro": 0.5,
+            "f1_macro": 0.5,
+            "precision_micro": 0.5,
+            "recall_micro": 0.5,
+            "f1_micro": 0.5,
+            "LOC_precision": 0.5,
+            "LOC_recall": 0.5,
+            "LOC_f1": 0.5,
+        }
+
+    def test_apply_without_annotations(self):
+        metric = F1Metric(id="F1", name="F1")
+
+        assert metric.apply([{"prediction": {"entities": [{"start": 0, "end": 5, "label": "LOC"}]}}]) == {
+            "precision_macro": 0,
+            "recall_macro": 0,
+            "f1_macro": 0,
+            "precision_micro": 0,
+            "recall_micro": 0,
+            "f1_micro": 0,
+        }
+
+
+class TestDatasetLabels:
+    def test_apply(self):
+        records = [
+            {"annotation": {"entities": [{"label": "LOC"}]}},
+            {"prediction": {"entities": [{"label": "PER"}, {"label": "ORG"}]}},
+            {"annotation": None, "prediction": None},
+        ]
+
+        assert DatasetLabels().apply(iter(records)) == {"labels": {"LOC", "PER", "ORG"}}
@@ -0,0 +1,71 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+import threading
+import time
+
+import pytest
+from argilla_server.utils import concurrency
+from argilla_server.utils.concurrency import run_blocking
+from pytest_mock import MockerFixture
+
+
+@pytest.mark.asyncio
+class TestRunBlocking:
+    async def test_run_blocking_in_worker_thread(self):
+        def _blocking_function(a: int, b: int = 0) -> int:
+            assert threading.current_thread() is not threading.main_thread()
+            return a + b
+
+        assert await run_blocking(_blocking_function, 1, b=2) == 3
+
+    async def test_run_blocking_propagates_errors(self):
+        def _failing_function():
+            raise ValueError("error")
+
+        with pytest.raises(ValueError, match="error"):
+            await run_blocking(_failing_function)
+
+    async def test_run_blocking_does_not_block_event_loop(self):
+        def _slow_function():
+            time.sleep(0.2)
+
+        async def _fast_coroutine():
+            await asyncio.sleep(0)
+            return time.monotonic()
+
+        start = time.monotonic()
+        _, finished_at = await asyncio.gather(run_blocking(_slow_function), _fast_coroutine())
+
+        assert finished_at - start < 0.2
+
+    async def test_run_blocking_is_bounded_by_limiter(self, mocker: MockerFixture):
+        mocker.patch.object(concurrency, "_LIMITER", None)
+        mocker.patch.object(concurrency.settings, "elasticsearch_sync_client_max_threads", 2)
+
+        lock = threading.Lock()
+        running, max_running = 0, 0
+
+        def _blocking_function():
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*[run_blocking(_blocking_function) for _ in range(6)])
+
+        assert max_running == 2
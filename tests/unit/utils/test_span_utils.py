@@ -38,8 +38,8 @@ def test_init():
         9: 2,
     }
 
-    assert span_utils._start_to_token_idx == {0: 0, 5: 1, 9: 2}
-    assert span_utils._end_to_token_idx == {4: 0, 9: 1, 10: 2}
+    assert list(span_utils._token_starts) == [0, 5, 9]
+    assert list(span_utils._token_ends) == [4, 9, 10]
 
 
 def test_init_value_error():
@@ -81,6 +81,13 @@ def test_validate_not_valid_and_misaligned_spans():
         span_utils.validate([("mock", 2, 1), ("mock", 0, 5)])
 
 
+def test_validate_with_empty_tokens():
+    span_utils = SpanUtils("test this", ["test", "", "this"])
+
+    assert span_utils.validate([("mock", 0, 4), ("mock", 5, 9)]) is None
+    assert span_utils.to_tags([("mock", 5, 9)]) == ["O", "O", "B-mock"]
+
+
 @pytest.mark.parametrize(
     "spans, expected",
     [